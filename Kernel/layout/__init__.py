@@ -1,4 +1,4 @@
-"""Layout: NSLayoutConstraint, NSLayoutAnchor, NSLayoutGuide."""
+"""Layout: NSLayoutConstraint, NSLayoutAnchor, NSLayoutGuide, NSLayoutEngine."""
 
 from .constraint import (
     NSLayoutConstraint,
@@ -10,6 +10,8 @@ from .constraint import (
     NSLayoutRelation,
     NSLayoutAttribute,
     NSLayoutPriority,
+    NSLayoutEngine,
+    solve_constraints,
 )
 
 __all__ = [
@@ -22,4 +24,6 @@ __all__ = [
     "NSLayoutRelation",
     "NSLayoutAttribute",
     "NSLayoutPriority",
+    "NSLayoutEngine",
+    "solve_constraints",
 ]
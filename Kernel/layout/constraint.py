@@ -1,14 +1,17 @@
-"""NSLayoutConstraint, anchors, layout guides, and a simple constraint solver.
+"""NSLayoutConstraint, anchors, layout guides, and the Auto Layout engine.
 
-The solver is intentionally lightweight: it handles pin-to-edge, centering,
-and fixed width/height constraints. For full AutoLayout semantics, a Cassowary
-solver could be plugged in via the same API.
+NSLayoutEngine maps constraints onto the incremental Cassowary solver in
+``solver.py``: priorities become strengths, frames are held in place by weak
+stays, and dragged or resized frames are edit variables. An engine keeps its
+tableau between layouts, so only changed constraints are re-solved.
 """
 
 from __future__ import annotations
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterable, Tuple
 from enum import IntEnum
 
+from .solver import Constraint, Operator, Solver, Strength, UnsatisfiableConstraint, Variable
+
 # ── enums ─────────────────────────────────────────────────────────
 
 
@@ -212,75 +215,294 @@ class NSLayoutConstraint:
         )
 
 
-# ── Simple solver ─────────────────────────────────────────────────
-
-
-def _get_attr_value(view, attr: NSLayoutAttribute) -> float:
-    """Read a layout attribute value from a view's frame."""
-    f = view.frame
-    if attr == NSLayoutAttribute.LEFT or attr == NSLayoutAttribute.LEADING:
-        return f.x
-    if attr == NSLayoutAttribute.RIGHT or attr == NSLayoutAttribute.TRAILING:
-        return f.x + f.width
-    if attr == NSLayoutAttribute.TOP:
-        return f.y
-    if attr == NSLayoutAttribute.BOTTOM:
-        return f.y + f.height
-    if attr == NSLayoutAttribute.WIDTH:
-        return f.width
-    if attr == NSLayoutAttribute.HEIGHT:
-        return f.height
-    if attr == NSLayoutAttribute.CENTER_X:
-        return f.x + f.width / 2
-    if attr == NSLayoutAttribute.CENTER_Y:
-        return f.y + f.height / 2
-    return 0.0
-
-
-def solve_constraints(constraints: List[NSLayoutConstraint], iterations: int = 4):
-    """Apply constraints by iteratively adjusting view frames.
-
-    This is a simple iterative solver suitable for pin/center/size constraints.
-    For production use, swap in a Cassowary solver.
+# ── Layout engine ─────────────────────────────────────────────────
+
+
+# attribute -> ((frame field index, coefficient), ...) over (x, y, width, height)
+_ATTR_TERMS = {
+    NSLayoutAttribute.LEFT: ((0, 1.0),),
+    NSLayoutAttribute.LEADING: ((0, 1.0),),
+    NSLayoutAttribute.RIGHT: ((0, 1.0), (2, 1.0)),
+    NSLayoutAttribute.TRAILING: ((0, 1.0), (2, 1.0)),
+    NSLayoutAttribute.TOP: ((1, 1.0),),
+    NSLayoutAttribute.BOTTOM: ((1, 1.0), (3, 1.0)),
+    NSLayoutAttribute.WIDTH: ((2, 1.0),),
+    NSLayoutAttribute.HEIGHT: ((3, 1.0),),
+    NSLayoutAttribute.CENTER_X: ((0, 1.0), (2, 0.5)),
+    NSLayoutAttribute.CENTER_Y: ((1, 1.0), (3, 0.5)),
+    NSLayoutAttribute.NOT_AN_ATTRIBUTE: (),
+}
+
+_OPERATORS = {
+    NSLayoutRelation.LESS_THAN_OR_EQUAL: Operator.LE,
+    NSLayoutRelation.EQUAL: Operator.EQ,
+    NSLayoutRelation.GREATER_THAN_OR_EQUAL: Operator.GE,
+}
+
+# Stays on (x, y, width, height). Positions hold a little harder than sizes,
+# so a lone trailing/bottom constraint resizes a view while centering moves it.
+_STAY_WEIGHTS = (1.5, 1.5, 1.0, 1.0)
+# Items that are never a constraint's first item (superviews, guides fixed from
+# outside) are held above every optional priority, so constraints move the
+# items they are declared on rather than their anchors.
+_ANCHOR_STRENGTH = Strength.STRONG
+# Strength used for a required constraint that conflicts with other required ones
+_BROKEN_PRIORITY = 999
+
+
+def _priority_strength(priority: float) -> float:
+    """Map an NSLayoutPriority to a solver strength.
+
+    Weights grow tenfold every 200 points (DEFAULT_LOW ~ 18, DEFAULT_HIGH
+    ~ 5600, 999 ~ 10^5), so a higher priority wins unless a lower one would
+    be violated by far more. The range stays well below Strength.STRONG to
+    keep the tableau numerically stable.
     """
-    from Kernel.view.nsview import NSRect
+    if priority >= NSLayoutPriority.REQUIRED:
+        return Strength.REQUIRED
+    return 10 ** (max(priority, 1) / 200)
 
-    for _ in range(iterations):
-        for c in constraints:
-            if not c.is_active:
-                continue
-            view = c.first_item
-            if view is None:
+
+def _set_frame(item, frame):
+    if isinstance(item, NSLayoutGuide):
+        item._frame_x, item._frame_y, item._frame_width, item._frame_height = frame
+    else:
+        item.frame = frame
+
+
+class _ItemVars:
+    """Solver variables for one item's frame and the stays holding it."""
+
+    __slots__ = ("item", "vars", "target", "written", "refs", "anchor", "editing")
+
+    def __init__(self, item: Any, anchor: bool):
+        self.item = item
+        self.vars = tuple(Variable(name) for name in ("x", "y", "width", "height"))
+        self.target: Tuple[float, ...] = tuple(item.frame)  # what the stays pull toward
+        self.written: Tuple[float, ...] = self.target  # the frame as the engine last saw it
+        self.refs = 0
+        self.anchor = anchor
+        self.editing = False
+
+
+class NSLayoutEngine:
+    """Incremental Cassowary layout over a set of NSLayoutConstraints.
+
+    Keep one engine per view hierarchy and call ``solve`` on every layout:
+    constraints that were added, removed or changed (constant, multiplier,
+    priority, relation) are the only ones re-entered into the tableau, and
+    frames are written back only for items whose values moved. Frames set
+    from outside between layouts become the items' new stay targets.
+
+    For drags and live resizes, ``begin_edit`` turns an item's frame into edit
+    variables, ``suggest_frame`` moves it and re-lays out everything that
+    depends on it, and ``end_edit`` leaves it where it was dropped.
+    """
+
+    def __init__(self):
+        self._solver = Solver()
+        self._items: Dict[int, _ItemVars] = {}
+        self._owners: Dict[Variable, _ItemVars] = {}
+        self._installed: Dict[NSLayoutConstraint, Tuple[tuple, Constraint]] = {}
+        self.broken: List[NSLayoutConstraint] = []
+
+    def solve(self, constraints: Iterable[NSLayoutConstraint]):
+        """Lay out the active constraints and write back changed frames."""
+        wanted = {
+            c: self._signature(c)
+            for c in constraints
+            if c.is_active and c.first_item is not None
+        }
+
+        released: Dict[int, _ItemVars] = {}
+        for c in [c for c, (sig, _) in self._installed.items() if wanted.get(c) != sig]:
+            for item_vars in self._uninstall(c):
+                released[id(item_vars.item)] = item_vars
+        # Items let go of by a constraint stay where it last put them
+        for item_vars in released.values():
+            if not item_vars.editing and item_vars.refs:
+                self._retarget(item_vars, item_vars.written)
+
+        leading = {id(c.first_item) for c in wanted}
+        for item_vars in self._items.values():
+            self._set_anchor(item_vars, id(item_vars.item) not in leading)
+        self._sync_frames()
+
+        # New items get their stays once their constraints are in: far fewer
+        # pivots than pulling every variable to its old frame first
+        added: List[_ItemVars] = []
+        for c, sig in wanted.items():
+            if c not in self._installed:
+                self._install(c, sig, leading, added)
+        for item_vars in added:
+            self._add_stays(item_vars, self._stay_strengths(item_vars))
+
+        for key in [key for key, item_vars in self._items.items() if item_vars.refs == 0]:
+            self._drop(key)
+
+        self._write_frames()
+
+    # ── edit variables ────────────────────────────────────────────
+
+    def begin_edit(self, item: Any, priority: float = NSLayoutPriority.DRAG_THAT_CAN_RESIZE):
+        """Let ``suggest_frame`` drive item's frame at the given priority."""
+        item_vars = self._item_vars(item)
+        if item_vars.editing:
+            return
+        self._remove_stays(item_vars)
+        self._add_stays(item_vars, (_priority_strength(priority),) * 4)
+        item_vars.editing = True
+
+    def suggest_frame(self, item: Any, frame):
+        """Move an edited item toward frame and write back every frame that changed."""
+        item_vars = self._item_vars(item)
+        if not item_vars.editing:
+            raise ValueError("begin_edit must be called before suggest_frame")
+        self._retarget(item_vars, tuple(frame))
+        self._write_frames()
+
+    def end_edit(self, item: Any):
+        """Stop editing item; it stays where the last suggestion put it."""
+        item_vars = self._item_vars(item)
+        if not item_vars.editing:
+            return
+        self._remove_stays(item_vars)
+        item_vars.editing = False
+        item_vars.target = tuple(var.value for var in item_vars.vars)
+        self._add_stays(item_vars, self._stay_strengths(item_vars))
+
+    # ── internals ─────────────────────────────────────────────────
+
+    @staticmethod
+    def _signature(c: NSLayoutConstraint) -> tuple:
+        return (
+            c.first_item, c.first_attribute, c.relation, c.second_item,
+            c.second_attribute, c.multiplier, c.constant, c.priority,
+        )
+
+    def _item_vars(self, item: Any) -> _ItemVars:
+        item_vars = self._items.get(id(item))
+        if item_vars is None:
+            raise KeyError(f"{item!r} has no constraints in this engine")
+        return item_vars
+
+    @staticmethod
+    def _stay_strengths(item_vars: _ItemVars) -> Tuple[float, ...]:
+        if item_vars.anchor:
+            return (_ANCHOR_STRENGTH,) * 4
+        return tuple(Strength.WEAK * weight for weight in _STAY_WEIGHTS)
+
+    def _add_stays(self, item_vars: _ItemVars, strengths: Tuple[float, ...]):
+        for var, strength, value in zip(item_vars.vars, strengths, item_vars.target):
+            self._solver.add_edit_variable(var, strength, value)
+
+    def _remove_stays(self, item_vars: _ItemVars):
+        for var in item_vars.vars:
+            self._solver.remove_edit_variable(var)
+
+    def _set_anchor(self, item_vars: _ItemVars, anchor: bool):
+        if item_vars.anchor == anchor:
+            return
+        item_vars.anchor = anchor
+        if not item_vars.editing:
+            self._remove_stays(item_vars)
+            self._add_stays(item_vars, self._stay_strengths(item_vars))
+
+    def _retarget(self, item_vars: _ItemVars, target: Tuple[float, ...]):
+        for var, old, new in zip(item_vars.vars, item_vars.target, target):
+            if new != old:
+                self._solver.suggest_value(var, new)
+        item_vars.target = target
+
+    def _sync_frames(self):
+        """Adopt frames that were changed from outside since the last layout."""
+        for item_vars in self._items.values():
+            if item_vars.editing:
                 continue
-            # compute target value
-            if c.second_item is not None:
-                target = (
-                    _get_attr_value(c.second_item, c.second_attribute) * c.multiplier
-                    + c.constant
-                )
-            else:
-                target = c.constant
-
-            f = view.frame
-            attr = c.first_attribute
-
-            if attr in (NSLayoutAttribute.LEFT, NSLayoutAttribute.LEADING):
-                w = f.width
-                view.frame = NSRect(target, f.y, w, f.height)
-            elif attr in (NSLayoutAttribute.RIGHT, NSLayoutAttribute.TRAILING):
-                view.frame = NSRect(f.x, f.y, target - f.x, f.height)
-            elif attr == NSLayoutAttribute.TOP:
-                view.frame = NSRect(f.x, target, f.width, f.height)
-            elif attr == NSLayoutAttribute.BOTTOM:
-                view.frame = NSRect(f.x, f.y, f.width, target - f.y)
-            elif attr == NSLayoutAttribute.WIDTH:
-                view.frame = NSRect(f.x, f.y, target, f.height)
-            elif attr == NSLayoutAttribute.HEIGHT:
-                view.frame = NSRect(f.x, f.y, f.width, target)
-            elif attr == NSLayoutAttribute.CENTER_X:
-                view.frame = NSRect(target - f.width / 2, f.y, f.width, f.height)
-            elif attr == NSLayoutAttribute.CENTER_Y:
-                view.frame = NSRect(f.x, target - f.height / 2, f.width, f.height)
+            frame = tuple(item_vars.item.frame)
+            if frame != item_vars.written:
+                self._retarget(item_vars, frame)
+                item_vars.written = frame
+
+    def _terms(self, item: Any, attr: NSLayoutAttribute, scale: float, terms: Dict[Variable, float]):
+        item_vars = self._items[id(item)]
+        for index, coefficient in _ATTR_TERMS[attr]:
+            var = item_vars.vars[index]
+            terms[var] = terms.get(var, 0.0) + coefficient * scale
+
+    def _install(self, c: NSLayoutConstraint, sig: tuple, leading: set, added: List[_ItemVars]):
+        items = [c.first_item] if c.second_item is None else [c.first_item, c.second_item]
+        for item in items:
+            item_vars = self._items.get(id(item))
+            if item_vars is None:
+                item_vars = self._items[id(item)] = _ItemVars(item, id(item) not in leading)
+                self._owners.update(zip(item_vars.vars, (item_vars,) * 4))
+                added.append(item_vars)
+            item_vars.refs += 1
+
+        # first = second * multiplier + constant  ->  first - second * multiplier - constant op 0
+        terms: Dict[Variable, float] = {}
+        self._terms(c.first_item, c.first_attribute, 1.0, terms)
+        if c.second_item is not None:
+            self._terms(c.second_item, c.second_attribute, -c.multiplier, terms)
+        op = _OPERATORS[c.relation]
+
+        constraint = Constraint(terms, -c.constant, op, _priority_strength(c.priority))
+        try:
+            self._solver.add_constraint(constraint)
+        except UnsatisfiableConstraint:
+            # Like AppKit, keep going with the conflicting constraint broken
+            constraint = Constraint(terms, -c.constant, op, _priority_strength(_BROKEN_PRIORITY))
+            self._solver.add_constraint(constraint)
+            self.broken.append(c)
+        self._installed[c] = (sig, constraint)
+
+    def _uninstall(self, c: NSLayoutConstraint) -> List[_ItemVars]:
+        sig, constraint = self._installed.pop(c)
+        self._solver.remove_constraint(constraint)
+        if c in self.broken:
+            self.broken.remove(c)
+        items = [self._items[id(sig[0])]]
+        if sig[3] is not None:
+            items.append(self._items[id(sig[3])])
+        for item_vars in items:
+            item_vars.refs -= 1
+        return items
+
+    def _drop(self, key: int):
+        item_vars = self._items.pop(key)
+        self._remove_stays(item_vars)
+        for var in item_vars.vars:
+            self._solver.forget_variable(var)
+            del self._owners[var]
+
+    def _write_frames(self):
+        from Kernel.view.nsview import NSRect
+
+        moved = {}
+        for var in self._solver.update_variables():
+            item_vars = self._owners.get(var)
+            if item_vars is not None:
+                moved[id(item_vars.item)] = item_vars
+        for item_vars in moved.values():
+            frame = NSRect(*(round(var.value, 9) for var in item_vars.vars))
+            item_vars.written = tuple(frame)
+            if item_vars.written != tuple(item_vars.item.frame):
+                _set_frame(item_vars.item, frame)
+
+
+def solve_constraints(
+    constraints: List[NSLayoutConstraint],
+    iterations: int = 4,
+    engine: Optional[NSLayoutEngine] = None,
+):
+    """Lay out constraints with the Cassowary engine.
+
+    Pass the same ``engine`` on every layout to keep its tableau between
+    calls; without one, a fresh engine solves from scratch. ``iterations`` is
+    kept for callers of the old fixed-pass solver and is ignored.
+    """
+    (engine or NSLayoutEngine()).solve(constraints)
 
 
 # ── NSLayoutGuide ─────────────────────────────────────────────────
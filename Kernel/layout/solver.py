@@ -0,0 +1,569 @@
+"""Incremental Cassowary simplex solver used by the Auto Layout engine.
+
+Constraints are linear: ``sum(coeff * var) + constant  (== | <= | >=)  0``.
+Required constraints must hold; weaker ones are satisfied as closely as their
+strength allows. The tableau persists between calls, so adding or removing a
+constraint and suggesting a new edit value only pivots the rows involved.
+
+This follows the algorithm of Badros, Borning & Stuckey, "The Cassowary
+Linear Arithmetic Constraint Solving Algorithm" (2001), in the formulation
+used by the kiwi solver.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple
+from enum import IntEnum
+import itertools
+
+EPSILON = 1.0e-8
+
+
+def _near_zero(value: float) -> bool:
+    return -EPSILON < value < EPSILON
+
+
+# ── strengths ─────────────────────────────────────────────────────
+
+
+class Strength:
+    REQUIRED = 1001001000.0
+    STRONG = 1000000.0
+    MEDIUM = 1000.0
+    WEAK = 1.0
+
+    @staticmethod
+    def clip(value: float) -> float:
+        return max(0.0, min(Strength.REQUIRED, value))
+
+
+# ── variables and constraints ─────────────────────────────────────
+
+
+class Variable:
+    """A solver variable; ``value`` is filled in by ``update_variables``."""
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self.value = 0.0
+
+    def __repr__(self):
+        return f"<Variable {self.name}={self.value}>"
+
+
+class Operator(IntEnum):
+    LE = -1
+    EQ = 0
+    GE = 1
+
+
+class Constraint:
+    """``sum(coeff * var) + constant  op  0`` at a given strength."""
+
+    __slots__ = ("terms", "constant", "op", "strength")
+
+    def __init__(
+        self,
+        terms: Dict[Variable, float],
+        constant: float = 0.0,
+        op: Operator = Operator.EQ,
+        strength: float = Strength.REQUIRED,
+    ):
+        self.terms = terms
+        self.constant = constant
+        self.op = op
+        self.strength = Strength.clip(strength)
+
+    def __repr__(self):
+        lhs = " + ".join(f"{c}*{v.name}" for v, c in self.terms.items())
+        op = {Operator.LE: "<=", Operator.EQ: "==", Operator.GE: ">="}[self.op]
+        return f"<Constraint {lhs} + {self.constant} {op} 0 @{self.strength}>"
+
+
+class UnsatisfiableConstraint(ValueError):
+    """A required constraint conflicts with the required constraints already added."""
+
+
+# ── tableau internals ─────────────────────────────────────────────
+
+
+class _Kind(IntEnum):
+    EXTERNAL = 0
+    SLACK = 1
+    ERROR = 2
+    DUMMY = 3
+
+
+_ids = itertools.count(1)
+
+
+class _Symbol:
+    __slots__ = ("kind", "id")
+
+    def __init__(self, kind: _Kind):
+        self.kind = kind
+        self.id = next(_ids)
+
+    def __repr__(self):
+        return f"{self.kind.name[0].lower()}{self.id}"
+
+
+class _Tag:
+    __slots__ = ("marker", "other")
+
+    def __init__(self, marker: Optional[_Symbol] = None, other: Optional[_Symbol] = None):
+        self.marker = marker
+        self.other = other
+
+
+class _Row:
+    """``constant + sum(coeff * symbol)``; as a basic row it is the value of its symbol."""
+
+    __slots__ = ("constant", "cells")
+
+    def __init__(self, constant: float = 0.0, cells: Optional[Dict[_Symbol, float]] = None):
+        self.constant = constant
+        self.cells: Dict[_Symbol, float] = cells if cells is not None else {}
+
+    def copy(self) -> _Row:
+        return _Row(self.constant, dict(self.cells))
+
+    def add(self, value: float) -> float:
+        self.constant += value
+        return self.constant
+
+    def insert_symbol(self, symbol: _Symbol, coefficient: float = 1.0):
+        value = self.cells.get(symbol, 0.0) + coefficient
+        if _near_zero(value):
+            self.cells.pop(symbol, None)
+        else:
+            self.cells[symbol] = value
+
+    def insert_row(self, other: _Row, coefficient: float = 1.0):
+        self.constant += other.constant * coefficient
+        for symbol, value in other.cells.items():
+            self.insert_symbol(symbol, value * coefficient)
+
+    def remove(self, symbol: _Symbol):
+        self.cells.pop(symbol, None)
+
+    def reverse_sign(self):
+        self.constant = -self.constant
+        self.cells = {s: -c for s, c in self.cells.items()}
+
+    def solve_for(self, symbol: _Symbol):
+        """Rewrite ``0 = self`` as ``symbol = ...``; the row then drops symbol."""
+        coefficient = -1.0 / self.cells.pop(symbol)
+        self.constant *= coefficient
+        self.cells = {s: c * coefficient for s, c in self.cells.items()}
+
+    def solve_for_pair(self, lhs: _Symbol, rhs: _Symbol):
+        """Rewrite ``lhs = self`` as ``rhs = ...``."""
+        self.insert_symbol(lhs, -1.0)
+        self.solve_for(rhs)
+
+    def coefficient_for(self, symbol: _Symbol) -> float:
+        return self.cells.get(symbol, 0.0)
+
+    def substitute(self, symbol: _Symbol, row: _Row):
+        coefficient = self.cells.pop(symbol, None)
+        if coefficient is not None:
+            self.insert_row(row, coefficient)
+
+
+class _Objective(_Row):
+    """The objective row, remembering which symbols changed since it was optimal.
+
+    After ``_optimize`` every non-dummy coefficient is non-negative, so only
+    touched symbols can be entering candidates on the next call.
+    """
+
+    __slots__ = ("touched",)
+
+    def __init__(self):
+        super().__init__()
+        self.touched: Dict[_Symbol, None] = {}
+
+    def insert_symbol(self, symbol: _Symbol, coefficient: float = 1.0):
+        super().insert_symbol(symbol, coefficient)
+        self.touched[symbol] = None
+
+
+class _EditInfo:
+    __slots__ = ("tag", "constraint", "constant")
+
+    def __init__(self, tag: _Tag, constraint: Constraint, constant: float):
+        self.tag = tag
+        self.constraint = constraint
+        self.constant = constant
+
+
+# ── solver ────────────────────────────────────────────────────────
+
+
+class Solver:
+    """Incremental Cassowary solver.
+
+    Besides the rows, the tableau keeps a column index (symbol -> basic
+    symbols whose rows mention it), so pivots, edits and removals visit only
+    the rows that involve the symbols at hand.
+    """
+
+    def __init__(self):
+        self._constraints: Dict[Constraint, _Tag] = {}
+        self._rows: Dict[_Symbol, _Row] = {}
+        self._columns: Dict[_Symbol, Dict[_Symbol, None]] = {}
+        self._vars: Dict[Variable, _Symbol] = {}
+        self._edits: Dict[Variable, _EditInfo] = {}
+        self._infeasible: List[_Symbol] = []
+        self._objective = _Objective()
+        self._artificial: Optional[_Row] = None
+
+    # ── constraints ───────────────────────────────────────────────
+
+    def add_constraint(self, constraint: Constraint):
+        if constraint in self._constraints:
+            raise ValueError(f"duplicate constraint: {constraint!r}")
+
+        row, tag = self._create_row(constraint)
+        subject = self._choose_subject(row, tag)
+
+        if subject is None and all(s.kind == _Kind.DUMMY for s in row.cells):
+            if not _near_zero(row.constant):
+                raise UnsatisfiableConstraint(repr(constraint))
+            subject = tag.marker
+
+        if subject is None:
+            if not self._add_with_artificial_variable(row):
+                # Take whatever is left of the row back out of the tableau
+                if self._in_tableau(tag.marker):
+                    self._constraints[constraint] = tag
+                    self.remove_constraint(constraint)
+                raise UnsatisfiableConstraint(repr(constraint))
+        else:
+            row.solve_for(subject)
+            self._substitute(subject, row)
+            self._add_row(subject, row)
+
+        self._constraints[constraint] = tag
+        self._optimize(self._objective)
+
+    def remove_constraint(self, constraint: Constraint):
+        tag = self._constraints.pop(constraint, None)
+        if tag is None:
+            raise KeyError(f"unknown constraint: {constraint!r}")
+
+        self._remove_constraint_effects(constraint, tag)
+
+        if tag.marker in self._rows:
+            self._pop_row(tag.marker)
+        else:
+            leaving = self._marker_leaving_symbol(tag.marker)
+            if leaving is None:
+                raise RuntimeError("failed to find leaving row")
+            row = self._pop_row(leaving)
+            row.solve_for_pair(leaving, tag.marker)
+            self._substitute(tag.marker, row)
+
+        self._optimize(self._objective)
+
+    def has_constraint(self, constraint: Constraint) -> bool:
+        return constraint in self._constraints
+
+    # ── edit variables ────────────────────────────────────────────
+
+    def add_edit_variable(self, variable: Variable, strength: float, value: float = 0.0):
+        """Make variable suggestible, starting from value."""
+        if variable in self._edits:
+            raise ValueError(f"duplicate edit variable: {variable!r}")
+        strength = Strength.clip(strength)
+        if strength == Strength.REQUIRED:
+            raise ValueError("edit variables cannot be required")
+
+        constraint = Constraint({variable: 1.0}, -value, Operator.EQ, strength)
+        self.add_constraint(constraint)
+        self._edits[variable] = _EditInfo(self._constraints[constraint], constraint, value)
+
+    def remove_edit_variable(self, variable: Variable):
+        info = self._edits.pop(variable, None)
+        if info is None:
+            raise KeyError(f"unknown edit variable: {variable!r}")
+        self.remove_constraint(info.constraint)
+
+    def has_edit_variable(self, variable: Variable) -> bool:
+        return variable in self._edits
+
+    def suggest_value(self, variable: Variable, value: float):
+        """Move an edit variable's target; re-optimizes only the affected rows."""
+        info = self._edits.get(variable)
+        if info is None:
+            raise KeyError(f"unknown edit variable: {variable!r}")
+
+        delta = value - info.constant
+        info.constant = value
+
+        marker, other = info.tag.marker, info.tag.other
+        row = self._rows.get(marker)
+        if row is not None:
+            if row.add(-delta) < 0.0:
+                self._infeasible.append(marker)
+        else:
+            row = self._rows.get(other)
+            if row is not None:
+                if row.add(delta) < 0.0:
+                    self._infeasible.append(other)
+            else:
+                for symbol in self._columns.get(marker, ()):
+                    row = self._rows[symbol]
+                    if (
+                        row.add(delta * row.cells[marker]) < 0.0
+                        and symbol.kind != _Kind.EXTERNAL
+                    ):
+                        self._infeasible.append(symbol)
+
+        self._dual_optimize()
+
+    # ── results ───────────────────────────────────────────────────
+
+    def update_variables(self) -> List[Variable]:
+        """Copy the solution into ``Variable.value``; returns those that changed."""
+        changed = []
+        for variable, symbol in self._vars.items():
+            row = self._rows.get(symbol)
+            value = row.constant if row is not None else 0.0
+            if value != variable.value:
+                variable.value = value
+                changed.append(variable)
+        return changed
+
+    def forget_variable(self, variable: Variable):
+        """Drop a variable no constraint refers to any more."""
+        symbol = self._vars.get(variable)
+        if symbol is None:
+            return
+        if symbol in self._rows:
+            self._pop_row(symbol)
+            del self._vars[variable]
+        elif symbol not in self._columns:
+            del self._vars[variable]
+
+    # ── internals ─────────────────────────────────────────────────
+
+    def _create_row(self, constraint: Constraint) -> Tuple[_Row, _Tag]:
+        row = _Row(constraint.constant)
+        for variable, coefficient in constraint.terms.items():
+            if _near_zero(coefficient):
+                continue
+            symbol = self._vars.get(variable)
+            if symbol is None:
+                symbol = self._vars[variable] = _Symbol(_Kind.EXTERNAL)
+            basic = self._rows.get(symbol)
+            if basic is not None:
+                row.insert_row(basic, coefficient)
+            else:
+                row.insert_symbol(symbol, coefficient)
+
+        tag = _Tag()
+        strength = constraint.strength
+        if constraint.op != Operator.EQ:
+            coefficient = 1.0 if constraint.op == Operator.LE else -1.0
+            tag.marker = _Symbol(_Kind.SLACK)
+            row.insert_symbol(tag.marker, coefficient)
+            if strength < Strength.REQUIRED:
+                tag.other = _Symbol(_Kind.ERROR)
+                row.insert_symbol(tag.other, -coefficient)
+                self._objective.insert_symbol(tag.other, strength)
+        elif strength < Strength.REQUIRED:
+            tag.marker = _Symbol(_Kind.ERROR)
+            tag.other = _Symbol(_Kind.ERROR)
+            row.insert_symbol(tag.marker, -1.0)
+            row.insert_symbol(tag.other, 1.0)
+            self._objective.insert_symbol(tag.marker, strength)
+            self._objective.insert_symbol(tag.other, strength)
+        else:
+            tag.marker = _Symbol(_Kind.DUMMY)
+            row.insert_symbol(tag.marker)
+
+        if row.constant < 0.0:
+            row.reverse_sign()
+        return row, tag
+
+    def _choose_subject(self, row: _Row, tag: _Tag) -> Optional[_Symbol]:
+        for symbol in row.cells:
+            if symbol.kind == _Kind.EXTERNAL:
+                return symbol
+        for symbol in (tag.marker, tag.other):
+            if (
+                symbol is not None
+                and symbol.kind in (_Kind.SLACK, _Kind.ERROR)
+                and row.coefficient_for(symbol) < 0.0
+            ):
+                return symbol
+        return None
+
+    def _add_with_artificial_variable(self, row: _Row) -> bool:
+        artificial = _Symbol(_Kind.SLACK)
+        self._add_row(artificial, row.copy())
+        self._artificial = row.copy()
+
+        self._optimize(self._artificial)
+        success = _near_zero(self._artificial.constant)
+        self._artificial = None
+
+        if artificial in self._rows:
+            basic = self._pop_row(artificial)
+            if not basic.cells:
+                return success
+            entering = next(
+                (s for s in basic.cells if s.kind in (_Kind.SLACK, _Kind.ERROR)), None
+            )
+            if entering is None:
+                return False
+            basic.solve_for_pair(artificial, entering)
+            self._substitute(entering, basic)
+            self._add_row(entering, basic)
+
+        for symbol in self._columns.pop(artificial, ()):
+            self._rows[symbol].remove(artificial)
+        self._objective.remove(artificial)
+        return success
+
+    def _add_row(self, symbol: _Symbol, row: _Row):
+        self._rows[symbol] = row
+        columns = self._columns
+        for cell in row.cells:
+            column = columns.get(cell)
+            if column is None:
+                columns[cell] = {symbol: None}
+            else:
+                column[symbol] = None
+
+    def _pop_row(self, symbol: _Symbol) -> _Row:
+        row = self._rows.pop(symbol)
+        columns = self._columns
+        for cell in row.cells:
+            column = columns[cell]
+            del column[symbol]
+            if not column:
+                del columns[cell]
+        return row
+
+    def _substitute(self, symbol: _Symbol, row: _Row):
+        """Replace symbol by row everywhere in the tableau and objective."""
+        columns = self._columns
+        for basic_symbol in columns.pop(symbol, ()):
+            basic = self._rows[basic_symbol]
+            cells = basic.cells
+            coefficient = cells.pop(symbol)
+            basic.constant += row.constant * coefficient
+            for cell, value in row.cells.items():
+                value = cells.get(cell, 0.0) + value * coefficient
+                if _near_zero(value):
+                    if cells.pop(cell, None) is not None:
+                        column = columns[cell]
+                        del column[basic_symbol]
+                        if not column:
+                            del columns[cell]
+                elif cell in cells:
+                    cells[cell] = value
+                else:
+                    cells[cell] = value
+                    column = columns.get(cell)
+                    if column is None:
+                        columns[cell] = {basic_symbol: None}
+                    else:
+                        column[basic_symbol] = None
+            if basic_symbol.kind != _Kind.EXTERNAL and basic.constant < 0.0:
+                self._infeasible.append(basic_symbol)
+        self._objective.substitute(symbol, row)
+        if self._artificial is not None:
+            self._artificial.substitute(symbol, row)
+
+    def _optimize(self, objective: _Row):
+        while True:
+            if objective is self._objective:
+                candidates = [
+                    symbol for symbol in objective.touched
+                    if symbol.kind != _Kind.DUMMY and objective.cells.get(symbol, 0.0) < 0.0
+                ]
+                objective.touched = dict.fromkeys(candidates)
+            else:
+                candidates = [
+                    symbol for symbol, coefficient in objective.cells.items()
+                    if symbol.kind != _Kind.DUMMY and coefficient < 0.0
+                ]
+            if not candidates:
+                return
+            entering = min(candidates, key=lambda symbol: symbol.id)
+
+            leaving = None
+            ratio = float("inf")
+            for symbol in self._columns.get(entering, ()):
+                if symbol.kind == _Kind.EXTERNAL:
+                    continue
+                row = self._rows[symbol]
+                coefficient = row.cells[entering]
+                if coefficient < 0.0:
+                    candidate = -row.constant / coefficient
+                    if candidate < ratio or (candidate == ratio and symbol.id < leaving.id):
+                        ratio, leaving = candidate, symbol
+            if leaving is None:
+                raise RuntimeError("objective is unbounded")
+
+            row = self._pop_row(leaving)
+            row.solve_for_pair(leaving, entering)
+            self._substitute(entering, row)
+            self._add_row(entering, row)
+
+    def _dual_optimize(self):
+        while self._infeasible:
+            leaving = self._infeasible.pop()
+            row = self._rows.get(leaving)
+            if row is None or row.constant >= 0.0 or _near_zero(row.constant):
+                continue
+
+            entering = None
+            ratio = float("inf")
+            for symbol, coefficient in row.cells.items():
+                if coefficient > 0.0 and symbol.kind != _Kind.DUMMY:
+                    candidate = self._objective.coefficient_for(symbol) / coefficient
+                    if candidate < ratio:
+                        ratio, entering = candidate, symbol
+            if entering is None:
+                raise RuntimeError("dual optimize failed")
+
+            self._pop_row(leaving)
+            row.solve_for_pair(leaving, entering)
+            self._substitute(entering, row)
+            self._add_row(entering, row)
+
+    def _in_tableau(self, symbol: _Symbol) -> bool:
+        return symbol in self._rows or symbol in self._columns
+
+    def _marker_leaving_symbol(self, marker: _Symbol) -> Optional[_Symbol]:
+        first = second = third = None
+        ratio_first = ratio_second = float("inf")
+        for symbol in self._columns.get(marker, ()):
+            row = self._rows[symbol]
+            coefficient = row.cells[marker]
+            if symbol.kind == _Kind.EXTERNAL:
+                third = symbol
+            elif coefficient < 0.0:
+                ratio = -row.constant / coefficient
+                if ratio < ratio_first:
+                    ratio_first, first = ratio, symbol
+            else:
+                ratio = row.constant / coefficient
+                if ratio < ratio_second:
+                    ratio_second, second = ratio, symbol
+        return first or second or third
+
+    def _remove_constraint_effects(self, constraint: Constraint, tag: _Tag):
+        for symbol in (tag.marker, tag.other):
+            if symbol is not None and symbol.kind == _Kind.ERROR:
+                row = self._rows.get(symbol)
+                if row is not None:
+                    self._objective.insert_row(row, -constraint.strength)
+                else:
+                    self._objective.insert_symbol(symbol, -constraint.strength)
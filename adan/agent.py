@@ -27,6 +27,8 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Callable
 from enum import Enum
 
+from core.safety_scanner import SafetyScanner
+
 from .grounding_enhanced import EnhancedGroundingEngine
 from .memory import AgentMemory, TurnRole, ConstraintCheck, GroundingInfo
 from .knowledge_base import get_knowledge_base
@@ -215,6 +217,8 @@ SAFETY_CONSTRAINTS = {
     }
 }
 
+_safety_scanner = SafetyScanner(SAFETY_CONSTRAINTS)
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # NEWTON AGENT
@@ -268,10 +272,6 @@ class NewtonAgent:
         Check text against safety constraints.
         Returns (passed, failed) constraint names.
         """
-        passed = []
-        failed = []
-        text_lower = text.lower()
-        
         constraint_map = {
             "harm": self.config.enable_harm_filter,
             "medical": self.config.enable_medical_filter,
@@ -279,23 +279,9 @@ class NewtonAgent:
             "security": self.config.enable_security_filter,
             "privacy": True,  # Always on
         }
-        
-        for constraint_id, constraint_data in SAFETY_CONSTRAINTS.items():
-            if not constraint_map.get(constraint_id, True):
-                continue
-                
-            violated = False
-            for pattern in constraint_data["patterns"]:
-                if re.search(pattern, text_lower):
-                    violated = True
-                    break
-            
-            if violated:
-                failed.append(constraint_id)
-            else:
-                passed.append(constraint_id)
-        
-        return passed, failed
+        enabled = [c for c in SAFETY_CONSTRAINTS if constraint_map.get(c, True)]
+
+        return _safety_scanner.check(text, enabled)
     
     def _extract_claims(self, text: str) -> List[str]:
         """Extract factual claims from text for grounding."""
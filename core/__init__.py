@@ -24,6 +24,9 @@ from .forge import Forge, ForgeConfig, get_forge
 # Alias for legacy callers
 VerificationEngine = Forge
 
+# ─── Safety Scanner (Prefiltered Content Safety) ──────────────────────────────
+from .safety_scanner import SafetyScanner
+
 # ─── Vault (AES-256-GCM Encrypted Storage) ────────────────────────────────────
 from .vault import Vault, VaultConfig, get_vault
 
@@ -92,6 +95,8 @@ __all__ = [
     "ForgeConfig",
     "get_forge",
     "VerificationEngine",
+    # Safety Scanner
+    "SafetyScanner",
     # Vault
     "Vault",
     "VaultConfig",
@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════════════
+NEWTON CORE BENCHMARK
+Throughput & Latency Testing for the Core Engine
+
+Usage:
+    python -m core.benchmark            # run every suite
+    python -m core.benchmark ledger     # run selected suites
+    python -m core.benchmark cdl batch aggregation safety qap vault
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import re
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+import timeit
+from typing import Callable, Dict, List
+
+from core.cdl import AggregationState, CDLEvaluator, CDLParser
+from core.forge import SAFETY_PATTERNS, Forge, ForgeConfig
+from core.ledger import Ledger, LedgerConfig
+from core.qap import QAPBuilder, compile_to_qap
+from core.safety_scanner import SafetyScanner
+from core.vault import Vault, VaultConfig
+
+
+def _header(title: str):
+    print(f"\n{'═' * 70}")
+    print(f"  {title}")
+    print(f"{'═' * 70}")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LEDGER APPEND THROUGHPUT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+def _ledger_append_throughput(
+    writers: int, appends_per_writer: int, **config
+) -> Dict[str, float]:
+    """Append from `writers` threads at once; returns throughput and latency."""
+    storage = tempfile.mkdtemp(prefix="newton_ledger_bench_")
+    ledger = Ledger(LedgerConfig(storage_path=storage, **config))
+    barrier = threading.Barrier(writers + 1)
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def writer(worker: int):
+        local = []
+        barrier.wait()
+        for i in range(appends_per_writer):
+            start = time.perf_counter()
+            entry = ledger.append(
+                operation="verify",
+                payload={"worker": worker, "i": i},
+                result="pass",
+                metadata={"elapsed_us": 42},
+            )
+            ledger.wait_durable(entry.index)
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=writer, args=(w,)) for w in range(writers)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    ledger.close()
+    shutil.rmtree(storage, ignore_errors=True)
+
+    total = writers * appends_per_writer
+    latencies.sort()
+    return {
+        "appends_per_sec": total / elapsed,
+        "p50_us": statistics.median(latencies) * 1e6,
+        "p99_us": latencies[int(len(latencies) * 0.99) - 1] * 1e6,
+    }
+
+
+def run_ledger_benchmark(total_appends: int = 6400, fsync_policy: str = "always") -> Dict:
+    """
+    Compare direct appends with group commit at 1, 8 and 64 writers.
+
+    Every append waits for durability, so with fsync_policy="always" the
+    direct path pays one fsync per entry while group commit shares one
+    fsync across each batch.
+    """
+    _header(f"LEDGER APPEND THROUGHPUT (fsync_policy={fsync_policy!r})")
+    print(f"  {'writers':>7}  {'mode':<13} {'appends/s':>11} {'p50 µs':>9} {'p99 µs':>9}")
+
+    results = {}
+    for writers in (1, 8, 64):
+        per_writer = max(1, total_appends // writers)
+        for mode, group_commit in (("direct", False), ("group_commit", True)):
+            stats = _ledger_append_throughput(
+                writers, per_writer, group_commit=group_commit, fsync_policy=fsync_policy
+            )
+            results[(writers, mode)] = stats
+            print(
+                f"  {writers:>7}  {mode:<13} {stats['appends_per_sec']:>11,.0f}"
+                f" {stats['p50_us']:>9.0f} {stats['p99_us']:>9.0f}"
+            )
+
+    return results
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CDL EVALUATION: INTERPRETER VS COMPILED PLANS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+CDL_CASES = {
+    "atomic lt": (
+        {"field": "amount", "operator": "lt", "value": 1000},
+        {"amount": 500},
+    ),
+    "nested path": (
+        {"field": "account.owner.age", "operator": "ge", "value": 18},
+        {"account": {"owner": {"age": 30}}},
+    ),
+    "matches": (
+        {"field": "email", "operator": "matches", "value": r"^[\w.]+@[\w.]+$"},
+        {"email": "ada@example.com"},
+    ),
+    "ratio": (
+        {"f_field": "debt", "g_field": "equity", "operator": "ratio_le", "threshold": 3.0},
+        {"debt": 2000, "equity": 1000},
+    ),
+    "and x8": (
+        {
+            "logic": "and",
+            "constraints": [
+                {"field": f"f{i}", "operator": "lt", "value": 100} for i in range(8)
+            ],
+        },
+        {f"f{i}": i for i in range(8)},
+    ),
+    "or x8 (first passes)": (
+        {
+            "logic": "or",
+            "constraints": [
+                {"field": f"f{i}", "operator": "lt", "value": 100} for i in range(8)
+            ],
+        },
+        {f"f{i}": i for i in range(8)},
+    ),
+    "conditional": (
+        {
+            "if": {"field": "amount", "operator": "gt", "value": 10000},
+            "then": {"field": "manager_approved", "operator": "eq", "value": True},
+            "else": {"field": "auto_approved", "operator": "eq", "value": True},
+        },
+        {"amount": 15000, "manager_approved": True},
+    ),
+}
+
+
+def run_cdl_benchmark(number: int = 20000) -> Dict:
+    """Time CDLEvaluator.evaluate against a compiled plan of the same constraint."""
+    _header(f"CDL EVALUATION: INTERPRETER VS COMPILED PLAN ({number:,} evals)")
+    print(f"  {'case':<22} {'evaluate µs':>12} {'plan µs':>9} {'speedup':>8}")
+
+    parser = CDLParser()
+    evaluator = CDLEvaluator()
+    results = {}
+    for name, (definition, obj) in CDL_CASES.items():
+        constraint = parser.parse(definition)
+        plan = evaluator.compile(constraint)
+        interpreted = timeit.timeit(lambda: evaluator.evaluate(constraint, obj), number=number)
+        compiled = timeit.timeit(lambda: plan(obj), number=number)
+        results[name] = {
+            "evaluate_us": interpreted / number * 1e6,
+            "plan_us": compiled / number * 1e6,
+        }
+        print(
+            f"  {name:<22} {results[name]['evaluate_us']:>12.2f}"
+            f" {results[name]['plan_us']:>9.2f} {interpreted / compiled:>7.1f}x"
+        )
+
+    return results
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BATCH VERIFICATION: PER-OBJECT VS COLUMNAR
+# ═══════════════════════════════════════════════════════════════════════════════
+
+BATCH_CONSTRAINTS = [
+    {"field": "score", "operator": "ge", "value": 0},
+    {"field": "score", "operator": "le", "value": 100},
+    {"field": "grade_level", "operator": "in", "value": [9, 10, 11, 12]},
+    {"f_field": "absences", "g_field": "school_days", "operator": "ratio_lt", "threshold": 0.1},
+    {"field": "student_id", "operator": "exists"},
+]
+
+
+def run_batch_benchmark(records: int = 20000) -> Dict:
+    """Verify a gradebook-style import with verify() per record vs verify_batch()."""
+    _header(f"BATCH VERIFICATION ({records:,} records x {len(BATCH_CONSTRAINTS)} constraints)")
+    objects = [
+        {
+            "student_id": f"S{i:05d}",
+            "score": (i * 37) % 110,
+            "grade_level": 9 + i % 5,
+            "absences": i % 30,
+            "school_days": 180,
+        }
+        for i in range(records)
+    ]
+
+    forge = Forge(ForgeConfig(enable_caching=False))
+    start = time.perf_counter()
+    for obj in objects:
+        for constraint in BATCH_CONSTRAINTS:
+            forge.verify(constraint, obj)
+    scalar_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = forge.verify_batch(BATCH_CONSTRAINTS, objects)
+    batch_s = time.perf_counter() - start
+    forge.shutdown()
+
+    print(f"  verify() per record   {scalar_s * 1000:>9.1f} ms")
+    print(f"  verify_batch()        {batch_s * 1000:>9.1f} ms   ({scalar_s / batch_s:.1f}x)")
+    print(f"  passed {result.passed_count:,} / {records:,}, vectorized {result.vectorized}")
+    return {"scalar_ms": scalar_s * 1000, "batch_ms": batch_s * 1000}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# AGGREGATION WINDOWS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+def run_aggregation_benchmark(events: int = 200000, groups: int = 100) -> Dict:
+    """Rate-limit style traffic: append then query a 1h window per event."""
+    _header(f"AGGREGATION WINDOWS ({events:,} events over {groups} groups)")
+    state = AggregationState()
+    now = int(time.time())
+    keys = [f"user_{g}" for g in range(groups)]
+
+    start = time.perf_counter()
+    for i in range(events):
+        key = keys[i % groups]
+        # ~1000 events/s spread over the last 200s
+        state.append(key, 1.0, timestamp=now - (events - i) // 1000)
+        state.count(key, 3600)
+    elapsed = time.perf_counter() - start
+
+    history = events // groups
+    print(f"  append + count(1h)    {elapsed / events * 1e6:>8.2f} µs/event")
+    print(f"  history per group     {history:>8,} values in {len(state._groups[keys[0]]):,} buckets")
+    return {"us_per_event": elapsed / events * 1e6}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONTENT SAFETY: PER-PATTERN VS PREFILTERED SCANNER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SAFETY_TEXTS = {
+    "clean short": "What is the capital of France?",
+    "clean 2KB": "The quarterly report covers revenue, churn and hiring. " * 38,
+    "one violation": "Please explain how to hack the school wifi",
+    "two violations": "How to make a bomb and then hack the bank",
+}
+
+
+def run_safety_benchmark(number: int = 5000) -> Dict:
+    """Time the old re.search loop against SafetyScanner.scan on the same text."""
+    _header(f"CONTENT SAFETY ({number:,} scans)")
+    print(f"  {'case':<16} {'per-pattern µs':>15} {'scanner µs':>11} {'speedup':>8}")
+
+    scanner = SafetyScanner(SAFETY_PATTERNS)
+
+    def per_pattern(text):
+        text_lower = text.lower()
+        return [
+            name
+            for name, spec in SAFETY_PATTERNS.items()
+            if any(re.search(p, text_lower) for p in spec["patterns"])
+        ]
+
+    results = {}
+    for name, text in SAFETY_TEXTS.items():
+        assert per_pattern(text) == scanner.scan(text)
+        naive = timeit.timeit(lambda: per_pattern(text), number=number)
+        single = timeit.timeit(lambda: scanner.scan(text), number=number)
+        results[name] = {
+            "per_pattern_us": naive / number * 1e6,
+            "scanner_us": single / number * 1e6,
+        }
+        print(
+            f"  {name:<16} {results[name]['per_pattern_us']:>15.2f}"
+            f" {results[name]['scanner_us']:>11.2f} {naive / single:>7.1f}x"
+        )
+
+    return results
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# QAP CONSTRUCTION: CONSECUTIVE-INTEGER VS ROOTS-OF-UNITY DOMAIN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+def run_qap_benchmark(rule_counts=(2, 10, 20, 40, 80)) -> Dict:
+    """Time QAPBuilder.build over both evaluation domains as circuits grow."""
+    _header("QAP CONSTRUCTION (BN254)")
+    print(f"  {'rules':>5} {'constraints':>11} {'witness':>8} {'range ms':>9} {'ntt ms':>9}")
+
+    results = {}
+    for rules in rule_counts:
+        source = "\n".join(
+            f'when x{i} == "a{i}" and y{i % 7} == "b" finfr' for i in range(rules)
+        )
+        compiled = compile_to_qap(source, domain="ntt")
+        constraints = compiled.r1cs
+        witness = compiled.symbols.next_witness_idx
+        timings = {}
+        for domain in QAPBuilder.DOMAINS:
+            start = time.perf_counter()
+            QAPBuilder(domain=domain).build(constraints, witness)
+            timings[domain] = (time.perf_counter() - start) * 1000
+        results[rules] = {"constraints": len(constraints), "witness": witness, **timings}
+        print(
+            f"  {rules:>5} {len(constraints):>11,} {witness:>8,}"
+            f" {timings['range']:>9.1f} {timings['ntt']:>9.1f}"
+        )
+
+    return results
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VAULT KEY CACHE & BATCHES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+def run_vault_benchmark(
+    requests: int = 200, hit_ratios=(0.0, 0.5, 0.9, 1.0), entries: int = 2000
+) -> Dict:
+    """
+    Per-request unlock -> retrieve -> lock at several key-cache hit ratios
+    (a miss re-derives the 100k-iteration PBKDF2 key), then single-entry
+    store/retrieve against store_many/retrieve_many.
+    """
+    _header("VAULT REQUESTS BY KEY-CACHE HIT RATIO")
+    print(f"  {'hit ratio':>9} {'requests/s':>11} {'p50 µs':>9} {'p99 µs':>9}")
+
+    storage = tempfile.mkdtemp(prefix="newton_vault_bench_")
+    try:
+        vault = Vault(VaultConfig(storage_path=storage))
+        owner_id = vault.register_identity("bench@example.com", "bench-pass")
+        salt = vault._keys[owner_id][1]
+        entry_ids = vault.store_many(owner_id, [{"n": i} for i in range(64)])
+        vault.lock(owner_id)
+
+        results = {}
+        for ratio in hit_ratios:
+            latencies = []
+            for i in range(requests):
+                # Spread the misses evenly: exactly (1 - ratio) of requests
+                if int((i + 1) * (1 - ratio)) > int(i * (1 - ratio)):
+                    vault.key_cache.forget(owner_id)
+                start = time.perf_counter()
+                vault.unlock("bench@example.com", "bench-pass", salt)
+                vault.retrieve(owner_id, entry_ids[i % len(entry_ids)])
+                vault.lock(owner_id)
+                latencies.append(time.perf_counter() - start)
+            latencies.sort()
+            stats = {
+                "requests_per_sec": requests / sum(latencies),
+                "p50_us": statistics.median(latencies) * 1e6,
+                "p99_us": latencies[int(len(latencies) * 0.99) - 1] * 1e6,
+            }
+            results[ratio] = stats
+            print(
+                f"  {ratio:>9.2f} {stats['requests_per_sec']:>11,.0f}"
+                f" {stats['p50_us']:>9.0f} {stats['p99_us']:>9.0f}"
+            )
+
+        _header(f"VAULT BATCHES ({entries:,} entries)")
+        vault.unlock("bench@example.com", "bench-pass", salt)
+        items = [{"n": i, "pad": "x" * 200} for i in range(entries)]
+        timings = {}
+
+        start = time.perf_counter()
+        ids = [vault.store(owner_id, item) for item in items]
+        timings["store"] = time.perf_counter() - start
+        start = time.perf_counter()
+        vault.store_many(owner_id, items)
+        timings["store_many"] = time.perf_counter() - start
+        start = time.perf_counter()
+        [vault.retrieve(owner_id, entry_id) for entry_id in ids]
+        timings["retrieve"] = time.perf_counter() - start
+        start = time.perf_counter()
+        vault.retrieve_many(owner_id, ids)
+        timings["retrieve_many"] = time.perf_counter() - start
+
+        for name, seconds in timings.items():
+            print(f"  {name:<14} {seconds * 1000:>9.1f} ms  {entries / seconds:>11,.0f} entries/s")
+        results["batches"] = timings
+        vault.close()
+    finally:
+        shutil.rmtree(storage, ignore_errors=True)
+
+    return results
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SUITES: Dict[str, Callable[[], Dict]] = {
+    "ledger": run_ledger_benchmark,
+    "cdl": run_cdl_benchmark,
+    "batch": run_batch_benchmark,
+    "aggregation": run_aggregation_benchmark,
+    "safety": run_safety_benchmark,
+    "qap": run_qap_benchmark,
+    "vault": run_vault_benchmark,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Newton core benchmarks")
+    # No choices=: argparse checks an empty nargs="*" list against them
+    parser.add_argument(
+        "suites", nargs="*", help=f"suites to run (default: all of {', '.join(SUITES)})"
+    )
+    args = parser.parse_args()
+    unknown = sorted(set(args.suites) - set(SUITES))
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(unknown)}")
+
+    for name in args.suites or SUITES:
+        SUITES[name]()
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,8 @@ import re
 import hashlib
 import time
 
+from .safety_scanner import SafetyScanner
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CARTRIDGE TYPES
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -115,6 +117,8 @@ SAFETY_PATTERNS = {
     },
 }
 
+_SAFETY_SCANNER = SafetyScanner(SAFETY_PATTERNS)
+
 # Visual-specific constraints
 VISUAL_CONSTRAINTS = {
     "dimensions": {"min": 1, "max_width": 4096, "max_height": 4096},
@@ -299,19 +303,11 @@ class ConstraintChecker:
         text: str, categories: Optional[List[str]] = None
     ) -> ConstraintResult:
         """Check text against safety patterns."""
-        text_lower = text.lower()
         categories = categories or list(SAFETY_PATTERNS.keys())
-        violations = []
-
-        for category in categories:
-            if category not in SAFETY_PATTERNS:
-                continue
-
-            constraint = SAFETY_PATTERNS[category]
-            for pattern in constraint["patterns"]:
-                if re.search(pattern, text_lower):
-                    violations.append(f"{constraint['name']}: {pattern}")
-                    break
+        violations = [
+            f"{SAFETY_PATTERNS[category]['name']}: {pattern}"
+            for category, pattern in _SAFETY_SCANNER.violations(text, categories)
+        ]
 
         return ConstraintResult(
             passed=len(violations) == 0,
@@ -32,10 +32,16 @@ See: docs/NEWTON_CLP_SYSTEM_DEFINITION.md for full historical context.
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
+from bisect import bisect_left
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Union
 from enum import Enum
+import json
+import os
 import re
+import threading
 import time
 import hashlib
 
@@ -268,50 +274,384 @@ class EvaluationResult:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+def _neumaier(total: float, compensation: float, value: float) -> tuple:
+    """Add value to a compensated (total, compensation) pair."""
+    t = total + value
+    if abs(total) >= abs(value):
+        compensation += (total - t) + value
+    else:
+        compensation += (value - t) + total
+    return t, compensation
+
+
+class _GroupWindow:
+    """
+    Per-second buckets for one aggregation group.
+
+    Bucket timestamps sit in a list with running (prefix) counts and
+    Neumaier-compensated running sums, so a window query is one bisect and
+    a subtraction, and counts never touch the sums. Expired buckets are
+    skipped by advancing `head` and compacted once they make up half the
+    list; compaction rebuilds the running sums from the per-bucket totals,
+    so rounding error does not build up over the life of a group.
+    """
+
+    __slots__ = ("ts", "counts", "sums", "run", "comp", "head")
+
+    def __init__(self):
+        self.ts: List[int] = []
+        self.counts: List[int] = []  # Running count through each bucket
+        self.sums: List[float] = []  # Total of each bucket
+        self.run: List[float] = []  # Running sum through each bucket
+        self.comp: List[float] = []  # Compensation of each running sum
+        self.head = 0  # First live bucket
+
+    def _prefix(self, i: int) -> tuple:
+        """Running (count, sum, compensation) of every bucket before index i."""
+        if i == 0:
+            return 0, 0.0, 0.0
+        return self.counts[i - 1], self.run[i - 1], self.comp[i - 1]
+
+    def add(self, ts: int, value: float):
+        if self.ts and ts < self.ts[-1]:
+            self._insert(ts, value)
+            return
+        if self.ts and ts == self.ts[-1]:
+            self.counts[-1] += 1
+            self.sums[-1] += value
+            self.run[-1], self.comp[-1] = _neumaier(self.run[-1], self.comp[-1], value)
+            return
+        count, total, comp = self._prefix(len(self.ts))
+        total, comp = _neumaier(total, comp, value)
+        self.ts.append(ts)
+        self.counts.append(count + 1)
+        self.sums.append(value)
+        self.run.append(total)
+        self.comp.append(comp)
+
+    def _insert(self, ts: int, value: float):
+        """Out-of-order append: O(n) from the insertion point onwards."""
+        i = bisect_left(self.ts, ts, self.head)
+        if i == len(self.ts) or self.ts[i] != ts:
+            count, total, comp = self._prefix(i)
+            self.ts.insert(i, ts)
+            self.counts.insert(i, count)
+            self.sums.insert(i, 0.0)
+            self.run.insert(i, total)
+            self.comp.insert(i, comp)
+        self.sums[i] += value
+        for j in range(i, len(self.ts)):
+            self.counts[j] += 1
+            self.run[j], self.comp[j] = _neumaier(self.run[j], self.comp[j], value)
+
+    def expire(self, cutoff: int):
+        """Drop buckets older than cutoff."""
+        head = self.head = max(self.head, bisect_left(self.ts, cutoff, self.head))
+        if head and head * 2 >= len(self.ts):
+            base = self.counts[head - 1]
+            del self.ts[:head]
+            del self.counts[:head]
+            del self.sums[:head]
+            self.head = 0
+            # Re-base the running totals on the first live bucket
+            total = comp = 0.0
+            for j, bucket_sum in enumerate(self.sums):
+                self.counts[j] -= base
+                total, comp = _neumaier(total, comp, bucket_sum)
+                self.run[j] = total
+                self.comp[j] = comp
+            del self.run[len(self.sums):]
+            del self.comp[len(self.sums):]
+
+    def count(self, cutoff: int) -> int:
+        """Count of values with timestamp >= cutoff."""
+        if not self.ts:
+            return 0
+        i = bisect_left(self.ts, cutoff, self.head)
+        return self.counts[-1] - (self.counts[i - 1] if i else 0)
+
+    def total(self, cutoff: int) -> float:
+        """Sum of values with timestamp >= cutoff."""
+        if not self.ts:
+            return 0.0
+        _, total, comp = self._prefix(bisect_left(self.ts, cutoff, self.head))
+        return (self.run[-1] - total) + (self.comp[-1] - comp)
+
+    def mean(self, cutoff: int) -> float:
+        """Average of values with timestamp >= cutoff."""
+        count = self.count(cutoff)
+        return self.total(cutoff) / count if count else 0.0
+
+    def buckets(self, cutoff: Optional[int] = None) -> List[tuple]:
+        """(ts, count, sum) for each live bucket with timestamp >= cutoff."""
+        i = self.head if cutoff is None else bisect_left(self.ts, cutoff, self.head)
+        count = self._prefix(i)[0]
+        out = []
+        for j in range(i, len(self.ts)):
+            out.append((self.ts[j], self.counts[j] - count, self.sums[j]))
+            count = self.counts[j]
+        return out
+
+    def __len__(self) -> int:
+        return len(self.ts) - self.head
+
+
 class AggregationState:
     """
     Maintains state for aggregation constraints.
     Windowed, grouped, append-only.
+
+    Values are bucketed per second with running sums, so appends are
+    amortized O(1) and sum/count/avg over any window cost one bisect.
+    Buckets older than max_age_seconds (or the largest window queried so
+    far, if longer) expire automatically, and the least recently used
+    groups are dropped beyond max_groups.
     """
 
-    def __init__(self):
-        # Structure: {group_key: [(timestamp, value), ...]}
-        self._data: Dict[str, List[tuple]] = {}
+    SNAPSHOT_VERSION = 1
+
+    def __init__(self, max_age_seconds: int = 604800, max_groups: int = 10000):
+        self.max_age_seconds = max_age_seconds
+        self.max_groups = max_groups
+        self._groups: "OrderedDict[str, _GroupWindow]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._horizon = 0  # Largest window queried, in seconds
+        self.evicted_groups = 0
+
+    def _group(self, group_key: str, create: bool) -> Optional[_GroupWindow]:
+        group = self._groups.get(group_key)
+        if group is not None:
+            self._groups.move_to_end(group_key)
+        elif create:
+            group = self._groups[group_key] = _GroupWindow()
+            while len(self._groups) > self.max_groups:
+                self._groups.popitem(last=False)
+                self.evicted_groups += 1
+        return group
+
+    def _expire(self, group: _GroupWindow, now: int):
+        group.expire(now - max(self.max_age_seconds, self._horizon))
 
     def append(self, group_key: str, value: float, timestamp: Optional[int] = None):
         """Append a value to the aggregation state."""
         ts = timestamp or int(time.time())
-        if group_key not in self._data:
-            self._data[group_key] = []
-        self._data[group_key].append((ts, value))
+        with self._lock:
+            group = self._group(group_key, create=True)
+            group.add(ts, value)
+            self._expire(group, int(time.time()))
+
+    def _window(self, group_key: str, window_seconds: int, query: Callable, empty: Any):
+        """Run a _GroupWindow query over the last window_seconds."""
+        now = int(time.time())
+        with self._lock:
+            if window_seconds > self._horizon:
+                self._horizon = window_seconds
+            group = self._group(group_key, create=False)
+            if group is None:
+                return empty
+            self._expire(group, now)
+            return query(group, now - window_seconds)
 
     def get_window(self, group_key: str, window_seconds: int) -> List[float]:
-        """Get values within the time window."""
-        if group_key not in self._data:
-            return []
+        """
+        Get values within the time window.
 
+        Values appended within the same second share a bucket and come back
+        as their sum.
+        """
         now = int(time.time())
-        cutoff = now - window_seconds
-        return [v for ts, v in self._data[group_key] if ts >= cutoff]
+        with self._lock:
+            group = self._group(group_key, create=False)
+            if group is None:
+                return []
+            return [total for _, _, total in group.buckets(now - window_seconds)]
 
     def sum(self, group_key: str, window_seconds: int) -> float:
         """Sum of values in window."""
-        return sum(self.get_window(group_key, window_seconds))
+        return self._window(group_key, window_seconds, _GroupWindow.total, 0.0)
 
     def count(self, group_key: str, window_seconds: int) -> int:
         """Count of values in window."""
-        return len(self.get_window(group_key, window_seconds))
+        return self._window(group_key, window_seconds, _GroupWindow.count, 0)
 
     def avg(self, group_key: str, window_seconds: int) -> float:
         """Average of values in window."""
-        values = self.get_window(group_key, window_seconds)
-        return sum(values) / len(values) if values else 0.0
+        return self._window(group_key, window_seconds, _GroupWindow.mean, 0.0)
 
     def prune(self, max_age_seconds: int = 604800):
         """Remove entries older than max_age (default: 1 week)."""
         cutoff = int(time.time()) - max_age_seconds
-        for key in self._data:
-            self._data[key] = [(ts, v) for ts, v in self._data[key] if ts >= cutoff]
+        with self._lock:
+            for key in list(self._groups):
+                group = self._groups[key]
+                group.expire(cutoff)
+                if not len(group):
+                    del self._groups[key]
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # SNAPSHOT / RESTORE
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serializable copy of every live bucket."""
+        with self._lock:
+            groups = {
+                key: [list(b) for b in group.buckets()]
+                for key, group in self._groups.items()
+            }
+            horizon = self._horizon
+        return {
+            "version": self.SNAPSHOT_VERSION,
+            "horizon": horizon,
+            "groups": groups,
+        }
+
+    def restore(self, snapshot: Dict[str, Any]):
+        """Replace the state with a snapshot() taken earlier."""
+        if snapshot.get("version") != self.SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported aggregation snapshot version: {snapshot.get('version')}"
+            )
+        groups: "OrderedDict[str, _GroupWindow]" = OrderedDict()
+        for key, buckets in snapshot["groups"].items():
+            group = _GroupWindow()
+            count, total, comp = 0, 0.0, 0.0
+            for ts, bucket_count, bucket_sum in buckets:
+                count += bucket_count
+                total, comp = _neumaier(total, comp, bucket_sum)
+                group.ts.append(int(ts))
+                group.counts.append(count)
+                group.sums.append(bucket_sum)
+                group.run.append(total)
+                group.comp.append(comp)
+            groups[key] = group
+        now = int(time.time())
+        with self._lock:
+            self._groups = groups
+            self._horizon = max(self._horizon, int(snapshot.get("horizon", 0)))
+            for group in groups.values():
+                self._expire(group, now)
+            while len(self._groups) > self.max_groups:
+                self._groups.popitem(last=False)
+                self.evicted_groups += 1
+
+    def save(self, path: str):
+        """Write a snapshot to path atomically."""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self.snapshot(), f)
+        os.replace(tmp, target)
+
+    def load(self, path: str) -> bool:
+        """Restore from a snapshot file; False if it is missing or unreadable."""
+        try:
+            with open(path) as f:
+                snapshot = json.load(f)
+            self.restore(snapshot)
+            return True
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PLAN HELPERS - Shared by CDLEvaluator.compile
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_TEMPORAL_OPERATORS = frozenset({Operator.WITHIN, Operator.AFTER, Operator.BEFORE})
+_AGGREGATION_OPERATORS = frozenset(
+    op for op in Operator if op.value.startswith(("sum_", "count_", "avg_"))
+)
+_RATIO_OPERATORS = frozenset(op for op in Operator if op.value.startswith("ratio_"))
+
+_RATIO_COMPARATORS: Dict[Operator, Callable[[float, Any, float], bool]] = {
+    Operator.RATIO_UNDEFINED: lambda r, t, eps: False,
+    Operator.RATIO_LT: lambda r, t, eps: r < t,
+    Operator.RATIO_LE: lambda r, t, eps: r <= t,
+    Operator.RATIO_GT: lambda r, t, eps: r > t,
+    Operator.RATIO_GE: lambda r, t, eps: r >= t,
+    Operator.RATIO_EQ: lambda r, t, eps: abs(r - t) < eps,
+    Operator.RATIO_NE: lambda r, t, eps: abs(r - t) >= eps,
+}
+
+
+def _field_getter(field_path: str) -> Callable[[Any], Any]:
+    """Resolve a dotted field path once; same lookups as _get_field_value."""
+    parts = tuple(field_path.split("."))
+
+    if len(parts) == 1:
+        key = parts[0]
+
+        def get_one(obj):
+            if isinstance(obj, dict) and key in obj:
+                return obj[key]
+            return None
+
+        return get_one
+
+    def get_path(obj):
+        value = obj
+        for part in parts:
+            if isinstance(value, dict) and part in value:
+                value = value[part]
+            else:
+                return None
+        return value
+
+    return get_path
+
+
+def _ratio_plan(
+    cid: str,
+    f_get: Callable,
+    g_get: Callable,
+    f_name: str,
+    g_name: str,
+    operator: "Operator",
+    threshold: Any,
+    epsilon: float,
+    message: Optional[str],
+    undefined_message: str,
+) -> Callable:
+    """Compiled f/g check shared by RatioConstraint and ratio_* atomics."""
+    compare = _RATIO_COMPARATORS.get(operator)
+    is_undefined_check = operator == Operator.RATIO_UNDEFINED
+
+    def run(obj):
+        f_value = f_get(obj)
+        g_value = g_get(obj)
+        if f_value is None:
+            return False, message or f"Numerator field '{f_name}' not found", cid
+        if g_value is None:
+            return False, message or f"Denominator field '{g_name}' not found", cid
+        try:
+            f = float(f_value)
+            g = float(g_value)
+        except (TypeError, ValueError) as e:
+            return False, message or f"Cannot convert to numeric: {e}", cid
+
+        if abs(g) < epsilon:
+            if is_undefined_check:
+                return True, None, cid
+            return False, message or undefined_message, cid
+
+        ratio = f / g
+        if compare is None:
+            return False, f"Unknown ratio operator: {operator}", cid
+        if compare(ratio, threshold, epsilon):
+            return True, None, cid
+        return (
+            False,
+            message
+            or f"finfr: {f_name}/{g_name} = {ratio:.4f} violates {operator.value} {threshold}",
+            cid,
+        )
+
+    return run
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -763,6 +1103,202 @@ class CDLEvaluator:
 
         return EvaluationResult(passed=passed, constraint_id=c.id, message=message)
 
+    # ─────────────────────────────────────────────────────────────────────────
+    # COMPILED PLANS
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def compile(self, constraint: Constraint) -> Callable[[Dict[str, Any]], EvaluationResult]:
+        """
+        Compile a constraint tree into a reusable closure plan.
+
+        Operator dispatch, dotted field paths and MATCHES regexes are resolved
+        once here instead of on every evaluation, and sub-constraints pass
+        (passed, message, constraint_id) tuples instead of EvaluationResults.
+        The plan returns exactly what evaluate() would. OR and NOT stop at the
+        first passing child unless the tree holds aggregations, whose windows
+        must still see every value; AND keeps going after a failure because
+        its message joins every failing child's message.
+
+        Plans snapshot the constraint: recompile after mutating it.
+        """
+        run, _ = self._compile_node(constraint)
+
+        def plan(obj: Dict[str, Any]) -> EvaluationResult:
+            self._evaluation_count += 1
+            passed, message, constraint_id = run(obj)
+            return EvaluationResult(
+                passed=passed, constraint_id=constraint_id, message=message
+            )
+
+        return plan
+
+    def _compile_node(self, constraint: Constraint) -> tuple:
+        """Compile one node; returns (run, stateful)."""
+        if isinstance(constraint, AtomicConstraint):
+            return self._compile_atomic(constraint)
+        elif isinstance(constraint, RatioConstraint):
+            return self._compile_ratio(constraint), False
+        elif isinstance(constraint, ConditionalConstraint):
+            return self._compile_conditional(constraint)
+        elif isinstance(constraint, CompositeConstraint):
+            return self._compile_composite(constraint)
+
+        message = f"Unknown constraint type: {type(constraint)}"
+        return (lambda obj: (False, message, "UNKNOWN")), False
+
+    def _compile_atomic(self, c: AtomicConstraint) -> tuple:
+        cid = c.id
+        get = _field_getter(c.field)
+        op = c.operator
+
+        if op in _TEMPORAL_OPERATORS or op in _AGGREGATION_OPERATORS:
+            # Clock- and window-dependent: reuse the interpreter with the
+            # accessor resolved.
+            method = (
+                self._evaluate_temporal
+                if op in _TEMPORAL_OPERATORS
+                else self._evaluate_aggregation
+            )
+
+            def run_delegated(obj):
+                r = method(c, obj, get(obj))
+                return r.passed, r.message, r.constraint_id
+
+            return run_delegated, op in _AGGREGATION_OPERATORS
+
+        if op in _RATIO_OPERATORS:
+            if c.denominator is None:
+                missing = "Ratio operator requires 'denominator' field to be specified"
+                return (lambda obj: (False, missing, cid)), False
+            return (
+                _ratio_plan(
+                    cid,
+                    get,
+                    _field_getter(c.denominator),
+                    c.field,
+                    c.denominator,
+                    op,
+                    c.value,
+                    c.epsilon,
+                    c.message,
+                    f"finfr: ratio {c.field}/{c.denominator} is undefined (g ≈ 0)",
+                ),
+                False,
+            )
+
+        compare = self._operator_map.get(op)
+        if compare is None:
+            unknown = f"Unknown operator: {op}"
+            return (lambda obj: (False, unknown, cid)), False
+
+        value = c.value
+        message = c.message
+        if op == Operator.MATCHES:
+            try:
+                pattern = re.compile(value)
+            except Exception:
+                pass  # Leave the error to surface per evaluation, as evaluate() does
+            else:
+                compare = lambda a, b: bool(pattern.search(str(a)))
+
+        def run_atomic(obj):
+            try:
+                passed = compare(get(obj), value)
+            except Exception as e:
+                return False, f"Evaluation error: {str(e)}", cid
+            return passed, (message if not passed else None), cid
+
+        return run_atomic, False
+
+    def _compile_ratio(self, c: RatioConstraint) -> Callable:
+        return _ratio_plan(
+            c.id,
+            _field_getter(c.f_field),
+            _field_getter(c.g_field),
+            c.f_field,
+            c.g_field,
+            c.operator,
+            c.threshold,
+            c.epsilon,
+            c.message,
+            f"finfr: ratio {c.f_field}/{c.g_field} is undefined (denominator ≈ 0)",
+        )
+
+    def _compile_conditional(self, c: ConditionalConstraint) -> tuple:
+        cid = c.id
+        condition, cond_stateful = self._compile_node(c.condition)
+        then, then_stateful = self._compile_node(c.then_constraint)
+        stateful = cond_stateful or then_stateful
+
+        if c.else_constraint is None:
+
+            def run_if(obj):
+                if condition(obj)[0]:
+                    return then(obj)
+                return True, None, cid
+
+            return run_if, stateful
+
+        otherwise, else_stateful = self._compile_node(c.else_constraint)
+
+        def run_if_else(obj):
+            if condition(obj)[0]:
+                return then(obj)
+            return otherwise(obj)
+
+        return run_if_else, stateful or else_stateful
+
+    def _compile_composite(self, c: CompositeConstraint) -> tuple:
+        cid = c.id
+        compiled = [self._compile_node(sub) for sub in c.constraints]
+        children = tuple(run for run, _ in compiled)
+        stateful = any(flag for _, flag in compiled)
+        logic = c.logic.lower()
+
+        if logic == "and":
+
+            def run_and(obj):
+                failed = None
+                for child in children:
+                    passed, message, _ = child(obj)
+                    if not passed:
+                        if failed is None:
+                            failed = []
+                        if message:
+                            failed.append(message)
+                if failed is None:
+                    return True, None, cid
+                return False, "; ".join(failed), cid
+
+            return run_and, stateful
+
+        if logic in ("or", "not"):
+            if stateful:
+                any_passed = lambda obj: any([child(obj)[0] for child in children])
+            else:
+                any_passed = lambda obj: any(child(obj)[0] for child in children)
+
+            if logic == "or":
+                return (
+                    lambda obj: (True, None, cid)
+                    if any_passed(obj)
+                    else (False, "All constraints failed", cid)
+                ), stateful
+            return (
+                lambda obj: (False, "NOT condition not satisfied", cid)
+                if any_passed(obj)
+                else (True, None, cid)
+            ), stateful
+
+        unknown = f"Unknown logic: {c.logic}"
+
+        def run_unknown(obj):
+            for child in children:
+                child(obj)
+            return False, unknown, cid
+
+        return run_unknown, stateful
+
     @property
     def evaluation_count(self) -> int:
         return self._evaluation_count
@@ -31,16 +31,41 @@ See: docs/NEWTON_CLP_SYSTEM_DEFINITION.md for full historical context.
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
 import time
 import hashlib
+import sys
 import threading
 from concurrent.futures import ThreadPoolExecutor
 import re
 
-from .cdl import Constraint, CDLEvaluator, CDLParser
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+    _HAS_NUMPY = False
+
+from .cdl import (
+    _AGGREGATION_OPERATORS,
+    _RATIO_COMPARATORS,
+    _RATIO_OPERATORS,
+    _TEMPORAL_OPERATORS,
+    _field_getter,
+    AtomicConstraint,
+    CompositeConstraint,
+    ConditionalConstraint,
+    Constraint,
+    CDLEvaluator,
+    CDLParser,
+    Operator,
+    RatioConstraint,
+)
+from .safety_scanner import SafetyScanner
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # FORGE CONFIGURATION
@@ -56,6 +81,10 @@ class ForgeConfig:
     enable_metrics: bool = True  # Track performance metrics
     enable_caching: bool = True  # Cache repeated evaluations
     cache_ttl_seconds: int = 300  # Cache TTL
+    cache_max_entries: int = 10000  # LRU bound across all shards
+    cache_shards: int = 16  # Independent locks for concurrent verify()
+    plan_cache_size: int = 1024  # Compiled constraint plans kept (LRU)
+    aggregation_state_path: Optional[str] = None  # Persist sum_/count_/avg_ windows
     strict_mode: bool = True  # Fail on any error
 
 
@@ -139,6 +168,481 @@ class VerificationResult:
         }
 
 
+@dataclass
+class BatchVerificationResult:
+    """Result of verifying one constraint set against many objects."""
+
+    passed: List[bool]  # Per object: every constraint passed
+    constraint_ids: List[str]
+    failures: List[List[int]]  # Per constraint: indices of failing objects
+    vectorized: int = 0  # Constraints evaluated column-wise
+    elapsed_us: int = 0
+
+    @property
+    def passed_count(self) -> int:
+        return sum(self.passed)
+
+    def bitmap(self) -> bytes:
+        """Pass/fail bits packed LSB-first, one bit per object."""
+        out = bytearray((len(self.passed) + 7) // 8)
+        for i, ok in enumerate(self.passed):
+            if ok:
+                out[i >> 3] |= 1 << (i & 7)
+        return bytes(out)
+
+    def to_dict(self) -> Dict[str, Any]:
+        total = len(self.passed)
+        return {
+            "total": total,
+            "passed": self.passed_count,
+            "failed": total - self.passed_count,
+            "bitmap": self.bitmap().hex(),
+            "failures": [
+                {"constraint_id": cid, "failed": indices}
+                for cid, indices in zip(self.constraint_ids, self.failures)
+            ],
+            "vectorized": self.vectorized,
+            "elapsed_us": self.elapsed_us,
+        }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VERIFICATION CACHE - Bounded LRU with TTL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Canonical hashable form of a value.
+
+    Tagged with the type so 1, 1.0 and True stay distinct (CONTAINS and
+    MATCHES compare str() forms). Dict order is kept for the same reason.
+    """
+    t = type(value)
+    if t in _SCALAR_TYPES:
+        return (t, value)
+    if t is dict:
+        return (t, tuple((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if t is list or t is tuple:
+        return (t, tuple(_freeze(v) for v in value))
+    try:
+        hash(value)
+        return (t, value)
+    except TypeError:
+        return (t, repr(value))
+
+
+def _constraint_signature(constraint: Any, fields: List[str]) -> Optional[tuple]:
+    """
+    Structural signature of a constraint, collecting the field paths it reads.
+
+    Returns None when the constraint's verdict cannot be cached: aggregation
+    windows and the wall clock (temporal checks with no reference field)
+    live outside the object. Generated ids of composite and conditional
+    constraints come from id(self) and may be reused, so those are keyed by
+    structure rather than by id.
+    """
+    if isinstance(constraint, AtomicConstraint):
+        op = constraint.operator
+        if op in _AGGREGATION_OPERATORS:
+            return None
+        if op in _TEMPORAL_OPERATORS:
+            if constraint.reference is None:
+                return None
+            fields.append(constraint.reference)
+        fields.append(constraint.field)
+        if constraint.denominator:
+            fields.append(constraint.denominator)
+        return (
+            "atomic",
+            constraint.id,
+            constraint.field,
+            op,
+            _freeze(constraint.value),
+            constraint.denominator,
+            constraint.reference,
+            constraint.epsilon,
+            constraint.message,
+        )
+    if isinstance(constraint, RatioConstraint):
+        fields.append(constraint.f_field)
+        fields.append(constraint.g_field)
+        return (
+            "ratio",
+            constraint.id,
+            constraint.f_field,
+            constraint.g_field,
+            constraint.operator,
+            constraint.threshold,
+            constraint.epsilon,
+            constraint.message,
+        )
+    if isinstance(constraint, ConditionalConstraint):
+        parts = [constraint.condition, constraint.then_constraint]
+        if constraint.else_constraint is not None:
+            parts.append(constraint.else_constraint)
+        signature = ["conditional", constraint.else_constraint is not None]
+    elif isinstance(constraint, CompositeConstraint):
+        parts = constraint.constraints
+        signature = ["composite", constraint.logic]
+    else:
+        return None
+    for part in parts:
+        sub = _constraint_signature(part, fields)
+        if sub is None:
+            return None
+        signature.append(sub)
+    return tuple(signature)
+
+
+def _node_states(constraint: Any) -> List[tuple]:
+    """(node, copy of its attributes) for every node of a constraint tree."""
+    states = []
+    stack = [constraint]
+    while stack:
+        node = stack.pop()
+        if not hasattr(node, "__dict__"):
+            continue
+        states.append((node, dict(node.__dict__)))
+        if isinstance(node, CompositeConstraint):
+            stack.extend(node.constraints)
+        elif isinstance(node, ConditionalConstraint):
+            stack.extend((node.condition, node.then_constraint, node.else_constraint))
+    return states
+
+
+def _sizeof(obj: Any) -> int:
+    """Approximate deep size of a cache key (nested tuples of scalars)."""
+    size = sys.getsizeof(obj)
+    if type(obj) is tuple:
+        for item in obj:
+            size += _sizeof(item)
+    return size
+
+
+class _CacheShard:
+    """One lock's worth of the verification cache."""
+
+    __slots__ = ("lock", "entries", "hits", "misses", "evictions", "expirations", "bytes")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[tuple, Tuple[VerificationResult, float, int]]" = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.bytes = 0
+
+
+class VerificationCache:
+    """
+    Size-bounded LRU cache of verification results with a TTL.
+
+    Keys are hashed onto independent shards, each with its own lock, so
+    parallel verify_all() calls rarely contend. Every shard holds at most
+    max_entries / shards results and drops its least recently used entry
+    on overflow.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 300, shards: int = 16):
+        self.ttl_seconds = ttl_seconds
+        self._shard_count = max(1, shards)
+        self._shard_capacity = max(1, -(-max_entries // self._shard_count))
+        self._shards = [_CacheShard() for _ in range(self._shard_count)]
+
+    @property
+    def max_entries(self) -> int:
+        return self._shard_capacity * self._shard_count
+
+    def get(self, key: tuple) -> Optional[VerificationResult]:
+        """Return the cached result for key, or None if absent or expired."""
+        shard = self._shards[hash(key) % self._shard_count]
+        now = time.monotonic()
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is None:
+                shard.misses += 1
+                return None
+            if entry[1] < now:
+                del shard.entries[key]
+                shard.bytes -= entry[2]
+                shard.expirations += 1
+                shard.misses += 1
+                return None
+            shard.entries.move_to_end(key)
+            shard.hits += 1
+            return entry[0]
+
+    def set(self, key: tuple, result: VerificationResult):
+        """Cache a result, evicting the shard's least recently used entries."""
+        shard = self._shards[hash(key) % self._shard_count]
+        size = (
+            _sizeof(key)
+            + sys.getsizeof(result)
+            + sys.getsizeof(result.message)
+            + sys.getsizeof(result.constraint_id)
+        )
+        expires = time.monotonic() + self.ttl_seconds
+        with shard.lock:
+            old = shard.entries.pop(key, None)
+            if old is not None:
+                shard.bytes -= old[2]
+            shard.entries[key] = (result, expires, size)
+            shard.bytes += size
+            while len(shard.entries) > self._shard_capacity:
+                _, evicted = shard.entries.popitem(last=False)
+                shard.bytes -= evicted[2]
+                shard.evictions += 1
+
+    def clear(self):
+        """Drop all cached results."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.bytes = 0
+
+    def reset_stats(self):
+        """Zero the hit, miss, eviction and expiration counters."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.hits = shard.misses = shard.evictions = shard.expirations = 0
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def stats(self) -> Dict[str, Any]:
+        totals = dict.fromkeys(
+            ("entries", "hits", "misses", "evictions", "expirations", "memory_bytes"), 0
+        )
+        for shard in self._shards:
+            with shard.lock:
+                totals["entries"] += len(shard.entries)
+                totals["hits"] += shard.hits
+                totals["misses"] += shard.misses
+                totals["evictions"] += shard.evictions
+                totals["expirations"] += shard.expirations
+                totals["memory_bytes"] += shard.bytes
+        lookups = totals["hits"] + totals["misses"]
+        totals["hit_rate"] = totals["hits"] / lookups if lookups else 0.0
+        totals["max_entries"] = self.max_entries
+        return totals
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COLUMNAR BATCH EVALUATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Ints beyond 2**53 don't survive conversion to float64, and Python compares
+# int with float exactly, so those rows stay on the scalar path.
+_EXACT_FLOAT_INT = 2**53
+_NUMERIC_TYPES = (int, float, bool)
+
+if _HAS_NUMPY:
+    _VECTOR_COMPARISONS = {
+        Operator.EQ: np.equal,
+        Operator.NE: np.not_equal,
+        Operator.LT: np.less,
+        Operator.LE: np.less_equal,
+        Operator.GT: np.greater,
+        Operator.GE: np.greater_equal,
+    }
+
+
+def _exact_number(value: Any) -> bool:
+    """True when float64 represents value exactly and compares like Python."""
+    t = type(value)
+    if t is float or t is bool:
+        return True
+    return t is int and -_EXACT_FLOAT_INT <= value <= _EXACT_FLOAT_INT
+
+
+def _is_stateful(constraint: Any) -> bool:
+    """Whether a tree holds aggregations, which must see objects in order."""
+    if isinstance(constraint, AtomicConstraint):
+        return constraint.operator in _AGGREGATION_OPERATORS
+    if isinstance(constraint, ConditionalConstraint):
+        return any(
+            _is_stateful(sub)
+            for sub in (
+                constraint.condition,
+                constraint.then_constraint,
+                constraint.else_constraint,
+            )
+            if sub is not None
+        )
+    if isinstance(constraint, CompositeConstraint):
+        return any(_is_stateful(sub) for sub in constraint.constraints)
+    return False
+
+
+class _BatchColumns:
+    """
+    Field columns extracted from a batch of objects, shared across constraints.
+
+    numeric(path) gives a float64 column plus a mask of rows that hold an
+    exactly representable number; other rows are evaluated one by one.
+    """
+
+    def __init__(self, objects: List[Dict[str, Any]], evaluator: CDLEvaluator):
+        self.objects = objects
+        self.size = len(objects)
+        self.evaluator = evaluator
+        self._raw: Dict[str, List[Any]] = {}
+        self._numeric: Dict[str, tuple] = {}
+        self.errors: set = set()  # Rows whose scalar evaluation raised
+
+    def raw(self, path: str) -> List[Any]:
+        column = self._raw.get(path)
+        if column is None:
+            get = _field_getter(path)
+            column = self._raw[path] = [get(obj) for obj in self.objects]
+        return column
+
+    def numeric(self, path: str) -> tuple:
+        cached = self._numeric.get(path)
+        if cached is None:
+            raw = self.raw(path)
+            mask = np.fromiter(
+                (_exact_number(v) for v in raw), dtype=bool, count=self.size
+            )
+            values = np.fromiter(
+                (v if ok else 0.0 for v, ok in zip(raw, mask)),
+                dtype=np.float64,
+                count=self.size,
+            )
+            cached = self._numeric[path] = (mask, values)
+        return cached
+
+    def scalar(self, constraint: Any, rows: Any, out: Any):
+        """Evaluate rows of out with the compiled node, recording errors."""
+        run, _ = self.evaluator._compile_node(constraint)
+        objects = self.objects
+        for i in rows:
+            try:
+                out[i] = bool(run(objects[i])[0])
+            except Exception:
+                self.errors.add(int(i))
+
+    def evaluate(self, constraint: Any) -> tuple:
+        """Pass bits for a pure constraint tree; returns (bits, vectorized)."""
+        if isinstance(constraint, AtomicConstraint):
+            return self._atomic(constraint)
+        if isinstance(constraint, RatioConstraint):
+            return self._ratio(
+                constraint,
+                constraint.f_field,
+                constraint.g_field,
+                constraint.threshold,
+            )
+        if isinstance(constraint, CompositeConstraint):
+            parts = [self.evaluate(sub) for sub in constraint.constraints]
+            bits = [b for b, _ in parts]
+            vectorized = any(v for _, v in parts)
+            logic = constraint.logic.lower()
+            if logic == "and":
+                combined = np.ones(self.size, dtype=bool)
+                for b in bits:
+                    combined &= b
+            elif logic in ("or", "not"):
+                combined = np.zeros(self.size, dtype=bool)
+                for b in bits:
+                    combined |= b
+                if logic == "not":
+                    combined = ~combined
+            else:
+                combined = np.zeros(self.size, dtype=bool)
+            return combined, vectorized
+        if isinstance(constraint, ConditionalConstraint):
+            condition, v1 = self.evaluate(constraint.condition)
+            then, v2 = self.evaluate(constraint.then_constraint)
+            if constraint.else_constraint is not None:
+                otherwise, v3 = self.evaluate(constraint.else_constraint)
+            else:
+                otherwise, v3 = np.ones(self.size, dtype=bool), False
+            return np.where(condition, then, otherwise), v1 or v2 or v3
+        out = np.zeros(self.size, dtype=bool)
+        self.scalar(constraint, range(self.size), out)
+        return out, False
+
+    def _atomic(self, c: AtomicConstraint) -> tuple:
+        op = c.operator
+        out = np.zeros(self.size, dtype=bool)
+
+        if op in _RATIO_OPERATORS and c.denominator is not None:
+            return self._ratio(c, c.field, c.denominator, c.value)
+
+        if op in _VECTOR_COMPARISONS and _exact_number(c.value):
+            mask, values = self.numeric(c.field)
+            out[mask] = _VECTOR_COMPARISONS[op](values[mask], float(c.value))
+            self.scalar(c, np.flatnonzero(~mask), out)
+            return out, True
+
+        if (
+            op in (Operator.IN, Operator.NOT_IN)
+            and type(c.value) in (list, tuple, set, frozenset)
+            and all(_exact_number(v) and v == v for v in c.value)
+        ):
+            mask, values = self.numeric(c.field)
+            mask = mask & (values == values)  # NaN membership is by identity
+            members = np.fromiter(
+                (float(v) for v in c.value), dtype=np.float64, count=len(c.value)
+            )
+            hits = np.isin(values[mask], members)
+            out[mask] = hits if op == Operator.IN else ~hits
+            self.scalar(c, np.flatnonzero(~mask), out)
+            return out, True
+
+        self.scalar(c, range(self.size), out)
+        return out, False
+
+    def _ratio(self, c: Any, f_path: str, g_path: str, threshold: Any) -> tuple:
+        out = np.zeros(self.size, dtype=bool)
+        compare = _RATIO_COMPARATORS.get(c.operator)
+        epsilon = c.epsilon
+        if (
+            compare is None
+            or type(epsilon) is not float
+            or not epsilon > 0
+            or not _exact_number(threshold)
+        ):
+            self.scalar(c, range(self.size), out)
+            return out, False
+
+        f_mask, f = self.numeric(f_path)
+        g_mask, g = self.numeric(g_path)
+        mask = f_mask & g_mask
+        f, g = f[mask], g[mask]
+        undefined = np.abs(g) < epsilon
+        if c.operator == Operator.RATIO_UNDEFINED:
+            out[mask] = undefined
+        else:
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                ratio = f / np.where(undefined, 1.0, g)
+                t = float(threshold)
+                if c.operator == Operator.RATIO_EQ:
+                    bits = np.abs(ratio - t) < epsilon
+                elif c.operator == Operator.RATIO_NE:
+                    bits = np.abs(ratio - t) >= epsilon
+                else:
+                    bits = _VECTOR_COMPARISONS[_RATIO_TO_COMPARISON[c.operator]](ratio, t)
+            out[mask] = bits & ~undefined
+        self.scalar(c, np.flatnonzero(~mask), out)
+        return out, True
+
+
+_RATIO_TO_COMPARISON = {
+    Operator.RATIO_LT: Operator.LT,
+    Operator.RATIO_LE: Operator.LE,
+    Operator.RATIO_GT: Operator.GT,
+    Operator.RATIO_GE: Operator.GE,
+}
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONTENT SAFETY PATTERNS - Built-in harm prevention
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -178,6 +682,8 @@ SAFETY_PATTERNS = {
     },
 }
 
+_SAFETY_SCANNER = SafetyScanner(SAFETY_PATTERNS)
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # THE FORGE
@@ -200,8 +706,15 @@ class Forge:
         self.metrics = ForgeMetrics()
         self._evaluator = CDLEvaluator()
         self._parser = CDLParser()
-        self._cache: Dict[str, tuple] = {}  # {cache_key: (result, timestamp)}
-        self._cache_lock = threading.Lock()
+        if self.config.aggregation_state_path:
+            self._evaluator.aggregation_state.load(self.config.aggregation_state_path)
+        self._cache = VerificationCache(
+            max_entries=self.config.cache_max_entries,
+            ttl_seconds=self.config.cache_ttl_seconds,
+            shards=self.config.cache_shards,
+        )
+        self._plans: "OrderedDict[str, tuple]" = OrderedDict()  # {id: (constraint, node states, plan)}
+        self._plans_lock = threading.Lock()
         self._executor = ThreadPoolExecutor(max_workers=self.config.max_workers)
 
         # Glass Box components (lazy initialization)
@@ -229,23 +742,23 @@ class Forge:
             constraint = self._parser.parse(constraint)
 
         # Check cache
+        cache_key = None
         if use_cache and self.config.enable_caching:
             cache_key = self._cache_key(constraint, obj)
-            cached = self._get_cached(cache_key)
-            if cached is not None:
-                self.metrics.cache_hits += 1
-                return VerificationResult(
-                    passed=cached.passed,
-                    constraint_id=cached.constraint_id,
-                    message=cached.message,
-                    elapsed_us=0,
-                    from_cache=True,
-                )
-            self.metrics.cache_misses += 1
+            if cache_key is not None:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    return VerificationResult(
+                        passed=cached.passed,
+                        constraint_id=getattr(constraint, "id", cached.constraint_id),
+                        message=cached.message,
+                        elapsed_us=0,
+                        from_cache=True,
+                    )
 
         # Evaluate
         try:
-            result = self._evaluator.evaluate(constraint, obj)
+            result = self._plan(constraint)(obj)
             elapsed_us = (time.perf_counter_ns() // 1000) - start_us
 
             verification_result = VerificationResult(
@@ -259,8 +772,8 @@ class Forge:
             self._update_metrics(verification_result)
 
             # Cache result
-            if use_cache and self.config.enable_caching:
-                self._set_cached(cache_key, verification_result)
+            if cache_key is not None:
+                self._cache.set(cache_key, verification_result)
 
             return verification_result
 
@@ -324,6 +837,126 @@ class Forge:
             elapsed_us=elapsed_us,
         )
 
+    def verify_batch(
+        self, constraints: List[Any], objects: List[Dict[str, Any]]
+    ) -> BatchVerificationResult:
+        """
+        Verify every constraint against every object.
+
+        Referenced fields are pulled into NumPy columns once and EQ/NE/LT/LE/
+        GT/GE, IN/NOT_IN and ratio checks run column-wise. Rows a column
+        can't represent exactly (missing fields, strings, huge ints) and all
+        other operators fall back to the scalar path, as does everything
+        when NumPy is unavailable. Aggregations are evaluated object by
+        object, in order, so their windows see the same sequence verify()
+        would. Pass/fail bits match calling verify() on each pair.
+        """
+        start_us = time.perf_counter_ns() // 1000
+        parsed = [
+            self._parser.parse(c) if isinstance(c, dict) else c for c in constraints
+        ]
+        size = len(objects)
+        error_passed = not self.config.strict_mode
+        errors = 0
+        vectorized = 0
+        bits: List[Any] = [None] * len(parsed)
+
+        def scalar(plan, obj) -> bool:
+            nonlocal errors
+            try:
+                return bool(plan(obj).passed)
+            except Exception:
+                errors += 1
+                return error_passed
+
+        # Stateful constraints: object-major, like sequential verify() calls
+        stateful = [i for i, c in enumerate(parsed) if _is_stateful(c)]
+        if stateful:
+            plans = [(i, self._plan(parsed[i])) for i in stateful]
+            for i, _ in plans:
+                bits[i] = [False] * size
+            for row, obj in enumerate(objects):
+                for i, plan in plans:
+                    bits[i][row] = scalar(plan, obj)
+
+        columns = _BatchColumns(objects, self._evaluator) if _HAS_NUMPY else None
+        for i, constraint in enumerate(parsed):
+            if bits[i] is not None:
+                continue
+            plan = self._plan(constraint)
+            if columns is None:
+                bits[i] = [scalar(plan, obj) for obj in objects]
+                continue
+            columns.errors = set()
+            column_bits, used_vectors = columns.evaluate(constraint)
+            vectorized += used_vectors
+            # Rows where a sub-constraint raised: replay the whole tree so
+            # short-circuiting decides, exactly as verify() would.
+            for row in columns.errors:
+                column_bits[row] = scalar(plan, objects[row])
+            bits[i] = column_bits
+
+        if _HAS_NUMPY:
+            matrix = np.array(bits, dtype=bool).reshape(len(parsed), size)
+            passed = matrix.all(axis=0).tolist()
+            failures = [np.flatnonzero(~row).tolist() for row in matrix]
+        else:
+            passed = [all(row_bits) for row_bits in zip(*bits)] if bits else [True] * size
+            failures = [
+                [row for row, ok in enumerate(column_bits) if not ok]
+                for column_bits in bits
+            ]
+
+        elapsed_us = (time.perf_counter_ns() // 1000) - start_us
+        if self.config.enable_metrics:
+            total = size * len(parsed)
+            failed_total = sum(len(f) for f in failures)
+            self.metrics.total_evaluations += total
+            self.metrics.passed_evaluations += total - failed_total
+            self.metrics.failed_evaluations += failed_total
+            self.metrics.error_evaluations += errors
+            self.metrics.total_time_us += elapsed_us
+
+        return BatchVerificationResult(
+            passed=passed,
+            constraint_ids=[getattr(c, "id", "UNKNOWN") for c in parsed],
+            failures=failures,
+            vectorized=vectorized,
+            elapsed_us=elapsed_us,
+        )
+
+    def _plan(self, constraint: Constraint):
+        """
+        Compiled plan for a constraint, cached by constraint id.
+
+        A cached plan is reused while every node of the tree it was compiled
+        from still holds the attributes it had then (a C-level dict compare
+        per node) and that tree is the constraint passed in or equal to it.
+        Generated composite and conditional ids come from id(self) and can
+        be reused by a different tree; the equality check covers that.
+        """
+        key = getattr(constraint, "id", None)
+        with self._plans_lock:
+            cached = self._plans.get(key)
+            if cached is not None:
+                self._plans.move_to_end(key)
+        if cached is not None:
+            compiled_from, states, plan = cached
+            if all(node.__dict__ == state for node, state in states) and (
+                compiled_from is constraint or compiled_from == constraint
+            ):
+                return plan
+
+        plan = self._evaluator.compile(constraint)
+        if key is not None:
+            entry = (constraint, _node_states(constraint), plan)
+            with self._plans_lock:
+                self._plans[key] = entry
+                self._plans.move_to_end(key)
+                while len(self._plans) > self.config.plan_cache_size:
+                    self._plans.popitem(last=False)
+        return plan
+
     # ─────────────────────────────────────────────────────────────────────────
     # CONTENT SAFETY - Built-in harm prevention
     # ─────────────────────────────────────────────────────────────────────────
@@ -338,30 +971,11 @@ class Forge:
         Now integrated into the Forge as a first-class operation.
         """
         start_us = time.perf_counter_ns() // 1000
-        text_lower = text.lower()
 
         if categories is None:
             categories = list(SAFETY_PATTERNS.keys())
 
-        passed_categories = []
-        failed_categories = []
-
-        for category in categories:
-            if category not in SAFETY_PATTERNS:
-                continue
-
-            patterns = SAFETY_PATTERNS[category]["patterns"]
-            violation = False
-
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    violation = True
-                    break
-
-            if violation:
-                failed_categories.append(category)
-            else:
-                passed_categories.append(category)
+        failed_categories = _SAFETY_SCANNER.scan(text, categories)
 
         elapsed_us = (time.perf_counter_ns() // 1000) - start_us
         passed = len(failed_categories) == 0
@@ -490,32 +1104,26 @@ class Forge:
     # CACHE MANAGEMENT
     # ─────────────────────────────────────────────────────────────────────────
 
-    def _cache_key(self, constraint: Constraint, obj: Dict[str, Any]) -> str:
-        """Generate cache key from constraint and object."""
-        c_str = str(constraint.id if hasattr(constraint, "id") else constraint)
-        o_str = str(sorted(obj.items()))
-        return hashlib.sha256(f"{c_str}:{o_str}".encode()).hexdigest()[:16]
-
-    def _get_cached(self, key: str) -> Optional[VerificationResult]:
-        """Get cached result if not expired."""
-        with self._cache_lock:
-            if key not in self._cache:
-                return None
-            result, timestamp = self._cache[key]
-            if time.time() - timestamp > self.config.cache_ttl_seconds:
-                del self._cache[key]
-                return None
-            return result
+    def _cache_key(self, constraint: Constraint, obj: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Generate cache key from constraint and object.
 
-    def _set_cached(self, key: str, result: VerificationResult):
-        """Cache a verification result."""
-        with self._cache_lock:
-            self._cache[key] = (result, time.time())
+        Only the fields the constraint reads go into the key, so unrelated
+        fields on the object don't defeat the cache. Returns None when the
+        constraint is not cacheable.
+        """
+        fields: List[str] = []
+        signature = _constraint_signature(constraint, fields)
+        if signature is None:
+            return None
+        get = self._evaluator._get_field_value
+        return (signature, tuple(_freeze(get(obj, path)) for path in fields))
 
     def clear_cache(self):
-        """Clear all cached results."""
-        with self._cache_lock:
-            self._cache.clear()
+        """Clear all cached results and compiled plans."""
+        self._cache.clear()
+        with self._plans_lock:
+            self._plans.clear()
 
     # ─────────────────────────────────────────────────────────────────────────
     # METRICS
@@ -544,11 +1152,26 @@ class Forge:
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get current metrics."""
-        return self.metrics.to_dict()
+        cache = self._cache.stats()
+        self.metrics.cache_hits = cache["hits"]
+        self.metrics.cache_misses = cache["misses"]
+        metrics = self.metrics.to_dict()
+        metrics.update(
+            {
+                "cache_hit_rate": round(cache["hit_rate"] * 100, 2),
+                "cache_evictions": cache["evictions"],
+                "cache_expirations": cache["expirations"],
+                "cache_entries": cache["entries"],
+                "cache_max_entries": cache["max_entries"],
+                "cache_memory_bytes": cache["memory_bytes"],
+            }
+        )
+        return metrics
 
     def reset_metrics(self):
         """Reset all metrics."""
         self.metrics = ForgeMetrics()
+        self._cache.reset_stats()
 
     # ─────────────────────────────────────────────────────────────────────────
     # SHUTDOWN
@@ -557,6 +1180,8 @@ class Forge:
     def shutdown(self):
         """Graceful shutdown of the Forge."""
         self._executor.shutdown(wait=True)
+        if self.config.aggregation_state_path:
+            self._evaluator.aggregation_state.save(self.config.aggregation_state_path)
 
     # ─────────────────────────────────────────────────────────────────────────
     # GLASS BOX ACTIVATION
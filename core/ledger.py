@@ -36,14 +36,25 @@ See: docs/NEWTON_CLP_SYSTEM_DEFINITION.md for full historical context.
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import Future
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import Any, Dict, List, Optional, Iterator
+import atexit
 import hashlib
+import heapq
 import time
 import json
+import mmap
 import os
+import shutil
+import struct
+import sys
 from pathlib import Path
-from threading import Lock
+from threading import Condition, Lock, Thread
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # SERVERLESS STORAGE PATH
@@ -74,11 +85,23 @@ class LedgerConfig:
     """Configuration for the Ledger."""
 
     storage_path: str = field(default_factory=_get_default_ledger_storage_path)
-    max_entries_memory: int = 10000  # Max entries in RAM
+    max_entries_memory: int = 10000  # Hot cache of recent entries (0 disables)
+    segment_max_entries: int = 100000  # Entries per on-disk segment file
     sync_interval_seconds: int = 60  # Auto-sync to disk
     enable_merkle_tree: bool = True  # Build Merkle tree for integrity
+    merkle_persist_interval: int = 1000  # Appends between Merkle node saves
     chain_verification: bool = True  # Verify prev_hash chain
 
+    # Group commit: appends are queued and written in batches by a
+    # background writer instead of inside the caller's request.
+    group_commit: bool = field(
+        default_factory=lambda: os.environ.get("NEWTON_LEDGER_GROUP_COMMIT") == "1"
+    )
+    group_commit_max_batch: int = 512  # Max entries written per batch
+    fsync_policy: str = "never"  # "always", "entries", "interval" or "never"
+    fsync_entries: int = 1000  # "entries": fsync after this many writes
+    fsync_interval_ms: int = 50  # "interval": fsync at most this often
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # LEDGER ENTRY - An immutable record
@@ -222,6 +245,614 @@ class MerkleTree:
         return current == self.root
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# MERKLE ACCUMULATOR - Incremental, persistent Merkle tree
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class MerkleAccumulator:
+    """
+    Append-optimized Merkle tree.
+
+    Every level of the tree is kept, so an append only rehashes the
+    right edge (O(log n)) and proofs are read from the stored levels
+    (O(log n)) without rebuilding anything. Roots and proofs are identical
+    to MerkleTree (odd nodes are paired with themselves), so certificates
+    and anchors issued before the switch still verify.
+
+    Levels persist as fixed-width hex records; only the nodes touched since
+    the last save are rewritten.
+    """
+
+    NODE_WIDTH = 65  # 64 hex chars + newline
+    MANIFEST = "merkle.json"
+
+    def __init__(self, hashes: Optional[List[str]] = None):
+        self.levels: List[List[str]] = [[]]
+        self._dirty_from: Dict[int, int] = {}
+        self._fixed_width = True
+        for h in hashes or []:
+            self.append(h)
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    @property
+    def root(self) -> str:
+        if not self.levels[0]:
+            return ""
+        return self.levels[-1][0]
+
+    @property
+    def leaves(self) -> List[str]:
+        return self.levels[0]
+
+    def _hash_pair(self, left: str, right: str) -> str:
+        """Hash two nodes together."""
+        return hashlib.sha256(f"{left}{right}".encode()).hexdigest()
+
+    def _mark_dirty(self, level: int, index: int):
+        current = self._dirty_from.get(level)
+        if current is None or index < current:
+            self._dirty_from[level] = index
+
+    def append(self, leaf_hash: str):
+        """Add a leaf and rehash the path from it to the root."""
+        levels = self.levels
+        levels[0].append(leaf_hash)
+        if len(leaf_hash) != self.NODE_WIDTH - 1:
+            self._fixed_width = False
+
+        idx = len(levels[0]) - 1
+        self._mark_dirty(0, idx)
+
+        k = 0
+        while len(levels[k]) > 1:
+            level = levels[k]
+            parent = idx >> 1
+            left = level[parent * 2]
+            right = level[parent * 2 + 1] if parent * 2 + 1 < len(level) else left
+            node = self._hash_pair(left, right)
+
+            if k + 1 == len(levels):
+                levels.append([])
+            upper = levels[k + 1]
+            if parent < len(upper):
+                upper[parent] = node
+            else:
+                upper.append(node)
+            self._mark_dirty(k + 1, parent)
+
+            idx = parent
+            k += 1
+
+    def get_proof(self, index: int) -> List[tuple]:
+        """
+        Get Merkle proof for leaf at index.
+        Returns list of (hash, direction) tuples.
+        """
+        if index < 0 or index >= len(self):
+            return []
+
+        proof = []
+        idx = index
+        for level in self.levels[:-1]:
+            if idx % 2 == 0:
+                sibling = level[idx + 1] if idx + 1 < len(level) else level[idx]
+                proof.append((sibling, "right"))
+            else:
+                proof.append((level[idx - 1], "left"))
+            idx >>= 1
+
+        return proof
+
+    def verify_proof(self, leaf_hash: str, proof: List[tuple]) -> bool:
+        """Verify a Merkle proof."""
+        current = leaf_hash
+        for sibling_hash, direction in proof:
+            if direction == "right":
+                current = self._hash_pair(current, sibling_hash)
+            else:
+                current = self._hash_pair(sibling_hash, current)
+        return current == self.root
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # PERSISTENCE
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def save(self, directory: Path) -> bool:
+        """
+        Write nodes changed since the last save to directory.
+        Returns False if the tree holds non-standard leaf hashes.
+        """
+        if not self._fixed_width:
+            return False
+
+        directory.mkdir(parents=True, exist_ok=True)
+        width = self.NODE_WIDTH
+
+        for k, start in sorted(self._dirty_from.items()):
+            level_file = directory / f"level_{k}.hex"
+            mode = "r+b" if level_file.exists() else "wb"
+            with open(level_file, mode) as f:
+                f.seek(0, os.SEEK_END)
+                start = min(start, f.tell() // width)
+                f.seek(start * width)
+                f.truncate()
+                f.write("".join(h + "\n" for h in self.levels[k][start:]).encode())
+
+        manifest = {"leaf_count": len(self), "height": len(self.levels), "root": self.root}
+        tmp = directory / (self.MANIFEST + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, directory / self.MANIFEST)
+
+        self._dirty_from = {}
+        return True
+
+    @classmethod
+    def load(cls, directory: Path) -> Optional["MerkleAccumulator"]:
+        """Load a saved tree. Returns None if missing or inconsistent."""
+        manifest_file = directory / cls.MANIFEST
+        if not manifest_file.exists():
+            return None
+
+        try:
+            with open(manifest_file, "r") as f:
+                manifest = json.load(f)
+
+            count = manifest["leaf_count"]
+            acc = cls()
+            if count == 0:
+                return acc
+
+            levels = []
+            width = cls.NODE_WIDTH
+            for k in range(manifest["height"]):
+                expected = -(-count // (1 << k))
+                with open(directory / f"level_{k}.hex", "rb") as f:
+                    data = f.read(expected * width)
+                if len(data) != expected * width:
+                    return None
+                level = data.decode().split("\n")[:-1]
+                if len(level) != expected:
+                    return None
+                levels.append(level)
+        except (OSError, ValueError, KeyError, UnicodeDecodeError):
+            return None
+
+        if len(levels[-1]) != 1 or levels[-1][0] != manifest["root"]:
+            return None
+
+        acc.levels = levels
+        return acc
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SEGMENTED STORE - Indexed on-disk entry storage
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class SegmentedStore:
+    """
+    Rolling segment files with a fixed-width offset index.
+
+    Records are JSON lines in <base>.jsonl, where base is the ledger index
+    of the segment's first record. <base>.idx holds one little-endian
+    uint64 start offset per record, so record i is a single slice.
+
+    Only the tail segment is opened at startup. Closed segments are
+    memory-mapped on first access and kept in a small LRU of open maps.
+    """
+
+    OFFSET = struct.Struct("<Q")
+    MAX_OPEN_SEGMENTS = 8
+
+    def __init__(self, directory: Path, segment_max_entries: int = 100000):
+        self.directory = directory
+        self.segment_max_entries = max(1, segment_max_entries)
+        self._bases: List[int] = []
+        self._open_segments: "OrderedDict[int, tuple]" = OrderedDict()
+        self._read_lock = Lock()
+
+        self._tail_base = 0
+        self._tail_offsets = array("Q")
+        self._tail_size = 0
+        self._tail_data = None
+        self._tail_index = None
+        self._tail_reader = None
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._bases = sorted(
+            int(p.stem) for p in self.directory.glob("*.jsonl") if p.stem.isdigit()
+        ) or [0]
+        self._open_tail(self._bases[-1])
+
+    def __len__(self) -> int:
+        return self._tail_base + len(self._tail_offsets)
+
+    def _paths(self, base: int) -> tuple:
+        name = f"{base:012d}"
+        return self.directory / f"{name}.jsonl", self.directory / f"{name}.idx"
+
+    def _open_tail(self, base: int):
+        """Open the tail segment, recovering records the index missed."""
+        data_path, index_path = self._paths(base)
+        data_path.touch()
+
+        offsets = array("Q")
+        if index_path.exists():
+            with open(index_path, "rb") as f:
+                raw = f.read()
+            offsets.frombytes(raw[: len(raw) - len(raw) % self.OFFSET.size])
+            if sys.byteorder != "little":
+                offsets.byteswap()
+
+        size = data_path.stat().st_size
+        while offsets and offsets[-1] >= size:
+            offsets.pop()
+
+        # Re-scan from the last indexed record: index records written after
+        # a crash between the data and index writes, drop a torn final line.
+        scan_from = offsets.pop() if offsets else 0
+        with open(data_path, "rb") as f:
+            f.seek(scan_from)
+            tail = f.read()
+        pos = scan_from
+        for line in tail.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            offsets.append(pos)
+            pos += len(line)
+
+        if pos != size:
+            with open(data_path, "r+b") as f:
+                f.truncate(pos)
+        index_bytes = array("Q", offsets)
+        if sys.byteorder != "little":
+            index_bytes.byteswap()
+        with open(index_path, "wb") as f:
+            f.write(index_bytes.tobytes())
+
+        self._tail_base = base
+        self._tail_offsets = offsets
+        self._tail_size = pos
+        self._tail_data = open(data_path, "ab")
+        self._tail_index = open(index_path, "ab")
+        self._tail_reader = open(data_path, "rb")
+
+    def _close_tail(self):
+        for f in (self._tail_data, self._tail_index):
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+        self._tail_reader.close()
+
+    def _roll(self):
+        """Close the full tail segment and start a new one."""
+        with self._read_lock:
+            self._close_tail()
+            base = len(self)
+            self._bases.append(base)
+            self._open_tail(base)
+
+    def append(self, record: str) -> bool:
+        """
+        Append one JSON record (without trailing newline).
+        Returns True if the record started a new segment.
+        """
+        rolled = len(self._tail_offsets) >= self.segment_max_entries
+        if rolled:
+            self._roll()
+
+        data = record.encode() + b"\n"
+        self._tail_data.write(data)
+        start = self._tail_size
+        self._tail_index.write(self.OFFSET.pack(start))
+        self._tail_size = start + len(data)
+        self._tail_offsets.append(start)
+        return rolled
+
+    def flush(self, fsync: bool = False):
+        """Push buffered writes to the OS (and to disk with fsync)."""
+        # Data first, so the index never points past written bytes
+        for f in (self._tail_data, self._tail_index):
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+
+    @property
+    def closed(self) -> bool:
+        return self._tail_data.closed
+
+    def close(self):
+        """Flush and close all open files."""
+        with self._read_lock:
+            self._close_tail()
+            while self._open_segments:
+                _, segment = self._open_segments.popitem()
+                for handle in segment:
+                    handle.close()
+
+    def _segment(self, base: int) -> tuple:
+        """Return (data_map, index_map) for a closed segment (read lock held)."""
+        segment = self._open_segments.get(base)
+        if segment is not None:
+            self._open_segments.move_to_end(base)
+            return segment[:2]
+
+        data_path, index_path = self._paths(base)
+        data_file = open(data_path, "rb")
+        index_file = open(index_path, "rb")
+        data_map = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        index_map = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._open_segments[base] = (data_map, index_map, data_file, index_file)
+
+        if len(self._open_segments) > self.MAX_OPEN_SEGMENTS:
+            _, evicted = self._open_segments.popitem(last=False)
+            for handle in evicted:
+                handle.close()
+        return data_map, index_map
+
+    def read(self, index: int) -> bytes:
+        """Read the raw record at index."""
+        if index < 0 or index >= len(self):
+            raise IndexError(index)
+
+        with self._read_lock:
+            if index >= self._tail_base:
+                i = index - self._tail_base
+                offsets = self._tail_offsets
+                start = offsets[i]
+                end = offsets[i + 1] if i + 1 < len(offsets) else self._tail_size
+                self._tail_data.flush()
+                self._tail_reader.seek(start)
+                return self._tail_reader.read(end - start)
+
+            base = self._bases[bisect_right(self._bases, index) - 1]
+            data_map, index_map = self._segment(base)
+            i = index - base
+            start = self.OFFSET.unpack_from(index_map, i * self.OFFSET.size)[0]
+            if (i + 1) * self.OFFSET.size < len(index_map):
+                end = self.OFFSET.unpack_from(index_map, (i + 1) * self.OFFSET.size)[0]
+            else:
+                end = len(data_map)
+            return data_map[start:end]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LEDGER INDEX - Secondary indexes for search
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class LedgerIndex:
+    """
+    Secondary indexes over ledger entries.
+
+    Entry-aligned columns (operation id, result id, timestamp) answer filter
+    checks without reading entries. Per-operation and per-result posting
+    lists plus a timestamp order let search start from the smallest
+    candidate set and bisect to the cursor.
+
+    Timestamps are normally non-decreasing, so the timestamp column is its
+    own sorted index; a separate order is only built if the clock goes back.
+    After that, in-order timestamps are appended to it and earlier ones wait
+    in a small pending list that is merged in one pass before the next time
+    query or save, so a clock step never makes every append O(n).
+    """
+
+    FILE = "search"
+    PENDING_INSERTS = 64  # Merge fewer out-of-order timestamps by insertion
+
+    def __init__(self):
+        self.operation_names: List[str] = []
+        self.result_names: List[str] = []
+        self._operation_ids: Dict[str, int] = {}
+        self._result_ids: Dict[str, int] = {}
+
+        self.operation_of = array("i")
+        self.result_of = array("i")
+        self.timestamps = array("q")
+        self.by_operation: List[array] = []
+        self.by_result: List[array] = []
+
+        # Only used once timestamps stop being monotonic
+        self._time_keys: Optional[array] = None
+        self._time_order: Optional[array] = None
+        self._time_pending: List[tuple] = []  # (timestamp, index) not yet merged
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @staticmethod
+    def _intern(value: str, names: List[str], ids: Dict[str, int], postings: List[array]) -> int:
+        value_id = ids.get(value)
+        if value_id is None:
+            value_id = ids[value] = len(names)
+            names.append(value)
+            postings.append(array("q"))
+        return value_id
+
+    def add(self, index: int, operation: str, result: str, timestamp: int):
+        """Index the entry at index (must be the next index)."""
+        op_id = self._intern(operation, self.operation_names, self._operation_ids, self.by_operation)
+        result_id = self._intern(result, self.result_names, self._result_ids, self.by_result)
+
+        self.operation_of.append(op_id)
+        self.result_of.append(result_id)
+        self.by_operation[op_id].append(index)
+        self.by_result[result_id].append(index)
+
+        timestamps = self.timestamps
+        if self._time_order is None and timestamps and timestamp < timestamps[-1]:
+            order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+            self._time_order = array("q", order)
+            self._time_keys = array("q", (timestamps[i] for i in order))
+        timestamps.append(timestamp)
+
+        if self._time_order is not None:
+            if timestamp >= self._time_keys[-1]:
+                self._time_keys.append(timestamp)
+                self._time_order.append(index)
+            else:
+                self._time_pending.append((timestamp, index))
+
+    def _merge_time_pending(self):
+        """Fold out-of-order timestamps into the sorted time order."""
+        if not self._time_pending:
+            return
+        pending, self._time_pending = sorted(self._time_pending), []
+        if len(pending) <= self.PENDING_INSERTS:
+            for timestamp, index in pending:
+                pos = bisect_right(self._time_keys, timestamp)
+                self._time_keys.insert(pos, timestamp)
+                self._time_order.insert(pos, index)
+            return
+        # Two sorted runs: timsort merges them in linear time
+        pairs = sorted(chain(zip(self._time_keys, self._time_order), pending))
+        self._time_keys = array("q", (key for key, _ in pairs))
+        self._time_order = array("q", (i for _, i in pairs))
+
+    def counts(self, by_result: bool = False) -> Dict[str, int]:
+        """Entry counts per operation (or per result)."""
+        names, postings = (
+            (self.result_names, self.by_result)
+            if by_result
+            else (self.operation_names, self.by_operation)
+        )
+        return {name: len(p) for name, p in zip(names, postings) if p}
+
+    def _time_range(self, start_time: Optional[int], end_time: Optional[int]):
+        """Ascending indices with start_time <= timestamp <= end_time."""
+        self._merge_time_pending()
+        keys = self.timestamps if self._time_order is None else self._time_keys
+        lo = bisect_left(keys, start_time) if start_time else 0
+        hi = bisect_right(keys, end_time) if end_time else len(keys)
+        if self._time_order is None:
+            return range(lo, hi)
+        return sorted(self._time_order[lo:hi])
+
+    def search(
+        self,
+        operation: Optional[str] = None,
+        result: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: int = 100,
+        before: Optional[int] = None,
+    ) -> List[int]:
+        """Matching indices below before, newest first."""
+        op_id = result_id = None
+        candidates = []
+        if operation:
+            op_id = self._operation_ids.get(operation)
+            if op_id is None:
+                return []
+            candidates.append(self.by_operation[op_id])
+        if result:
+            result_id = self._result_ids.get(result)
+            if result_id is None:
+                return []
+            candidates.append(self.by_result[result_id])
+        if start_time or end_time:
+            candidates.append(self._time_range(start_time, end_time))
+        if not candidates:
+            candidates.append(range(len(self)))
+
+        driver = min(candidates, key=len)
+        stop = bisect_left(driver, before) if before is not None else len(driver)
+
+        matches: List[int] = []
+        for k in range(stop - 1, -1, -1):
+            if len(matches) >= limit:
+                break
+
+            i = driver[k]
+            if op_id is not None and self.operation_of[i] != op_id:
+                continue
+            if result_id is not None and self.result_of[i] != result_id:
+                continue
+            if start_time and self.timestamps[i] < start_time:
+                continue
+            if end_time and self.timestamps[i] > end_time:
+                continue
+
+            matches.append(i)
+
+        return matches
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # PERSISTENCE
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _arrays(self) -> List[array]:
+        self._merge_time_pending()
+        arrays = [self.operation_of, self.result_of, self.timestamps]
+        arrays += self.by_operation + self.by_result
+        if self._time_order is not None:
+            arrays += [self._time_keys, self._time_order]
+        return arrays
+
+    def save(self, directory: Path, tip_hash: str):
+        """Snapshot the index; tip_hash identifies the last indexed entry."""
+        directory.mkdir(parents=True, exist_ok=True)
+        arrays = self._arrays()
+        meta = {
+            "count": len(self),
+            "tip_hash": tip_hash,
+            "byteorder": sys.byteorder,
+            "operations": self.operation_names,
+            "results": self.result_names,
+            "time_ordered": self._time_order is not None,
+            "arrays": [[a.typecode, len(a)] for a in arrays],
+        }
+
+        # One file: a JSON header line, then the raw arrays
+        tmp = directory / (self.FILE + ".idx.tmp")
+        with open(tmp, "wb") as f:
+            f.write(json.dumps(meta).encode() + b"\n")
+            for a in arrays:
+                a.tofile(f)
+        os.replace(tmp, directory / (self.FILE + ".idx"))
+
+    @classmethod
+    def load(cls, directory: Path) -> Optional[tuple]:
+        """Load a snapshot. Returns (index, tip_hash) or None."""
+        index_file = directory / (cls.FILE + ".idx")
+        if not index_file.exists():
+            return None
+
+        try:
+            arrays = []
+            with open(index_file, "rb") as f:
+                meta = json.loads(f.readline())
+                for typecode, length in meta["arrays"]:
+                    a = array(typecode)
+                    a.fromfile(f, length)
+                    if meta["byteorder"] != sys.byteorder:
+                        a.byteswap()
+                    arrays.append(a)
+        except (OSError, EOFError, ValueError, KeyError):
+            return None
+
+        index = cls()
+        n_ops, n_results = len(meta["operations"]), len(meta["results"])
+        index.operation_of, index.result_of, index.timestamps = arrays[:3]
+        index.by_operation = arrays[3 : 3 + n_ops]
+        index.by_result = arrays[3 + n_ops : 3 + n_ops + n_results]
+        if meta["time_ordered"]:
+            index._time_keys, index._time_order = arrays[-2:]
+
+        index.operation_names = list(meta["operations"])
+        index.result_names = list(meta["results"])
+        index._operation_ids = {name: i for i, name in enumerate(index.operation_names)}
+        index._result_ids = {name: i for i, name in enumerate(index.result_names)}
+
+        if len(index) != meta["count"]:
+            return None
+        return index, meta["tip_hash"]
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # THE LEDGER
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -243,12 +874,46 @@ class Ledger:
 
     def __init__(self, config: Optional[LedgerConfig] = None):
         self.config = config or LedgerConfig()
+        self._store: Optional[SegmentedStore] = None
+
+        # Hot cache: the most recent entries, [_cache_base, len(self))
         self._entries: List[LedgerEntry] = []
-        self._merkle_tree: Optional[MerkleTree] = None
+        self._cache_base = 0
+        self._count = 0
+        self._tip_hash = self.GENESIS_HASH
+        self._merkle: Optional[MerkleAccumulator] = None
+        self._merkle_saved_count = 0
+        self._index = LedgerIndex()
         self._lock = Lock()
 
+        # Last fully-verified (index, entry_hash); see verify_chain
+        self._checkpoint: Optional[tuple] = None
+        self._checkpoint_lock = Lock()
+        self._audit: Dict[str, Any] = {"running": False}
+        self._audit_thread: Optional[Thread] = None
+
+        # Commit state: written/durable are the last indices on disk
+        self._commit_cond = Condition()
+        self._commit_queue: List[LedgerEntry] = []
+        self._commit_waiters: List[tuple] = []
+        self._sync_requested = False
+        self._closing = False
+        self._unsynced = 0
+        self._last_fsync = time.monotonic()
+        self._writer: Optional[Thread] = None
+
         # Load existing ledger
         self._load()
+        if self.config.enable_merkle_tree:
+            self._load_merkle()
+        self._load_index()
+        self._load_checkpoint()
+
+        self._written_index = self._durable_index = self._count - 1
+        if self.config.group_commit:
+            self._writer = Thread(target=self._commit_loop, daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
 
     # ─────────────────────────────────────────────────────────────────────────
     # APPEND OPERATIONS
@@ -262,40 +927,56 @@ class Ledger:
 
         This is the ONLY way to add to the ledger.
         No updates. No deletes. Only appends.
-        """
-        with self._lock:
-            # Compute payload hash
-            if isinstance(payload, (dict, list)):
-                payload_str = json.dumps(payload, sort_keys=True)
-            else:
-                payload_str = str(payload)
-            payload_hash = hashlib.sha256(payload_str.encode()).hexdigest()
 
-            # Get previous hash
-            if self._entries:
-                prev_hash = self._entries[-1].entry_hash
-            else:
-                prev_hash = self.GENESIS_HASH
+        With group_commit the entry is queued for the background writer;
+        use wait_durable(entry.index) or durable_future(entry.index) to
+        wait until it is on disk.
+        """
+        # Compute payload hash
+        if isinstance(payload, (dict, list)):
+            payload_str = json.dumps(payload, sort_keys=True)
+        else:
+            payload_str = str(payload)
+        payload_hash = hashlib.sha256(payload_str.encode()).hexdigest()
 
+        with self._lock:
             # Create entry
             entry = LedgerEntry(
-                index=len(self._entries),
+                index=self._count,
                 timestamp=int(time.time() * 1000),
                 operation=operation,
                 payload_hash=payload_hash,
                 result=result,
-                prev_hash=prev_hash,
+                prev_hash=self._tip_hash,
                 metadata=metadata or {},
             )
 
             # Append
-            self._entries.append(entry)
-
-            # Invalidate Merkle tree (will rebuild on demand)
-            self._merkle_tree = None
+            self._count += 1
+            self._tip_hash = entry.entry_hash
+            self._cache_entry(entry)
+            self._index.add(entry.index, entry.operation, entry.result, entry.timestamp)
+
+            # Extend Merkle tree along the right edge
+            if self.config.enable_merkle_tree and self._merkle is not None:
+                self._merkle.append(entry.entry_hash)
+            else:
+                self._merkle = None
 
             # Persist
-            self._save_entry(entry)
+            if self._writer is not None:
+                with self._commit_cond:
+                    self._commit_queue.append(entry)
+                    self._commit_cond.notify_all()
+            else:
+                self._write_batch([entry])
+                self._maybe_fsync()
+            if (
+                self._merkle is not None
+                and len(self._merkle) - self._merkle_saved_count
+                >= self.config.merkle_persist_interval
+            ):
+                self._save_merkle()
 
             return entry
 
@@ -324,17 +1005,19 @@ class Ledger:
 
     def get(self, index: int) -> Optional[LedgerEntry]:
         """Get entry by index."""
-        if 0 <= index < len(self._entries):
-            return self._entries[index]
+        if 0 <= index < len(self):
+            return self._entry_at(index)
         return None
 
     def get_range(self, start: int, end: int) -> List[LedgerEntry]:
         """Get entries in range [start, end)."""
-        return self._entries[start:end]
+        span = range(len(self))[start:end]
+        return list(self._iter_range(span.start, span.stop))
 
     def get_latest(self, n: int = 10) -> List[LedgerEntry]:
         """Get the n most recent entries."""
-        return self._entries[-n:]
+        total = len(self)
+        return list(self._iter_range(max(0, total - n), total))
 
     def search(
         self,
@@ -343,61 +1026,164 @@ class Ledger:
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
         limit: int = 100,
+        before: Optional[int] = None,
     ) -> List[LedgerEntry]:
-        """Search entries with filters."""
-        matches = []
-
-        for entry in reversed(self._entries):
-            if len(matches) >= limit:
-                break
-
-            if operation and entry.operation != operation:
-                continue
-            if result and entry.result != result:
-                continue
-            if start_time and entry.timestamp < start_time:
-                continue
-            if end_time and entry.timestamp > end_time:
-                continue
-
-            matches.append(entry)
+        """
+        Search entries with filters, newest first.
 
-        return matches
+        Uses the secondary indexes, so only matching entries are read.
+        Pass before=<index> to continue below an earlier page (cursor).
+        """
+        with self._lock:
+            indices = self._index.search(
+                operation=operation,
+                result=result,
+                start_time=start_time,
+                end_time=end_time,
+                limit=limit,
+                before=before,
+            )
+        return [self._entry_at(i) for i in indices]
 
     def __len__(self) -> int:
-        return len(self._entries)
+        return self._count
 
     def __iter__(self) -> Iterator[LedgerEntry]:
-        return iter(self._entries)
+        return self._iter_range(0, len(self))
+
+    def _entry_at(self, index: int) -> LedgerEntry:
+        """Entry at a valid index, from the hot cache or its segment."""
+        offset = index - self._cache_base
+        if offset >= 0:
+            try:
+                entry = self._entries[offset]
+                if entry.index == index:
+                    return entry
+            except IndexError:
+                pass  # Cache trimmed concurrently
+        return LedgerEntry.from_dict(json.loads(self._store.read(index)))
+
+    def _iter_range(self, start: int, end: int) -> Iterator[LedgerEntry]:
+        for i in range(start, end):
+            yield self._entry_at(i)
+
+    def _cache_entry(self, entry: LedgerEntry):
+        """
+        Add a new entry to the hot cache, trimming the oldest in chunks.
+        Entries still waiting for the writer are never trimmed.
+        """
+        self._entries.append(entry)
+        limit = self.config.max_entries_memory
+        if len(self._entries) > limit:
+            drop = len(self._entries) - limit + limit // 4
+            drop = min(drop, len(self._store) - self._cache_base)
+            if drop > 0:
+                del self._entries[:drop]
+                self._cache_base += drop
 
     # ─────────────────────────────────────────────────────────────────────────
     # INTEGRITY VERIFICATION
     # ─────────────────────────────────────────────────────────────────────────
 
-    def verify_chain(self) -> tuple:
+    def verify_chain(self, full: bool = False) -> tuple:
         """
-        Verify the entire chain integrity.
+        Verify the chain integrity.
         Returns (valid, first_invalid_index).
+
+        Only entries appended since the last verified checkpoint are
+        checked; the checkpoint then advances to the tip. Pass full=True
+        to re-verify from genesis (start_audit runs this in the background).
         """
-        if not self._entries:
+        n = len(self)
+        if n == 0:
             return True, -1
 
-        # Check genesis
-        if self._entries[0].prev_hash != self.GENESIS_HASH:
-            return False, 0
+        start = 0
+        checkpoint = self._checkpoint
+        if not full and checkpoint is not None:
+            cp_index, cp_hash = checkpoint
+            if cp_index < n and self._entry_at(cp_index).entry_hash == cp_hash:
+                start = cp_index + 1
+
+        valid, invalid_at = self._verify_range(start, n)
+        if valid:
+            self._advance_checkpoint(n - 1)
+        return valid, invalid_at
+
+    def _verify_range(self, start: int, end: int, progress: Optional[Dict] = None) -> tuple:
+        """Verify entries [start, end) and their links to the previous entry."""
+        # Genesis links to GENESIS_HASH
+        prev_hash = self.GENESIS_HASH if start == 0 else self._entry_at(start - 1).entry_hash
 
-        # Verify each entry
-        for i, entry in enumerate(self._entries):
+        for i, entry in enumerate(self._iter_range(start, end), start):
             # Verify self-hash
             if not entry.verify_integrity():
                 return False, i
 
             # Verify chain link
-            if i > 0 and entry.prev_hash != self._entries[i - 1].entry_hash:
+            if entry.prev_hash != prev_hash:
                 return False, i
+            prev_hash = entry.entry_hash
+
+            if progress is not None and i % 1000 == 0:
+                progress["verified"] = i - start
 
         return True, -1
 
+    def start_audit(self) -> bool:
+        """
+        Re-verify the whole chain from genesis in a background thread.
+
+        Progress is reported by audit_status() (and stats()). A failed audit
+        drops the checkpoint so verify_chain() reports the damage too.
+        Returns False if an audit is already running.
+        """
+        with self._checkpoint_lock:
+            if self._audit.get("running"):
+                return False
+            self._audit = {
+                "running": True,
+                "verified": 0,
+                "total": len(self),
+                "started_at": int(time.time() * 1000),
+            }
+            self._audit_thread = Thread(target=self._run_audit, daemon=True)
+            self._audit_thread.start()
+            return True
+
+    def _run_audit(self):
+        audit = self._audit
+        total = audit["total"]
+        valid, invalid_at = self._verify_range(0, total, progress=audit) if total else (True, -1)
+
+        if valid:
+            if total:
+                self._advance_checkpoint(total - 1)
+        else:
+            with self._checkpoint_lock:
+                self._checkpoint = None
+                self._save_checkpoint()
+
+        audit.update(
+            running=False,
+            verified=total if valid else invalid_at,
+            valid=valid,
+            first_invalid=invalid_at,
+            finished_at=int(time.time() * 1000),
+        )
+
+    def audit_status(self) -> Dict[str, Any]:
+        """Progress of the most recent full audit."""
+        return dict(self._audit)
+
+    def _advance_checkpoint(self, index: int):
+        """Record index as verified if it is beyond the current checkpoint."""
+        with self._checkpoint_lock:
+            if self._checkpoint is not None and self._checkpoint[0] >= index:
+                return
+            self._checkpoint = (index, self._entry_at(index).entry_hash)
+            self._save_checkpoint()
+
     def verify_entry(self, index: int) -> bool:
         """Verify a single entry's integrity."""
         entry = self.get(index)
@@ -405,29 +1191,29 @@ class Ledger:
             return False
         return entry.verify_integrity()
 
+    def _get_merkle(self) -> MerkleAccumulator:
+        """Return the Merkle tree, building it if it is not maintained."""
+        if self._merkle is None:
+            self._merkle = MerkleAccumulator([e.entry_hash for e in self])
+        return self._merkle
+
     def get_merkle_root(self) -> str:
         """Get the Merkle root of all entries."""
-        if self._merkle_tree is None:
-            hashes = [e.entry_hash for e in self._entries]
-            self._merkle_tree = MerkleTree(hashes)
-        return self._merkle_tree.root
+        with self._lock:
+            return self._get_merkle().root
 
     def get_merkle_proof(self, index: int) -> List[tuple]:
         """Get Merkle proof for entry at index."""
-        if self._merkle_tree is None:
-            hashes = [e.entry_hash for e in self._entries]
-            self._merkle_tree = MerkleTree(hashes)
-        return self._merkle_tree.get_proof(index)
+        with self._lock:
+            return self._get_merkle().get_proof(index)
 
     def verify_merkle_proof(self, index: int, proof: List[tuple]) -> bool:
         """Verify a Merkle proof for entry at index."""
         entry = self.get(index)
         if entry is None:
             return False
-        if self._merkle_tree is None:
-            hashes = [e.entry_hash for e in self._entries]
-            self._merkle_tree = MerkleTree(hashes)
-        return self._merkle_tree.verify_proof(entry.entry_hash, proof)
+        with self._lock:
+            return self._get_merkle().verify_proof(entry.entry_hash, proof)
 
     # ─────────────────────────────────────────────────────────────────────────
     # EXPORT
@@ -439,8 +1225,8 @@ class Ledger:
             "version": "1.0.0",
             "exported_at": int(time.time() * 1000),
             "merkle_root": self.get_merkle_root(),
-            "entry_count": len(self._entries),
-            "entries": [e.to_dict() for e in self._entries],
+            "entry_count": len(self),
+            "entries": [e.to_dict() for e in self],
         }
 
         json_str = json.dumps(data, indent=2)
@@ -465,57 +1251,297 @@ class Ledger:
             "entry": entry.to_dict(),
             "merkle_root": self.get_merkle_root(),
             "merkle_proof": self.get_merkle_proof(index),
-            "total_entries": len(self._entries),
+            "total_entries": len(self),
             "certificate_generated": int(time.time() * 1000),
             "signature": self._sign_certificate(entry),
         }
 
     def _sign_certificate(self, entry: LedgerEntry) -> str:
         """Generate certificate signature."""
-        data = f"{entry.entry_hash}:{self.get_merkle_root()}:{len(self._entries)}"
+        data = f"{entry.entry_hash}:{self.get_merkle_root()}:{len(self)}"
         return hashlib.sha256(data.encode()).hexdigest()[:16].upper()
 
     # ─────────────────────────────────────────────────────────────────────────
     # PERSISTENCE
     # ─────────────────────────────────────────────────────────────────────────
 
-    def _save_entry(self, entry: LedgerEntry):
-        """Append entry to disk."""
-        path = Path(self.config.storage_path)
-        path.mkdir(parents=True, exist_ok=True)
+    def _write_batch(self, batch: List[LedgerEntry]):
+        """Append entries to disk (in the caller, or the commit writer)."""
+        rolled = False
+        for entry in batch:
+            rolled |= self._store.append(json.dumps(entry.to_dict()))
+        self._store.flush()
+        self._unsynced += len(batch)
+        self._written_index = batch[-1].index
+
+        # Snapshot the search index once per segment
+        if rolled:
+            if self._writer is None:
+                self._save_index()
+            else:
+                with self._lock:
+                    self._save_index()
 
-        ledger_file = path / "ledger.jsonl"
-        with open(ledger_file, "a") as f:
-            f.write(json.dumps(entry.to_dict()) + "\n")
+    def _maybe_fsync(self, force: bool = False):
+        """Apply fsync_policy to written entries and publish durability."""
+        if self._written_index == self._durable_index:
+            return
+
+        policy = self.config.fsync_policy
+        now = time.monotonic()
+        if policy != "never" and (
+            force
+            or policy == "always"
+            or (policy == "entries" and self._unsynced >= self.config.fsync_entries)
+            or (
+                policy == "interval"
+                and (now - self._last_fsync) * 1000 >= self.config.fsync_interval_ms
+            )
+        ):
+            self._store.flush(fsync=True)
+            self._last_fsync = now
+            self._unsynced = 0
+        elif policy != "never":
+            return
+
+        with self._commit_cond:
+            self._durable_index = self._written_index
+            self._commit_cond.notify_all()
+            waiters = self._commit_waiters
+            while waiters and waiters[0][0] <= self._durable_index:
+                heapq.heappop(waiters)[2].set_result(self._durable_index)
+
+    def _commit_loop(self):
+        """Background writer: drain the queue in batches (group commit)."""
+        interval = self.config.fsync_interval_ms / 1000
+        max_batch = self.config.group_commit_max_batch
+
+        while True:
+            with self._commit_cond:
+                while not (self._commit_queue or self._closing or self._sync_requested):
+                    timeout = None
+                    if self._written_index != self._durable_index:
+                        timeout = interval
+                    if not self._commit_cond.wait(timeout):
+                        break
+
+                batch = self._commit_queue[:max_batch]
+                del self._commit_queue[: len(batch)]
+                closing = self._closing and not self._commit_queue
+                force = closing or (self._sync_requested and not self._commit_queue)
+                if force:
+                    self._sync_requested = False
+
+            try:
+                if batch:
+                    self._write_batch(batch)
+                self._maybe_fsync(force=force)
+            except IOError as e:
+                print(f"Warning: Error writing ledger batch: {e}")
+
+            if closing:
+                return
+
+    def wait_durable(self, index: int, timeout: Optional[float] = None) -> bool:
+        """
+        Block until entry index is durable under fsync_policy.
+        Returns False on timeout.
+        """
+        if self._writer is None:
+            with self._lock:
+                if self._durable_index < index:
+                    self._maybe_fsync(force=True)
+            return self._durable_index >= index
+
+        with self._commit_cond:
+            if self._durable_index < index:
+                self._sync_requested = True
+                self._commit_cond.notify_all()
+            return self._commit_cond.wait_for(lambda: self._durable_index >= index, timeout)
+
+    def durable_future(self, index: int) -> Future:
+        """
+        Future resolved (with the durable index) once entry index is durable.
+        In async code: await asyncio.wrap_future(ledger.durable_future(i)).
+        """
+        future: Future = Future()
+        if self._writer is None:
+            self.wait_durable(index)
+
+        with self._commit_cond:
+            if self._durable_index >= index:
+                future.set_result(self._durable_index)
+            else:
+                heapq.heappush(self._commit_waiters, (index, id(future), future))
+                self._sync_requested = True
+                self._commit_cond.notify_all()
+        return future
 
     def _load(self):
-        """Load ledger from disk."""
+        """
+        Open the segmented store. Only the tail segment is read; older
+        entries are fetched from their segments on demand.
+        """
         path = Path(self.config.storage_path)
-        ledger_file = path / "ledger.jsonl"
+        segments = path / "segments"
+        legacy_file = path / "ledger.jsonl"
 
-        if not ledger_file.exists():
-            return
+        if legacy_file.exists() and not segments.exists():
+            self._migrate_jsonl(legacy_file, segments)
+
+        self._store = SegmentedStore(segments, self.config.segment_max_entries)
+        self._count = self._cache_base = len(self._store)
+        if self._count:
+            self._tip_hash = self._entry_at(self._count - 1).entry_hash
 
+    def _migrate_jsonl(self, legacy_file: Path, segments: Path):
+        """One-time import of a single-file ledger.jsonl into segments."""
+        staging = segments.with_name("segments.migrating")
+        if staging.exists():
+            shutil.rmtree(staging)
+
+        store = SegmentedStore(staging, self.config.segment_max_entries)
         try:
-            with open(ledger_file, "r") as f:
+            with open(legacy_file, "r") as f:
                 for line in f:
                     line = line.strip()
                     if line:
-                        entry_dict = json.loads(line)
-                        entry = LedgerEntry.from_dict(entry_dict)
-                        self._entries.append(entry)
-        except (json.JSONDecodeError, IOError) as e:
+                        LedgerEntry.from_dict(json.loads(line))
+                        store.append(line)
+        except (json.JSONDecodeError, IOError, KeyError) as e:
             print(f"Warning: Error loading ledger: {e}")
+        finally:
+            store.close()
 
-    def sync(self):
-        """Force sync to disk (rewrites entire file)."""
+        os.replace(staging, segments)
+        os.replace(legacy_file, legacy_file.with_name("ledger.jsonl.migrated"))
+
+    def _merkle_dir(self) -> Path:
+        return Path(self.config.storage_path) / "merkle"
+
+    def _load_merkle(self):
+        """
+        Restore the Merkle tree saved next to the ledger segments.
+
+        Only entries appended after the last save are rehashed. A saved
+        tree that does not match the loaded entries is discarded.
+        """
+        acc = MerkleAccumulator.load(self._merkle_dir())
+        if acc is not None:
+            n = len(acc)
+            if n > len(self) or (n and acc.leaves[n - 1] != self._entry_at(n - 1).entry_hash):
+                acc = None
+
+        if acc is None:
+            acc = MerkleAccumulator()
+        self._merkle_saved_count = len(acc)
+
+        for entry in self._iter_range(len(acc), len(self)):
+            acc.append(entry.entry_hash)
+        self._merkle = acc
+
+        if len(acc) != self._merkle_saved_count:
+            self._save_merkle()
+
+    def _save_merkle(self):
+        """Persist Merkle nodes changed since the last save."""
+        try:
+            if self._merkle.save(self._merkle_dir()):
+                self._merkle_saved_count = len(self._merkle)
+        except IOError as e:
+            print(f"Warning: Error saving Merkle tree: {e}")
+
+    def _index_dir(self) -> Path:
+        return Path(self.config.storage_path) / "index"
+
+    def _load_index(self):
+        """Load the search index snapshot and index entries added after it."""
+        loaded = LedgerIndex.load(self._index_dir())
+        index = LedgerIndex()
+        if loaded is not None:
+            n = len(loaded[0])
+            if n <= len(self) and (n == 0 or self._entry_at(n - 1).entry_hash == loaded[1]):
+                index = loaded[0]
+
+        for entry in self._iter_range(len(index), len(self)):
+            index.add(entry.index, entry.operation, entry.result, entry.timestamp)
+        self._index = index
+
+    def _save_index(self):
+        """Snapshot the search index (caller holds the lock)."""
+        try:
+            self._index.save(self._index_dir(), self._tip_hash)
+        except IOError as e:
+            print(f"Warning: Error saving ledger index: {e}")
+
+    def _load_checkpoint(self):
+        """Load the verified checkpoint, ignoring it if it no longer matches."""
+        checkpoint_file = Path(self.config.storage_path) / "checkpoint.json"
+        if not checkpoint_file.exists():
+            return
+
+        try:
+            with open(checkpoint_file, "r") as f:
+                data = json.load(f)
+            index, entry_hash = data["index"], data["entry_hash"]
+        except (json.JSONDecodeError, IOError, KeyError) as e:
+            print(f"Warning: Error loading ledger checkpoint: {e}")
+            return
+
+        if 0 <= index < len(self) and self._entry_at(index).entry_hash == entry_hash:
+            self._checkpoint = (index, entry_hash)
+
+    def _save_checkpoint(self):
+        """Write the checkpoint (caller holds _checkpoint_lock)."""
         path = Path(self.config.storage_path)
-        path.mkdir(parents=True, exist_ok=True)
+        checkpoint_file = path / "checkpoint.json"
+        try:
+            if self._checkpoint is None:
+                if checkpoint_file.exists():
+                    checkpoint_file.unlink()
+                return
+
+            path.mkdir(parents=True, exist_ok=True)
+            index, entry_hash = self._checkpoint
+            tmp = path / "checkpoint.json.tmp"
+            with open(tmp, "w") as f:
+                json.dump(
+                    {
+                        "index": index,
+                        "entry_hash": entry_hash,
+                        "verified_at": int(time.time() * 1000),
+                    },
+                    f,
+                )
+            os.replace(tmp, checkpoint_file)
+        except IOError as e:
+            print(f"Warning: Error saving ledger checkpoint: {e}")
 
-        ledger_file = path / "ledger.jsonl"
-        with open(ledger_file, "w") as f:
-            for entry in self._entries:
-                f.write(json.dumps(entry.to_dict()) + "\n")
+    def sync(self):
+        """Force sync to disk (fsyncs the tail segment and its index)."""
+        if self._writer is not None and self._writer.is_alive():
+            self.wait_durable(len(self) - 1)
+
+        with self._lock:
+            self._store.flush(fsync=True)
+            if self._merkle is not None:
+                self._save_merkle()
+            self._save_index()
+
+    def close(self):
+        """Drain pending commits, sync and release open segment files."""
+        if self._writer is not None:
+            with self._commit_cond:
+                self._closing = True
+                self._commit_cond.notify_all()
+            self._writer.join()
+            atexit.unregister(self.close)
+
+        if self._store.closed:
+            return
+        self.sync()
+        with self._lock:
+            self._store.close()
 
     # ─────────────────────────────────────────────────────────────────────────
     # STATS
@@ -523,31 +1549,31 @@ class Ledger:
 
     def stats(self) -> Dict[str, Any]:
         """Get ledger statistics."""
-        if not self._entries:
+        if not len(self):
             return {
                 "total_entries": 0,
                 "operations": {},
                 "results": {},
                 "chain_valid": True,
+                "audit": self.audit_status(),
             }
 
-        operations: Dict[str, int] = {}
-        results: Dict[str, int] = {}
-
-        for entry in self._entries:
-            operations[entry.operation] = operations.get(entry.operation, 0) + 1
-            results[entry.result] = results.get(entry.result, 0) + 1
+        with self._lock:
+            operations = self._index.counts()
+            results = self._index.counts(by_result=True)
 
         chain_valid, _ = self.verify_chain()
 
         return {
-            "total_entries": len(self._entries),
-            "first_entry": self._entries[0].timestamp if self._entries else None,
-            "last_entry": self._entries[-1].timestamp if self._entries else None,
+            "total_entries": len(self),
+            "first_entry": self._entry_at(0).timestamp,
+            "last_entry": self._entry_at(len(self) - 1).timestamp,
             "operations": operations,
             "results": results,
             "merkle_root": self.get_merkle_root(),
             "chain_valid": chain_valid,
+            "verified_through": self._checkpoint[0] if self._checkpoint else -1,
+            "audit": self.audit_status(),
         }
 
 
@@ -203,22 +203,21 @@ class MerkleAnchorScheduler:
         Returns:
             MerkleProof if successful, None otherwise
         """
-        # Get Merkle proof from ledger (returns list of tuples)
-        proof_tuples = self.ledger.get_merkle_proof(entry_index)
-        if not proof_tuples:
+        # Get entry
+        entry = self.ledger.get(entry_index)
+        if not entry:
             return None
 
+        # Get Merkle proof from ledger (returns list of tuples; empty for
+        # a single-entry ledger, where the entry hash is the root)
+        proof_tuples = self.ledger.get_merkle_proof(entry_index)
+
         # Convert tuples to dict format
         proof_path = [
             {"hash": hash_val, "direction": direction}
             for hash_val, direction in proof_tuples
         ]
 
-        # Get entry
-        entry = self.ledger.get(entry_index)
-        if not entry:
-            return None
-
         # Get current Merkle root
         merkle_root = self.ledger.get_merkle_root()
 
@@ -25,7 +25,8 @@ finfr in circuit form: g2 * 1 = 0 (the unrepresentable state)
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union, Set
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union, Set, Tuple
 from enum import Enum, auto
 
 # ===============================================================================
@@ -49,12 +50,22 @@ class FieldElement:
     Used for circuit arithmetic where all operations are mod p.
     """
 
+    __slots__ = ("prime", "value")
+
     _prime = BN254_PRIME
 
     def __init__(self, value: int, prime: Optional[int] = None):
         self.prime = prime or FieldElement._prime
         self.value = value % self.prime
 
+    @classmethod
+    def reduced(cls, value: int, prime: int) -> "FieldElement":
+        """Wrap a value already in [0, prime) without re-reducing it."""
+        element = object.__new__(cls)
+        element.prime = prime
+        element.value = value
+        return element
+
     @classmethod
     def set_prime(cls, prime: int):
         """Set the global prime for all field elements."""
@@ -1217,23 +1228,149 @@ class R1CSBuilder:
             )
 
 
+# ===============================================================================
+# POLYNOMIAL ARITHMETIC - plain ints mod p, coefficients low degree first
+# ===============================================================================
+
+
+def _poly_from_roots(roots: Tuple[int, ...], prime: int) -> List[int]:
+    """Coefficients of prod(x - r) over roots."""
+    coeffs = [1]
+    for root in roots:
+        shifted = [0] + coeffs
+        for i, c in enumerate(coeffs):
+            shifted[i] = (shifted[i] - c * root) % prime
+        coeffs = shifted
+    return coeffs
+
+
+@lru_cache(maxsize=2)
+def _lagrange_basis(roots: Tuple[int, ...], prime: int) -> List[List[int]]:
+    """
+    Coefficients of every Lagrange basis polynomial over roots.
+
+    L_i(x) = T(x) / ((x - r_i) * T'(r_i)) where T is the target polynomial,
+    so each basis is one synthetic division of T, and T'(r_i) is that
+    quotient evaluated at r_i. The whole set costs O(m^2) and is cached
+    per root set, since every witness column interpolates over it.
+    """
+    target = _poly_from_roots(roots, prime)
+    m = len(roots)
+    basis = []
+    for root in roots:
+        quotient = [0] * m
+        acc = 0
+        for k in range(m, 0, -1):
+            acc = (acc * root + target[k]) % prime
+            quotient[k - 1] = acc
+        denominator = 0
+        for c in reversed(quotient):
+            denominator = (denominator * root + c) % prime
+        inv = pow(denominator, prime - 2, prime)
+        basis.append([c * inv % prime for c in quotient])
+    return basis
+
+
+def _root_of_unity(n: int, prime: int) -> int:
+    """
+    A primitive n-th root of unity mod prime (n a power of two).
+
+    Raises:
+        ValueError: If n does not divide prime - 1
+    """
+    if (prime - 1) % n:
+        raise ValueError(
+            f"F_{prime} has no {n}-th roots of unity; use domain='range'"
+        )
+    # omega = g^((p-1)/n) is primitive iff g is a quadratic non-residue
+    g = 2
+    while pow(g, (prime - 1) // 2, prime) == 1:
+        g += 1
+    return pow(g, (prime - 1) // n, prime)
+
+
+def _ntt(values: List[int], omega: int, prime: int) -> List[int]:
+    """Evaluate the polynomial with coefficients `values` at powers of omega."""
+    n = len(values)
+    a = list(values)
+
+    # Bit-reversal permutation
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            a[i], a[j] = a[j], a[i]
+
+    # Iterative Cooley-Tukey butterflies
+    length = 2
+    while length <= n:
+        half = length // 2
+        step = pow(omega, n // length, prime)
+        twiddles = [1] * half
+        for k in range(1, half):
+            twiddles[k] = twiddles[k - 1] * step % prime
+        for start in range(0, n, length):
+            for k in range(half):
+                u = a[start + k]
+                v = a[start + k + half] * twiddles[k] % prime
+                a[start + k] = (u + v) % prime
+                a[start + k + half] = (u - v) % prime
+        length <<= 1
+
+    return a
+
+
 # ===============================================================================
 # QAP - Quadratic Arithmetic Program
 # ===============================================================================
 
 
-@dataclass
 class QAPPolynomial:
     """
     A polynomial in coefficient form.
 
     Coefficients are indexed from degree 0 (constant term) upward.
+
+    Polynomials built by QAPBuilder hold plain ints mod p (from_ints) and
+    only create FieldElement coefficients when `coefficients` is read.
     """
 
-    coefficients: List[FieldElement]
+    def __init__(self, coefficients: List[FieldElement]):
+        self._coefficients: Optional[List[FieldElement]] = coefficients
+        self._values: Optional[List[int]] = None
+        self._prime = 0
+
+    @classmethod
+    def from_ints(cls, values: List[int], prime: int) -> "QAPPolynomial":
+        """Polynomial over coefficients already reduced mod prime."""
+        poly = cls.__new__(cls)
+        poly._coefficients = None
+        poly._values = values
+        poly._prime = prime
+        return poly
+
+    @property
+    def coefficients(self) -> List[FieldElement]:
+        if self._coefficients is None:
+            reduced = FieldElement.reduced
+            self._coefficients = [reduced(v, self._prime) for v in self._values]
+            # The list is mutable from here on, so it is the only copy
+            self._values = None
+        return self._coefficients
 
     def evaluate(self, x: FieldElement) -> FieldElement:
         """Evaluate polynomial at x using Horner's method."""
+        if self._values is not None:
+            prime = self._prime
+            result = 0
+            for coeff in reversed(self._values):
+                result = (result * x.value + coeff) % prime
+            return FieldElement.reduced(result, prime)
+
         if not self.coefficients:
             return FieldElement.zero(x.prime)
 
@@ -1245,12 +1382,24 @@ class QAPPolynomial:
 
     def degree(self) -> int:
         """Return degree of polynomial."""
+        if self._values is not None:
+            return len(self._values) - 1
         return len(self.coefficients) - 1
 
     def to_list(self) -> List[int]:
         """Return coefficients as list of integers."""
+        if self._values is not None:
+            return list(self._values)
         return [c.value for c in self.coefficients]
 
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, QAPPolynomial):
+            return NotImplemented
+        return self.to_list() == other.to_list()
+
+    def __repr__(self) -> str:
+        return f"QAPPolynomial(coefficients={self.coefficients!r})"
+
 
 class QAPBuilder:
     """
@@ -1263,10 +1412,26 @@ class QAPBuilder:
         A(x) * B(x) - C(x) = H(x) * T(x)
 
     where T(x) is the target polynomial vanishing on evaluation points.
+
+    Evaluation domains:
+        "range": r_i = 1..m, T(x) = prod(x - r_i)
+        "ntt":   r_i = w^i for a primitive n-th root of unity w, n the next
+                 power of two >= m (constraints are padded with 0 * 0 = 0),
+                 T(x) = x^n - 1. Interpolation is an inverse NTT, so large
+                 circuits avoid the O(m^2) basis; the field needs
+                 n | p - 1 (BN254 supports n up to 2^28).
+
+    Interpolation runs on plain ints mod p and only visits the non-zero
+    entries of each witness column.
     """
 
-    def __init__(self, prime: int = BN254_PRIME):
+    DOMAINS = ("range", "ntt")
+
+    def __init__(self, prime: int = BN254_PRIME, domain: str = "range"):
+        if domain not in self.DOMAINS:
+            raise ValueError(f"Unknown evaluation domain: {domain}")
         self.prime = prime
+        self.domain = domain
         self.A_polys: Dict[int, QAPPolynomial] = {}
         self.B_polys: Dict[int, QAPPolynomial] = {}
         self.C_polys: Dict[int, QAPPolynomial] = {}
@@ -1285,44 +1450,105 @@ class QAPBuilder:
         if self.num_constraints == 0:
             return self
 
-        # Choose evaluation points: r_i = i for i in 1..m
-        self.roots = list(range(1, self.num_constraints + 1))
-
-        # Build target polynomial T(x) = prod_{i=1..m}(x - r_i)
-        self.target_poly = self._build_target_polynomial()
-
-        # For each witness variable, build A_j, B_j, C_j polynomials
-        for j in range(num_witness):
-            # Extract coefficient of w_j in each constraint's A vector
-            a_values = [constraints[i].A.get(j, 0) for i in range(self.num_constraints)]
-            b_values = [constraints[i].B.get(j, 0) for i in range(self.num_constraints)]
-            c_values = [constraints[i].C.get(j, 0) for i in range(self.num_constraints)]
-
-            # Interpolate polynomials passing through (r_i, value_i)
-            self.A_polys[j] = self._lagrange_interpolate(self.roots, a_values)
-            self.B_polys[j] = self._lagrange_interpolate(self.roots, b_values)
-            self.C_polys[j] = self._lagrange_interpolate(self.roots, c_values)
+        if self.domain == "ntt":
+            size = 1 << (self.num_constraints - 1).bit_length()
+            omega = _root_of_unity(size, self.prime)
+            self.roots = [pow(omega, i, self.prime) for i in range(size)]
+            # T(x) = x^n - 1 vanishes on every n-th root of unity
+            target = [self.prime - 1] + [0] * (size - 1) + [1]
+            interpolate = self._ntt_interpolator(omega, size)
+        else:
+            # Choose evaluation points: r_i = i for i in 1..m
+            self.roots = list(range(1, self.num_constraints + 1))
+            target = _poly_from_roots(tuple(self.roots), self.prime)
+            interpolate = self._basis_interpolator(tuple(self.roots))
+
+        self.target_poly = self._to_poly(target)
+
+        # For each witness variable, build A_j, B_j, C_j polynomials from
+        # the (constraint, coefficient) pairs where it appears
+        for polys, vectors in (
+            (self.A_polys, [c.A for c in constraints]),
+            (self.B_polys, [c.B for c in constraints]),
+            (self.C_polys, [c.C for c in constraints]),
+        ):
+            for j, column in enumerate(self._columns(vectors, num_witness)):
+                polys[j] = self._to_poly(interpolate(column))
 
         return self
 
-    def _build_target_polynomial(self) -> QAPPolynomial:
-        """Build target polynomial T(x) = prod(x - r_i)."""
-        # Start with T(x) = 1
-        coeffs = [F(1, self.prime)]
+    def _columns(
+        self, vectors: List[Dict[int, int]], num_witness: int
+    ) -> List[List[Tuple[int, int]]]:
+        """Transpose constraint rows into per-witness (row, value) lists."""
+        prime = self.prime
+        half = prime // 2
+        columns: List[List[Tuple[int, int]]] = [[] for _ in range(num_witness)]
+        for i, vector in enumerate(vectors):
+            for j, value in vector.items():
+                value %= prime
+                if value and 0 <= j < num_witness:
+                    # Keep small negatives small: -1 rather than p - 1
+                    columns[j].append((i, value - prime if value > half else value))
+        return columns
+
+    def _basis_interpolator(self, roots: Tuple[int, ...]):
+        """Interpolate columns as sums of the cached Lagrange basis."""
+        basis = _lagrange_basis(roots, self.prime)
+        prime = self.prime
+        size = len(roots)
+
+        def interpolate(column: List[Tuple[int, int]]) -> List[int]:
+            acc = [0] * size
+            for i, value in column:
+                row = basis[i]
+                if value == 1:
+                    acc = [a + b for a, b in zip(acc, row)]
+                else:
+                    acc = [a + value * b for a, b in zip(acc, row)]
+            return [a % prime for a in acc]
 
-        for root in self.roots:
-            # Multiply by (x - root)
-            new_coeffs = [F(0, self.prime)] * (len(coeffs) + 1)
+        return interpolate
 
-            for i, c in enumerate(coeffs):
-                # c * x term
-                new_coeffs[i + 1] = new_coeffs[i + 1] + c
-                # c * (-root) term
-                new_coeffs[i] = new_coeffs[i] - c * F(root, self.prime)
+    def _ntt_interpolator(self, omega: int, size: int):
+        """
+        Interpolate columns over the n-th roots of unity.
 
-            coeffs = new_coeffs
+        There L_i(x) = (1/n) * sum_k w^(-ik) x^k, so a column with few
+        entries is summed directly from one table of powers of w^-1;
+        denser columns go through an inverse NTT.
+        """
+        prime = self.prime
+        inv_omega = pow(omega, prime - 2, prime)
+        inv_size = pow(size, prime - 2, prime)
+        powers = [1] * size
+        for k in range(1, size):
+            powers[k] = powers[k - 1] * inv_omega % prime
+        dense_from = size.bit_length()
+
+        def interpolate(column: List[Tuple[int, int]]) -> List[int]:
+            if len(column) >= dense_from:
+                values = [0] * size
+                for i, value in column:
+                    values[i] = value % prime
+                coeffs = _ntt(values, inv_omega, prime)
+                return [c * inv_size % prime for c in coeffs]
+
+            acc = [0] * size
+            for i, value in column:
+                # w^(-ik) = powers[ik mod n]
+                acc = [a + value * powers[i * k % size] for k, a in enumerate(acc)]
+            return [a * inv_size % prime for a in acc]
+
+        return interpolate
+
+    def _to_poly(self, coeffs: List[int]) -> QAPPolynomial:
+        """Polynomial over reduced int coefficients."""
+        return QAPPolynomial.from_ints(coeffs, self.prime)
 
-        return QAPPolynomial(coefficients=coeffs)
+    def _build_target_polynomial(self) -> QAPPolynomial:
+        """Build target polynomial T(x) = prod(x - r_i)."""
+        return self._to_poly(_poly_from_roots(tuple(self.roots), self.prime))
 
     def _lagrange_interpolate(
         self, points: List[int], values: List[int]
@@ -1333,62 +1559,15 @@ class QAPBuilder:
         L_i(x) = prod_{j!=i}((x - x_j) / (x_i - x_j))
         P(x) = sum_i(y_i * L_i(x))
         """
-        n = len(points)
-
-        if n == 0:
+        if not points:
             return QAPPolynomial(coefficients=[F(0, self.prime)])
 
-        # Build each Lagrange basis polynomial
-        result_coeffs = [F(0, self.prime)] * n
-
-        for i in range(n):
-            if values[i] == 0:
-                continue
-
-            # Build L_i(x)
-            basis = self._build_lagrange_basis(points, i)
-
-            # Multiply by y_i and add to result
-            for j, coeff in enumerate(basis.coefficients):
-                if j < len(result_coeffs):
-                    result_coeffs[j] = result_coeffs[j] + coeff * F(
-                        values[i], self.prime
-                    )
-
-        return QAPPolynomial(coefficients=result_coeffs)
+        column = self._columns([{0: y} for y in values], 1)[0]
+        return self._to_poly(self._basis_interpolator(tuple(points))(column))
 
     def _build_lagrange_basis(self, points: List[int], i: int) -> QAPPolynomial:
         """Build i-th Lagrange basis polynomial L_i(x)."""
-        n = len(points)
-        x_i = points[i]
-
-        # L_i(x) = prod_{j!=i}((x - x_j) / (x_i - x_j))
-        # Start with 1
-        coeffs = [F(1, self.prime)]
-
-        denominator = F(1, self.prime)
-
-        for j in range(n):
-            if j == i:
-                continue
-
-            x_j = points[j]
-
-            # Multiply by (x - x_j)
-            new_coeffs = [F(0, self.prime)] * (len(coeffs) + 1)
-            for k, c in enumerate(coeffs):
-                new_coeffs[k + 1] = new_coeffs[k + 1] + c  # c * x
-                new_coeffs[k] = new_coeffs[k] - c * F(x_j, self.prime)  # c * (-x_j)
-            coeffs = new_coeffs
-
-            # Accumulate denominator
-            denominator = denominator * (F(x_i, self.prime) - F(x_j, self.prime))
-
-        # Divide by denominator
-        inv_denom = denominator.inverse()
-        coeffs = [c * inv_denom for c in coeffs]
-
-        return QAPPolynomial(coefficients=coeffs)
+        return self._to_poly(list(_lagrange_basis(tuple(points), self.prime)[i]))
 
     def to_dict(self) -> Dict[str, Any]:
         """Export QAP as dictionary."""
@@ -1396,6 +1575,7 @@ class QAPBuilder:
             "field": f"F_p where p = {self.prime}",
             "num_constraints": self.num_constraints,
             "num_witness": self.num_witness,
+            "domain": self.domain,
             "roots": self.roots,
             "target_poly": self.target_poly.to_list() if self.target_poly else [],
             "A_polys": {k: v.to_list() for k, v in self.A_polys.items()},
@@ -1528,9 +1708,12 @@ class QAPCompiler:
         result.qap         # Quadratic Arithmetic Program
     """
 
-    def __init__(self, prime: int = BN254_PRIME, debug: bool = False):
+    def __init__(
+        self, prime: int = BN254_PRIME, debug: bool = False, domain: str = "range"
+    ):
         self.prime = prime
         self.debug = debug
+        self.domain = domain
 
     def compile(self, source: str) -> CompilationResult:
         """Compile tinyTalk source to QAP."""
@@ -1576,7 +1759,7 @@ class QAPCompiler:
                 self._debug_print("R1CS", r1cs)
 
             # QAP conversion phase
-            qap = QAPBuilder(self.prime)
+            qap = QAPBuilder(self.prime, self.domain)
             qap.build(r1cs, symbols.next_witness_idx)
 
             if self.debug:
@@ -1618,7 +1801,7 @@ class QAPCompiler:
 
 
 def compile_to_qap(
-    source: str, prime: int = BN254_PRIME, debug: bool = False
+    source: str, prime: int = BN254_PRIME, debug: bool = False, domain: str = "range"
 ) -> CompilationResult:
     """
     Convenience function to compile tinyTalk to QAP.
@@ -1627,11 +1810,12 @@ def compile_to_qap(
         source: tinyTalk source code
         prime: Field prime (default: BN254)
         debug: Print debug output
+        domain: QAP evaluation domain, "range" or "ntt" (see QAPBuilder)
 
     Returns:
         CompilationResult with all compilation artifacts
     """
-    compiler = QAPCompiler(prime=prime, debug=debug)
+    compiler = QAPCompiler(prime=prime, debug=debug, domain=domain)
     return compiler.compile(source)
 
 
@@ -1710,25 +1894,16 @@ def format_compilation_output(result: CompilationResult) -> str:
         lines.append(f"  Roots: {result.qap.roots}")
 
         if result.qap.target_poly:
-            lines.append("  T(x) = prod(x - r_i)")
+            if result.qap.domain == "ntt":
+                lines.append(f"  T(x) = x^{len(result.qap.roots)} - 1")
+            else:
+                lines.append("  T(x) = prod(x - r_i)")
 
         lines.append("  Polynomials:")
         for j in sorted(result.qap.A_polys.keys()):
-            a_deg = (
-                result.qap.A_polys[j].degree()
-                if result.qap.A_polys[j].coefficients
-                else 0
-            )
-            b_deg = (
-                result.qap.B_polys[j].degree()
-                if result.qap.B_polys[j].coefficients
-                else 0
-            )
-            c_deg = (
-                result.qap.C_polys[j].degree()
-                if result.qap.C_polys[j].coefficients
-                else 0
-            )
+            a_deg = max(result.qap.A_polys[j].degree(), 0)
+            b_deg = max(result.qap.B_polys[j].degree(), 0)
+            c_deg = max(result.qap.C_polys[j].degree(), 0)
             lines.append(f"    w[{j}]: A deg={a_deg}, B deg={b_deg}, C deg={c_deg}")
 
     # Errors
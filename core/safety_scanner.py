@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════════════
+NEWTON SAFETY SCANNER
+Compiled, prefiltered content safety matching.
+
+Every pattern is compiled once, and its parse tree is walked for a set of
+literal strings that any match must contain ("hack", "crack", "bypass", ...).
+A scan lower-cases the text once, checks which of those literals occur, and
+only runs the regexes whose literals are present. Clean text, the common
+case, costs one substring check per distinct literal instead of a regex scan
+per pattern. Those checks are separate C-level `in` searches rather than one
+combined pass: on CPython they beat a single alternation (or a trie of the
+literals) over the same text by roughly 2x.
+
+The result is identical to calling re.search(pattern, text.lower()) for
+each pattern in turn.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import re
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# The regex parser is private to the re module; without it no literals are
+# derived and every pattern is simply searched.
+try:
+    from re import _constants as _sre, _parser as _sre_parse
+except ImportError:
+    try:  # Python < 3.11
+        import sre_constants as _sre
+        import sre_parse as _sre_parse
+    except ImportError:
+        _sre = _sre_parse = None
+
+_REPEATS = {
+    getattr(_sre, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(_sre, name)
+}
+_ATOMIC_GROUP = getattr(_sre, "ATOMIC_GROUP", None)
+
+
+def _strength(literals: FrozenSet[str]) -> Tuple[int, int]:
+    """Longer shortest literal first, then fewer alternatives."""
+    return (min(map(len, literals)), -len(literals))
+
+
+def _sequence_literals(items) -> Optional[FrozenSet[str]]:
+    """Best required-literal set for a sequence of parse items."""
+    best = None
+    run: List[str] = []
+
+    def consider(literals):
+        nonlocal best
+        if literals and (best is None or _strength(literals) > _strength(best)):
+            best = literals
+
+    for op, av in items:
+        if op is _sre.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            consider(frozenset(["".join(run)]))
+            run = []
+        consider(_item_literals(op, av))
+    if run:
+        consider(frozenset(["".join(run)]))
+    return best
+
+
+def _item_literals(op, av) -> Optional[FrozenSet[str]]:
+    """Literals one of which every match of this item contains, or None."""
+    if op is _sre.SUBPATTERN:
+        add_flags = av[1]
+        if add_flags & _sre.SRE_FLAG_IGNORECASE:
+            return None
+        return _sequence_literals(av[-1])
+    if op is _ATOMIC_GROUP:
+        return _sequence_literals(av)
+    if op in _REPEATS:
+        low, _, body = av
+        return _sequence_literals(body) if low >= 1 else None
+    if op is _sre.BRANCH:
+        union = set()
+        for branch in av[1]:
+            literals = _sequence_literals(branch)
+            if literals is None:
+                return None
+            union |= literals
+        return frozenset(union)
+    return None
+
+
+def required_literals(pattern: str) -> Optional[FrozenSet[str]]:
+    """
+    Literal strings one of which occurs in every match of pattern.
+
+    Returns None when no such set can be derived (case-insensitive flags,
+    character classes only, optional-only content, ...), in which case the
+    pattern is always searched.
+    """
+    if _sre_parse is None:
+        return None
+    try:
+        parsed = _sre_parse.parse(pattern)
+        state = getattr(parsed, "state", None) or getattr(parsed, "pattern", None)
+        if getattr(state, "flags", 0) & _sre.SRE_FLAG_IGNORECASE:
+            return None
+        return _sequence_literals(parsed.data)
+    except (re.error, AttributeError, TypeError, ValueError):
+        return None
+
+
+class SafetyScanner:
+    """
+    Compiled scanner for a {category: {"patterns": [...], ...}} table.
+
+    Used by Forge.verify_content, ConstraintChecker.check_safety and the
+    agent pipelines, each with its own pattern table. Text is lower-cased
+    before matching, as all of those callers did.
+    """
+
+    def __init__(self, categories: Dict[str, Dict[str, Any]]):
+        self.categories = categories
+        self._order = list(categories)
+        self._patterns: Dict[str, List[Tuple[re.Pattern, Optional[FrozenSet[str]]]]] = {
+            name: [(re.compile(p), required_literals(p)) for p in spec["patterns"]]
+            for name, spec in categories.items()
+        }
+
+    def _first_match(
+        self, name: str, text: str, present: Dict[str, bool]
+    ) -> Optional[re.Pattern]:
+        """First pattern of a category (in table order) that matches text."""
+        for compiled, literals in self._patterns[name]:
+            if literals is not None:
+                for literal in literals:
+                    hit = present.get(literal)
+                    if hit is None:
+                        hit = present[literal] = literal in text
+                    if hit:
+                        break
+                else:
+                    continue
+            if compiled.search(text):
+                return compiled
+        return None
+
+    def _selected(self, categories: Optional[Iterable[str]]) -> List[str]:
+        """Known categories in the caller's order; unknown names are skipped."""
+        if categories is None:
+            return list(self._order)
+        return [name for name in categories if name in self._patterns]
+
+    def _scan(
+        self, text: str, categories: Optional[Iterable[str]]
+    ) -> List[Tuple[str, re.Pattern]]:
+        text = text.lower()
+        present: Dict[str, bool] = {}
+        found: Dict[str, Optional[re.Pattern]] = {}
+        out = []
+        for name in self._selected(categories):
+            if name not in found:
+                found[name] = self._first_match(name, text, present)
+            if found[name] is not None:
+                out.append((name, found[name]))
+        return out
+
+    def scan(self, text: str, categories: Optional[Iterable[str]] = None) -> List[str]:
+        """Categories with at least one matching pattern, in the order asked."""
+        return [name for name, _ in self._scan(text, categories)]
+
+    def check(
+        self, text: str, categories: Optional[Iterable[str]] = None
+    ) -> Tuple[List[str], List[str]]:
+        """(passed, failed) category names, in the order asked."""
+        selected = self._selected(categories)
+        failed = self.scan(text, selected)
+        failed_set = set(failed)
+        return [name for name in selected if name not in failed_set], failed
+
+    def violations(
+        self, text: str, categories: Optional[Iterable[str]] = None
+    ) -> List[Tuple[str, str]]:
+        """(category, first matching pattern in table order) per violation."""
+        return [(name, compiled.pattern) for name, compiled in self._scan(text, categories)]
@@ -11,14 +11,20 @@ Your constraints, your keys, your rules.
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 import hashlib
 import hmac
 import time
 import json
 import os
 import base64
+import mmap
+import struct
+import threading
+import zlib
 from pathlib import Path
 
 # Use cryptography library if available, fallback to basic implementation
@@ -44,7 +50,14 @@ class VaultConfig:
     storage_path: str = ".newton_vault"
     key_derivation_iterations: int = 100000
     encryption_enabled: bool = True
-    auto_save: bool = True
+    auto_save: bool = True  # flush each write to the log as it happens
+    fsync: bool = True  # fsync on every flush (store_many fsyncs once per batch)
+    compaction_ratio: float = 0.5  # compact once this share of the log is dead
+    compaction_min_bytes: int = 1 << 20  # but never for less dead space than this
+    key_cache_ttl: float = 300.0  # seconds a derived key is reused; 0 disables
+    key_cache_size: int = 1024
+    crypto_workers: int = field(default_factory=lambda: min(4, os.cpu_count() or 1))
+    parallel_min_bytes: int = 1 << 20  # batches smaller than this stay on one thread
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -140,6 +153,100 @@ class KeyDerivation:
         return hashlib.sha256(identity.encode()).hexdigest()[:16].upper()
 
 
+def _zero(buffer: bytearray):
+    """Overwrite key material in place."""
+    buffer[:] = bytes(len(buffer))
+
+
+class KeyCache:
+    """
+    Short-lived cache of derived keys, so repeated unlocks skip PBKDF2.
+
+    Entries are indexed by an HMAC of (identity, passphrase, salt) under a
+    per-process secret; passphrases are never held. Keys are kept in
+    bytearrays and zeroed when they expire, are evicted or are forgotten.
+    A lookup without a salt returns the newest key for that identity and
+    passphrase, so re-registering within the TTL reuses it.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._secret = os.urandom(32)
+        # tag -> (key, salt, fingerprint, expires_at, unsalted tag), oldest first
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._latest: Dict[bytes, bytes] = {}  # unsalted tag -> newest tag
+        self._lock = threading.Lock()
+
+    def _tag(self, identity: str, passphrase: str, salt: bytes) -> bytes:
+        material = json.dumps([identity, passphrase, salt.hex()]).encode()
+        return hmac.new(self._secret, material, hashlib.sha256).digest()
+
+    def get(
+        self, identity: str, passphrase: str, salt: Optional[bytes] = None
+    ) -> Optional[tuple]:
+        """Return a copy of (key, salt) if cached and fresh, else None."""
+        with self._lock:
+            self._expire(time.monotonic())
+            if salt is None:
+                tag = self._latest.get(self._tag(identity, passphrase, b""))
+            else:
+                tag = self._tag(identity, passphrase, salt)
+            cached = self._entries.get(tag) if tag is not None else None
+            if cached is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return bytearray(cached[0]), cached[1]
+
+    def put(
+        self, identity: str, passphrase: str, salt: bytes, key: bytes, fingerprint: str
+    ):
+        """Cache a copy of a freshly derived key."""
+        with self._lock:
+            tag = self._tag(identity, passphrase, salt)
+            unsalted = self._tag(identity, passphrase, b"")
+            self._drop(tag)
+            self._entries[tag] = (
+                bytearray(key), salt, fingerprint, time.monotonic() + self.ttl, unsalted
+            )
+            self._latest[unsalted] = tag
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def forget(self, fingerprint: str):
+        """Zero and drop every cached key for one identity."""
+        with self._lock:
+            for tag in [t for t, e in self._entries.items() if e[2] == fingerprint]:
+                self._drop(tag)
+
+    def clear(self):
+        """Zero and drop every cached key."""
+        with self._lock:
+            for tag in list(self._entries):
+                self._drop(tag)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expire(self, now: float):
+        # Every entry has the same TTL, so insertion order is expiry order
+        while self._entries:
+            tag, entry = next(iter(self._entries.items()))
+            if entry[3] > now:
+                break
+            self._drop(tag)
+
+    def _drop(self, tag: bytes):
+        entry = self._entries.pop(tag, None)
+        if entry is not None:
+            _zero(entry[0])
+            if self._latest.get(entry[4]) == tag:
+                del self._latest[entry[4]]
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # ENCRYPTION ENGINE
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -152,6 +259,10 @@ class EncryptionEngine:
     Authenticated encryption - tampering is detectable.
     """
 
+    def context(self, key: bytes) -> "CipherContext":
+        """Bind the engine to one key, reusing a single AESGCM instance."""
+        return CipherContext(self, key)
+
     def encrypt(self, key: bytes, plaintext: bytes) -> tuple:
         """
         Encrypt data with AES-256-GCM.
@@ -196,6 +307,163 @@ class EncryptionEngine:
             )
 
 
+class CipherContext:
+    """EncryptionEngine bound to one key. Safe to share across threads."""
+
+    def __init__(self, engine: EncryptionEngine, key: bytes):
+        self._engine = engine
+        self._key = key
+        self._aesgcm = AESGCM(key) if CRYPTO_AVAILABLE else None
+
+    def encrypt(self, plaintext: bytes) -> tuple:
+        """Returns (ciphertext, nonce) tuple."""
+        if self._aesgcm is None:
+            return self._engine.encrypt(self._key, plaintext)
+        nonce = os.urandom(12)
+        return self._aesgcm.encrypt(nonce, plaintext, None), nonce
+
+    def decrypt(self, ciphertext: bytes, nonce: bytes) -> bytes:
+        if self._aesgcm is None:
+            return self._engine.decrypt(self._key, ciphertext, nonce)
+        return self._aesgcm.decrypt(nonce, ciphertext, None)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RECORD LOG
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class RecordLog:
+    """
+    Append-only file of framed records.
+
+    Each record is a FRAME (crc32, header length, body length) followed by
+    a JSON header and a binary body; the CRC covers both. Opening reads
+    only frames and headers, and cuts off a torn or corrupt final record.
+    Bodies are read on demand and checked against their CRC.
+    """
+
+    FRAME = struct.Struct("<III")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.size = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+        self._writer = None
+        self._reader = None
+        self._dirty = False
+
+    def open(self) -> List[Tuple[int, int, Dict[str, Any]]]:
+        """Open the log; returns (offset, size, header) for every record."""
+        records = []
+        frame_size = self.FRAME.size
+        end = self.path.stat().st_size
+        pos = 0
+        if end:
+            with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                while pos + frame_size <= end:
+                    crc, head_len, body_len = self.FRAME.unpack_from(view, pos)
+                    size = frame_size + head_len + body_len
+                    if pos + size > end:
+                        break
+                    head_end = pos + frame_size + head_len
+                    head = view[pos + frame_size:head_end]
+                    if pos + size == end:
+                        # Only the final record can be half-written; check it in full
+                        if zlib.crc32(view[head_end:end], zlib.crc32(head)) != crc:
+                            break
+                    try:
+                        header = json.loads(head)
+                    except ValueError:
+                        break
+                    records.append((pos, size, header))
+                    pos += size
+
+        if pos != end:
+            with open(self.path, "r+b") as f:
+                f.truncate(pos)
+        self.size = pos
+        self._writer = open(self.path, "ab")
+        self._reader = open(self.path, "rb")
+        return records
+
+    def append(self, header: Dict[str, Any], body: bytes = b"") -> Tuple[int, int]:
+        """Append one record; returns its (offset, size)."""
+        head = json.dumps(header, separators=(",", ":")).encode()
+        crc = zlib.crc32(body, zlib.crc32(head))
+        record = self.FRAME.pack(crc, len(head), len(body)) + head + body
+        offset = self.size
+        self._writer.write(record)
+        self.size += len(record)
+        self._dirty = True
+        return offset, len(record)
+
+    def read(self, offset: int, size: int) -> Tuple[Dict[str, Any], bytes]:
+        """Read and verify the record at offset; returns (header, body)."""
+        if self._dirty:
+            self._writer.flush()
+            self._dirty = False
+        self._reader.seek(offset)
+        record = self._reader.read(size)
+        crc, head_len, body_len = self.FRAME.unpack_from(record)
+        head = record[self.FRAME.size:self.FRAME.size + head_len]
+        body = record[self.FRAME.size + head_len:]
+        if len(body) != body_len or zlib.crc32(body, zlib.crc32(head)) != crc:
+            raise ValueError(f"Corrupt vault record at offset {offset}")
+        return json.loads(head), body
+
+    def flush(self, fsync: bool = False):
+        """Push buffered records to the OS (and to disk with fsync)."""
+        self._writer.flush()
+        self._dirty = False
+        if fsync:
+            os.fsync(self._writer.fileno())
+
+    def rewrite(self, records: List[Tuple[int, int]]) -> List[int]:
+        """
+        Replace the log with just the given (offset, size) records, in order.
+        Returns their new offsets.
+        """
+        self.flush()
+        tmp = self.path.with_suffix(".compact")
+        offsets = []
+        pos = 0
+        with open(tmp, "wb") as out:
+            for offset, size in records:
+                self._reader.seek(offset)
+                out.write(self._reader.read(size))
+                offsets.append(pos)
+                pos += size
+            out.flush()
+            os.fsync(out.fileno())
+        self.close()
+        os.replace(tmp, self.path)
+        self.size = pos
+        self._writer = open(self.path, "ab")
+        self._reader = open(self.path, "rb")
+        return offsets
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._reader.close()
+            self._writer = self._reader = None
+
+
+@dataclass
+class _Slot:
+    """Where an entry's latest record lives, plus what listing needs."""
+
+    owner_id: str
+    created_at: int
+    updated_at: int
+    version: int
+    metadata: Dict[str, Any]
+    offset: int
+    size: int
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # THE VAULT
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -212,15 +480,36 @@ class Vault:
     - Your constraints are encrypted with YOUR key
     - Only YOU can decrypt YOUR constraints
     - No master key, no backdoors, no exceptions
+
+    Entries are appended to <storage_path>/entries.log (see RecordLog);
+    only their location and listing metadata are kept in memory, so
+    retrieve reads and decrypts just the one record. Overwritten and
+    deleted records are dropped by compaction once they make up
+    compaction_ratio of the log.
+
+    Derived keys are kept in a KeyCache for key_cache_ttl seconds, so
+    per-request unlock/lock cycles pay for PBKDF2 once. Batches
+    (store_many / retrieve_many) share one cipher context per owner and
+    spread large batches over crypto_workers threads.
     """
 
+    LOG_FILE = "entries.log"
+
     def __init__(self, config: Optional[VaultConfig] = None):
         self.config = config or VaultConfig()
         self.key_derivation = KeyDerivation(self.config.key_derivation_iterations)
         self.encryption = EncryptionEngine()
-        self._entries: Dict[str, VaultEntry] = {}
+        self._slots: Dict[str, _Slot] = {}  # entry_id -> latest record
         self._owner_index: Dict[str, List[str]] = {}  # owner_id -> [entry_ids]
         self._keys: Dict[str, tuple] = {}  # owner_id -> (key, salt)
+        self._ciphers: Dict[str, CipherContext] = {}  # owner_id -> bound cipher
+        self.key_cache: Optional[KeyCache] = None
+        if self.config.key_cache_ttl > 0:
+            self.key_cache = KeyCache(self.config.key_cache_ttl, self.config.key_cache_size)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._log: Optional[RecordLog] = None
+        self._dead_bytes = 0
+        self._lock = threading.RLock()
 
         # Load existing vault
         self._load()
@@ -234,29 +523,43 @@ class Vault:
         Register a new identity and derive encryption key.
         Returns the identity fingerprint.
         """
-        key, salt = self.key_derivation.derive_key(identity, passphrase)
-        fingerprint = self.key_derivation.derive_fingerprint(identity)
-
-        self._keys[fingerprint] = (key, salt)
-
-        return fingerprint
+        return self._unlock(identity, passphrase, None)
 
     def unlock(self, identity: str, passphrase: str, salt: bytes) -> str:
         """
         Unlock an existing identity.
         Returns the identity fingerprint.
         """
-        key, _ = self.key_derivation.derive_key(identity, passphrase, salt)
+        return self._unlock(identity, passphrase, salt)
+
+    def _unlock(self, identity: str, passphrase: str, salt: Optional[bytes]) -> str:
         fingerprint = self.key_derivation.derive_fingerprint(identity)
 
+        cached = self.key_cache.get(identity, passphrase, salt) if self.key_cache else None
+        if cached is not None:
+            key, salt = cached
+        else:
+            key, salt = self.key_derivation.derive_key(identity, passphrase, salt)
+            key = bytearray(key)
+            if self.key_cache is not None:
+                self.key_cache.put(identity, passphrase, salt, key, fingerprint)
+
+        self.lock(fingerprint)
         self._keys[fingerprint] = (key, salt)
+        self._ciphers[fingerprint] = self.encryption.context(key)
 
         return fingerprint
 
-    def lock(self, owner_id: str):
-        """Lock an identity (remove key from memory)."""
+    def lock(self, owner_id: str, forget: bool = False):
+        """
+        Lock an identity (zero its key and remove it from memory).
+        With forget, also drop its cached keys so the next unlock re-derives.
+        """
+        self._ciphers.pop(owner_id, None)
         if owner_id in self._keys:
-            del self._keys[owner_id]
+            _zero(self._keys.pop(owner_id)[0])
+        if forget and self.key_cache is not None:
+            self.key_cache.forget(owner_id)
 
     def is_unlocked(self, owner_id: str) -> bool:
         """Check if an identity is unlocked."""
@@ -277,93 +580,191 @@ class Vault:
         Store encrypted data in the Vault.
         Returns the entry ID.
         """
-        if owner_id not in self._keys:
-            raise PermissionError(f"Identity not unlocked: {owner_id}")
+        return self._store(owner_id, [data], [entry_id], metadata)[0]
 
-        key, _ = self._keys[owner_id]
+    def store_many(
+        self,
+        owner_id: str,
+        items: Iterable[Union[Dict, List, str, bytes]],
+        metadata: Optional[Dict] = None,
+    ) -> List[str]:
+        """
+        Store several entries with a single flush (and fsync).
+        Returns the new entry IDs in order.
+        """
+        items = list(items)
+        return self._store(owner_id, items, [None] * len(items), metadata)
 
-        # Generate entry ID
-        if entry_id is None:
-            entry_id = f"V_{hashlib.sha256(os.urandom(16)).hexdigest()[:12].upper()}"
+    def _store(
+        self,
+        owner_id: str,
+        items: List[Union[Dict, List, str, bytes]],
+        entry_ids: List[Optional[str]],
+        metadata: Optional[Dict],
+    ) -> List[str]:
+        """Encrypt items (outside the lock), then append and flush them."""
+        cipher = self._cipher(owner_id)
 
         # Serialize data
-        if isinstance(data, (dict, list)):
-            plaintext = json.dumps(data).encode()
-        elif isinstance(data, str):
-            plaintext = data.encode()
-        else:
-            plaintext = data
+        plaintexts = []
+        for data in items:
+            if isinstance(data, (dict, list)):
+                plaintexts.append(json.dumps(data).encode())
+            elif isinstance(data, str):
+                plaintexts.append(data.encode())
+            else:
+                plaintexts.append(data)
 
         # Encrypt
-        now = int(time.time())
         if self.config.encryption_enabled:
-            ciphertext, nonce = self.encryption.encrypt(key, plaintext)
+            nbytes = sum(len(plaintext) for plaintext in plaintexts)
+            sealed = self._map_crypto(cipher.encrypt, plaintexts, nbytes)
         else:
-            ciphertext = plaintext
-            nonce = b""
-
-        # Check for existing entry (update)
-        version = 1
-        created_at = now
-        if entry_id in self._entries:
-            version = self._entries[entry_id].version + 1
-            created_at = self._entries[entry_id].created_at
-
-        # Create entry
-        entry = VaultEntry(
-            id=entry_id,
-            owner_id=owner_id,
-            data=ciphertext,
-            nonce=nonce,
-            created_at=created_at,
-            updated_at=now,
-            version=version,
-            metadata=metadata or {},
-        )
-
-        # Store
-        self._entries[entry_id] = entry
-
-        # Update owner index
-        if owner_id not in self._owner_index:
-            self._owner_index[owner_id] = []
-        if entry_id not in self._owner_index[owner_id]:
-            self._owner_index[owner_id].append(entry_id)
+            sealed = [(plaintext, b"") for plaintext in plaintexts]
+
+        with self._lock:
+            stored = []
+            now = int(time.time())
+            for entry_id, (ciphertext, nonce) in zip(entry_ids, sealed):
+                # Generate entry ID
+                if entry_id is None:
+                    entry_id = f"V_{hashlib.sha256(os.urandom(16)).hexdigest()[:12].upper()}"
+
+                # Check for existing entry (update)
+                version = 1
+                created_at = now
+                if entry_id in self._slots:
+                    version = self._slots[entry_id].version + 1
+                    created_at = self._slots[entry_id].created_at
+
+                self._append_entry(VaultEntry(
+                    id=entry_id,
+                    owner_id=owner_id,
+                    data=ciphertext,
+                    nonce=nonce,
+                    created_at=created_at,
+                    updated_at=now,
+                    version=version,
+                    metadata=metadata or {},
+                ))
+                stored.append(entry_id)
+
+            if self.config.auto_save:
+                self._log.flush(self.config.fsync)
+            self._maybe_compact()
+        return stored
+
+    def _cipher(self, owner_id: str) -> CipherContext:
+        cipher = self._ciphers.get(owner_id)
+        if cipher is None:
+            raise PermissionError(f"Identity not unlocked: {owner_id}")
+        return cipher
 
-        # Auto-save
-        if self.config.auto_save:
-            self._save()
+    def _map_crypto(self, fn: Callable, items: List, nbytes: int) -> List:
+        """
+        Apply fn to every item; large batches are split into one chunk per
+        worker so the thread hand-off is paid once per chunk, not per item.
+        """
+        workers = self.config.crypto_workers
+        if workers <= 1 or len(items) < 2 or nbytes < self.config.parallel_min_bytes:
+            return [fn(item) for item in items]
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(workers, thread_name_prefix="vault-crypto")
+        size = -(-len(items) // workers)
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        results = self._pool.map(lambda chunk: [fn(item) for item in chunk], chunks)
+        return [result for chunk in results for result in chunk]
+
+    def _append_entry(self, entry: VaultEntry):
+        """Append a put record and index it."""
+        if self._log is None:
+            self._open_log()
+        header = {
+            "op": "put",
+            "id": entry.id,
+            "owner_id": entry.owner_id,
+            "created_at": entry.created_at,
+            "updated_at": entry.updated_at,
+            "version": entry.version,
+            "metadata": entry.metadata,
+            "nonce": len(entry.nonce),
+        }
+        offset, size = self._log.append(header, entry.nonce + entry.data)
+        self._index(header, offset, size)
+
+    def _index(self, header: Dict[str, Any], offset: int, size: int):
+        """Apply one log record to the in-memory index."""
+        entry_id = header["id"]
+        old = self._slots.pop(entry_id, None)
+        if old is not None:
+            self._dead_bytes += old.size
+            if header["op"] != "put" or old.owner_id != header["owner_id"]:
+                ids = self._owner_index.get(old.owner_id, [])
+                if entry_id in ids:
+                    ids.remove(entry_id)
+
+        if header["op"] != "put":
+            # Tombstones only matter until the next compaction
+            self._dead_bytes += size
+            return
 
-        return entry_id
+        self._slots[entry_id] = _Slot(
+            owner_id=header["owner_id"],
+            created_at=header["created_at"],
+            updated_at=header["updated_at"],
+            version=header["version"],
+            metadata=header["metadata"],
+            offset=offset,
+            size=size,
+        )
+        if old is None or old.owner_id != header["owner_id"]:
+            self._owner_index.setdefault(header["owner_id"], []).append(entry_id)
 
     def retrieve(self, owner_id: str, entry_id: str) -> Any:
         """
         Retrieve and decrypt data from the Vault.
         """
-        if owner_id not in self._keys:
-            raise PermissionError(f"Identity not unlocked: {owner_id}")
+        return self.retrieve_many(owner_id, [entry_id])[0]
 
-        if entry_id not in self._entries:
-            raise KeyError(f"Entry not found: {entry_id}")
+    def retrieve_many(self, owner_id: str, entry_ids: Iterable[str]) -> List[Any]:
+        """
+        Retrieve and decrypt several entries, in the order given.
+        Raises like retrieve if any entry is missing or not owned.
+        """
+        cipher = self._cipher(owner_id)
 
-        entry = self._entries[entry_id]
+        with self._lock:
+            records = []
+            nbytes = 0
+            for entry_id in entry_ids:
+                slot = self._slots.get(entry_id)
+                if slot is None:
+                    raise KeyError(f"Entry not found: {entry_id}")
 
-        if entry.owner_id != owner_id:
-            raise PermissionError("Entry owned by different identity")
+                if slot.owner_id != owner_id:
+                    raise PermissionError("Entry owned by different identity")
 
-        key, _ = self._keys[owner_id]
+                header, body = self._log.read(slot.offset, slot.size)
+                records.append((body[header["nonce"]:], body[:header["nonce"]]))
+                nbytes += slot.size
 
         # Decrypt
         if self.config.encryption_enabled:
-            plaintext = self.encryption.decrypt(key, entry.data, entry.nonce)
+            plaintexts = self._map_crypto(
+                lambda record: cipher.decrypt(*record), records, nbytes
+            )
         else:
-            plaintext = entry.data
+            plaintexts = [ciphertext for ciphertext, _ in records]
 
         # Deserialize
-        try:
-            return json.loads(plaintext.decode())
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            return plaintext
+        results = []
+        for plaintext in plaintexts:
+            try:
+                results.append(json.loads(plaintext.decode()))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                results.append(plaintext)
+        return results
 
     def list_entries(self, owner_id: str) -> List[Dict[str, Any]]:
         """List all entries for an owner (metadata only, not decrypted content)."""
@@ -372,34 +773,33 @@ class Vault:
 
         return [
             {
-                "id": self._entries[eid].id,
-                "created_at": self._entries[eid].created_at,
-                "updated_at": self._entries[eid].updated_at,
-                "version": self._entries[eid].version,
-                "metadata": self._entries[eid].metadata,
+                "id": eid,
+                "created_at": self._slots[eid].created_at,
+                "updated_at": self._slots[eid].updated_at,
+                "version": self._slots[eid].version,
+                "metadata": self._slots[eid].metadata,
             }
             for eid in self._owner_index[owner_id]
-            if eid in self._entries
+            if eid in self._slots
         ]
 
     def delete(self, owner_id: str, entry_id: str):
         """Delete an entry (if owner matches)."""
-        if entry_id not in self._entries:
-            return
-
-        entry = self._entries[entry_id]
-        if entry.owner_id != owner_id:
-            raise PermissionError("Entry owned by different identity")
+        with self._lock:
+            slot = self._slots.get(entry_id)
+            if slot is None:
+                return
 
-        del self._entries[entry_id]
+            if slot.owner_id != owner_id:
+                raise PermissionError("Entry owned by different identity")
 
-        if owner_id in self._owner_index:
-            self._owner_index[owner_id] = [
-                eid for eid in self._owner_index[owner_id] if eid != entry_id
-            ]
+            header = {"op": "del", "id": entry_id}
+            offset, size = self._log.append(header)
+            self._index(header, offset, size)
 
-        if self.config.auto_save:
-            self._save()
+            if self.config.auto_save:
+                self._log.flush(self.config.fsync)
+            self._maybe_compact()
 
     # ─────────────────────────────────────────────────────────────────────────
     # CONSTRAINT-SPECIFIC OPERATIONS
@@ -426,50 +826,67 @@ class Vault:
     # PERSISTENCE
     # ─────────────────────────────────────────────────────────────────────────
 
-    def _save(self):
-        """Save vault to disk."""
-        path = Path(self.config.storage_path)
-        path.mkdir(parents=True, exist_ok=True)
-
-        # Save entries
-        entries_file = path / "entries.json"
-        entries_data = {eid: entry.to_dict() for eid, entry in self._entries.items()}
-        with open(entries_file, "w") as f:
-            json.dump(entries_data, f, indent=2)
-
-        # Save index
-        index_file = path / "index.json"
-        with open(index_file, "w") as f:
-            json.dump(self._owner_index, f, indent=2)
+    def flush(self):
+        """Write buffered records to disk."""
+        with self._lock:
+            if self._log is not None:
+                self._log.flush(self.config.fsync)
+
+    def close(self):
+        """Flush and close the log."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        with self._lock:
+            if self._log is not None:
+                self._log.flush(self.config.fsync)
+                self._log.close()
+                self._log = None
+
+    def compact(self):
+        """Rewrite the log with only the live record of each entry."""
+        with self._lock:
+            if self._log is None:
+                return
+            live = sorted(self._slots.values(), key=lambda slot: slot.offset)
+            offsets = self._log.rewrite([(slot.offset, slot.size) for slot in live])
+            for slot, offset in zip(live, offsets):
+                slot.offset = offset
+            self._dead_bytes = 0
+
+    def _maybe_compact(self):
+        if (
+            self._dead_bytes >= self.config.compaction_min_bytes
+            and self._dead_bytes >= self.config.compaction_ratio * self._log.size
+        ):
+            self.compact()
+
+    def _open_log(self):
+        """Open (creating if needed) the log and index its records."""
+        self._log = RecordLog(Path(self.config.storage_path) / self.LOG_FILE)
+        for offset, size, header in self._log.open():
+            self._index(header, offset, size)
 
     def _load(self):
-        """Load vault from disk."""
+        """Load the vault index from disk."""
         path = Path(self.config.storage_path)
 
-        if not path.exists():
+        if (path / self.LOG_FILE).exists():
+            self._open_log()
             return
 
-        # Load entries
+        # Vaults written before the log existed: copy entries.json across once
         entries_file = path / "entries.json"
         if entries_file.exists():
             try:
                 with open(entries_file, "r") as f:
                     entries_data = json.load(f)
-                self._entries = {
-                    eid: VaultEntry.from_dict(data)
-                    for eid, data in entries_data.items()
-                }
-            except (json.JSONDecodeError, IOError):
-                pass
-
-        # Load index
-        index_file = path / "index.json"
-        if index_file.exists():
-            try:
-                with open(index_file, "r") as f:
-                    self._owner_index = json.load(f)
             except (json.JSONDecodeError, IOError):
-                pass
+                return
+            self._open_log()
+            for data in entries_data.values():
+                self._append_entry(VaultEntry.from_dict(data))
+            self._log.flush(fsync=True)
 
     # ─────────────────────────────────────────────────────────────────────────
     # STATS
@@ -478,9 +895,12 @@ class Vault:
     def stats(self) -> Dict[str, Any]:
         """Get vault statistics."""
         return {
-            "total_entries": len(self._entries),
+            "total_entries": len(self._slots),
             "total_owners": len(self._owner_index),
+            "log_bytes": self._log.size if self._log is not None else 0,
+            "dead_bytes": self._dead_bytes,
             "unlocked_identities": len(self._keys),
+            "cached_keys": len(self.key_cache) if self.key_cache is not None else 0,
             "encryption_enabled": self.config.encryption_enabled,
             "crypto_library_available": CRYPTO_AVAILABLE,
         }
@@ -3222,14 +3222,56 @@ async def teachers_aide_info():
 # ═══════════════════════════════════════════════════════════════════════════════
 
 @app.get("/ledger")
-async def get_ledger_entries(limit: int = 100):
-    """Get recent ledger entries."""
-    entries = ledger.get_latest(limit)
+async def get_ledger_entries(
+    limit: int = 100,
+    cursor: Optional[int] = None,
+    operation: Optional[str] = None,
+    result: Optional[str] = None,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None,
+):
+    """
+    Get recent ledger entries, optionally filtered.
+
+    Each page is in chronological order. Pass the returned next_cursor as
+    cursor to fetch the page of older entries; it is null on the last page.
+    """
+    page = ledger.search(
+        operation=operation,
+        result=result,
+        start_time=start_time,
+        end_time=end_time,
+        limit=limit + 1,
+        before=cursor,
+    )
+    has_more = len(page) > limit
+    entries = list(reversed(page[:limit]))
     return {
         "total": len(ledger),
         "returned": len(entries),
         "merkle_root": ledger.get_merkle_root(),
         "entries": [e.to_dict() for e in entries],
+        "next_cursor": entries[0].index if has_more and entries else None,
+        "engine": ENGINE
+    }
+
+
+@app.post("/ledger/audit")
+async def start_ledger_audit():
+    """Start a full, from-genesis chain audit in the background."""
+    started = ledger.start_audit()
+    return {
+        "started": started,
+        "audit": ledger.audit_status(),
+        "engine": ENGINE
+    }
+
+
+@app.get("/ledger/audit")
+async def get_ledger_audit():
+    """Progress of the most recent full chain audit."""
+    return {
+        "audit": ledger.audit_status(),
         "engine": ENGINE
     }
 
@@ -3944,7 +3986,8 @@ async def health():
         },
         "ledger": {
             "entries": len(ledger),
-            "chain_valid": chain_valid
+            "chain_valid": chain_valid,
+            "audit_running": ledger.audit_status().get("running", False)
         },
         "glass_box": {
             "enabled": forge._glass_box_enabled,
@@ -10,7 +10,7 @@ from .atom import Atom
 from .transaction import Transaction
 from .ledger_entry import LedgerEntry
 from .phases import Phase, PhaseMachine
-from .invariant import canonical_hash, one_equals_one, GoalRegistry
+from .invariant import canonical_hash, one_equals_one, GoalRegistry, StateDigest
 from .reversibility import InverseOperation, Snapshot, SnapshotManager, compute_inverse
 from .paradox import ParadoxDetector, ParadoxError, ParadoxResult
 from .tlm import NewtonTLM
@@ -32,6 +32,7 @@ __all__ = [
     "canonical_hash",
     "one_equals_one",
     "GoalRegistry",
+    "StateDigest",
 
     # Reversibility
     "InverseOperation",
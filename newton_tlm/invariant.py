@@ -11,6 +11,8 @@ import json
 from typing import Any, Dict, Set
 from dataclasses import dataclass, field
 
+_DIGEST_MODULUS = 1 << 256
+
 
 def canonical_hash(obj: Any) -> str:
     """
@@ -31,6 +33,53 @@ def canonical_hash(obj: Any) -> str:
     return hashlib.sha256(json_str.encode()).hexdigest()
 
 
+@dataclass
+class StateDigest:
+    """
+    Order-independent digest of a multiset of elements.
+    
+    The digest is the sum of the elements' canonical hashes modulo 2**256,
+    so adding or removing one element costs one hash however many elements
+    there are, and equal multisets give equal digests whatever order they
+    were built in.
+    
+    Attributes:
+        total: Sum of element hashes modulo 2**256
+        count: Number of elements
+    """
+    total: int = 0
+    count: int = 0
+    
+    def add(self, element: Any) -> None:
+        """
+        Add an element to the multiset.
+        
+        Args:
+            element: JSON-serializable element
+        """
+        self.total = (self.total + int(canonical_hash(element), 16)) % _DIGEST_MODULUS
+        self.count += 1
+    
+    def remove(self, element: Any) -> None:
+        """
+        Remove an element previously added.
+        
+        Args:
+            element: Element equal to one passed to add()
+        """
+        self.total = (self.total - int(canonical_hash(element), 16)) % _DIGEST_MODULUS
+        self.count -= 1
+    
+    def hexdigest(self) -> str:
+        """
+        Get the digest as a SHA256 hex string.
+        
+        Returns:
+            SHA256 hash of the element count and sum
+        """
+        return hashlib.sha256(f"{self.count}:{self.total:064x}".encode()).hexdigest()
+
+
 def one_equals_one(current: Any, goal: Any) -> bool:
     """
     The fundamental Newton invariant: 1 == 1
@@ -7,7 +7,7 @@ Snapshot, restore, and rollback operations for verified reversibility.
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import copy
 
 
@@ -39,10 +39,15 @@ def compute_inverse(operation: str, data: Any) -> InverseOperation:
     inverse_map = {
         "add_atom": "remove_atom",
         "add_edge": "remove_edge",
+        "add_pattern": "remove_pattern",
         "increment_pattern": "decrement_pattern",
         "decrement_pattern": "increment_pattern",
         "remove_atom": "add_atom",
-        "remove_edge": "add_edge"
+        "remove_edge": "add_edge",
+        "remove_pattern": "add_pattern",
+        # Updates are undone by updating back to the previous data
+        "update_atom": "update_atom",
+        "update_edge": "update_edge"
     }
     
     inverse_type = inverse_map.get(operation, f"undo_{operation}")
@@ -66,6 +71,9 @@ class Snapshot:
         phase: Current phase at snapshot time
         ledger_size: Size of ledger at snapshot time
         metadata: Additional snapshot metadata
+        position: History position the snapshot refers to; snapshots
+            taken by a TLM carry only this and leave atoms, edges and
+            patterns empty
     """
     index: int
     state_hash: str
@@ -75,6 +83,7 @@ class Snapshot:
     phase: str
     ledger_size: int
     metadata: Dict[str, Any]
+    position: Optional[int] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -91,7 +100,8 @@ class Snapshot:
             "patterns": self.patterns,
             "phase": self.phase,
             "ledger_size": self.ledger_size,
-            "metadata": self.metadata
+            "metadata": self.metadata,
+            "position": self.position
         }
     
     @staticmethod
@@ -113,7 +123,8 @@ class Snapshot:
             patterns=data["patterns"],
             phase=data["phase"],
             ledger_size=data["ledger_size"],
-            metadata=data["metadata"]
+            metadata=data["metadata"],
+            position=data.get("position")
         )
     
     def deep_copy(self) -> 'Snapshot':
@@ -131,22 +142,240 @@ class Snapshot:
             patterns=copy.deepcopy(self.patterns),
             phase=self.phase,
             ledger_size=self.ledger_size,
-            metadata=copy.deepcopy(self.metadata)
+            metadata=copy.deepcopy(self.metadata),
+            position=self.position
         )
 
 
+@dataclass
+class Delta:
+    """
+    One step in the commit history.
+    
+    Attributes:
+        parent: Position the step was applied at (None for a root)
+        entry: Ledger entry holding the step's forward changes (None for
+            a root)
+        inverse: Operations undoing the step, in the order to apply them
+        checkpoint: Nearest position at or above this one with a full
+            checkpoint (None if there is none)
+        depth: Steps from that checkpoint
+    """
+    parent: Optional[int]
+    entry: Any
+    inverse: List[InverseOperation]
+    checkpoint: Optional[int]
+    depth: int
+
+
 class SnapshotManager:
     """
     Manages snapshots for rollback capability.
     
+    Snapshots are positions in a tree of commit history rather than
+    copies of the state. Each position records the ledger entry that
+    produced it and the inverse operations undoing it, so moving between
+    positions means undoing up to the common ancestor and redoing down
+    from it. A full copy of the state (a checkpoint) is only kept when a
+    snapshot is taken more than checkpoint_interval steps below the last
+    one, which bounds both the number of copies and the work needed to
+    rebuild any snapshot from its checkpoint. History older than the
+    oldest checkpoint a retained snapshot needs is discarded.
+    
     Attributes:
         snapshots: List of stored snapshots
         max_snapshots: Maximum number of snapshots to keep
+        checkpoint_interval: Maximum steps between a snapshot and the
+            checkpoint it is rebuilt from
+        history: Steps by position
+        checkpoints: Full state by position (None for the empty state)
+        taken: Number of snapshots saved so far
     """
     
-    def __init__(self, max_snapshots: int = 100):
+    def __init__(self, max_snapshots: int = 100, checkpoint_interval: int = 100):
         self.snapshots: List[Snapshot] = []
         self.max_snapshots = max_snapshots
+        self.checkpoint_interval = checkpoint_interval
+        self.history: Dict[int, Delta] = {}
+        self.checkpoints: Dict[int, Optional[Snapshot]] = {}
+        self.taken = 0
+        self._next_position = 0
+    
+    def new_root(self) -> int:
+        """
+        Start a new history at the empty state.
+        
+        Returns:
+            Position of the empty state
+        """
+        position = self._next_position
+        self._next_position += 1
+        self.history[position] = Delta(None, None, [], position, 0)
+        self.checkpoints[position] = None
+        return position
+    
+    def record(self, parent: int, entry: Any, inverse: List[InverseOperation]) -> int:
+        """
+        Record a step applied at parent.
+        
+        Args:
+            parent: Position the step was applied at
+            entry: Ledger entry with the step's changes
+            inverse: Operations undoing the step
+            
+        Returns:
+            Position after the step
+        """
+        position = self._next_position
+        self._next_position += 1
+        above = self.history.get(parent)
+        if above is not None and above.checkpoint in self.history:
+            self.history[position] = Delta(
+                parent, entry, inverse, above.checkpoint, above.depth + 1
+            )
+        else:
+            self.history[position] = Delta(parent, entry, inverse, None, 0)
+        
+        if not self.snapshots:
+            # Nothing can roll back past here
+            self._prune(position)
+        return position
+    
+    def needs_checkpoint(self, position: int) -> bool:
+        """
+        Check whether a snapshot at position needs a full checkpoint.
+        
+        Args:
+            position: Position being snapshotted
+            
+        Returns:
+            True if position is too far from its checkpoint (or has none)
+        """
+        delta = self.history[position]
+        return (delta.checkpoint not in self.checkpoints
+                or delta.depth > self.checkpoint_interval)
+    
+    def add_checkpoint(self, position: int, state: Snapshot) -> None:
+        """
+        Store the full state at position.
+        
+        Args:
+            position: Position the state belongs to
+            state: Snapshot holding the full state
+        """
+        self.checkpoints[position] = state
+        delta = self.history[position]
+        delta.checkpoint = position
+        delta.depth = 0
+    
+    def holds(self, snapshot: Snapshot) -> bool:
+        """
+        Check whether snapshot was saved here and can still be reached.
+        
+        Args:
+            snapshot: Snapshot to check
+            
+        Returns:
+            True if snapshot's position is in this manager's history
+        """
+        return (snapshot.position in self.history
+                and any(s is snapshot for s in self.snapshots))
+    
+    def plan(self, current: Optional[int], target: int) -> Tuple[Optional[int], List[Delta], List[Delta]]:
+        """
+        Find the cheapest way to move from current to target.
+        
+        Either undo steps up to the common ancestor and redo down to
+        target, or rebuild target's checkpoint and redo from there,
+        whichever touches fewer operations.
+        
+        Args:
+            current: Position of the live state (None to always rebuild)
+            target: Position to move to
+            
+        Returns:
+            (checkpoint, undo, redo): the checkpoint position to rebuild
+            from (None to start from the live state), steps to undo in
+            order, and steps to redo in order
+            
+        Raises:
+            ValueError: If target cannot be reached
+        """
+        history = self.history
+        
+        # Rebuild from target's checkpoint
+        redo: List[Delta] = []
+        cost = 0
+        position: Optional[int] = target
+        while position not in self.checkpoints:
+            delta = history.get(position)
+            if delta is None:
+                raise ValueError(f"History position {target} is no longer reachable")
+            redo.append(delta)
+            cost += len(delta.inverse)
+            position = delta.parent
+        checkpoint = position
+        state = self.checkpoints[checkpoint]
+        if state is not None:
+            cost += len(state.atoms) + len(state.edges) + len(state.patterns)
+        redo.reverse()
+        
+        # Undo to the common ancestor, giving up once it costs more
+        undo_cost = {}
+        spent = 0
+        position = current
+        while position in history and spent <= cost:
+            undo_cost[position] = spent
+            delta = history[position]
+            spent += len(delta.inverse)
+            position = delta.parent
+        
+        down: List[int] = []
+        spent = 0
+        position = target
+        while position not in undo_cost:
+            delta = history.get(position)
+            if delta is None or spent > cost:
+                return checkpoint, [], redo
+            down.append(position)
+            spent += len(delta.inverse)
+            position = delta.parent
+        if undo_cost[position] + spent > cost:
+            return checkpoint, [], redo
+        
+        ancestor = position
+        undo: List[Delta] = []
+        position = current
+        while position != ancestor:
+            delta = history[position]
+            undo.append(delta)
+            position = delta.parent
+        down.reverse()
+        return None, undo, [history[p] for p in down]
+    
+    def _prune(self, current: int) -> None:
+        """
+        Drop history no retained snapshot (or current) can need.
+        
+        Positions only ever descend from smaller ones, so everything
+        below the oldest checkpoint still in use can go.
+        
+        Args:
+            current: Position of the live state
+        """
+        cutoff = current
+        for snapshot in self.snapshots:
+            delta = self.history.get(snapshot.position)
+            if delta is not None and delta.checkpoint is not None:
+                cutoff = min(cutoff, delta.checkpoint)
+        
+        history = self.history
+        while history:
+            position = next(iter(history))
+            if position >= cutoff:
+                break
+            del history[position]
+            self.checkpoints.pop(position, None)
     
     def save_snapshot(self, snapshot: Snapshot) -> None:
         """
@@ -156,10 +385,13 @@ class SnapshotManager:
             snapshot: Snapshot to save
         """
         self.snapshots.append(snapshot)
+        self.taken += 1
         
         # Trim old snapshots if needed
         if len(self.snapshots) > self.max_snapshots:
             self.snapshots.pop(0)
+            if snapshot.position is not None:
+                self._prune(snapshot.position)
     
     def get_latest(self) -> Optional[Snapshot]:
         """
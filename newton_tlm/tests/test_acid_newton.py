@@ -25,7 +25,7 @@ import pytest
 import time
 from newton_tlm import (
     NewtonTLM, Atom, Phase, PhaseMachine,
-    canonical_hash, one_equals_one, GoalRegistry
+    canonical_hash, one_equals_one, GoalRegistry, Snapshot
 )
 
 
@@ -354,7 +354,136 @@ class TestNewtonCompliance:
         # Should be at snap1 state
         hash_rolled_back = tlm.get_state_hash()
         assert hash_rolled_back == snap1.state_hash
-    
+
+    def test_n4_rollback_undoes_changes_outside_transactions(self):
+        """
+        N4: Reversibility - Direct graph and pattern edits are rolled back too.
+        """
+        tlm = NewtonTLM()
+        tlm.ingest("a")
+        snap = tlm.snapshot()
+        tlm.ingest("b")
+
+        tlm.graph.add_node("rogue", id="rogue")
+        tlm.patterns['zz'] = 1
+
+        assert tlm.rollback()
+        assert "rogue" not in tlm.graph
+        assert 'zz' not in tlm.patterns
+        assert tlm.get_state_hash() == snap.state_hash
+        assert tlm.compute_state_hash() == snap.state_hash
+        assert tlm.verify_integrity()
+
+    @pytest.mark.parametrize("steps", [0, 2])
+    def test_n4_rollback_undoes_same_size_edits(self, steps):
+        """
+        N4: Reversibility - Direct edits that add or remove nothing are rolled back too.
+        """
+        tlm = NewtonTLM()
+        tlm.ingest("a b")
+        snap = tlm.snapshot()
+        patterns = dict(tlm.patterns)
+        for i in range(steps):
+            tlm.ingest(f"more {i}")
+
+        pattern = next(iter(tlm.patterns))
+        tlm.patterns[pattern] += 5
+        node_id = next(iter(tlm.graph.nodes))
+        tlm.graph.nodes[node_id]["value"] = "tampered"
+
+        assert tlm.rollback()
+        assert dict(tlm.patterns) == patterns
+        assert tlm.graph.nodes[node_id]["value"] != "tampered"
+        assert tlm.get_state_hash() == snap.state_hash
+        assert tlm.compute_state_hash() == snap.state_hash
+        assert tlm.verify_integrity()
+
+    def test_n4_snapshot_after_direct_edit_restores_exactly(self):
+        """
+        N4: Reversibility - A snapshot of directly edited state restores to that state.
+        """
+        tlm = NewtonTLM()
+        tlm.ingest("a")
+        before = tlm.snapshot()
+        tlm.patterns["manual"] = 3
+        edited = tlm.snapshot()
+        tlm.ingest("b")
+
+        tlm.restore(edited)
+        assert tlm.patterns["manual"] == 3
+        assert tlm.compute_state_hash() == edited.state_hash
+        tlm.restore(before)
+        assert "manual" not in tlm.patterns
+        assert tlm.compute_state_hash() == before.state_hash
+        tlm.restore(edited)
+        assert tlm.patterns["manual"] == 3
+        assert tlm.get_state_hash() == tlm.compute_state_hash()
+
+    def test_n4_restore_across_branches(self):
+        """
+        N4: Reversibility - Restores replaying deltas rebuild the exact state.
+        """
+        def state(tlm):
+            return (
+                {n: dict(d) for n, d in tlm.graph.nodes(data=True)},
+                {(u, v): dict(d) for u, v, d in tlm.graph.edges(data=True)},
+                dict(tlm.patterns),
+            )
+
+        def commit(tlm, i):
+            tx = tlm.begin_transaction()
+            tx.add_atom(Atom.create(id=f"n{i % 4}", kind="data", value=i))
+            tx.add_edge(f"n{i % 4}", f"bare{i % 3}", f"rel{i}")
+            tx.update_pattern(f"p{i % 2}", i + 1)
+            tlm.commit_transaction()
+
+        tlm = NewtonTLM(checkpoint_interval=2)
+        snapshots, states = [], []
+        for i in range(12):
+            if i == 6:
+                # Branch off the second snapshot
+                tlm.restore(snapshots[1])
+            commit(tlm, i)
+            snapshots.append(tlm.snapshot())
+            states.append(state(tlm))
+
+        for k in [0, 11, 3, 7, 5, 10, 1, 1, 8]:
+            tlm.restore(snapshots[k])
+            assert state(tlm) == states[k]
+            assert tlm.get_state_hash() == snapshots[k].state_hash
+            assert tlm.compute_state_hash() == snapshots[k].state_hash
+
+        # Full snapshots from elsewhere still restore, bare nodes included
+        tlm.graph.add_node("rogue")
+        tlm.restore(snapshots[4])
+        assert state(tlm) == states[4]
+        full = Snapshot.from_dict(tlm.snapshots.checkpoints[
+            tlm.snapshots.history[snapshots[4].position].checkpoint
+        ].to_dict())
+        other = NewtonTLM()
+        other.restore(full)
+        assert other.get_state_hash() == full.state_hash
+        assert other.verify_integrity()
+
+    def test_n4_snapshot_memory_is_bounded(self):
+        """
+        N4: Reversibility - Snapshots share history and copy state rarely.
+        """
+        tlm = NewtonTLM(checkpoint_interval=10)
+        tlm.snapshots.max_snapshots = 5
+        for i in range(100):
+            tlm.ingest(f"item_{i}")
+            tlm.snapshot()
+
+        checkpoints = [s for s in tlm.snapshots.checkpoints.values() if s is not None]
+        assert len(checkpoints) <= 2
+        assert len(tlm.snapshots.history) <= 5 + 10 + 1
+        assert all(not s.atoms for s in tlm.snapshots.snapshots)
+
+        assert tlm.rollback(95)
+        assert tlm.rollback(99)
+        assert tlm.rollback(0) is False
+
     def test_n5_phase_loop_0_to_9_to_0(self):
         """
         N5: Phase Loop - Complete 0→9→0 cycle in ingest.
@@ -440,6 +569,54 @@ class TestNewtonCompliance:
             # Integrity check should fail
             assert not tlm.verify_integrity()
 
+    def test_n7_incremental_hash_matches_full_recompute(self):
+        """
+        N7: The incrementally maintained state hash equals a full recompute.
+        """
+        def build(order):
+            tlm = NewtonTLM()
+            steps = [
+                [("atom", "a", 1), ("pattern", "kind:data", 1)],
+                [("edge", "a", "b", "rel"), ("edge", "c", "c", "self")],
+                [("atom", "b", 2), ("edge", "a", "b", "other"), ("pattern", "kind:data", -1)],
+                [("atom", "a", "replaced"), ("pattern", "kind:text", 3)],
+            ]
+            for i in order:
+                tx = tlm.begin_transaction()
+                for op in steps[i]:
+                    if op[0] == "atom":
+                        tx.add_atom(Atom.create(id=op[1], kind="data", value=op[2]))
+                    elif op[0] == "edge":
+                        tx.add_edge(*op[1:])
+                    else:
+                        tx.update_pattern(*op[1:])
+                tlm.commit_transaction()
+                assert tlm.get_state_hash() == tlm.compute_state_hash()
+            return tlm
+        
+        tlm = build([0, 1, 2, 3])
+        assert tlm.verify_integrity()
+        # Same content reached in another order hashes the same
+        assert build([1, 0, 2, 3]).get_state_hash() == tlm.get_state_hash()
+        
+        ingested = NewtonTLM()
+        ingested.ingest("first")
+        snapshot = ingested.snapshot()
+        ingested.ingest("more")
+        ingested.restore(snapshot)
+        assert ingested.get_state_hash() == snapshot.state_hash
+        assert ingested.verify_integrity()
+    
+    def test_n7_integrity_detects_untracked_changes(self):
+        """
+        N7: Changes made around the transaction API fail the cross-check.
+        """
+        tlm = NewtonTLM()
+        tlm.ingest("entry")
+        tlm.graph.add_node("rogue", kind="data")
+        
+        assert not tlm.verify_integrity()
+
 
 # =============================================================================
 # INTEGRATION TESTS
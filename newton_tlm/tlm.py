@@ -7,6 +7,7 @@ Main class implementing the Newton-compliant symbolic language kernel.
 """
 
 import networkx as nx
+from functools import partial
 from typing import Any, Dict, List, Optional
 import time
 
@@ -14,11 +15,77 @@ from .atom import Atom
 from .transaction import Transaction
 from .ledger_entry import LedgerEntry
 from .phases import Phase, PhaseMachine
-from .invariant import canonical_hash, GoalRegistry
-from .reversibility import Snapshot, SnapshotManager
+from .invariant import GoalRegistry, StateDigest
+from .reversibility import InverseOperation, Snapshot, SnapshotManager, compute_inverse
 from .paradox import ParadoxDetector, ParadoxResult
 
 
+class _Writes:
+    """Flag raised by any write to a TLM's graph or pattern containers."""
+    
+    __slots__ = ("seen",)
+    
+    def __init__(self):
+        self.seen = False
+
+
+class _TrackedDict(dict):
+    """Dict that raises its _Writes flag whenever it is modified."""
+    
+    writes = _Writes()  # Replaced per instance by _tracked
+    
+    def __setitem__(self, key, value):
+        self.writes.seen = True
+        super().__setitem__(key, value)
+    
+    def __delitem__(self, key):
+        self.writes.seen = True
+        super().__delitem__(key)
+    
+    def __ior__(self, other):
+        self.writes.seen = True
+        return super().__ior__(other)
+    
+    def update(self, *args, **kwargs):
+        self.writes.seen = True
+        super().update(*args, **kwargs)
+    
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self.writes.seen = True
+        return super().setdefault(key, default)
+    
+    def pop(self, *args):
+        self.writes.seen = True
+        return super().pop(*args)
+    
+    def popitem(self):
+        self.writes.seen = True
+        return super().popitem()
+    
+    def clear(self):
+        self.writes.seen = True
+        super().clear()
+
+
+def _tracked(writes: _Writes) -> _TrackedDict:
+    d = _TrackedDict()
+    d.writes = writes
+    return d
+
+
+class _TrackedDiGraph(nx.DiGraph):
+    """DiGraph whose node, adjacency and edge dicts all report writes."""
+    
+    def __init__(self, incoming_graph_data=None, writes: Optional[_Writes] = None, **attr):
+        self.writes = writes if writes is not None else _Writes()
+        factory = partial(_tracked, self.writes)
+        self.node_dict_factory = self.node_attr_dict_factory = factory
+        self.adjlist_outer_dict_factory = self.adjlist_inner_dict_factory = factory
+        self.edge_attr_dict_factory = factory
+        super().__init__(incoming_graph_data, **attr)
+
+
 class NewtonTLM:
     """
     Newton Topological Language Machine.
@@ -40,41 +107,183 @@ class NewtonTLM:
         transaction: Current transaction buffer
         ledger: Append-only history of state transitions
         snapshots: Snapshot manager for rollback
+    
+    The state hash is maintained incrementally from each transaction's
+    changes, so state changes should go through transactions (or
+    restore/replay_ledger). verify_integrity() cross-checks it against a
+    full recomputation. The graph and pattern containers flag writes made
+    around the transaction API, so snapshot() and restore() fall back to
+    full copies for such state.
+    
+    Every commit is also recorded as a step in the snapshot manager's
+    history, so snapshots are history positions and restoring one
+    replays inverse or forward steps (see SnapshotManager).
     """
     
-    def __init__(self):
-        self.graph = nx.DiGraph()
-        self.patterns: Dict[str, int] = {}
+    def __init__(self, checkpoint_interval: int = 100):
+        # Writes made around _apply/_load raise this flag (see _digest_in_sync)
+        self._writes = _Writes()
+        self.graph = _TrackedDiGraph(writes=self._writes)
+        self.patterns: Dict[str, int] = _tracked(self._writes)
         self.phase_machine = PhaseMachine()
         self.goal_registry = GoalRegistry()
         self.transaction: Optional[Transaction] = None
         self.ledger: List[LedgerEntry] = []
-        self.snapshots = SnapshotManager()
+        self.snapshots = SnapshotManager(checkpoint_interval=checkpoint_interval)
         self._atom_counter = 0  # Counter for deterministic atom IDs
+        self._digest = StateDigest()  # Incremental digest of the state
+        self._position = self.snapshots.new_root()  # History position of the state
+    
+    def _atom_element(self, node_id: str) -> list:
+        """Digest element for a node; timestamps are metadata, so excluded."""
+        node_data = self.graph.nodes[node_id]
+        return ["atom", node_id, {k: v for k, v in node_data.items() if k != 'ts'}]
+    
+    def _full_digest(self) -> StateDigest:
+        """Build the state digest from scratch."""
+        digest = StateDigest()
+        for n in self.graph.nodes():
+            digest.add(self._atom_element(n))
+        for from_id, to_id in self.graph.edges():
+            digest.add(["edge", from_id, to_id])
+        for pattern, count in self.patterns.items():
+            digest.add(["pattern", pattern, count])
+        return digest
+    
+    def _apply(self, operation: str, data: Any) -> None:
+        """
+        Apply one state operation, keeping the digest current.
+        
+        Args:
+            operation: Operation type, as produced by compute_inverse
+            data: (node_id, attrs), (from_id, to_id, attrs) or
+                (pattern, count)
+        """
+        writes = self._writes
+        outside = writes.seen
+        try:
+            self._apply_operation(operation, data)
+        finally:
+            writes.seen = outside
+    
+    def _apply_operation(self, operation: str, data: Any) -> None:
+        """Body of _apply."""
+        digest = self._digest
+        if operation == "add_atom":
+            node_id, attrs = data
+            self.graph.add_node(node_id, **attrs)
+            digest.add(self._atom_element(node_id))
+        elif operation == "remove_atom":
+            digest.remove(self._atom_element(data[0]))
+            self.graph.remove_node(data[0])
+        elif operation == "update_atom":
+            node_id, attrs = data
+            digest.remove(self._atom_element(node_id))
+            node_data = self.graph.nodes[node_id]
+            node_data.clear()
+            node_data.update(attrs)
+            digest.add(self._atom_element(node_id))
+        elif operation == "add_edge":
+            from_id, to_id, attrs = data
+            self.graph.add_edge(from_id, to_id, **attrs)
+            digest.add(["edge", from_id, to_id])
+        elif operation == "remove_edge":
+            digest.remove(["edge", data[0], data[1]])
+            self.graph.remove_edge(data[0], data[1])
+        elif operation == "update_edge":
+            from_id, to_id, attrs = data
+            edge_data = self.graph.edges[from_id, to_id]
+            edge_data.clear()
+            edge_data.update(attrs)
+        elif operation in ("add_pattern", "remove_pattern"):
+            pattern, count = data
+            if operation == "add_pattern":
+                self.patterns[pattern] = count
+                digest.add(["pattern", pattern, count])
+            else:
+                digest.remove(["pattern", pattern, self.patterns.pop(pattern)])
+        elif operation in ("increment_pattern", "decrement_pattern"):
+            pattern, delta = data
+            count = self.patterns[pattern]
+            digest.remove(["pattern", pattern, count])
+            count += delta if operation == "increment_pattern" else -delta
+            self.patterns[pattern] = count
+            digest.add(["pattern", pattern, count])
+        else:
+            raise ValueError(f"Unknown state operation: {operation}")
+    
+    def _apply_changes(self, atoms: List[Dict[str, Any]], edges: List[tuple],
+                       pattern_deltas: Dict[str, int]) -> List[InverseOperation]:
+        """
+        Apply a transaction's (or ledger entry's) changes.
+        
+        Args:
+            atoms: Atom dictionaries to add or merge into existing nodes
+            edges: (from_id, to_id, edge_type) triples
+            pattern_deltas: Changes to pattern counts
+            
+        Returns:
+            Operations undoing the changes, in the order to apply them
+        """
+        inverse: List[InverseOperation] = []
+        
+        def do(operation, data, undo_data):
+            self._apply(operation, data)
+            inverse.append(compute_inverse(operation, undo_data))
+        
+        # Apply atoms (merging into existing nodes, like add_node)
+        for atom_data in atoms:
+            node_id = atom_data["id"]
+            if node_id in self.graph:
+                old = dict(self.graph.nodes[node_id])
+                do("update_atom", (node_id, {**old, **atom_data}), (node_id, old))
+            else:
+                do("add_atom", (node_id, dict(atom_data)), (node_id, None))
+        
+        # Apply edges, creating missing endpoints as bare nodes
+        for from_id, to_id, edge_type in edges:
+            for node_id in dict.fromkeys((from_id, to_id)):
+                if node_id not in self.graph:
+                    do("add_atom", (node_id, {}), (node_id, None))
+            if self.graph.has_edge(from_id, to_id):
+                old = dict(self.graph.edges[from_id, to_id])
+                do("update_edge", (from_id, to_id, {**old, "type": edge_type}),
+                   (from_id, to_id, old))
+            else:
+                do("add_edge", (from_id, to_id, {"type": edge_type}),
+                   (from_id, to_id, None))
+        
+        # Apply pattern deltas
+        for pattern, delta in pattern_deltas.items():
+            if pattern in self.patterns:
+                do("increment_pattern", (pattern, delta), (pattern, delta))
+            else:
+                do("add_pattern", (pattern, delta), (pattern, None))
+        
+        inverse.reverse()
+        return inverse
     
     def get_state_hash(self) -> str:
         """
-        Compute deterministic hash of current state.
+        Get deterministic hash of current state.
         
-        Timestamps are excluded for determinism since they're metadata.
+        The hash covers atoms (without timestamps), edges and pattern
+        counts, and does not depend on the order they were added in.
         
         Returns:
             SHA256 hash of state
         """
-        # Extract atoms without timestamps for deterministic hashing
-        atoms_for_hash = []
-        for n in self.graph.nodes():
-            node_data = dict(self.graph.nodes[n])
-            # Remove timestamp for deterministic comparison
-            node_data_clean = {k: v for k, v in node_data.items() if k != 'ts'}
-            atoms_for_hash.append(node_data_clean)
-        
-        state = {
-            "atoms": sorted(atoms_for_hash, key=lambda x: x.get("id", "")),
-            "edges": sorted(list(self.graph.edges())),
-            "patterns": dict(sorted(self.patterns.items()))
-        }
-        return canonical_hash(state)
+        return self._digest.hexdigest()
+    
+    def compute_state_hash(self) -> str:
+        """
+        Recompute the state hash from the full graph.
+        
+        Returns:
+            SHA256 hash of state, equal to get_state_hash() unless the
+            graph or patterns were changed outside a transaction
+        """
+        return self._full_digest().hexdigest()
     
     def begin_transaction(self) -> Transaction:
         """
@@ -105,19 +314,10 @@ class NewtonTLM:
             raise RuntimeError("No transaction in progress")
         
         hash_before = self.get_state_hash()
-        
-        # Apply atoms
-        for atom in self.transaction.atoms:
-            self.graph.add_node(atom.id, **atom.to_dict())
-        
-        # Apply edges
-        for from_id, to_id, edge_type in self.transaction.edges:
-            self.graph.add_edge(from_id, to_id, type=edge_type)
-        
-        # Apply pattern deltas
-        for pattern, delta in self.transaction.pattern_deltas.items():
-            self.patterns[pattern] = self.patterns.get(pattern, 0) + delta
-        
+        atoms_added = [a.to_dict() for a in self.transaction.atoms]
+        inverse = self._apply_changes(
+            atoms_added, self.transaction.edges, self.transaction.pattern_deltas
+        )
         hash_after = self.get_state_hash()
         
         # Record in ledger
@@ -125,13 +325,14 @@ class NewtonTLM:
             index=len(self.ledger),
             hash_before=hash_before,
             hash_after=hash_after,
-            atoms_added=[a.to_dict() for a in self.transaction.atoms],
+            atoms_added=atoms_added,
             edges_added=self.transaction.edges,
             pattern_deltas=self.transaction.pattern_deltas,
             phase=self.phase_machine.get_phase_name(),
             operation="commit_transaction"
         )
         self.ledger.append(entry)
+        self._position = self.snapshots.record(self._position, entry, inverse)
         
         # Mark transaction as committed
         self.transaction.commit()
@@ -274,44 +475,131 @@ class NewtonTLM:
         """
         Create snapshot of current state.
         
+        The snapshot records the current history position; a full copy
+        of the state is only kept when the position is more than
+        checkpoint_interval steps from the last checkpoint.
+        
         Returns:
-            Snapshot capturing full state
+            Snapshot of the current position
         """
+        if not self._digest_in_sync():
+            # The state was changed outside a transaction, so no history
+            # step leads here: rehash it and start a new history from a
+            # full copy
+            self._digest = self._full_digest()
+            self._writes.seen = False
+            self._position = self.snapshots.new_root()
+            self.snapshots.add_checkpoint(self._position, self._capture())
+        elif self.snapshots.needs_checkpoint(self._position):
+            self.snapshots.add_checkpoint(self._position, self._capture())
+        
         snapshot = Snapshot(
-            index=len(self.snapshots.snapshots),
+            index=self.snapshots.taken,
             state_hash=self.get_state_hash(),
-            atoms=[self.graph.nodes[n] for n in self.graph.nodes()],
-            edges=list(self.graph.edges(data=True)),
-            patterns=dict(self.patterns),
+            atoms=[],
+            edges=[],
+            patterns={},
             phase=self.phase_machine.get_phase_name(),
             ledger_size=len(self.ledger),
-            metadata={"timestamp": time.time(), "atom_counter": self._atom_counter}
+            metadata={"timestamp": time.time(), "atom_counter": self._atom_counter},
+            position=self._position
         )
         
         self.snapshots.save_snapshot(snapshot)
         return snapshot
     
+    def _capture(self) -> Snapshot:
+        """Copy the full state into a checkpoint snapshot."""
+        return Snapshot(
+            index=-1,
+            state_hash=self.get_state_hash(),
+            # Bare nodes created by edges come back with their edges
+            atoms=[dict(data) for _, data in self.graph.nodes(data=True) if data],
+            edges=[(u, v, dict(data)) for u, v, data in self.graph.edges(data=True)],
+            patterns=dict(self.patterns),
+            phase=self.phase_machine.get_phase_name(),
+            ledger_size=len(self.ledger),
+            metadata={},
+            position=self._position
+        )
+    
+    def _load(self, state: Optional[Snapshot]) -> None:
+        """Replace the state with a full snapshot (None for empty)."""
+        self.graph.clear()
+        self.patterns.clear()
+        if state is not None:
+            for atom_data in state.atoms:
+                if atom_data:
+                    self.graph.add_node(atom_data["id"], **atom_data)
+            for from_id, to_id, edge_data in state.edges:
+                self.graph.add_edge(from_id, to_id, **edge_data)
+            self.patterns.update(state.patterns)
+        self._digest = self._full_digest()
+        self._writes.seen = False
+    
+    def _digest_in_sync(self) -> bool:
+        """Check that the state was only changed through _apply and _load."""
+        return (
+            not self._writes.seen
+            and getattr(self.graph, "writes", None) is self._writes
+            and getattr(self.patterns, "writes", None) is self._writes
+            and self._digest.count == (
+                self.graph.number_of_nodes()
+                + self.graph.number_of_edges()
+                + len(self.patterns)
+            )
+        )
+    
+    def _move(self, current: Optional[int], target: int) -> None:
+        """Bring the state from history position current to target."""
+        checkpoint, undo, redo = self.snapshots.plan(current, target)
+        if checkpoint is not None:
+            self._load(self.snapshots.checkpoints[checkpoint])
+        for delta in undo:
+            for op in delta.inverse:
+                self._apply(op.operation_type, op.data)
+        for delta in redo:
+            entry = delta.entry
+            self._apply_changes(entry.atoms_added, entry.edges_added, entry.pattern_deltas)
+    
     def restore(self, snapshot: Snapshot) -> None:
         """
         Restore state from snapshot.
         
+        Snapshots from this TLM are restored by undoing steps back to
+        the common ancestor and redoing down to the snapshot, or by
+        rebuilding its checkpoint and redoing from there, whichever is
+        cheaper. Any other snapshot must carry the full state, which is
+        loaded and becomes the start of a new history.
+        
         Args:
             snapshot: Snapshot to restore from
+            
+        Raises:
+            ValueError: If snapshot holds neither a reachable position
+                nor the full state
         """
-        # Clear current state
-        self.graph.clear()
-        self.patterns.clear()
-        
-        # Restore atoms
-        for atom_data in snapshot.atoms:
-            self.graph.add_node(atom_data["id"], **atom_data)
-        
-        # Restore edges
-        for from_id, to_id, edge_data in snapshot.edges:
-            self.graph.add_edge(from_id, to_id, **edge_data)
-        
-        # Restore patterns
-        self.patterns.update(snapshot.patterns)
+        if self.snapshots.holds(snapshot):
+            exact = self._digest_in_sync()
+            if exact:
+                try:
+                    self._move(self._position, snapshot.position)
+                    exact = self._digest.hexdigest() == snapshot.state_hash
+                except (KeyError, nx.NetworkXError):
+                    exact = False
+            if not exact:
+                # The state was changed outside a transaction, so the
+                # steps don't lead back; rebuild from the checkpoint
+                self._move(None, snapshot.position)
+            self._position = snapshot.position
+        elif snapshot.atoms or snapshot.position is None:
+            self._load(snapshot)
+            self._position = self.snapshots.new_root()
+            self.snapshots.add_checkpoint(self._position, snapshot.deep_copy())
+        else:
+            raise ValueError(
+                f"Snapshot {snapshot.index} is not in this TLM's history"
+            )
         
         # Restore atom counter if available
         if "atom_counter" in snapshot.metadata:
@@ -360,47 +648,49 @@ class NewtonTLM:
         Returns:
             True if replay successful
         """
+        # Clear current state
+        self._load(None)
+        self.ledger.clear()
+        self.phase_machine.reset()
+        self._position = self.snapshots.new_root()
+        
         try:
-            # Clear current state
-            self.graph.clear()
-            self.patterns.clear()
-            self.ledger.clear()
-            self.phase_machine.reset()
-            
             # Replay each entry
             for entry_data in ledger_data:
                 entry = LedgerEntry.from_dict(entry_data)
-                
-                # Apply atoms
-                for atom_data in entry.atoms_added:
-                    atom = Atom.from_dict(atom_data)
-                    self.graph.add_node(atom.id, **atom.to_dict())
-                
-                # Apply edges
-                for from_id, to_id, edge_type in entry.edges_added:
-                    self.graph.add_edge(from_id, to_id, type=edge_type)
-                
-                # Apply pattern deltas
-                for pattern, delta in entry.pattern_deltas.items():
-                    self.patterns[pattern] = self.patterns.get(pattern, 0) + delta
+                entry.atoms_added = [
+                    Atom.from_dict(atom_data).to_dict() for atom_data in entry.atoms_added
+                ]
+                inverse = self._apply_changes(
+                    entry.atoms_added, entry.edges_added, entry.pattern_deltas
+                )
                 
                 # Add to ledger
                 self.ledger.append(entry)
+                self._position = self.snapshots.record(self._position, entry, inverse)
             
             return True
             
         except Exception:
+            # A half-applied entry is not in the history; rehash and
+            # start a new one from what is there
+            self._digest = self._full_digest()
+            self._position = self.snapshots.new_root()
+            self.snapshots.add_checkpoint(self._position, self._capture())
             return False
     
     def verify_integrity(self) -> bool:
         """
         Verify ledger integrity using hash chains.
         
+        Also recomputes the state hash from the full graph and checks it
+        against the incrementally maintained one.
+        
         Returns:
             True if all hashes are consistent
         """
-        if not self.ledger:
-            return True
+        if self.compute_state_hash() != self.get_state_hash():
+            return False
         
         # Check each entry's hash chain
         for i, entry in enumerate(self.ledger):
@@ -7,14 +7,17 @@ Simple, secure authentication gateway for Newton API.
 - Admin access (for Jared)
 - JWT-like tokens with expiration
 
-Storage: JSON file (upgrade to proper DB later if needed)
+Storage: SQLite in WAL mode, with verified sessions cached in memory
 """
 
 import hashlib
 import secrets
 import json
 import os
-from datetime import datetime, timedelta
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional, Dict, Any
 from pydantic import BaseModel
@@ -26,11 +29,19 @@ from pydantic import BaseModel
 
 # Storage location (use /tmp on Render for persistence within instance)
 STORAGE_DIR = Path(os.environ.get("NEWTON_STORAGE", "/tmp/newton"))
-USERS_FILE = STORAGE_DIR / "parccloud_users.json"
+DB_FILE = STORAGE_DIR / "parccloud.db"
+USERS_FILE = STORAGE_DIR / "parccloud_users.json"  # Old JSON store, imported once
 
 # Token expiration
 TOKEN_EXPIRY_HOURS = 24 * 7  # 1 week
 
+# Verified sessions are served from memory for this long before re-reading
+SESSION_CACHE_TTL = 60  # seconds
+SESSION_CACHE_SIZE = 10_000
+
+# Expired sessions are deleted in one batch at most this often
+EXPIRY_SWEEP_SECONDS = 300
+
 # Admin credentials (MUST be set via environment variables - no defaults for security)
 ADMIN_KEY = os.environ.get("PARCCLOUD_ADMIN_KEY")
 ADMIN_SECRET = os.environ.get("PARCCLOUD_ADMIN_SECRET")
@@ -82,26 +93,233 @@ class AuthResponse(BaseModel):
 # STORAGE HELPERS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def _ensure_storage():
-    """Ensure storage directory and file exist."""
-    STORAGE_DIR.mkdir(parents=True, exist_ok=True)
-    if not USERS_FILE.exists():
-        USERS_FILE.write_text(json.dumps({"users": {}, "sessions": {}}))
-
-
-def _load_data() -> Dict:
-    """Load user data from JSON file."""
-    _ensure_storage()
-    try:
-        return json.loads(USERS_FILE.read_text())
-    except (json.JSONDecodeError, FileNotFoundError):
-        return {"users": {}, "sessions": {}}
-
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    email TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    password_hash TEXT NOT NULL,
+    password_salt TEXT NOT NULL,
+    is_admin INTEGER NOT NULL DEFAULT 0,
+    tier TEXT NOT NULL DEFAULT 'free',
+    created_at TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sessions (
+    token TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    is_admin INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sessions_expires_at ON sessions (expires_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+) WITHOUT ROWID;
+"""
 
-def _save_data(data: Dict):
-    """Save user data to JSON file."""
-    _ensure_storage()
-    USERS_FILE.write_text(json.dumps(data, indent=2))
+_ADMIN_INFO = {
+    "id": "admin",
+    "name": "Administrator",
+    "is_admin": True,
+    "tier": "admin",
+}
+
+
+class _UserStore:
+    """
+    Users and sessions in SQLite, with a cache of verified sessions.
+
+    Tokens and emails are keys, so every lookup is one index probe.
+    Cached sessions are dropped after SESSION_CACHE_TTL, when they expire,
+    when this process logs them out, and all at once whenever another
+    process commits to the database (PRAGMA data_version changes).
+    Expired sessions are deleted by a periodic sweep rather than one write
+    per expired token.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._cache: Dict[str, tuple] = {}  # token -> (user info, expires_at, cached_at)
+        self._data_version = None
+        self._next_sweep = 0.0
+
+    def import_json(self, users_file: Path):
+        """Copy users and sessions from the old JSON store, once."""
+        with self._lock:
+            if self._db.execute("SELECT 1 FROM meta WHERE key = 'json_imported'").fetchone():
+                return
+            try:
+                data = json.loads(users_file.read_text())
+            except (json.JSONDecodeError, FileNotFoundError):
+                data = {}
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (u["id"], u["email"], u["name"], u["password_hash"], u["password_salt"],
+                         int(u.get("is_admin", False)), u.get("tier", "free"), u["created_at"])
+                        for u in data.get("users", {}).values()
+                    ],
+                )
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO sessions VALUES (?, ?, ?, ?)",
+                    [
+                        (token, session["user_id"], _timestamp(session["expires"]),
+                         int(session.get("is_admin", False)))
+                        for token, session in data.get("sessions", {}).items()
+                    ],
+                )
+                self._db.execute("INSERT INTO meta VALUES ('json_imported', ?)", (str(users_file),))
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def add_user(self, user: Dict[str, Any]) -> bool:
+        """Insert a user; False if the email is already registered."""
+        with self._lock:
+            try:
+                self._db.execute(
+                    "INSERT INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (user["id"], user["email"], user["name"], user["password_hash"],
+                     user["password_salt"], int(user["is_admin"]), user["tier"],
+                     user["created_at"]),
+                )
+            except sqlite3.IntegrityError:
+                return False
+            return True
+
+    def user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """Look up a user through the email index."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, name, email, password_hash, password_salt, is_admin, tier"
+                " FROM users WHERE email = ?",
+                (email,),
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ("id", "name", "email", "password_hash", "password_salt", "is_admin", "tier")
+        user = dict(zip(keys, row))
+        user["is_admin"] = bool(user["is_admin"])
+        return user
+
+    def add_session(self, token: str, user_id: str, expires_at: float, is_admin: bool):
+        """Store a new session."""
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO sessions VALUES (?, ?, ?, ?)",
+                (token, user_id, expires_at, int(is_admin)),
+            )
+
+    def session_user(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return the user info for a live session token, or None."""
+        now = time.time()
+        with self._lock:
+            version = self._db.execute("PRAGMA data_version").fetchone()[0]
+            if version != self._data_version:
+                self._cache.clear()
+                self._data_version = version
+
+            cached = self._cache.get(token)
+            if cached is not None:
+                info, expires_at, cached_at = cached
+                if now < expires_at and now - cached_at < SESSION_CACHE_TTL:
+                    return dict(info)
+                del self._cache[token]
+
+            if now >= self._next_sweep:
+                self.sweep(now)
+
+            row = self._db.execute(
+                "SELECT s.user_id, s.expires_at, u.name, u.email, u.is_admin, u.tier"
+                " FROM sessions s LEFT JOIN users u ON u.id = s.user_id"
+                " WHERE s.token = ?",
+                (token,),
+            ).fetchone()
+            if row is None:
+                return None
+            user_id, expires_at, name, email, is_admin, tier = row
+            if now > expires_at:
+                return None
+            if user_id == "admin":
+                info = dict(_ADMIN_INFO)
+            elif name is None:
+                return None
+            else:
+                info = {
+                    "id": user_id,
+                    "name": name,
+                    "email": email,
+                    "is_admin": bool(is_admin),
+                    "tier": tier,
+                }
+
+            if len(self._cache) >= SESSION_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[token] = (info, expires_at, now)
+            return dict(info)
+
+    def delete_session(self, token: str) -> bool:
+        """Remove a session; False if it did not exist."""
+        with self._lock:
+            self._cache.pop(token, None)
+            cursor = self._db.execute("DELETE FROM sessions WHERE token = ?", (token,))
+            return cursor.rowcount > 0
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Delete every expired session; returns how many were removed."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._next_sweep = now + EXPIRY_SWEEP_SECONDS
+            cursor = self._db.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+            return cursor.rowcount
+
+    def user_count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+_store: Optional[_UserStore] = None
+_store_lock = threading.Lock()
+
+
+def _get_store() -> _UserStore:
+    """Open the store at DB_FILE (importing USERS_FILE if present)."""
+    global _store
+    with _store_lock:
+        if _store is None or _store.path != DB_FILE:
+            if _store is not None:
+                _store.close()
+            _store = _UserStore(DB_FILE)
+            if USERS_FILE.exists():
+                _store.import_json(USERS_FILE)
+        return _store
+
+
+def _timestamp(iso: str) -> float:
+    """Unix time for a naive UTC ISO timestamp."""
+    return datetime.fromisoformat(iso).replace(tzinfo=timezone.utc).timestamp()
+
+
+def _new_session(user_id: str, is_admin: bool) -> tuple:
+    """Create and store a session token; returns (token, expiry datetime)."""
+    token = _generate_token()
+    expires = datetime.utcnow() + timedelta(hours=TOKEN_EXPIRY_HOURS)
+    expires_at = expires.replace(tzinfo=timezone.utc).timestamp()
+    _get_store().add_session(token, user_id, expires_at, is_admin)
+    return token, expires
 
 
 def _hash_password(password: str, salt: str = None) -> tuple:
@@ -141,14 +359,6 @@ def signup(name: str, email: str, password: str) -> AuthResponse:
     if "@" not in email or "." not in email:
         return AuthResponse(success=False, message="Invalid email address")
 
-    # Load existing users
-    data = _load_data()
-
-    # Check if email exists
-    for user in data["users"].values():
-        if user["email"] == email:
-            return AuthResponse(success=False, message="Email already registered. Try signing in.")
-
     # Create new user
     user_id = _generate_user_id()
     hashed, salt = _hash_password(password)
@@ -164,18 +374,10 @@ def signup(name: str, email: str, password: str) -> AuthResponse:
         "created_at": datetime.utcnow().isoformat(),
     }
 
-    # Generate session token
-    token = _generate_token()
-    expires = datetime.utcnow() + timedelta(hours=TOKEN_EXPIRY_HOURS)
-
-    # Store user and session
-    data["users"][user_id] = user
-    data["sessions"][token] = {
-        "user_id": user_id,
-        "expires": expires.isoformat(),
-        "is_admin": False,
-    }
-    _save_data(data)
+    # Store user (the email index rejects duplicates) and session
+    if not _get_store().add_user(user):
+        return AuthResponse(success=False, message="Email already registered. Try signing in.")
+    token, expires = _new_session(user_id, False)
 
     return AuthResponse(
         success=True,
@@ -197,14 +399,8 @@ def signin(email: str, password: str) -> AuthResponse:
     """Sign in with email and password."""
     email = email.lower().strip()
 
-    data = _load_data()
-
     # Find user by email
-    user = None
-    for u in data["users"].values():
-        if u["email"] == email:
-            user = u
-            break
+    user = _get_store().user_by_email(email)
 
     if not user:
         return AuthResponse(success=False, message="No account found with this email")
@@ -215,16 +411,7 @@ def signin(email: str, password: str) -> AuthResponse:
         return AuthResponse(success=False, message="Incorrect password")
 
     # Generate new session token
-    token = _generate_token()
-    expires = datetime.utcnow() + timedelta(hours=TOKEN_EXPIRY_HOURS)
-
-    # Store session
-    data["sessions"][token] = {
-        "user_id": user["id"],
-        "expires": expires.isoformat(),
-        "is_admin": user.get("is_admin", False),
-    }
-    _save_data(data)
+    token, expires = _new_session(user["id"], user.get("is_admin", False))
 
     return AuthResponse(
         success=True,
@@ -249,16 +436,7 @@ def admin_auth(admin_key: str, admin_secret: str) -> AuthResponse:
         return AuthResponse(success=False, message="Invalid admin credentials")
 
     # Generate admin session token
-    token = _generate_token()
-    expires = datetime.utcnow() + timedelta(hours=TOKEN_EXPIRY_HOURS)
-
-    data = _load_data()
-    data["sessions"][token] = {
-        "user_id": "admin",
-        "expires": expires.isoformat(),
-        "is_admin": True,
-    }
-    _save_data(data)
+    token, expires = _new_session("admin", True)
 
     return AuthResponse(
         success=True,
@@ -281,53 +459,14 @@ def verify_token(token: str) -> Optional[Dict[str, Any]]:
     if not token:
         return None
 
-    data = _load_data()
-    session = data["sessions"].get(token)
-
-    if not session:
-        return None
-
-    # Check expiration
-    expires = datetime.fromisoformat(session["expires"])
-    if datetime.utcnow() > expires:
-        # Clean up expired session
-        del data["sessions"][token]
-        _save_data(data)
-        return None
-
-    # Get user info
-    if session["user_id"] == "admin":
-        return {
-            "id": "admin",
-            "name": "Administrator",
-            "is_admin": True,
-            "tier": "admin",
-        }
-
-    user = data["users"].get(session["user_id"])
-    if not user:
-        return None
-
-    return {
-        "id": user["id"],
-        "name": user["name"],
-        "email": user["email"],
-        "is_admin": user.get("is_admin", False),
-        "tier": user.get("tier", "free"),
-    }
+    return _get_store().session_user(token)
 
 
 def logout(token: str) -> bool:
     """Invalidate a session token."""
-    data = _load_data()
-    if token in data["sessions"]:
-        del data["sessions"][token]
-        _save_data(data)
-        return True
-    return False
+    return _get_store().delete_session(token)
 
 
 def get_user_count() -> int:
     """Get total number of registered users."""
-    data = _load_data()
-    return len(data["users"])
+    return _get_store().user_count()
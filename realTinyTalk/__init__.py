@@ -14,11 +14,17 @@ The trace IS the proof.
 __version__ = "1.0.0"
 __author__ = "Newton Supercomputer"
 
+from functools import partial
+
 from .kernel import TinyTalkKernel, ExecutionBounds, Trace, Ledger, fin, finfr
 from .lexer import Lexer, Token, TokenType
 from .parser import Parser, Program, Literal, Identifier, BinaryOp, UnaryOp
 from .types import Value, ValueType, TinyType, TypeChecker
+from .resolver import resolve
 from .runtime import Runtime, Scope, TinyFunction, TinyTalkError
+from .compiler import Code, compile_program
+from .vm import VM
+from .cache import ModuleCache, CompiledModule, get_cache, configure_cache
 from .ffi import (
     FFIConfig,
     configure_ffi,
@@ -66,6 +72,16 @@ __all__ = [
     "Scope",
     "TinyFunction",
     "TinyTalkError",
+    "resolve",
+    # Bytecode VM
+    "Code",
+    "compile_program",
+    "VM",
+    # Module cache
+    "ModuleCache",
+    "CompiledModule",
+    "get_cache",
+    "configure_cache",
     # FFI
     "FFIConfig",
     "configure_ffi",
@@ -87,14 +103,24 @@ __all__ = [
 ]
 
 
-def run(source: str, bounds: ExecutionBounds = None) -> Value:
-    """Run TinyTalk source code."""
-    lexer = Lexer(source)
-    tokens = lexer.tokenize()
-    parser = Parser(tokens)
-    ast = parser.parse()
-    runtime = Runtime(bounds)
-    return runtime.execute(ast)
+ENGINES = {"tree": Runtime, "vm": VM, "jit": partial(Runtime, jit=True)}
+
+
+def run(source: str, bounds: ExecutionBounds = None, engine: str = "tree") -> Value:
+    """
+    Run TinyTalk source code.
+
+    engine selects the interpreter: "tree" walks the AST, "vm" compiles it
+    to bytecode and runs it on the stack VM, "jit" walks the AST but runs
+    hot numeric functions as compiled Python. Parsed programs and bytecode
+    come from the module cache, so running the same source again skips the
+    front end.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {sorted(ENGINES)}")
+    module = get_cache().get(source, bytecode=engine == "vm")
+    runtime = ENGINES[engine](bounds)
+    return runtime.execute_module(module)
 
 
 def repl():
@@ -0,0 +1,223 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+TINYTALK MODULE CACHE
+Parse once, run many.
+
+Lexing, parsing and resolving dominate the cost of short scripts, and the
+same source is often run again and again (the web playground, the kernel,
+imported .tt modules). ModuleCache keys each source by a hash of its text
+and COMPILER_VERSION and keeps the resolved Program - plus its bytecode,
+once the VM has asked for it - in an in-memory LRU. Given a directory it
+also pickles entries to disk so a fresh process can skip the front end.
+
+Cached Programs and Code objects are shared between runs. Neither engine
+mutates them while executing, and Programs are resolved before they are
+published, so concurrent runs never see a half-annotated tree.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from .compiler import COMPILER_VERSION, Code, compile_program
+from .lexer import Lexer
+from .parser import Parser, Program
+from .resolver import resolve
+
+
+def source_key(source: str) -> str:
+    """Content address of a source text for this compiler and interpreter."""
+    salt = f"{COMPILER_VERSION}:{sys.implementation.cache_tag}\0"
+    return hashlib.sha256((salt + source).encode("utf-8")).hexdigest()
+
+
+class CompiledModule:
+    """The front-end output for one source text."""
+
+    __slots__ = ("key", "program", "tokens", "_code")
+
+    def __init__(self, key: str, program: Program, tokens: int, code: Optional[Code] = None):
+        self.key = key
+        self.program = resolve(program)
+        self.tokens = tokens
+        self._code = code
+
+    @property
+    def code(self) -> Code:
+        """Bytecode for the VM, compiled on first use."""
+        if self._code is None:
+            self._code = compile_program(self.program)
+        return self._code
+
+    def __getstate__(self):
+        return (self.key, self.program, self.tokens, self._code)
+
+    def __setstate__(self, state):
+        self.key, self.program, self.tokens, self._code = state
+
+    def __repr__(self):
+        return f"<module {self.key[:12]}>"
+
+
+class ModuleCache:
+    """
+    Content-addressed LRU of CompiledModules, optionally backed by disk.
+
+    maxsize bounds the in-memory entries; directory, when given, holds one
+    <key>.pickle per module. Disk entries are trusted: only point directory
+    at a location no one else can write to.
+    """
+
+    def __init__(self, maxsize: int = 256, directory: Optional[str] = None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self._entries: "OrderedDict[str, CompiledModule]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.disk_writes = 0
+        self.evictions = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def lookup(self, source: str) -> Optional[CompiledModule]:
+        """The cached module for source, or None (counted as a miss)."""
+        key = source_key(source)
+        with self._lock:
+            module = self._entries.get(key)
+            if module is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return module
+
+        module = self._read(key)
+        with self._lock:
+            if module is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self.hits += 1
+        self._insert(module)
+        return module
+
+    def add(self, source: str, program: Program, tokens: int = 0) -> CompiledModule:
+        """Cache an already parsed program for source."""
+        module = CompiledModule(source_key(source), program, tokens)
+        self._insert(module)
+        self._write(module)
+        return module
+
+    def get(self, source: str, bytecode: bool = False) -> CompiledModule:
+        """
+        The module for source, lexing and parsing it on a miss.
+
+        With bytecode, the VM code is compiled now too and stored with the
+        entry, so the on-disk copy carries it.
+        """
+        module = self.lookup(source)
+        if module is None:
+            tokens = Lexer(source).tokenize()
+            module = CompiledModule(source_key(source), Parser(tokens).parse(), len(tokens))
+            self._insert(module)
+        elif not bytecode or module._code is not None:
+            return module
+        if bytecode:
+            module._code = compile_program(module.program)
+        self._write(module)
+        return module
+
+    def load(self, path: str) -> CompiledModule:
+        """The module for a .tt file; edits change the key, so never stale."""
+        with open(path, "r", encoding="utf-8") as f:
+            return self.get(f.read())
+
+    def clear(self):
+        """Forget every in-memory entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.disk_hits = 0
+            self.disk_writes = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "disk_writes": self.disk_writes,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # STORAGE
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _insert(self, module: CompiledModule):
+        with self._lock:
+            self._entries[module.key] = module
+            self._entries.move_to_end(module.key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".pickle")
+
+    def _read(self, key: str) -> Optional[CompiledModule]:
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                module = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, AttributeError, EOFError, ImportError):
+            # Truncated or from an incompatible build: treat as a miss
+            return None
+        return module if isinstance(module, CompiledModule) and module.key == key else None
+
+    def _write(self, module: CompiledModule):
+        if not self.directory:
+            return
+        try:
+            data = pickle.dumps(module, protocol=pickle.HIGHEST_PROTOCOL)
+        except RecursionError:
+            # Very deeply nested programs stay memory-only
+            return
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._path(module.key))
+        except OSError:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            return
+        with self._lock:
+            self.disk_writes += 1
+
+
+_default_cache = ModuleCache()
+
+
+def get_cache() -> ModuleCache:
+    """The process-wide cache used by run(), the kernel and .tt imports."""
+    return _default_cache
+
+
+def configure_cache(maxsize: int = 256, directory: Optional[str] = None) -> ModuleCache:
+    """Replace the process-wide cache, e.g. to add an on-disk store."""
+    global _default_cache
+    _default_cache = ModuleCache(maxsize, directory)
+    return _default_cache
@@ -12,6 +12,7 @@ Usage:
     tinytalk repl                    Interactive REPL
 """
 
+import os
 import sys
 import argparse
 from pathlib import Path
@@ -22,8 +23,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 def cmd_run(args):
     """Run a tinyTalk file."""
-    from realTinyTalk import run
+    from realTinyTalk import configure_cache, run
 
+    if args.cache_dir:
+        configure_cache(directory=args.cache_dir)
     source = Path(args.file).read_text(encoding="utf-8")
     result = run(source)
 
@@ -121,6 +124,11 @@ Examples:
     run_parser.add_argument(
         "-q", "--quiet", action="store_true", help="Suppress result output"
     )
+    run_parser.add_argument(
+        "--cache-dir",
+        default=os.environ.get("TINYTALK_CACHE_DIR"),
+        help="Keep parsed programs here to skip parsing on the next run",
+    )
 
     # build command
     build_parser = subparsers.add_parser("build", help="Compile to target language")
@@ -0,0 +1,799 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+TINYTALK BYTECODE COMPILER
+Compiles the Parser AST into compact bytecode for the stack VM (vm.py).
+
+Names are resolved at compile time. Every block that declares a name gets a
+frame: a Python list [parent_frame, constants, slot0, slot1, ...]. Function
+parameters share a frame with the function body, a loop variable with the
+loop body, and a catch variable with the catch block, exactly where the
+tree-walker would have nested two Scopes with nothing observable between
+them. Blocks that declare nothing get no frame at all. Top-level names live
+in the runtime's global Scope, alongside the builtins.
+
+A name is looked up in the slots that may hold it, innermost first, skipping
+slots not yet assigned, then in the global scope - the same order Scope.get
+walks its dict chain.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .parser import (
+    Program,
+    Literal,
+    Identifier,
+    BinaryOp,
+    UnaryOp,
+    Call,
+    Index,
+    Member,
+    Array,
+    MapLiteral,
+    Lambda,
+    Conditional,
+    Range,
+    Pipe,
+    StepChain,
+    LetStmt,
+    ConstStmt,
+    AssignStmt,
+    Block,
+    IfStmt,
+    ForStmt,
+    WhileStmt,
+    ReturnStmt,
+    BreakStmt,
+    ContinueStmt,
+    FnDecl,
+    StructDecl,
+    EnumDecl,
+    ImportStmt,
+    MatchStmt,
+    TryStmt,
+    ThrowStmt,
+)
+from .resolver import UNSET, declared_names, import_name
+from .runtime import Runtime, TinyTalkError
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# OPCODES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Values and names
+CONST = 0  # arg: Value
+POP = 1
+DUP = 2
+LOAD_FAST = 3  # arg: (slot, fallback, name, error)
+LOAD_DEREF = 4  # arg: (depth, slot, fallback, name, error)
+LOAD_GLOBAL = 5  # arg: (name, error)
+STORE = 6  # arg: (candidates, name, own_slot, keep)
+DEFINE = 7  # arg: (slot or None, name, const, keep)
+COMPOUND_STORE = 8  # arg: (candidates, name, op)
+
+# Operators
+ADD = 10
+SUB = 11
+MUL = 12
+MOD = 13
+LT = 14
+GT = 15
+LE = 16
+GE = 17
+EQ = 18
+NE = 19
+BINARY = 20  # arg: operator string
+UNARY = 21  # arg: operator string
+AND_JUMP = 22  # arg: target
+OR_JUMP = 23  # arg: target
+TO_BOOL = 24
+
+# Control flow
+JUMP = 30  # arg: target
+JUMP_IF_FALSE = 31  # arg: target
+GET_ITER = 32
+FOR_ITER = 33  # arg: (exit target, slot fill)
+LOOP_BACK = 34  # arg: target
+LOOP_CHECK = 35
+SET_RESULT = 36  # arg: stack offset of the loop result below the body value
+ENTER_SCOPE = 37  # arg: slot fill
+EXIT_SCOPE = 38
+RETURN = 39  # arg: True for an explicit return statement
+BREAK_OUTSIDE = 40
+
+# Calls and data
+CALL = 50  # arg: argument count
+CALL_PIPE = 51  # arg: argument count, piped value included
+MAKE_FUNCTION = 52  # arg: (name, params, Code)
+GET_ATTR = 53  # arg: field
+GET_INDEX = 54
+SET_ATTR = 55  # arg: field
+SET_INDEX = 56
+BUILD_LIST = 57  # arg: count
+BUILD_MAP = 58  # arg: pair count
+RANGE = 59  # arg: inclusive
+STEP = 60  # arg: (((step name, argument count), ...), total argument count)
+
+# Declarations, modules, errors
+MAKE_STRUCT = 70  # arg: (name, fields, methods, default Codes)
+ENUM = 71  # arg: (name, variants)
+IMPORT = 72  # arg: (module, items, alias, names defined)
+MATCH_LITERAL = 73  # arg: (literal, next case target)
+SETUP_TRY = 74  # arg: handler target
+POP_TRY = 75
+THROW = 76
+
+# Bump whenever the AST, resolver annotations or bytecode change shape;
+# the module cache keys compiled programs by it
+COMPILER_VERSION = 1
+
+# Frame layout: [parent, constants, slot0, slot1, ...]
+FRAME_HEADER = 2
+
+
+class Code:
+    """A compiled function, lambda, field default or program."""
+
+    __slots__ = ("name", "instructions", "nparams", "nslots", "fill", "line")
+
+    def __init__(
+        self,
+        name: str,
+        instructions: List[Tuple[int, Any, int]],
+        nparams: int,
+        nslots: int,
+        line: int,
+    ):
+        self.name = name
+        self.instructions = instructions
+        self.nparams = nparams
+        self.nslots = nslots
+        self.fill = [UNSET] * (nslots - nparams)
+        self.line = line
+
+    def __repr__(self):
+        return f"<code {self.name} line {self.line}>"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COMPILER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class _Frame:
+    """Compile-time view of a runtime frame."""
+
+    def __init__(self, names: List[str], parent: Optional["_Frame"]):
+        self.slots: Dict[str, int] = {}
+        for i, name in enumerate(names):
+            self.slots[name] = i + FRAME_HEADER
+        self.size = len(names)
+        self.parent = parent
+        # Names certainly defined by the statements compiled so far
+        self.defined: Set[str] = set()
+
+
+class _Loop:
+    """Break/continue bookkeeping for the innermost loop."""
+
+    def __init__(self, is_for: bool, head: int, frames: int, tries: int):
+        self.is_for = is_for
+        self.head = head
+        self.frames = frames
+        self.tries = tries
+        self.breaks: List[int] = []
+
+
+class Compiler:
+    """
+    Compiles one unit (program, function body or field default) to a Code.
+
+    Nested functions are compiled by a child Compiler whose outermost frame
+    has the enclosing frame as its parent.
+    """
+
+    def __init__(
+        self,
+        frame: Optional[_Frame] = None,
+        module: bool = False,
+        global_defined: Optional[Set[str]] = None,
+    ):
+        self.frame = frame
+        self.module = module
+        self.global_defined = global_defined if global_defined is not None else set()
+        self.instructions: List[list] = []
+        self.loops: List[_Loop] = []
+        self.open_frames = 0
+        self.tries = 0
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # ENTRY POINTS
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def compile_program(cls, program: Program) -> Code:
+        """Compile a whole program; top-level names are globals."""
+        compiler = cls(module=True)
+        compiler._statements(program.statements, True)
+        compiler._emit(RETURN, False, program.line)
+        return compiler._finish("<program>", 0, 0, program.line)
+
+    def _compile_function(
+        self, name: str, params: List[str], body, line: int
+    ) -> Code:
+        """Compile a function body in a frame holding params + body names."""
+        statements = body.statements if isinstance(body, Block) else None
+        names = list(params)
+        if statements is not None:
+            names += [
+                n
+                for n in declared_names(statements, self._is_defined)
+                if n not in params
+            ]
+        frame = _Frame(names, self.frame)
+        # A repeated parameter name binds the last argument, as define() did
+        for i, param in enumerate(params):
+            frame.slots[param] = i + FRAME_HEADER
+        frame.defined.update(params)
+        # Names defined before the function is created are defined when it runs
+        child = Compiler(frame, global_defined=set(self.global_defined))
+        if statements is not None:
+            child._statements(statements, True)
+        else:
+            child._expr(body)
+        child._emit(RETURN, False, line)
+        return child._finish(name, len(params), frame.size, line)
+
+    def _compile_default(self, expr) -> Code:
+        """Field defaults are evaluated in the global scope."""
+        child = Compiler()
+        child._expr(expr)
+        child._emit(RETURN, False, expr.line)
+        return child._finish("<default>", 0, 0, expr.line)
+
+    def _finish(self, name: str, nparams: int, nslots: int, line: int) -> Code:
+        instructions = [tuple(ins) for ins in self.instructions]
+        return Code(name, instructions, nparams, nslots, line)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # EMISSION
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _emit(self, op: int, arg: Any = None, line: int = 0) -> int:
+        self.instructions.append([op, arg, line])
+        return len(self.instructions) - 1
+
+    def _here(self) -> int:
+        return len(self.instructions)
+
+    def _patch(self, index: int, target: int):
+        ins = self.instructions[index]
+        if ins[0] == FOR_ITER:
+            ins[1] = (target, ins[1][1])
+        elif ins[0] == MATCH_LITERAL:
+            ins[1] = (ins[1][0], target)
+        else:
+            ins[1] = target
+
+    def _enter(self, names: List[str], line: int, emit: bool = True):
+        self.frame = _Frame(names, self.frame)
+        self.open_frames += 1
+        if emit:
+            self._emit(ENTER_SCOPE, [UNSET] * len(names), line)
+
+    def _exit(self, line: int, emit: bool = True):
+        self.frame = self.frame.parent
+        self.open_frames -= 1
+        if emit:
+            self._emit(EXIT_SCOPE, None, line)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # NAMES
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _candidates(self, name: str) -> Tuple[Tuple[int, int], ...]:
+        """(depth, slot) of every enclosing frame that declares name."""
+        out = []
+        depth = 0
+        frame = self.frame
+        while frame is not None:
+            slot = frame.slots.get(name)
+            if slot is not None:
+                out.append((depth, slot))
+            frame = frame.parent
+            depth += 1
+        return tuple(out)
+
+    def _load(self, name: str, line: int, error: Optional[str] = None):
+        error = error or f"Undefined variable '{name}'"
+        cands = self._candidates(name)
+        if not cands:
+            self._emit(LOAD_GLOBAL, (name, error), line)
+        elif cands[0][0] == 0:
+            self._emit(LOAD_FAST, (cands[0][1], cands[1:], name, error), line)
+        else:
+            depth, slot = cands[0]
+            self._emit(LOAD_DEREF, (depth, slot, cands[1:], name, error), line)
+
+    def _is_defined(self, name: str) -> bool:
+        """Whether name certainly exists in an enclosing scope at this point."""
+        frame = self.frame
+        while frame is not None:
+            if name in frame.defined:
+                return True
+            frame = frame.parent
+        return name in self.global_defined
+
+    def _mark_defined(self, name: str):
+        if self.frame is None:
+            self.global_defined.add(name)
+        else:
+            self.frame.defined.add(name)
+
+    def _own_slot(self, name: str) -> Optional[int]:
+        """Slot for a define in the current scope, or None for a global."""
+        if self.frame is None:
+            return None
+        slot = self.frame.slots.get(name)
+        if slot is None:
+            raise TinyTalkError(f"Cannot resolve '{name}' in this scope")
+        return slot
+
+    def _define(
+        self,
+        name: str,
+        line: int,
+        const: bool = False,
+        keep: bool = False,
+        certain: bool = True,
+    ):
+        self._emit(DEFINE, (self._own_slot(name), name, const, keep), line)
+        if certain:
+            self._mark_defined(name)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # STATEMENTS
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _statements(self, statements, want: bool):
+        """Compile a statement list; if want, leave the last value on the stack."""
+        if not statements:
+            if want:
+                self._emit(CONST, _NULL, 0)
+            return
+        last = len(statements) - 1
+        for i, stmt in enumerate(statements):
+            self._stmt(stmt, want and i == last)
+
+    def _block(self, block: Block, want: bool):
+        """Compile a block in its own frame (elided when it declares nothing)."""
+        names = declared_names(block.statements, self._is_defined)
+        if names:
+            self._enter(names, block.line)
+        self._statements(block.statements, want)
+        if names:
+            self._exit(block.line)
+
+    def _body(self, block: Block, want: bool):
+        """Statements of a block whose names live in the frame just entered."""
+        self._statements(block.statements, want)
+
+    def _stmt(self, node, want: bool):
+        line = node.line
+
+        if isinstance(node, (LetStmt, ConstStmt)):
+            if node.value is not None:
+                self._expr(node.value)
+            else:
+                self._emit(CONST, _NULL, line)
+            self._define(node.name, line, isinstance(node, ConstStmt), want)
+            return
+
+        if isinstance(node, AssignStmt):
+            self._assign(node.target, node.value, node.op, line, want)
+            return
+
+        if isinstance(node, Block):
+            self._block(node, want)
+            return
+
+        if isinstance(node, IfStmt):
+            self._if(node, want)
+            return
+
+        if isinstance(node, ForStmt):
+            self._for(node, want)
+            return
+
+        if isinstance(node, WhileStmt):
+            self._while(node, want)
+            return
+
+        if isinstance(node, ReturnStmt):
+            if node.value is not None:
+                self._expr(node.value)
+            else:
+                self._emit(CONST, _NULL, line)
+            self._emit(RETURN, self.module, line)
+            return
+
+        if isinstance(node, (BreakStmt, ContinueStmt)):
+            self._jump_out(isinstance(node, BreakStmt), line)
+            return
+
+        if isinstance(node, FnDecl):
+            params = [p[0] for p in node.params]
+            code = self._compile_function(node.name, params, node.body, line)
+            self._emit(MAKE_FUNCTION, (node.name, node.params, code), line)
+            self._define(node.name, line, const=True)
+            self._null(want, line)
+            return
+
+        if isinstance(node, StructDecl):
+            methods = []
+            for _, method in node.methods:
+                params = ["self"] + [p[0] for p in method.params]
+                code = self._compile_function(
+                    method.name, params, method.body, method.line
+                )
+                methods.append((method.name, method.params, code))
+            defaults = tuple(
+                self._compile_default(default) if default else None
+                for _, _, default in node.fields
+            )
+            self._emit(MAKE_STRUCT, (node.name, node.fields, methods, defaults), line)
+            self._define(node.name, line, const=True)
+            self._null(want, line)
+            return
+
+        if isinstance(node, EnumDecl):
+            self._emit(ENUM, (node.name, node.variants), line)
+            self._null(want, line)
+            return
+
+        if isinstance(node, ImportStmt):
+            names = node.items or [import_name(node)]
+            self._emit(IMPORT, (node.module, node.items, node.alias, names), line)
+            for name in names:
+                self._define(name, line)
+            self._null(want, line)
+            return
+
+        if isinstance(node, MatchStmt):
+            self._match(node, want)
+            return
+
+        if isinstance(node, TryStmt):
+            self._try(node, want)
+            return
+
+        if isinstance(node, ThrowStmt):
+            if node.value is not None:
+                self._expr(node.value)
+            else:
+                self._emit(CONST, _NULL, line)
+            self._emit(THROW, None, line)
+            return
+
+        if isinstance(node, BinaryOp) and node.op in _ASSIGN_OPS:
+            self._assign(node.left, node.right, node.op, line, want)
+            return
+
+        # Expression statement
+        self._expr(node)
+        if not want:
+            self._emit(POP, None, line)
+
+    def _null(self, want: bool, line: int):
+        if want:
+            self._emit(CONST, _NULL, line)
+
+    def _assign(self, target, value, op: str, line: int, want: bool):
+        self._expr(value)
+        if isinstance(target, Identifier):
+            name = target.name
+            cands = self._candidates(name)
+            if op == "=":
+                own = self.frame.slots.get(name) if self.frame is not None else None
+                self._emit(STORE, (cands, name, own, want), line)
+                self._mark_defined(name)
+                return
+            self._emit(COMPOUND_STORE, (cands, name, op[:-1]), line)
+        elif isinstance(target, Index):
+            self._expr(target.obj)
+            self._expr(target.index)
+            self._emit(SET_INDEX, None, line)
+        elif isinstance(target, Member):
+            self._expr(target.obj)
+            self._emit(SET_ATTR, target.field, line)
+        if not want:
+            self._emit(POP, None, line)
+
+    def _if(self, node: IfStmt, want: bool):
+        ends = []
+        branches = [(node.condition, node.then_branch)] + list(node.elif_branches)
+        for cond, body in branches:
+            self._expr(cond)
+            skip = self._emit(JUMP_IF_FALSE, None, node.line)
+            self._block(body, want)
+            ends.append(self._emit(JUMP, None, node.line))
+            self._patch(skip, self._here())
+        if node.else_branch:
+            self._block(node.else_branch, want)
+        else:
+            self._null(want, node.line)
+        for j in ends:
+            self._patch(j, self._here())
+
+    def _for(self, node: ForStmt, want: bool):
+        line = node.line
+        self._null(want, line)
+        self._expr(node.iterable)
+        self._emit(GET_ITER, None, line)
+        names = [node.var] + [
+            n
+            for n in declared_names(node.body.statements, self._is_defined)
+            if n != node.var
+        ]
+        head = self._emit(FOR_ITER, (None, [UNSET] * (len(names) - 1)), line)
+        loop = _Loop(True, head, self.open_frames, self.tries)
+        self._enter(names, line, emit=False)
+        self.frame.defined.add(node.var)
+        self.loops.append(loop)
+        self._body(node.body, want)
+        if want:
+            self._emit(SET_RESULT, 2, line)
+        self.loops.pop()
+        self._exit(line, emit=False)
+        self._emit(LOOP_BACK, head, line)
+        end = self._here()
+        self._patch(head, end)
+        for j in loop.breaks:
+            self._patch(j, end)
+
+    def _while(self, node: WhileStmt, want: bool):
+        line = node.line
+        self._null(want, line)
+        head = self._emit(LOOP_CHECK, None, line)
+        self._expr(node.condition)
+        exit_jump = self._emit(JUMP_IF_FALSE, None, line)
+        loop = _Loop(False, head, self.open_frames, self.tries)
+        self.loops.append(loop)
+        names = declared_names(node.body.statements, self._is_defined)
+        if names:
+            self._enter(names, node.body.line)
+        self._body(node.body, want)
+        if want:
+            self._emit(SET_RESULT, 1, line)
+        if names:
+            self._exit(node.body.line)
+        self.loops.pop()
+        self._emit(JUMP, head, line)
+        end = self._here()
+        self._patch(exit_jump, end)
+        for j in loop.breaks:
+            self._patch(j, end)
+
+    def _jump_out(self, is_break: bool, line: int):
+        """break/continue: unwind frames and handlers opened inside the loop."""
+        if not self.loops:
+            self._emit(BREAK_OUTSIDE, None, line)
+            return
+        loop = self.loops[-1]
+        for _ in range(self.open_frames - loop.frames):
+            self._emit(EXIT_SCOPE, None, line)
+        for _ in range(self.tries - loop.tries):
+            self._emit(POP_TRY, None, line)
+        if not is_break:
+            self._emit(JUMP, loop.head, line)
+            return
+        if loop.is_for:
+            self._emit(POP, None, line)  # the iterator
+        loop.breaks.append(self._emit(JUMP, None, line))
+
+    def _match(self, node: MatchStmt, want: bool):
+        line = node.line
+        self._expr(node.value)
+        ends = []
+        for pattern, body in node.cases:
+            skip = None
+            if isinstance(pattern, Literal):
+                skip = self._emit(MATCH_LITERAL, (pattern.value, None), line)
+            elif isinstance(pattern, Identifier):
+                if pattern.name != "_":
+                    self._emit(DUP, None, line)
+                    # Only binds when this case is reached
+                    self._define(pattern.name, line, certain=False)
+            else:
+                continue  # other patterns never match
+            self._emit(POP, None, line)
+            self._expr(body)
+            if not want:
+                self._emit(POP, None, line)
+            ends.append(self._emit(JUMP, None, line))
+            if skip is not None:
+                self._patch(skip, self._here())
+        self._emit(POP, None, line)
+        self._null(want, line)
+        for j in ends:
+            self._patch(j, self._here())
+
+    def _try(self, node: TryStmt, want: bool):
+        line = node.line
+        if node.catch_body is None:
+            self._block(node.body, want)
+            return
+        setup = self._emit(SETUP_TRY, None, line)
+        self.tries += 1
+        self._block(node.body, want)
+        self.tries -= 1
+        self._emit(POP_TRY, None, line)
+        done = self._emit(JUMP, None, line)
+        self._patch(setup, self._here())
+        # The handler starts with the error message on the stack
+        names = declared_names(node.catch_body.statements, self._is_defined)
+        if node.catch_var:
+            names = [node.catch_var] + [n for n in names if n != node.catch_var]
+        else:
+            self._emit(POP, None, line)
+        if names:
+            self._enter(names, line)
+            if node.catch_var:
+                self._define(node.catch_var, line)
+        self._body(node.catch_body, want)
+        if names:
+            self._exit(line)
+        self._patch(done, self._here())
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # EXPRESSIONS
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _expr(self, node):
+        """Compile an expression, leaving its value on the stack."""
+        line = node.line
+
+        if isinstance(node, Literal):
+            self._emit(CONST, Runtime._eval_literal(node), line)
+            return
+
+        if isinstance(node, Identifier):
+            self._load(node.name, line)
+            return
+
+        if isinstance(node, BinaryOp):
+            op = node.op
+            if op in ("and", "or"):
+                self._expr(node.left)
+                short = self._emit(AND_JUMP if op == "and" else OR_JUMP, None, line)
+                self._expr(node.right)
+                self._emit(TO_BOOL, None, line)
+                self._patch(short, self._here())
+                return
+            if op in _ASSIGN_OPS:
+                self._assign(node.left, node.right, op, line, True)
+                return
+            self._expr(node.left)
+            self._expr(node.right)
+            fast = _FAST_BINARY.get(op)
+            if fast is not None:
+                self._emit(fast, op, line)
+            else:
+                self._emit(BINARY, op, line)
+            return
+
+        if isinstance(node, UnaryOp):
+            self._expr(node.operand)
+            self._emit(UNARY, node.op, line)
+            return
+
+        if isinstance(node, Call):
+            self._expr(node.callee)
+            for arg in node.args:
+                self._expr(arg)
+            self._emit(CALL, len(node.args), line)
+            return
+
+        if isinstance(node, Index):
+            self._expr(node.obj)
+            self._expr(node.index)
+            self._emit(GET_INDEX, None, line)
+            return
+
+        if isinstance(node, Member):
+            self._expr(node.obj)
+            self._emit(GET_ATTR, node.field, line)
+            return
+
+        if isinstance(node, Array):
+            for el in node.elements:
+                self._expr(el)
+            self._emit(BUILD_LIST, len(node.elements), line)
+            return
+
+        if isinstance(node, MapLiteral):
+            for key, value in node.pairs:
+                self._expr(key)
+                self._expr(value)
+            self._emit(BUILD_MAP, len(node.pairs), line)
+            return
+
+        if isinstance(node, Lambda):
+            code = self._compile_function("<lambda>", node.params, node.body, line)
+            params = [(p, None) for p in node.params]
+            self._emit(MAKE_FUNCTION, ("<lambda>", params, code), line)
+            return
+
+        if isinstance(node, Conditional):
+            self._expr(node.condition)
+            skip = self._emit(JUMP_IF_FALSE, None, line)
+            self._expr(node.then_expr)
+            done = self._emit(JUMP, None, line)
+            self._patch(skip, self._here())
+            self._expr(node.else_expr)
+            self._patch(done, self._here())
+            return
+
+        if isinstance(node, Range):
+            self._expr(node.start)
+            self._expr(node.end)
+            self._emit(RANGE, node.inclusive, line)
+            return
+
+        if isinstance(node, Pipe):
+            # x |> f(a)  becomes  f(x, a)
+            self._expr(node.left)
+            right = node.right
+            args = []
+            if isinstance(right, Call):
+                callee, args = right.callee, right.args
+            else:
+                callee = right
+            if isinstance(callee, Identifier):
+                self._load(callee.name, line, f"Undefined function '{callee.name}'")
+            else:
+                self._expr(callee)
+            for arg in args:
+                self._expr(arg)
+            self._emit(CALL_PIPE, len(args) + 1, line)
+            return
+
+        if isinstance(node, StepChain):
+            # One STEP runs the whole chain as a fused pipeline
+            self._expr(node.source)
+            steps = []
+            for step_name, step_args in node.steps:
+                for arg in step_args:
+                    self._expr(arg)
+                steps.append((step_name, len(step_args)))
+            self._emit(STEP, (tuple(steps), sum(n for _, n in steps)), node.line)
+            return
+
+        # Statements used where a value is expected
+        self._stmt(node, True)
+
+
+_ASSIGN_OPS = ("=", "+=", "-=", "*=", "/=", "%=", "//=", "**=")
+
+_FAST_BINARY = {
+    "+": ADD,
+    "-": SUB,
+    "*": MUL,
+    "%": MOD,
+    "<": LT,
+    ">": GT,
+    "<=": LE,
+    ">=": GE,
+    "==": EQ,
+    "is": EQ,
+    "!=": NE,
+    "isnt": NE,
+}
+
+_NULL = Runtime._eval_literal(Literal(value=None))
+
+
+def compile_program(program: Program) -> Code:
+    """Compile a parsed program to bytecode."""
+    return Compiler.compile_program(program)
@@ -0,0 +1,531 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+TINYTALK JIT
+Tiered execution for hot functions on the tree-walking Runtime.
+
+Runtime(jit=True) counts calls per FnDecl. Once a function has been called
+HOT_CALLS times it is transpiled with the Python backend's emitter,
+compiled with compile() and called natively from then on.
+
+Only functions whose meaning the emitted Python reproduces exactly are
+compiled: pure numeric functions of their parameters and locals that call
+nothing but themselves. Operators whose TinyTalk semantics differ from
+Python's (==, and/or, ^, **, compound assignment) go through helpers that
+mirror Runtime._binary_op. Anything else - strings, lists, globals, other
+calls, lambdas - raises Unsupported and the function stays interpreted.
+
+Because compiled functions are pure, a Python exception (ZeroDivisionError,
+TypeError on a null, RecursionError) simply sends the call back to the
+interpreter, which reports the error the way it always has. Bounds are
+still enforced: every call and every loop back-edge charges the runtime's
+op, iteration and recursion counters, and TinyTalkErrors raised there
+propagate unchanged.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import time
+from dataclasses import fields, is_dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .backends.python.emitter import PythonEmitter
+from .parser import (
+    Literal,
+    Identifier,
+    BinaryOp,
+    UnaryOp,
+    Call,
+    Conditional,
+    LetStmt,
+    AssignStmt,
+    Block,
+    IfStmt,
+    ForStmt,
+    WhileStmt,
+    ReturnStmt,
+    BreakStmt,
+    ContinueStmt,
+    Range,
+)
+from .resolver import GLOBAL_REF
+from .types import Value, ValueType
+
+# Calls before a function is compiled
+HOT_CALLS = 32
+
+# Ops between wall-clock checks (mirrors the VM)
+TIME_CHECK_INTERVAL = 1024
+
+
+class Unsupported(Exception):
+    """The function uses a construct the JIT does not compile."""
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SEMANTIC HELPERS - TinyTalk meaning for Python scalars
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+def _tt_eq(a, b) -> bool:
+    """Runtime._equal for null, booleans, ints and floats."""
+    ta, tb = type(a), type(b)
+    if ta is tb:
+        if ta is float and a != b:
+            if abs(a - b) < 1e-9:
+                return True
+            m = max(abs(a), abs(b))
+            return m > 0 and abs(a - b) / m < 1e-9
+        return a == b
+    if (ta is int and tb is float) or (ta is float and tb is int):
+        return abs(float(a) - float(b)) < 1e-9 or float(a) == float(b)
+    return False
+
+
+def _tt_pow(a, b):
+    """** as Runtime._numeric_op computes it."""
+    r = a**b
+    if isinstance(r, float) and r.is_integer() and type(a) is int and type(b) is int:
+        return int(r)
+    return r
+
+
+def _tt_num(r):
+    """Result of a compound assignment, as Runtime._apply_op boxes it."""
+    if isinstance(r, float) and r.is_integer():
+        return int(r)
+    return r
+
+
+def _tt_range(start, end):
+    """Bounds of an int range; anything else is left to the interpreter."""
+    if type(start) is not int or type(end) is not int:
+        raise TypeError("range bounds must be ints")
+    return range(start, end)
+
+
+def _box(v) -> Optional[Value]:
+    if v is None:
+        return Value.null_val()
+    t = type(v)
+    if t is bool:
+        return Value.bool_val(v)
+    if t is int:
+        return Value.int_val(v)
+    if t is float:
+        return Value.float_val(v)
+    return None
+
+
+_UNBOX = (ValueType.INT, ValueType.FLOAT, ValueType.BOOLEAN, ValueType.NULL)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# EMITTER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+def _cost(node) -> int:
+    """
+    AST nodes the interpreter evaluates for node: roughly its op count.
+
+    Blocks, if-branches and loop bodies are left out; compiled code charges
+    them when they actually run.
+    """
+    if isinstance(node, (list, tuple)):
+        return sum(_cost(n) for n in node)
+    if isinstance(node, Block):
+        return 0
+    if isinstance(node, IfStmt):
+        return 1 + _cost(node.condition) + sum(_cost(c) for c, _ in node.elif_branches)
+    if isinstance(node, ForStmt):
+        return 1 + _cost(node.iterable)
+    if isinstance(node, WhileStmt):
+        return 1
+    if not is_dataclass(node):
+        return 0
+    return 1 + sum(_cost(getattr(node, f.name)) for f in fields(node) if f.repr)
+
+
+_SIMPLE_OPS = {"+", "-", "*", "/", "%", "<", ">", "<=", ">="}
+_COMPOUND = {"+=", "-=", "*=", "/=", "%=", "//=", "**="}
+_BITWISE = {"&", "|", "^", "<<", ">>"}
+
+
+class JitEmitter(PythonEmitter):
+    """
+    Emits one FnDecl as a Python function over plain Python scalars.
+
+    Expressions go through PythonEmitter's dispatch; the overrides below
+    restrict it to the supported subset. Statements are emitted here, since
+    the function body needs implicit returns and bounds accounting.
+    """
+
+    def __init__(self, name: str, params: List[str]):
+        super().__init__(include_runtime=False)
+        self.name = name
+        self.params = params
+        # Visible locals -> index of the scope declaring them. Python has one
+        # set of locals per function, so TinyTalk scopes may reuse a name only
+        # when they do not nest (no shadowing).
+        self.owner: Dict[str, int] = {}
+        self.scopes: List[List[str]] = []
+
+    def emit_function(self, body) -> str:
+        self._push()
+        for p in self.params:
+            self._declare(p)
+        cost, lines = self._block(body, 2, tail=True)
+        lines = [
+            f"def f_{self.name}({', '.join('v_' + p for p in self.params)}):",
+            f"    _enter({cost}, {body.line})",
+            "    try:",
+        ] + lines
+        lines += ["    finally:", "        _rt.recursion_depth -= 1"]
+        return "\n".join(lines)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # NAMES
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _push(self):
+        self.scopes.append([])
+
+    def _pop(self):
+        for name in self.scopes.pop():
+            del self.owner[name]
+
+    def _declare(self, name: str):
+        depth = self.owner.setdefault(name, len(self.scopes) - 1)
+        if depth != len(self.scopes) - 1:
+            raise Unsupported(f"'{name}' shadows an outer local")
+        if name not in self.scopes[-1]:
+            self.scopes[-1].append(name)
+
+    def _local(self, node: Identifier) -> str:
+        if node.ref is None or node.ref == GLOBAL_REF:
+            raise Unsupported(f"global '{node.name}'")
+        if node.name not in self.owner:
+            raise Unsupported(f"'{node.name}' read before it is defined")
+        return "v_" + node.name
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # STATEMENTS
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _block(self, node, depth: int, tail: bool = False) -> Tuple[int, List[str]]:
+        """
+        Lines for node as a block body; tail returns its value.
+
+        Statements are charged in runs that end at control flow, each run
+        when it starts, so an early return does not pay for code after it.
+        The first run's cost is returned for the caller to charge.
+        """
+        pad = "    " * depth
+        statements = node.statements if isinstance(node, Block) else [node]
+        scoped = isinstance(node, Block) and node.scoped
+        if scoped:
+            self._push()
+        first, lines, run, run_lines = None, [], 0, []
+        for i, stmt in enumerate(statements):
+            last = tail and i == len(statements) - 1
+            run += _cost(stmt)
+            run_lines += self._stmt(stmt, depth, last)
+            if isinstance(stmt, (Block, IfStmt, WhileStmt, ForStmt)) or i == len(statements) - 1:
+                if first is None:
+                    first = run + isinstance(node, Block)
+                elif run:
+                    lines.append(f"{pad}_rt.op_count += {run}")
+                lines += run_lines
+                run, run_lines = 0, []
+        if tail and not statements:
+            lines.append(f"{pad}return None")
+        if scoped:
+            self._pop()
+        return first or 0, lines or [f"{pad}pass"]
+
+    def _charged(self, node, depth: int, tail: bool = False) -> List[str]:
+        """Lines for a body that runs conditionally, charging it as it starts."""
+        cost, lines = self._block(node, depth, tail)
+        return ["    " * depth + f"_rt.op_count += {cost}"] + lines
+
+    def _stmt(self, node, depth: int, tail: bool) -> List[str]:
+        pad = "    " * depth
+
+        if isinstance(node, LetStmt):
+            value = self._emit_node(node.value) if node.value else "None"
+            self._declare(node.name)
+            line = f"{pad}v_{node.name} = {value}"
+            return [line, f"{pad}return v_{node.name}"] if tail else [line]
+
+        if isinstance(node, AssignStmt) or (
+            isinstance(node, BinaryOp) and (node.op == "=" or node.op in _COMPOUND)
+        ):
+            target, value, op = (
+                (node.target, node.value, node.op)
+                if isinstance(node, AssignStmt)
+                else (node.left, node.right, node.op)
+            )
+            if not isinstance(target, Identifier):
+                raise Unsupported("assignment to an index or member")
+            value = self._emit_node(value)
+            if op == "=":
+                if target.ref is None or target.ref == GLOBAL_REF:
+                    raise Unsupported(f"assignment to global '{target.name}'")
+                if target.name not in self.owner:
+                    self._declare(target.name)
+                line = f"{pad}v_{target.name} = {value}"
+            else:
+                name = self._local(target)
+                line = f"{pad}{name} = _tt_num({name} {op[:-1]} {value})"
+            return [line, f"{pad}return v_{target.name}"] if tail else [line]
+
+        if isinstance(node, ReturnStmt):
+            value = self._emit_node(node.value) if node.value else "None"
+            return [f"{pad}return {value}"]
+
+        if isinstance(node, Block):
+            return self._charged(node, depth, tail)
+
+        if isinstance(node, IfStmt):
+            lines = [f"{pad}if {self._emit_node(node.condition)}:"]
+            lines += self._charged(node.then_branch, depth + 1, tail)
+            for cond, body in node.elif_branches:
+                lines.append(f"{pad}elif {self._emit_node(cond)}:")
+                lines += self._charged(body, depth + 1, tail)
+            if node.else_branch is not None:
+                lines.append(f"{pad}else:")
+                lines += self._charged(node.else_branch, depth + 1, tail)
+            elif tail:
+                lines.append(f"{pad}return None")
+            return lines
+
+        if isinstance(node, (WhileStmt, ForStmt)):
+            if tail:
+                raise Unsupported("loop as the function's value")
+            return self._loop(node, depth)
+
+        if isinstance(node, BreakStmt):
+            return [f"{pad}break"]
+        if isinstance(node, ContinueStmt):
+            return [f"{pad}continue"]
+
+        # Expression statement
+        expr = self._emit_node(node)
+        return [f"{pad}return {expr}" if tail else f"{pad}{expr}"]
+
+    def _loop(self, node, depth: int) -> List[str]:
+        pad = "    " * depth
+        if isinstance(node, WhileStmt):
+            lines = [
+                f"{pad}while True:",
+                f"{pad}    _loop({_cost(node.condition)}, {node.line})",
+                f"{pad}    if not {self._emit_node(node.condition)}:",
+                f"{pad}        break",
+            ]
+            return lines + self._charged(node.body, depth + 1)
+
+        if not isinstance(node.iterable, Range):
+            raise Unsupported("for loop over a non-range")
+        start = self._emit_node(node.iterable.start)
+        end = self._emit_node(node.iterable.end)
+        if node.iterable.inclusive:
+            end = f"{end} + 1"
+        self._push()
+        self._declare(node.var)
+        cost, body = self._block(node.body, depth + 1)
+        lines = [
+            f"{pad}for v_{node.var} in _tt_range({start}, {end}):",
+            f"{pad}    _loop({cost}, {node.line})",
+        ] + body
+        self._pop()
+        return lines
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # EXPRESSIONS
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _emit_node(self, node) -> str:
+        if isinstance(node, Identifier):
+            return self._local(node)
+        if not isinstance(node, (Literal, BinaryOp, UnaryOp, Call, Conditional)):
+            raise Unsupported(type(node).__name__)
+        return super()._emit_node(node)
+
+    def _emit_literal(self, node: Literal) -> str:
+        if node.value is not None and type(node.value) not in (bool, int, float):
+            raise Unsupported("non-numeric literal")
+        return super()._emit_literal(node)
+
+    def _emit_binary(self, node: BinaryOp) -> str:
+        op = node.op
+        left = self._emit_node(node.left)
+        right = self._emit_node(node.right)
+        if op in _SIMPLE_OPS:
+            return f"({left} {op} {right})"
+        if op in ("and", "or"):
+            return f"bool({left} {op} {right})"
+        if op in ("==", "is"):
+            return f"_tt_eq({left}, {right})"
+        if op in ("!=", "isnt"):
+            return f"(not _tt_eq({left}, {right}))"
+        if op == "//":
+            return f"int({left} // {right})"
+        if op == "**":
+            return f"_tt_pow({left}, {right})"
+        if op in _BITWISE:
+            return f"(int({left}) {op} int({right}))"
+        raise Unsupported(f"operator {op}")
+
+    def _emit_unary(self, node: UnaryOp) -> str:
+        if node.op not in ("-", "not", "!", "~", "+"):
+            raise Unsupported(f"unary {node.op}")
+        operand = self._emit_node(node.operand)
+        if node.op == "~":
+            return f"(~int({operand}))"
+        if node.op == "+":
+            return operand
+        return super()._emit_unary(node)
+
+    def _emit_call(self, node: Call) -> str:
+        callee = node.callee
+        if not (
+            isinstance(callee, Identifier)
+            and callee.name == self.name
+            and callee.ref == GLOBAL_REF
+        ):
+            raise Unsupported("call to another function")
+        if len(node.args) != len(self.params):
+            raise Unsupported("call with missing or extra arguments")
+        args = ", ".join(self._emit_node(a) for a in node.args)
+        return f"f_{self.name}({args})"
+
+    def _emit_conditional_expr(self, node: Conditional) -> str:
+        if node.else_expr is None:
+            raise Unsupported("conditional without else")
+        return super()._emit_conditional_expr(node)
+
+
+class _Meter:
+    """Charges compiled code to the runtime's bounds."""
+
+    __slots__ = ("rt", "next_check")
+
+    def __init__(self, runtime):
+        self.rt = runtime
+        self.next_check = 0
+
+    def enter(self, cost: int, line: int):
+        rt = self.rt
+        rt.recursion_depth += 1
+        if rt.recursion_depth > rt.bounds.max_recursion:
+            rt.recursion_depth -= 1
+            raise _error(f"Exceeded maximum recursion depth ({rt.bounds.max_recursion})", line)
+        self.charge(cost)
+
+    def loop(self, cost: int, line: int):
+        rt = self.rt
+        rt.iteration_count += 1
+        if rt.iteration_count > rt.bounds.max_iterations:
+            raise _error(f"Exceeded maximum iterations ({rt.bounds.max_iterations})", line)
+        self.charge(cost)
+
+    def charge(self, cost: int):
+        rt = self.rt
+        rt.op_count += cost
+        if rt.op_count < self.next_check:
+            return
+        if rt.op_count > rt.bounds.max_ops:
+            raise _error(f"Exceeded maximum operations ({rt.bounds.max_ops})")
+        if time.time() - rt.start_time > rt.bounds.timeout_seconds:
+            raise _error(f"Exceeded timeout ({rt.bounds.timeout_seconds}s)")
+        self.next_check = min(rt.op_count + TIME_CHECK_INTERVAL, rt.bounds.max_ops + 1)
+
+
+def _error(message: str, line: int = 0):
+    from .runtime import TinyTalkError
+
+    return TinyTalkError(message, line)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FUNCTION JIT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class _Entry:
+    __slots__ = ("body", "calls", "native")
+
+    def __init__(self, body):
+        self.body = body
+        self.calls = 0
+        # None: not compiled yet; False: unsupported
+        self.native = None
+
+
+class FunctionJIT:
+    """Per-runtime call counters and compiled functions."""
+
+    def __init__(self, runtime, threshold: int = HOT_CALLS):
+        self.runtime = runtime
+        self.threshold = threshold
+        self.meter = _Meter(runtime)
+        self.entries: Dict[int, _Entry] = {}
+        self.compiled = 0
+
+    def call(self, fn, args: List[Value]) -> Optional[Value]:
+        """Run fn natively if it is hot and compilable; None means interpret."""
+        entry = self.entries.get(id(fn.body))
+        if entry is None or entry.body is not fn.body:
+            entry = self.entries[id(fn.body)] = _Entry(fn.body)
+        if entry.native is None:
+            entry.calls += 1
+            if entry.calls < self.threshold:
+                return None
+            entry.native = self._compile(fn)
+        if entry.native is False or len(args) != len(fn.params):
+            return None
+        for a in args:
+            if a.type not in _UNBOX:
+                return None
+        # Self-calls bind to the compiled function, so the name must still
+        # mean this function
+        current = self.runtime.global_scope.get(fn.name)
+        if current is None or current.data is not fn:
+            return None
+
+        from .runtime import TinyTalkError
+
+        rt = self.runtime
+        depth, ops, iterations = rt.recursion_depth, rt.op_count, rt.iteration_count
+        # The interpreter already counted this call; entering counts it again
+        rt.recursion_depth -= 1
+        try:
+            boxed = _box(entry.native(*[a.data for a in args]))
+        except TinyTalkError:
+            raise
+        except Exception:
+            boxed = None
+        finally:
+            rt.recursion_depth = depth
+        if boxed is None:
+            # Interpret the call instead; it is pure, so only restore counters
+            rt.op_count, rt.iteration_count = ops, iterations
+        return boxed
+
+    def _compile(self, fn):
+        try:
+            emitter = JitEmitter(fn.name, [p[0] for p in fn.params])
+            source = emitter.emit_function(fn.body)
+            namespace = {
+                "_enter": self.meter.enter,
+                "_loop": self.meter.loop,
+                "_rt": self.runtime,
+                "_tt_eq": _tt_eq,
+                "_tt_pow": _tt_pow,
+                "_tt_num": _tt_num,
+                "_tt_range": _tt_range,
+            }
+            exec(compile(source, f"<jit {fn.name}>", "exec"), namespace)
+        except (Unsupported, SyntaxError):
+            return False
+        self.compiled += 1
+        return namespace[f"f_{fn.name}"]
@@ -239,18 +239,31 @@ class TrustPolicy:
 class Compiler:
     """Compiles TinyTalk source to AST."""
 
-    def __init__(self):
+    def __init__(self, cache=None):
+        from .cache import get_cache
         from .lexer import Lexer
         from .parser import Parser
 
         self.lexer_class = Lexer
         self.parser_class = Parser
+        self.cache = cache or get_cache()
 
     def compile(self, source: str) -> Result:
-        """Compile source code to AST."""
+        """Compile source code to AST (cached by content)."""
         trace = [Trace.t("compile:start", True, {"length": len(source)})]
 
         try:
+            module = self.cache.lookup(source)
+            if module is not None:
+                trace.append(
+                    Trace.t(
+                        "compile:cache",
+                        True,
+                        {"key": module.key, "tokens": module.tokens},
+                    )
+                )
+                return fin(module.program, trace)
+
             # Tokenize
             lexer = self.lexer_class(source)
             tokens = lexer.tokenize()
@@ -267,7 +280,7 @@ class Compiler:
                 )
             )
 
-            return fin(ast, trace)
+            return fin(self.cache.add(source, ast, len(tokens)).program, trace)
 
         except SyntaxError as e:
             trace.append(Trace.t("compile:error", False, note=str(e)))
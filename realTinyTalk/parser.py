@@ -10,7 +10,7 @@ Grammar → Tokens → AST
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List, Optional, Any
+from typing import Any, Dict, List, Optional, Tuple
 from .lexer import Token, TokenType
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -102,6 +102,7 @@ class Program(ASTNode):
     """Root program node."""
 
     statements: List[ASTNode] = field(default_factory=list)
+    resolved: bool = field(default=False, repr=False, compare=False)
 
     def __post_init__(self):
         self.type = NodeType.PROGRAM
@@ -122,6 +123,8 @@ class Identifier(ASTNode):
     """Variable or function name."""
 
     name: str = ""
+    # (depth, slot) set by the resolver; None means a dynamic lookup
+    ref: Optional[Tuple[int, int]] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         self.type = NodeType.IDENTIFIER
@@ -210,6 +213,7 @@ class Lambda(ASTNode):
 
     params: List[str] = field(default_factory=list)
     body: ASTNode = None
+    layout: Optional[Dict[str, int]] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         self.type = NodeType.LAMBDA
@@ -307,6 +311,9 @@ class Block(ASTNode):
     """Block of statements."""
 
     statements: List[ASTNode] = field(default_factory=list)
+    # Set by the resolver: blocks that declare nothing share their parent's Scope
+    scoped: bool = field(default=True, repr=False, compare=False)
+    layout: Optional[Dict[str, int]] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         self.type = NodeType.BLOCK_STMT
@@ -332,6 +339,7 @@ class ForStmt(ASTNode):
     var: str = ""
     iterable: ASTNode = None
     body: ASTNode = None
+    layout: Optional[Dict[str, int]] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         self.type = NodeType.FOR_STMT
@@ -384,6 +392,7 @@ class FnDecl(ASTNode):
     body: ASTNode = None
     is_async: bool = False
     is_pub: bool = False
+    layout: Optional[Dict[str, int]] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         self.type = NodeType.FN_DECL
@@ -443,6 +452,7 @@ class TryStmt(ASTNode):
     body: ASTNode = None
     catch_var: Optional[str] = None
     catch_body: Optional[ASTNode] = None
+    catch_layout: Optional[Dict[str, int]] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         self.type = NodeType.TRY_STMT
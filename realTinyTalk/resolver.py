@@ -0,0 +1,392 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+TINYTALK RESOLVER
+Static scope resolution for the tree-walking Runtime.
+
+Runs once over a parsed Program and annotates it in place:
+
+    Identifier.ref      (depth, slot) of the innermost scope declaring the
+                        name, or GLOBAL_REF for the global scope
+    Block.scoped        whether the block needs a Scope of its own
+    *.layout            {name: slot} for every Scope the Runtime creates
+                        (blocks, function calls, loop iterations, catches)
+
+Scopes are laid out the way the bytecode compiler lays out frames: function
+parameters share a Scope with the function body, a loop variable with the
+loop body, a catch variable with the catch block, and blocks that declare
+nothing get no Scope. Names the resolver cannot predict (nested match
+bindings, assignments inside expressions) still work: Scope keeps a dict
+for them, and a slot that has not been assigned yet falls back to the dict
+chain, which preserves shadow-before-let semantics.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from .parser import (
+    Program,
+    Identifier,
+    BinaryOp,
+    UnaryOp,
+    Call,
+    Index,
+    Member,
+    Array,
+    MapLiteral,
+    Lambda,
+    Conditional,
+    Range,
+    Pipe,
+    StepChain,
+    LetStmt,
+    ConstStmt,
+    AssignStmt,
+    Block,
+    IfStmt,
+    ForStmt,
+    WhileStmt,
+    ReturnStmt,
+    FnDecl,
+    StructDecl,
+    ImportStmt,
+    MatchStmt,
+    TryStmt,
+    ThrowStmt,
+)
+
+
+class _Unset:
+    """Marker for a slot whose name has not been defined yet."""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return "<unset>"
+
+    def __reduce__(self):
+        # Pickled bytecode must keep comparing slots against this instance
+        return "UNSET"
+
+
+UNSET = _Unset()
+
+# Identifier.ref for names that live in the global scope
+GLOBAL_REF = (-1, -1)
+
+
+def import_name(node: ImportStmt) -> str:
+    """The name an import statement defines (mirrors Runtime._import)."""
+    if node.module.startswith("@"):
+        return node.module[1:]
+    if node.alias:
+        return node.alias
+    if node.module.endswith(".tt"):
+        return node.module.split("/")[-1][:-3]
+    return node.module.split(".")[-1].split("/")[-1].replace(".py", "")
+
+
+def declared_names(statements, defined: Callable[[str], bool] = None) -> List[str]:
+    """
+    Names the statements of one block may define directly in its scope.
+
+    A plain assignment defines its target only when no enclosing scope has
+    it; names for which defined() is true already exist outside the block
+    whenever it runs, so they are left out.
+    """
+    names: Dict[str, None] = {}
+    for stmt in statements:
+        if isinstance(stmt, (LetStmt, ConstStmt, FnDecl, StructDecl)):
+            names[stmt.name] = None
+        elif isinstance(stmt, (AssignStmt, BinaryOp)):
+            target = stmt.target if isinstance(stmt, AssignStmt) else stmt.left
+            op = stmt.op
+            if op == "=" and isinstance(target, Identifier):
+                if defined is None or not defined(target.name):
+                    names[target.name] = None
+        elif isinstance(stmt, ImportStmt):
+            for name in stmt.items or [import_name(stmt)]:
+                names[name] = None
+        elif isinstance(stmt, MatchStmt):
+            for pattern, _ in stmt.cases:
+                if isinstance(pattern, Identifier) and pattern.name != "_":
+                    names[pattern.name] = None
+    return list(names)
+
+
+class _ScopeInfo:
+    """Resolve-time view of one runtime Scope."""
+
+    def __init__(self, names: List[str], parent: Optional["_ScopeInfo"]):
+        self.layout: Dict[str, int] = {}
+        for name in names:
+            self.layout.setdefault(name, len(self.layout))
+        self.parent = parent
+        # Names certainly defined by the statements resolved so far
+        self.defined: Set[str] = set()
+
+
+class Resolver:
+    """Annotates a Program with (depth, slot) references and Scope layouts."""
+
+    def __init__(self):
+        self.scope: Optional[_ScopeInfo] = None
+        self.global_defined: Set[str] = set()
+
+    def resolve(self, program: Program) -> Program:
+        for stmt in program.statements:
+            self._node(stmt)
+        program.resolved = True
+        return program
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # SCOPES
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _push(self, names: List[str]) -> _ScopeInfo:
+        self.scope = _ScopeInfo(names, self.scope)
+        return self.scope
+
+    def _pop(self):
+        self.scope = self.scope.parent
+
+    def _ref(self, name: str) -> Tuple[int, int]:
+        depth = 0
+        info = self.scope
+        while info is not None:
+            slot = info.layout.get(name)
+            if slot is not None:
+                return (depth, slot)
+            info = info.parent
+            depth += 1
+        return GLOBAL_REF
+
+    def _is_defined(self, name: str) -> bool:
+        """Whether name certainly exists in an enclosing scope at this point."""
+        info = self.scope
+        while info is not None:
+            if name in info.defined:
+                return True
+            info = info.parent
+        return name in self.global_defined
+
+    def _mark_defined(self, name: str):
+        if self.scope is None:
+            self.global_defined.add(name)
+        else:
+            self.scope.defined.add(name)
+
+    def _body_names(self, body, first: List[str]) -> List[str]:
+        """first + the names a merged body block declares."""
+        if not isinstance(body, Block):
+            return list(first)
+        return list(first) + declared_names(body.statements, self._is_defined)
+
+    def _merged_body(self, body):
+        """Resolve a body whose names live in the Scope just pushed."""
+        if isinstance(body, Block):
+            body.scoped = False
+            for stmt in body.statements:
+                self._node(stmt)
+        else:
+            self._node(body)
+
+    def _function(self, node, params: List[str]):
+        """Resolve a FnDecl or Lambda: parameters and body share one Scope."""
+        info = self._push(self._body_names(node.body, params))
+        info.defined.update(params)
+        node.layout = info.layout
+        self._merged_body(node.body)
+        self._pop()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # NODES
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _node(self, node):
+        if node is None:
+            return
+
+        if isinstance(node, Identifier):
+            node.ref = self._ref(node.name)
+            return
+
+        if isinstance(node, (LetStmt, ConstStmt)):
+            self._node(node.value)
+            self._mark_defined(node.name)
+            return
+
+        if isinstance(node, AssignStmt):
+            self._assign(node.target, node.value, node.op)
+            return
+
+        if isinstance(node, BinaryOp):
+            if node.op in _ASSIGN_OPS:
+                self._assign(node.left, node.right, node.op)
+                return
+            self._node(node.left)
+            self._node(node.right)
+            return
+
+        if isinstance(node, UnaryOp):
+            self._node(node.operand)
+            return
+
+        if isinstance(node, Call):
+            self._node(node.callee)
+            for arg in node.args:
+                self._node(arg)
+            return
+
+        if isinstance(node, Index):
+            self._node(node.obj)
+            self._node(node.index)
+            return
+
+        if isinstance(node, Member):
+            self._node(node.obj)
+            return
+
+        if isinstance(node, Array):
+            for el in node.elements:
+                self._node(el)
+            return
+
+        if isinstance(node, MapLiteral):
+            for key, value in node.pairs:
+                self._node(key)
+                self._node(value)
+            return
+
+        if isinstance(node, Lambda):
+            self._function(node, list(node.params))
+            return
+
+        if isinstance(node, Conditional):
+            self._node(node.condition)
+            self._node(node.then_expr)
+            self._node(node.else_expr)
+            return
+
+        if isinstance(node, Range):
+            self._node(node.start)
+            self._node(node.end)
+            return
+
+        if isinstance(node, Pipe):
+            self._node(node.left)
+            self._node(node.right)
+            return
+
+        if isinstance(node, StepChain):
+            self._node(node.source)
+            for _, step_args in node.steps:
+                for arg in step_args:
+                    self._node(arg)
+            return
+
+        if isinstance(node, Block):
+            self._block(node)
+            return
+
+        if isinstance(node, IfStmt):
+            self._node(node.condition)
+            self._node(node.then_branch)
+            for cond, body in node.elif_branches:
+                self._node(cond)
+                self._node(body)
+            self._node(node.else_branch)
+            return
+
+        if isinstance(node, ForStmt):
+            self._node(node.iterable)
+            info = self._push(self._body_names(node.body, [node.var]))
+            info.defined.add(node.var)
+            node.layout = info.layout
+            self._merged_body(node.body)
+            self._pop()
+            return
+
+        if isinstance(node, WhileStmt):
+            self._node(node.condition)
+            self._node(node.body)
+            return
+
+        if isinstance(node, (ReturnStmt, ThrowStmt)):
+            self._node(node.value)
+            return
+
+        if isinstance(node, FnDecl):
+            self._function(node, [p[0] for p in node.params])
+            self._mark_defined(node.name)
+            return
+
+        if isinstance(node, StructDecl):
+            for _, method in node.methods:
+                self._function(method, ["self"] + [p[0] for p in method.params])
+            # Field defaults are evaluated in the global scope
+            saved = self.scope
+            self.scope = None
+            for _, _, default in node.fields:
+                self._node(default)
+            self.scope = saved
+            self._mark_defined(node.name)
+            return
+
+        if isinstance(node, ImportStmt):
+            for name in node.items or [import_name(node)]:
+                self._mark_defined(name)
+            return
+
+        if isinstance(node, MatchStmt):
+            self._node(node.value)
+            for pattern, body in node.cases:
+                if isinstance(pattern, Identifier) and pattern.name != "_":
+                    # Only binds when the case is reached, so never certain
+                    if self.scope is not None:
+                        self.scope.layout.setdefault(
+                            pattern.name, len(self.scope.layout)
+                        )
+                self._node(body)
+            return
+
+        if isinstance(node, TryStmt):
+            self._node(node.body)
+            if node.catch_body is not None:
+                first = [node.catch_var] if node.catch_var else []
+                info = self._push(self._body_names(node.catch_body, first))
+                info.defined.update(first)
+                node.catch_layout = info.layout
+                self._merged_body(node.catch_body)
+                self._pop()
+            return
+
+        # Literals, break/continue, enums: nothing to resolve
+
+    def _block(self, block: Block):
+        names = declared_names(block.statements, self._is_defined)
+        block.scoped = bool(names)
+        if names:
+            block.layout = self._push(names).layout
+        for stmt in block.statements:
+            self._node(stmt)
+        if names:
+            self._pop()
+
+    def _assign(self, target, value, op: str):
+        self._node(value)
+        if isinstance(target, Identifier):
+            target.ref = self._ref(target.name)
+            if op == "=":
+                self._mark_defined(target.name)
+        else:
+            self._node(target)
+
+
+_ASSIGN_OPS = ("=", "+=", "-=", "*=", "/=", "%=", "//=", "**=")
+
+
+def resolve(program: Program) -> Program:
+    """Annotate a parsed program for slot-indexed lookups (idempotent)."""
+    if not program.resolved:
+        Resolver().resolve(program)
+    return program
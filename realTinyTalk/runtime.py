@@ -8,11 +8,17 @@ Every step is traced. Every result is verified.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Callable, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Callable, Tuple
+import operator
+import os
 import time
+from collections import deque
+from collections.abc import Sequence
+from itertools import islice
 
 from .kernel import ExecutionBounds, Trace, Ledger
-from .types import Value, ValueType
+from .resolver import UNSET, declared_names, resolve
+from .types import RangeValue, Value, ValueType
 from .parser import (
     Program,
     Literal,
@@ -77,51 +83,131 @@ class TinyTalkError(Exception):
         super().__init__(f"Line {line}: {message}" if line else message)
 
 
+# Operators for compound assignment (x += y, ...)
+_COMPOUND_OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+    "//": operator.floordiv,
+    "**": operator.pow,
+}
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SCOPE
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
 class Scope:
-    """Variable scope with parent chain."""
+    """
+    Variable scope with parent chain.
+
+    Names the resolver laid out for this scope live in slots, indexed by
+    Identifier.ref; anything else (imports it could not predict, names
+    defined by the host) lives in the variables dict.
+    """
+
+    __slots__ = ("parent", "root", "variables", "constants", "layout", "slots")
 
-    def __init__(self, parent: Optional["Scope"] = None):
+    def __init__(
+        self, parent: Optional["Scope"] = None, layout: Optional[Dict[str, int]] = None
+    ):
         self.parent = parent
+        self.root = parent.root if parent is not None else self
         self.variables: Dict[str, Value] = {}
         self.constants: set = set()
+        self.layout = layout or _NO_LAYOUT
+        self.slots = [UNSET] * len(self.layout)
 
     def define(self, name: str, value: Value, const: bool = False):
         """Define a new variable in this scope."""
-        self.variables[name] = value
+        slot = self.layout.get(name)
+        if slot is None:
+            self.variables[name] = value
+        else:
+            self.slots[slot] = value
         if const:
             self.constants.add(name)
 
+    def _own(self, name: str):
+        """This scope's value for name, or UNSET."""
+        slot = self.layout.get(name)
+        if slot is not None:
+            return self.slots[slot]
+        return self.variables.get(name, UNSET)
+
     def get(self, name: str) -> Optional[Value]:
         """Get a variable, searching parent scopes."""
-        if name in self.variables:
-            return self.variables[name]
-        if self.parent:
-            return self.parent.get(name)
+        scope = self
+        while scope is not None:
+            val = scope._own(name)
+            if val is not UNSET:
+                return val
+            scope = scope.parent
         return None
 
     def set(self, name: str, value: Value) -> bool:
         """Set a variable, searching parent scopes."""
-        if name in self.variables:
-            if name in self.constants:
-                raise TinyTalkError(f"Cannot reassign constant '{name}'")
-            self.variables[name] = value
-            return True
-        if self.parent:
-            return self.parent.set(name, value)
+        scope = self
+        while scope is not None:
+            if scope._own(name) is not UNSET:
+                if name in scope.constants:
+                    raise TinyTalkError(f"Cannot reassign constant '{name}'")
+                scope.define(name, value)
+                return True
+            scope = scope.parent
         return False
 
     def has(self, name: str) -> bool:
         """Check if variable exists."""
-        if name in self.variables:
-            return True
-        if self.parent:
-            return self.parent.has(name)
-        return False
+        return self.get(name) is not None
+
+    def _resolved(self, ref: Tuple[int, int]) -> "Scope":
+        depth = ref[0]
+        if depth < 0:
+            return self.root
+        scope = self
+        while depth:
+            scope = scope.parent
+            depth -= 1
+        return scope
+
+    def lookup(self, ref: Optional[Tuple[int, int]], name: str) -> Optional[Value]:
+        """get() through a resolver (depth, slot) reference."""
+        if ref is not None:
+            if ref[0] < 0:
+                val = self.root.variables.get(name)
+                if val is not None:
+                    return val
+            else:
+                val = self._resolved(ref).slots[ref[1]]
+                if val is not UNSET:
+                    return val
+        # Not assigned yet: an outer scope (or the dict) may still have it
+        return self.get(name)
+
+    def assign(self, ref: Optional[Tuple[int, int]], name: str, value: Value) -> bool:
+        """set() through a resolver (depth, slot) reference."""
+        if ref is not None:
+            scope = self._resolved(ref)
+            if ref[0] < 0:
+                found = name in scope.variables
+            else:
+                found = scope.slots[ref[1]] is not UNSET
+            if found:
+                if scope.constants and name in scope.constants:
+                    raise TinyTalkError(f"Cannot reassign constant '{name}'")
+                if ref[0] < 0:
+                    scope.variables[name] = value
+                else:
+                    scope.slots[ref[1]] = value
+                return True
+        return self.set(name, value)
+
+
+_NO_LAYOUT: Dict[str, int] = {}
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -136,9 +222,14 @@ class TinyFunction:
     name: str
     params: List[Tuple[str, Optional[str]]]  # (name, type_hint)
     body: Any  # AST node
-    closure: Scope
+    closure: Scope = field(repr=False)
     is_native: bool = False
     native_fn: Optional[Callable] = None
+    # Slot layout of the call Scope (parameters + body), from the resolver
+    layout: Optional[Dict[str, int]] = field(default=None, repr=False)
+    # Global scope of the VM that created the function, which may not be the
+    # VM calling it when the function comes from an imported .tt module
+    globals: Optional["Scope"] = field(default=None, repr=False)
 
 
 @dataclass
@@ -197,7 +288,7 @@ class Runtime:
     Executes AST with bounded computation and full tracing.
     """
 
-    def __init__(self, bounds: Optional[ExecutionBounds] = None):
+    def __init__(self, bounds: Optional[ExecutionBounds] = None, jit: bool = False):
         self.bounds = bounds or ExecutionBounds()
         self.global_scope = Scope()
         self.structs: Dict[str, TinyStruct] = {}
@@ -211,6 +302,16 @@ class Runtime:
         self.recursion_depth = 0
         self.start_time = 0.0
 
+        # .tt files being imported by this runtime and its importers
+        self._importing: Tuple[str, ...] = ()
+
+        # Tiered execution: hot functions run as compiled Python (jit.py)
+        self.jit = None
+        if jit:
+            from .jit import FunctionJIT
+
+            self.jit = FunctionJIT(self)
+
         # Register builtins
         self._register_builtins()
 
@@ -290,6 +391,8 @@ class Runtime:
         self.traces = []
 
         try:
+            if isinstance(ast, Program):
+                resolve(ast)
             result = self._eval(ast, self.global_scope)
             self.traces.append(Trace.t("execute", True, {"result": str(result)}))
             return result
@@ -299,6 +402,10 @@ class Runtime:
         except (BreakException, ContinueException):
             raise TinyTalkError("Break/continue outside of loop")
 
+    def execute_module(self, module) -> Value:
+        """Execute a cached CompiledModule (see cache.py)."""
+        return self.execute(module.program)
+
     def _check_bounds(self):
         """Check execution bounds."""
         self.op_count += 1
@@ -327,7 +434,7 @@ class Runtime:
 
         # Identifier
         if isinstance(node, Identifier):
-            val = scope.get(node.name)
+            val = scope.lookup(node.ref, node.name)
             if val is None:
                 raise TinyTalkError(f"Undefined variable '{node.name}'", node.line)
             return val
@@ -371,7 +478,7 @@ class Runtime:
         if isinstance(node, Lambda):
             params = [(p, None) for p in node.params]
             return Value.function_val(
-                TinyFunction("<lambda>", params, node.body, scope)
+                TinyFunction("<lambda>", params, node.body, scope, layout=node.layout)
             )
 
         # Conditional (ternary)
@@ -386,14 +493,7 @@ class Runtime:
         if isinstance(node, Range):
             start = self._eval(node.start, scope)
             end = self._eval(node.end, scope)
-
-            items = []
-            i = start.data
-            end_val = end.data + 1 if node.inclusive else end.data
-            while i < end_val:
-                items.append(Value.int_val(i))
-                i += 1
-            return Value.list_val(items)
+            return self._range_list(start, end, node.inclusive)
 
         # Pipe
         if isinstance(node, Pipe):
@@ -403,15 +503,16 @@ class Runtime:
             # Right side must be callable or a call
             if isinstance(node.right, Call):
                 # Insert left as first argument
+                callee = node.right.callee
                 fn = (
-                    scope.get(node.right.callee.name)
-                    if isinstance(node.right.callee, Identifier)
+                    scope.lookup(callee.ref, callee.name)
+                    if isinstance(callee, Identifier)
                     else self._eval(node.right.callee, scope)
                 )
                 args = [left] + [self._eval(a, scope) for a in node.right.args]
                 return self._call_function(fn.data, args, scope, node.line)
             elif isinstance(node.right, Identifier):
-                fn = scope.get(node.right.name)
+                fn = scope.lookup(node.right.ref, node.right.name)
                 if fn is None:
                     raise TinyTalkError(
                         f"Undefined function '{node.right.name}'", node.line
@@ -441,35 +542,30 @@ class Runtime:
         if isinstance(node, AssignStmt):
             val = self._eval(node.value, scope)
 
-            if isinstance(node.target, Identifier):
+            target = node.target
+            if isinstance(target, Identifier):
                 if node.op == "=":
-                    if not scope.set(node.target.name, val):
-                        scope.define(node.target.name, val)
+                    if not scope.assign(target.ref, target.name, val):
+                        scope.define(target.name, val)
                 else:
                     # Compound assignment
-                    old_val = scope.get(node.target.name)
+                    old_val = scope.lookup(target.ref, target.name)
                     op = node.op[:-1]  # Remove '=' from '+=', '-=', etc.
                     new_val = self._apply_op(old_val, val, op, node.line)
-                    scope.set(node.target.name, new_val)
+                    scope.assign(target.ref, target.name, new_val)
                     return new_val
             elif isinstance(node.target, Index):
                 container = self._eval(node.target.obj, scope)
                 index = self._eval(node.target.index, scope)
-                if container.type == ValueType.LIST:
-                    container.data[int(index.data)] = val
-                elif container.type == ValueType.MAP:
-                    container.data[index.to_python()] = val
+                self._set_index(container, index, val)
             elif isinstance(node.target, Member):
                 obj = self._eval(node.target.obj, scope)
-                if obj.type == ValueType.STRUCT_INSTANCE:
-                    obj.data.fields[node.target.field] = val
-                elif obj.type == ValueType.MAP:
-                    obj.data[node.target.field] = val
+                self._set_member(obj, node.target.field, val)
             return val
 
         # Block
         if isinstance(node, Block):
-            block_scope = Scope(scope)
+            block_scope = Scope(scope, node.layout) if node.scoped else scope
             result = Value.null_val()
             for stmt in node.statements:
                 result = self._eval(stmt, block_scope)
@@ -502,7 +598,9 @@ class Runtime:
 
         # Function declaration
         if isinstance(node, FnDecl):
-            fn = TinyFunction(node.name, node.params, node.body, scope)
+            fn = TinyFunction(
+                node.name, node.params, node.body, scope, layout=node.layout
+            )
             scope.define(node.name, Value.function_val(fn), const=True)
             return Value.null_val()
 
@@ -516,6 +614,7 @@ class Runtime:
                     method_decl.params,
                     method_decl.body,
                     scope,  # closure captures the scope at definition time
+                    layout=method_decl.layout,
                 )
                 methods[method_decl.name] = method_fn
 
@@ -568,7 +667,8 @@ class Runtime:
 
         raise TinyTalkError(f"Unknown node type: {type(node).__name__}")
 
-    def _eval_literal(self, node: Literal) -> Value:
+    @staticmethod
+    def _eval_literal(node: Literal) -> Value:
         """Evaluate a literal."""
         val = node.value
         if val is None:
@@ -583,6 +683,19 @@ class Runtime:
             return Value.string_val(val)
         return Value.null_val()
 
+    def _range_list(self, start: Value, end: Value, inclusive: bool) -> Value:
+        """start..end (or start..=end) as a list of ints, lazy for int bounds."""
+        if start.type == ValueType.INT and end.type == ValueType.INT:
+            stop = end.data + 1 if inclusive else end.data
+            return RangeValue(range(start.data, stop))
+        items = []
+        i = start.data
+        end_val = end.data + 1 if inclusive else end.data
+        while i < end_val:
+            items.append(Value.int_val(i))
+            i += 1
+        return Value.list_val(items)
+
     def _eval_binary(self, node: BinaryOp, scope: Scope) -> Value:
         """Evaluate binary operation."""
         op = node.op
@@ -612,7 +725,10 @@ class Runtime:
 
         left = self._eval(node.left, scope)
         right = self._eval(node.right, scope)
+        return self._binary_op(op, left, right, node.line)
 
+    def _binary_op(self, op: str, left: Value, right: Value, line: int) -> Value:
+        """Apply a non-short-circuit binary operator to evaluated operands."""
         # Arithmetic
         if op == "+":
             # Auto-coerce to string if EITHER side is string (no str() needed!)
@@ -620,37 +736,37 @@ class Runtime:
                 return Value.string_val(self._to_string(left) + self._to_string(right))
             if left.type == ValueType.LIST and right.type == ValueType.LIST:
                 return Value.list_val(left.data + right.data)
-            return self._numeric_op(left, right, lambda a, b: a + b, node.line)
+            return self._numeric_op(left, right, lambda a, b: a + b, line)
 
         if op == "-":
-            return self._numeric_op(left, right, lambda a, b: a - b, node.line)
+            return self._numeric_op(left, right, lambda a, b: a - b, line)
 
         if op == "*":
             if left.type == ValueType.STRING and right.type == ValueType.INT:
                 return Value.string_val(left.data * right.data)
             if left.type == ValueType.LIST and right.type == ValueType.INT:
                 return Value.list_val(left.data * right.data)
-            return self._numeric_op(left, right, lambda a, b: a * b, node.line)
+            return self._numeric_op(left, right, lambda a, b: a * b, line)
 
         if op == "/":
             if left.type == ValueType.NULL or right.type == ValueType.NULL:
-                raise TinyTalkError("Cannot perform arithmetic on null", node.line)
+                raise TinyTalkError("Cannot perform arithmetic on null", line)
             if right.data == 0:
-                raise TinyTalkError("Division by zero", node.line)
+                raise TinyTalkError("Division by zero", line)
             return Value.float_val(left.data / right.data)
 
         if op == "//":
             if left.type == ValueType.NULL or right.type == ValueType.NULL:
-                raise TinyTalkError("Cannot perform arithmetic on null", node.line)
+                raise TinyTalkError("Cannot perform arithmetic on null", line)
             if right.data == 0:
-                raise TinyTalkError("Division by zero", node.line)
+                raise TinyTalkError("Division by zero", line)
             return Value.int_val(int(left.data // right.data))
 
         if op == "%":
-            return self._numeric_op(left, right, lambda a, b: a % b, node.line)
+            return self._numeric_op(left, right, lambda a, b: a % b, line)
 
         if op == "**":
-            return self._numeric_op(left, right, lambda a, b: a**b, node.line)
+            return self._numeric_op(left, right, lambda a, b: a**b, line)
 
         # Comparison
         if op == "<":
@@ -674,7 +790,7 @@ class Runtime:
         # has - check if container contains value
         if op == "has":
             if left.type == ValueType.LIST:
-                return Value.bool_val(any(right.data == v.data for v in left.data))
+                return Value.bool_val(any(right.data == v.data for v in left.view))
             if left.type == ValueType.MAP:
                 return Value.bool_val(right.to_python() in left.data)
             if left.type == ValueType.STRING:
@@ -684,7 +800,7 @@ class Runtime:
         # hasnt - opposite of has
         if op == "hasnt":
             if left.type == ValueType.LIST:
-                return Value.bool_val(not any(right.data == v.data for v in left.data))
+                return Value.bool_val(not any(right.data == v.data for v in left.view))
             if left.type == ValueType.MAP:
                 return Value.bool_val(right.to_python() not in left.data)
             if left.type == ValueType.STRING:
@@ -694,7 +810,7 @@ class Runtime:
         # isin - check if value is in container (reverse of 'in')
         if op == "isin":
             if right.type == ValueType.LIST:
-                return Value.bool_val(any(left.data == v.data for v in right.data))
+                return Value.bool_val(any(left.data == v.data for v in right.view))
             if right.type == ValueType.MAP:
                 return Value.bool_val(left.to_python() in right.data)
             if right.type == ValueType.STRING:
@@ -734,14 +850,14 @@ class Runtime:
         # In/not in
         if op == "in":
             if right.type == ValueType.LIST:
-                return Value.bool_val(any(left.data == v.data for v in right.data))
+                return Value.bool_val(any(left.data == v.data for v in right.view))
             if right.type == ValueType.MAP:
                 return Value.bool_val(left.data in right.data)
             if right.type == ValueType.STRING:
                 return Value.bool_val(str(left.data) in right.data)
             return Value.bool_val(False)
 
-        raise TinyTalkError(f"Unknown operator: {op}", node.line)
+        raise TinyTalkError(f"Unknown operator: {op}", line)
 
     def _equal(self, left: Value, right: Value) -> Value:
         """Test equality with float tolerance for near-equal floats."""
@@ -818,25 +934,34 @@ class Runtime:
         """Evaluate assignment."""
         val = self._eval(node.right, scope)
 
-        if isinstance(node.left, Identifier):
-            if not scope.set(node.left.name, val):
-                scope.define(node.left.name, val)
+        target = node.left
+        if isinstance(target, Identifier):
+            if not scope.assign(target.ref, target.name, val):
+                scope.define(target.name, val)
         elif isinstance(node.left, Index):
             container = self._eval(node.left.obj, scope)
             index = self._eval(node.left.index, scope)
-            if container.type == ValueType.LIST:
-                container.data[int(index.data)] = val
-            elif container.type == ValueType.MAP:
-                container.data[index.to_python()] = val
+            self._set_index(container, index, val)
         elif isinstance(node.left, Member):
             obj = self._eval(node.left.obj, scope)
-            if obj.type == ValueType.STRUCT_INSTANCE:
-                obj.data.fields[node.left.field] = val
-            elif obj.type == ValueType.MAP:
-                obj.data[node.left.field] = val
+            self._set_member(obj, node.left.field, val)
 
         return val
 
+    def _set_index(self, container: Value, index: Value, val: Value):
+        """Write container[index] = val for lists and maps."""
+        if container.type == ValueType.LIST:
+            container.data[int(index.data)] = val
+        elif container.type == ValueType.MAP:
+            container.data[index.to_python()] = val
+
+    def _set_member(self, obj: Value, field: str, val: Value):
+        """Write obj.field = val for struct instances and maps."""
+        if obj.type == ValueType.STRUCT_INSTANCE:
+            obj.data.fields[field] = val
+        elif obj.type == ValueType.MAP:
+            obj.data[field] = val
+
     def _eval_compound_assignment(self, node: BinaryOp, scope: Scope, op: str) -> Value:
         """Evaluate compound assignment like +=, -=."""
         left = self._eval(node.left, scope)
@@ -861,26 +986,17 @@ class Runtime:
             val = Value.int_val(result)
 
         if isinstance(node.left, Identifier):
-            scope.set(node.left.name, val)
+            scope.assign(node.left.ref, node.left.name, val)
 
         return val
 
     def _apply_op(self, left: Value, right: Value, op: str, line: int) -> Value:
         """Apply binary operator to values."""
-        ops = {
-            "+": lambda a, b: a + b,
-            "-": lambda a, b: a - b,
-            "*": lambda a, b: a * b,
-            "/": lambda a, b: a / b,
-            "%": lambda a, b: a % b,
-            "//": lambda a, b: a // b,
-            "**": lambda a, b: a**b,
-        }
-
-        if op not in ops:
+        fn = _COMPOUND_OPS.get(op)
+        if fn is None:
             raise TinyTalkError(f"Unknown operator: {op}", line)
 
-        result = ops[op](left.data, right.data)
+        result = fn(left.data, right.data)
         if isinstance(result, float) and result.is_integer():
             return Value.int_val(int(result))
         elif isinstance(result, float):
@@ -889,22 +1005,24 @@ class Runtime:
 
     def _eval_unary(self, node: UnaryOp, scope: Scope) -> Value:
         """Evaluate unary operation."""
-        operand = self._eval(node.operand, scope)
+        return self._unary_op(node.op, self._eval(node.operand, scope), node.line)
 
-        if node.op == "-":
+    def _unary_op(self, op: str, operand: Value, line: int) -> Value:
+        """Apply a unary operator to an evaluated operand."""
+        if op == "-":
             return (
                 Value.float_val(-operand.data)
                 if operand.type == ValueType.FLOAT
                 else Value.int_val(-int(operand.data))
             )
-        if node.op in ("not", "!"):
+        if op in ("not", "!"):
             return Value.bool_val(not operand.is_truthy())
-        if node.op == "~":
+        if op == "~":
             return Value.int_val(~int(operand.data))
-        if node.op == "+":
+        if op == "+":
             return operand
 
-        raise TinyTalkError(f"Unknown unary operator: {node.op}", node.line)
+        raise TinyTalkError(f"Unknown unary operator: {op}", line)
 
     def _eval_call(self, node: Call, scope: Scope) -> Value:
         """Evaluate function call."""
@@ -938,7 +1056,7 @@ class Runtime:
             instance = bound.instance
 
             # Create method scope with closure as parent
-            fn_scope = Scope(fn.closure)
+            fn_scope = Scope(fn.closure, fn.layout)
 
             # Inject 'self' as the instance
             fn_scope.define("self", Value(ValueType.STRUCT_INSTANCE, instance))
@@ -974,8 +1092,13 @@ class Runtime:
             if fn.is_native:
                 return fn.native_fn(args)
 
+            if self.jit is not None and fn.closure is self.global_scope:
+                result = self.jit.call(fn, args)
+                if result is not None:
+                    return result
+
             # Create function scope
-            fn_scope = Scope(fn.closure)
+            fn_scope = Scope(fn.closure, fn.layout)
 
             # Bind parameters
             for i, (param_name, _) in enumerate(fn.params):
@@ -997,14 +1120,18 @@ class Runtime:
         """Evaluate index access."""
         obj = self._eval(node.obj, scope)
         index = self._eval(node.index, scope)
+        return self._get_index(obj, index, node.line)
 
+    def _get_index(self, obj: Value, index: Value, line: int) -> Value:
+        """Read obj[index]."""
         if obj.type == ValueType.LIST:
+            items = obj.view
             idx = int(index.data)
             if idx < 0:
-                idx = len(obj.data) + idx
-            if idx < 0 or idx >= len(obj.data):
-                raise TinyTalkError(f"Index {idx} out of bounds", node.line)
-            return obj.data[idx]
+                idx = len(items) + idx
+            if idx < 0 or idx >= len(items):
+                raise TinyTalkError(f"Index {idx} out of bounds", line)
+            return items[idx]
 
         if obj.type == ValueType.MAP:
             key = index.to_python()
@@ -1017,29 +1144,31 @@ class Runtime:
             if idx < 0:
                 idx = len(obj.data) + idx
             if idx < 0 or idx >= len(obj.data):
-                raise TinyTalkError(f"Index {idx} out of bounds", node.line)
+                raise TinyTalkError(f"Index {idx} out of bounds", line)
             return Value.string_val(obj.data[idx])
 
-        raise TinyTalkError(f"Cannot index {obj.type.value}", node.line)
+        raise TinyTalkError(f"Cannot index {obj.type.value}", line)
 
     def _eval_member(self, node: Member, scope: Scope) -> Value:
         """Evaluate member access."""
-        obj = self._eval(node.obj, scope)
+        return self._get_member(self._eval(node.obj, scope), node.field, node.line)
 
+    def _get_member(self, obj: Value, field: str, line: int) -> Value:
+        """Read obj.field: struct fields and methods, map keys, properties."""
         if obj.type == ValueType.STRUCT_INSTANCE:
             instance = obj.data
             # Fields take priority over methods (Python-like)
-            if node.field in instance.fields:
-                return instance.fields[node.field]
+            if field in instance.fields:
+                return instance.fields[field]
             # Check for methods - return bound method
-            if node.field in instance.struct.methods:
-                method = instance.struct.methods[node.field]
+            if field in instance.struct.methods:
+                method = instance.struct.methods[field]
                 bound = BoundMethod(method, instance)
                 return Value(ValueType.FUNCTION, bound)
-            raise TinyTalkError(f"Unknown field '{node.field}'", node.line)
+            raise TinyTalkError(f"Unknown field '{field}'", line)
 
         if obj.type == ValueType.MAP:
-            key = node.field
+            key = field
             if key in obj.data:
                 return obj.data[key]
             return Value.null_val()
@@ -1053,10 +1182,10 @@ class Runtime:
         # x.type -> type name as string
         # ═══════════════════════════════════════════════════════════════════
 
-        if node.field == "str":
+        if field == "str":
             return Value.string_val(self._to_string(obj))
 
-        if node.field == "num":
+        if field == "num":
             if obj.type == ValueType.STRING:
                 try:
                     if "." in obj.data:
@@ -1070,7 +1199,7 @@ class Runtime:
                 return Value.int_val(1 if obj.data else 0)
             return Value.int_val(0)
 
-        if node.field == "int":
+        if field == "int":
             if obj.type == ValueType.STRING:
                 try:
                     return Value.int_val(int(float(obj.data)))
@@ -1082,7 +1211,7 @@ class Runtime:
                 return Value.int_val(1 if obj.data else 0)
             return Value.int_val(0)
 
-        if node.field == "float":
+        if field == "float":
             if obj.type == ValueType.STRING:
                 try:
                     return Value.float_val(float(obj.data))
@@ -1092,54 +1221,55 @@ class Runtime:
                 return Value.float_val(float(obj.data))
             return Value.float_val(0.0)
 
-        if node.field == "bool":
+        if field == "bool":
             return Value.bool_val(obj.is_truthy())
 
-        if node.field == "type":
+        if field == "type":
             return Value.string_val(obj.type.value)
 
         # .len works on strings, lists, and maps - universal length
-        if node.field == "len":
+        if field == "len":
             if obj.type == ValueType.STRING:
                 return Value.int_val(len(obj.data))
             if obj.type == ValueType.LIST:
-                return Value.int_val(len(obj.data))
+                return Value.int_val(len(obj.view))
             if obj.type == ValueType.MAP:
                 return Value.int_val(len(obj.data))
             return Value.int_val(0)
 
         # Built-in methods
         if obj.type == ValueType.STRING:
-            if node.field == "length":
+            if field == "length":
                 return Value.int_val(len(obj.data))
-            if node.field in ("upper", "upcase"):  # Support both
+            if field in ("upper", "upcase"):  # Support both
                 return Value.string_val(obj.data.upper())
-            if node.field in ("lower", "lowcase"):  # Support both
+            if field in ("lower", "lowcase"):  # Support both
                 return Value.string_val(obj.data.lower())
-            if node.field == "trim":
+            if field == "trim":
                 return Value.string_val(obj.data.strip())
-            if node.field == "chars":  # Get chars as list
+            if field == "chars":  # Get chars as list
                 return Value.list_val([Value.string_val(c) for c in obj.data])
-            if node.field == "words":  # Split into words
+            if field == "words":  # Split into words
                 return Value.list_val([Value.string_val(w) for w in obj.data.split()])
-            if node.field == "lines":  # Split into lines
+            if field == "lines":  # Split into lines
                 return Value.list_val(
                     [Value.string_val(l) for l in obj.data.splitlines()]
                 )
-            if node.field == "reversed":  # Reverse the string
+            if field == "reversed":  # Reverse the string
                 return Value.string_val(obj.data[::-1])
         if obj.type == ValueType.LIST:
-            if node.field == "length":
-                return Value.int_val(len(obj.data))
-            if node.field == "first":
-                return obj.data[0] if obj.data else Value.null_val()
-            if node.field == "last":
-                return obj.data[-1] if obj.data else Value.null_val()
-            if node.field == "empty":
-                return Value.bool_val(len(obj.data) == 0)
+            items = obj.view
+            if field == "length":
+                return Value.int_val(len(items))
+            if field == "first":
+                return items[0] if items else Value.null_val()
+            if field == "last":
+                return items[-1] if items else Value.null_val()
+            if field == "empty":
+                return Value.bool_val(len(items) == 0)
 
         raise TinyTalkError(
-            f"Cannot access '.{node.field}' on {obj.type.value}", node.line
+            f"Cannot access '.{field}' on {obj.type.value}", line
         )
 
     def _to_string(self, val: Value, seen: set = None) -> str:
@@ -1192,16 +1322,7 @@ class Runtime:
 
     def _eval_for(self, node: ForStmt, scope: Scope) -> Value:
         """Evaluate for loop."""
-        iterable = self._eval(node.iterable, scope)
-
-        if iterable.type == ValueType.LIST:
-            items = iterable.data
-        elif iterable.type == ValueType.STRING:
-            items = [Value.string_val(c) for c in iterable.data]
-        elif iterable.type == ValueType.MAP:
-            items = [Value.string_val(k) for k in iterable.data.keys()]
-        else:
-            raise TinyTalkError(f"Cannot iterate over {iterable.type.value}", node.line)
+        items = self._iter_items(self._eval(node.iterable, scope), node.line)
 
         result = Value.null_val()
         for item in items:
@@ -1212,7 +1333,7 @@ class Runtime:
                     node.line,
                 )
 
-            loop_scope = Scope(scope)
+            loop_scope = Scope(scope, node.layout)
             loop_scope.define(node.var, item)
 
             try:
@@ -1224,6 +1345,16 @@ class Runtime:
 
         return result
 
+    def _iter_items(self, iterable: Value, line: int) -> Iterable[Value]:
+        """Items a for loop visits: list elements, characters or map keys."""
+        if iterable.type == ValueType.LIST:
+            return iterable.view
+        if iterable.type == ValueType.STRING:
+            return [Value.string_val(c) for c in iterable.data]
+        if iterable.type == ValueType.MAP:
+            return [Value.string_val(k) for k in iterable.data.keys()]
+        raise TinyTalkError(f"Cannot iterate over {iterable.type.value}", line)
+
     def _eval_while(self, node: WhileStmt, scope: Scope) -> Value:
         """Evaluate while loop."""
         result = Value.null_val()
@@ -1251,17 +1382,51 @@ class Runtime:
 
     def _eval_import(self, node: ImportStmt, scope: Scope) -> Value:
         """Evaluate import statement."""
+        self._import(node.module, scope, node.items, node.alias)
+        return Value.null_val()
+
+    def _import(self, module: str, scope, items: List[str], alias: Optional[str]):
+        """Define what an import brings in on scope."""
         # Will be handled by FFI system
         from . import ffi
 
-        if node.module.startswith("@"):
+        if module.startswith("@"):
             # Built-in module
-            ffi.import_builtin(node.module[1:], scope, node.names)
+            ffi.import_builtin(module[1:], scope, items)
+        elif module.endswith(".tt"):
+            self._import_tinytalk(module, scope, items, alias)
         else:
             # External module
-            ffi.import_external(node.module, scope, node.names, node.alias)
+            ffi.import_external(module, scope, items, alias)
 
-        return Value.null_val()
+    def _import_tinytalk(self, path: str, scope, items: List[str], alias: Optional[str]):
+        """Run a TinyTalk file once per import and export its top-level names."""
+        from .cache import get_cache
+
+        key = os.path.abspath(path)
+        if key in self._importing:
+            raise TinyTalkError(f"Circular import of {path}")
+        try:
+            module = get_cache().load(path)
+        except OSError as e:
+            raise TinyTalkError(f"Cannot import module: {path} ({e.strerror})")
+
+        # Same engine, so exported functions can be called from here
+        runtime = type(self)(self.bounds)
+        runtime._importing = self._importing + (key,)
+        runtime.execute_module(module)
+        exports = {
+            name: runtime.global_scope.get(name)
+            for name in declared_names(module.program.statements)
+            if runtime.global_scope.has(name)
+        }
+
+        if items:
+            for name in items:
+                if name in exports:
+                    scope.define(name, exports[name])
+        else:
+            scope.define(alias or path.split("/")[-1][:-3], Value.map_val(exports))
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # STEP CHAIN EVALUATION - dplyr-style data manipulation
@@ -1273,136 +1438,145 @@ class Runtime:
 
         Steps are applied left-to-right, each transforming the data.
         """
-        # Start with the source data
         data = self._eval(node.source, scope)
-
-        for step_name, step_args in node.steps:
-            # Evaluate step arguments (if any)
-            args = [self._eval(a, scope) for a in step_args]
-
-            # Apply the step
-            data = self._apply_step(data, step_name, args, scope, node.line)
-
-        return data
-
-    def _apply_step(
-        self, data: Value, step: str, args: List[Value], scope: Scope, line: int
+        steps = [
+            (step_name, [self._eval(a, scope) for a in step_args])
+            for step_name, step_args in node.steps
+        ]
+        return self._apply_steps(data, steps, scope, node.line)
+
+    def _apply_steps(
+        self,
+        data: Value,
+        steps: List[Tuple[str, List[Value]]],
+        scope: Optional[Scope],
+        line: int,
     ) -> Value:
-        """Apply a single step transformation."""
+        """
+        Run a whole step chain as one fused pipeline.
 
-        # Ensure we have a list to work with
-        if data.type != ValueType.LIST:
-            if data.type == ValueType.STRING:
-                # Convert string to list of chars for step operations
-                data = Value.list_val([Value.string_val(c) for c in data.data])
-            else:
-                raise TinyTalkError(
-                    f"Step operations require a list, got {data.type.value}", line
-                )
+        Streaming steps wrap generators, so items flow through _filter, _map
+        and friends one at a time and _take/_first stop pulling once they have
+        enough. _sort and _group need every item; so does _reverse. Steps
+        that reduce to a single value (_count, _sum, _first, ...) end the
+        stream; the next step, if any, starts again from that value.
+        """
+        current: Any = data
+        for step, args in steps:
+            if isinstance(current, Value):
+                current = self._step_items(current, line)
+            current = self._step(current, step, args, scope, line)
+        if isinstance(current, Value):
+            return current
+        return Value.list_val(list(current))
+
+    def _step_items(self, data: Value, line: int) -> Iterable[Value]:
+        """The items a step chain works on: list elements or characters."""
+        if data.type == ValueType.LIST:
+            return data.view
+        if data.type == ValueType.STRING:
+            # Steps see a string as its list of characters
+            return [Value.string_val(c) for c in data.data]
+        raise TinyTalkError(
+            f"Step operations require a list, got {data.type.value}", line
+        )
 
-        items = data.data  # List[Value]
+    def _step_fn(self, args: List[Value], step: str, what: str, line: int) -> Any:
+        """The function argument of _filter/_map/_group."""
+        if not args:
+            raise TinyTalkError(f"{step} requires a {what} function", line)
+        if args[0].type != ValueType.FUNCTION:
+            raise TinyTalkError(f"{step} argument must be a function", line)
+        return args[0].data
+
+    def _step(
+        self,
+        items: Iterable[Value],
+        step: str,
+        args: List[Value],
+        scope: Optional[Scope],
+        line: int,
+    ) -> Any:
+        """Apply one step: returns an iterable of items, or a Value."""
+        call = self._call_function
 
         # _filter(predicate) - Keep items where predicate is true
         if step == "_filter":
-            if not args:
-                raise TinyTalkError("_filter requires a predicate function", line)
-            pred = args[0]
-            if pred.type != ValueType.FUNCTION:
-                raise TinyTalkError("_filter argument must be a function", line)
-            result = []
-            for item in items:
-                res = self._call_function(pred.data, [item], scope, line)
-                if res.is_truthy():
-                    result.append(item)
-            return Value.list_val(result)
-
-        # _sort - Sort the list (optionally with key function)
-        if step == "_sort":
-            if args and args[0].type == ValueType.FUNCTION:
-                key_fn = args[0]
-                sorted_items = sorted(
-                    items,
-                    key=lambda x: self._call_function(
-                        key_fn.data, [x], scope, line
-                    ).to_python(),
-                )
-            else:
-                sorted_items = sorted(items, key=lambda x: x.to_python())
-            return Value.list_val(sorted_items)
+            pred = self._step_fn(args, step, "predicate", line)
+            return (
+                item for item in items if call(pred, [item], scope, line).is_truthy()
+            )
 
         # _map(transform) - Transform each item
         if step == "_map":
-            if not args:
-                raise TinyTalkError("_map requires a transform function", line)
-            fn = args[0]
-            if fn.type != ValueType.FUNCTION:
-                raise TinyTalkError("_map argument must be a function", line)
-            result = [
-                self._call_function(fn.data, [item], scope, line) for item in items
-            ]
-            return Value.list_val(result)
+            fn = self._step_fn(args, step, "transform", line)
+            return (call(fn, [item], scope, line) for item in items)
 
         # _take(n) - Take first n items
         if step == "_take":
             n = int(args[0].data) if args else 1
-            return Value.list_val(items[:n])
+            return islice(items, n) if n >= 0 else list(items)[:n]
 
         # _drop(n) - Drop first n items
         if step == "_drop":
             n = int(args[0].data) if args else 1
-            return Value.list_val(items[n:])
+            return islice(items, n, None) if n >= 0 else list(items)[n:]
 
         # _first - Get first item
         if step == "_first":
-            return items[0] if items else Value.null_val()
+            first = next(iter(items), None)
+            return first if first is not None else Value.null_val()
 
         # _last - Get last item
         if step == "_last":
+            if not isinstance(items, Sequence):
+                items = deque(items, maxlen=1)
             return items[-1] if items else Value.null_val()
 
+        # _sort - Sort the list (optionally with key function)
+        if step == "_sort":
+            if args and args[0].type == ValueType.FUNCTION:
+                key_fn = args[0].data
+                return sorted(
+                    items,
+                    key=lambda x: call(key_fn, [x], scope, line).to_python(),
+                )
+            return sorted(items, key=lambda x: x.to_python())
+
         # _reverse - Reverse the list
         if step == "_reverse":
-            return Value.list_val(list(reversed(items)))
+            result = list(items)
+            result.reverse()
+            return result
 
         # _unique - Remove duplicates (preserving order)
         if step == "_unique":
-            seen = set()
-            result = []
-            for item in items:
-                key = item.to_python()
-                # Make lists hashable by converting to tuple
-                if isinstance(key, list):
-                    key = tuple(key)
-                if key not in seen:
-                    seen.add(key)
-                    result.append(item)
-            return Value.list_val(result)
+            return self._unique(items)
 
         # _count - Count items (or count matching predicate)
         if step == "_count":
             if args and args[0].type == ValueType.FUNCTION:
-                pred = args[0]
+                pred = args[0].data
                 count = sum(
-                    1
-                    for item in items
-                    if self._call_function(pred.data, [item], scope, line).is_truthy()
+                    1 for item in items if call(pred, [item], scope, line).is_truthy()
                 )
-            else:
+            elif isinstance(items, Sequence):
                 count = len(items)
+            else:
+                count = sum(1 for _ in items)
             return Value.int_val(count)
 
         # _sum - Sum numeric values
         if step == "_sum":
-            total = sum(
-                item.data
-                for item in items
-                if item.type in (ValueType.INT, ValueType.FLOAT)
-            )
-            return (
-                Value.float_val(total)
-                if any(item.type == ValueType.FLOAT for item in items)
-                else Value.int_val(int(total))
-            )
+            total = 0
+            is_float = False
+            for item in items:
+                if item.type == ValueType.INT:
+                    total += item.data
+                elif item.type == ValueType.FLOAT:
+                    total += item.data
+                    is_float = True
+            return Value.float_val(total) if is_float else Value.int_val(int(total))
 
         # _avg - Average of numeric values
         if step == "_avg":
@@ -1417,26 +1591,20 @@ class Runtime:
 
         # _min - Minimum value
         if step == "_min":
-            if not items:
-                return Value.null_val()
-            return min(items, key=lambda x: x.to_python())
+            best = min(items, key=lambda x: x.to_python(), default=None)
+            return best if best is not None else Value.null_val()
 
         # _max - Maximum value
         if step == "_max":
-            if not items:
-                return Value.null_val()
-            return max(items, key=lambda x: x.to_python())
+            best = max(items, key=lambda x: x.to_python(), default=None)
+            return best if best is not None else Value.null_val()
 
         # _group(key_fn) - Group by key function
         if step == "_group":
-            if not args:
-                raise TinyTalkError("_group requires a key function", line)
-            key_fn = args[0]
-            if key_fn.type != ValueType.FUNCTION:
-                raise TinyTalkError("_group argument must be a function", line)
+            key_fn = self._step_fn(args, step, "key", line)
             groups = {}
             for item in items:
-                key = self._call_function(key_fn.data, [item], scope, line).to_python()
+                key = call(key_fn, [item], scope, line).to_python()
                 if key not in groups:
                     groups[key] = []
                 groups[key].append(item)
@@ -1445,39 +1613,62 @@ class Runtime:
 
         # _flatten - Flatten nested lists one level
         if step == "_flatten":
-            result = []
-            for item in items:
-                if item.type == ValueType.LIST:
-                    result.extend(item.data)
-                else:
-                    result.append(item)
-            return Value.list_val(result)
+            return self._flatten(items)
 
         # _zip(other_list) - Zip with another list
         if step == "_zip":
             if not args or args[0].type != ValueType.LIST:
                 raise TinyTalkError("_zip requires a list argument", line)
-            other = args[0].data
-            result = [Value.list_val([a, b]) for a, b in zip(items, other)]
-            return Value.list_val(result)
+            other = args[0].view
+            return (Value.list_val([a, b]) for a, b in zip(items, other))
 
         # _chunk(size) - Split into chunks of size n
         if step == "_chunk":
             n = int(args[0].data) if args else 2
-            result = [Value.list_val(items[i : i + n]) for i in range(0, len(items), n)]
-            return Value.list_val(result)
+            if n <= 0:
+                items = list(items)
+                return [
+                    Value.list_val(items[i : i + n]) for i in range(0, len(items), n)
+                ]
+            return self._chunks(items, n)
 
         raise TinyTalkError(f"Unknown step: {step}", line)
 
+    @staticmethod
+    def _unique(items: Iterable[Value]) -> Iterable[Value]:
+        seen = set()
+        for item in items:
+            key = item.to_python()
+            # Make lists hashable by converting to tuple
+            if isinstance(key, list):
+                key = tuple(key)
+            if key not in seen:
+                seen.add(key)
+                yield item
+
+    @staticmethod
+    def _flatten(items: Iterable[Value]) -> Iterable[Value]:
+        for item in items:
+            if item.type == ValueType.LIST:
+                yield from item.view
+            else:
+                yield item
+
+    @staticmethod
+    def _chunks(items: Iterable[Value], n: int) -> Iterable[Value]:
+        it = iter(items)
+        while True:
+            chunk = list(islice(it, n))
+            if not chunk:
+                return
+            yield Value.list_val(chunk)
+
     def _eval_match(self, node: MatchStmt, scope: Scope) -> Value:
         """Evaluate match statement."""
-        value = self._eval(node.expr, scope)
+        value = self._eval(node.value, scope)
 
-        for pattern, guard, body in node.cases:
+        for pattern, body in node.cases:
             if self._match_pattern(value, pattern, scope):
-                if guard:
-                    if not self._eval(guard, scope).is_truthy():
-                        continue
                 return self._eval(body, scope)
 
         return Value.null_val()
@@ -1496,16 +1687,14 @@ class Runtime:
     def _eval_try(self, node: TryStmt, scope: Scope) -> Value:
         """Evaluate try statement."""
         try:
-            return self._eval(node.try_body, scope)
+            return self._eval(node.body, scope)
         except TinyTalkError as e:
-            if node.catch_var and node.catch_body:
-                catch_scope = Scope(scope)
+            if node.catch_body is None:
+                raise
+            catch_scope = Scope(scope, node.catch_layout)
+            if node.catch_var:
                 catch_scope.define(node.catch_var, Value.string_val(str(e.message)))
-                return self._eval(node.catch_body, catch_scope)
-            raise
-        finally:
-            if node.finally_body:
-                self._eval(node.finally_body, scope)
+            return self._eval(node.catch_body, catch_scope)
 
     def _construct_struct(self, struct: TinyStruct, args: List[Value]) -> Value:
         """Construct a struct instance."""
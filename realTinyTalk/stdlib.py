@@ -11,7 +11,7 @@ from typing import List
 import math
 import hashlib
 
-from .types import Value, ValueType
+from .types import RangeValue, Value, ValueType
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # OUTPUT FUNCTIONS
@@ -99,7 +99,7 @@ def builtin_len(args: List[Value]) -> Value:
     if val.type == ValueType.STRING:
         return Value.int_val(len(val.data))
     if val.type == ValueType.LIST:
-        return Value.int_val(len(val.data))
+        return Value.int_val(len(val.view))
     if val.type == ValueType.MAP:
         return Value.int_val(len(val.data))
     return Value.int_val(0)
@@ -210,23 +210,23 @@ def builtin_map(args: List[Value]) -> Value:
 
 
 def builtin_range(args: List[Value]) -> Value:
-    """Generate a range of numbers."""
+    """Generate a range of numbers (built lazily, see RangeValue)."""
     if not args:
         return Value.list_val([])
 
     if len(args) == 1:
         end = int(args[0].data)
-        return Value.list_val([Value.int_val(i) for i in range(end)])
+        return RangeValue(range(end))
 
     if len(args) == 2:
         start = int(args[0].data)
         end = int(args[1].data)
-        return Value.list_val([Value.int_val(i) for i in range(start, end)])
+        return RangeValue(range(start, end))
 
     start = int(args[0].data)
     end = int(args[1].data)
     step = int(args[2].data)
-    return Value.list_val([Value.int_val(i) for i in range(start, end, step)])
+    return RangeValue(range(start, end, step))
 
 
 def builtin_append(args: List[Value]) -> Value:
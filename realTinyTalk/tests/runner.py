@@ -173,7 +173,13 @@ def parse_test_file(content: str, filename: str) -> List[Tuple[str, str, str, in
 
 
 def run_test(
-    name: str, code: str, expected: str, file: str, line: int, category: TestCategory
+    name: str,
+    code: str,
+    expected: str,
+    file: str,
+    line: int,
+    category: TestCategory,
+    engine: str = "tree",
 ) -> TestResult:
     """Run a single test and return detailed result."""
     start = time.time()
@@ -182,7 +188,7 @@ def run_test(
 
     try:
         with redirect_stdout(stdout_capture):
-            run(code)
+            run(code, engine=engine)
 
         actual = stdout_capture.getvalue().strip()
         expected_clean = expected.strip()
@@ -246,7 +252,7 @@ def run_test(
         )
 
 
-def run_suite(path: Path) -> SuiteResult:
+def run_suite(path: Path, engine: str = "tree") -> SuiteResult:
     """Run all tests in a file."""
     start = time.time()
 
@@ -259,7 +265,7 @@ def run_suite(path: Path) -> SuiteResult:
 
     results = []
     for name, code, expected, line in tests:
-        result = run_test(name, code, expected, path.name, line, category)
+        result = run_test(name, code, expected, path.name, line, category, engine)
         results.append(result)
 
     return SuiteResult(
@@ -440,6 +446,8 @@ Examples:
   python runner.py --filter strings   # Run tests matching 'strings'
   python runner.py --category core    # Run only core tests
   python runner.py 09_strings.tt      # Run specific file
+  python runner.py --engine vm        # Run on the bytecode VM
+  python runner.py --engine jit       # Tree-walker with hot functions compiled
         """,
     )
 
@@ -462,6 +470,13 @@ Examples:
     parser.add_argument(
         "--max-failures", type=int, default=10, help="Maximum failures to display"
     )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        default="tree",
+        choices=["tree", "vm", "jit"],
+        help="Interpreter to run tests on",
+    )
     parser.add_argument("files", nargs="*", help="Specific test files to run")
 
     args = parser.parse_args()
@@ -499,7 +514,7 @@ Examples:
     # Run suites
     suites = []
     for path in test_files:
-        suite = run_suite(path)
+        suite = run_suite(path, args.engine)
 
         # Filter results by name pattern
         if args.filter:
@@ -0,0 +1,122 @@
+"""
+═══════════════════════════════════════════════════════════════
+MODULE CACHE TESTS
+Parse once, run many: cached programs behave like fresh ones.
+═══════════════════════════════════════════════════════════════
+"""
+
+import io
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from realTinyTalk import ENGINES, ModuleCache, TinyTalkKernel, cache, run
+from realTinyTalk.resolver import UNSET
+
+
+SCOPES = """let total = 0
+fn add(n) {
+  let k = n * 2
+  total = total + k
+}
+for i in 0..4 {
+  let j = i
+  add(j)
+}
+try { throw "x" } catch (e) { show(e) }
+show(total)
+total"""
+
+
+@pytest.fixture
+def fresh(monkeypatch):
+    """A private process-wide cache for the test."""
+    monkeypatch.setattr(cache, "_default_cache", ModuleCache())
+    return cache.get_cache()
+
+
+def output(source, engine):
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        run(source, engine=engine)
+    return buf.getvalue().split("\n")[:-1]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_second_run_hits(fresh, engine):
+    assert output(SCOPES, engine) == ["x", "12"]
+    assert output(SCOPES, engine) == ["x", "12"]
+    assert fresh.stats()["hits"] == 1
+    assert fresh.stats()["misses"] == 1
+
+
+def test_engines_share_one_entry(fresh):
+    assert run(SCOPES).data == run(SCOPES, engine="vm").data == 12
+    module = fresh.get(SCOPES)
+    assert module.program.resolved
+    assert module._code is not None
+    assert len(fresh) == 1
+
+
+def test_key_follows_content(fresh):
+    assert run("1 + 1").data == 2
+    assert run("1 + 2").data == 3
+    assert fresh.stats()["misses"] == 2
+
+
+def test_lru_eviction():
+    lru = ModuleCache(maxsize=2)
+    for source in ("1", "2", "1", "3"):
+        lru.get(source)
+    assert lru.lookup("1") is not None
+    assert lru.lookup("2") is None
+    assert lru.stats()["evictions"] == 1
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_disk_round_trip(tmp_path, engine):
+    ModuleCache(directory=str(tmp_path)).get(SCOPES, bytecode=True)
+    reloaded = ModuleCache(directory=str(tmp_path))
+    module = reloaded.get(SCOPES)
+    assert reloaded.stats()["disk_hits"] == 1
+    assert module.code.fill.count(UNSET) == len(module.code.fill)
+
+    with redirect_stdout(io.StringIO()):
+        assert ENGINES[engine]().execute_module(module).data == 12
+
+
+def test_corrupt_disk_entry_is_a_miss(tmp_path):
+    store = ModuleCache(directory=str(tmp_path))
+    key = store.get("1 + 1").key
+    (tmp_path / (key + ".pickle")).write_bytes(b"not a pickle")
+    reloaded = ModuleCache(directory=str(tmp_path))
+    assert reloaded.get("1 + 1").program.statements
+    assert reloaded.stats()["misses"] == 1
+
+
+def test_kernel_compile_uses_cache(fresh):
+    kernel = TinyTalkKernel()
+    first = kernel.compiler.compile("let a = 1\na + 1")
+    second = kernel.compiler.compile("let a = 1\na + 1")
+    assert first.value is second.value
+    assert [t.step for t in second.trace] == ["compile:start", "compile:cache"]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_tt_imports(fresh, tmp_path, monkeypatch, engine):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "util.tt").write_text('let base = 10\nfn scale(x) { x * base }\n')
+    (tmp_path / "loop.tt").write_text('import "loop.tt"\n')
+    source = 'import "util.tt"\nimport "util.tt" as u\nshow(util.scale(2), u.base)'
+    assert output(source, engine) == ["20 10"]
+    assert fresh.stats()["hits"] >= 1
+
+    (tmp_path / "util.tt").write_text('let base = 3\nfn scale(x) { x * base }\n')
+    assert output(source, engine) == ["6 3"]
+
+    with pytest.raises(Exception, match="Circular import of loop.tt"):
+        run('import "loop.tt"', engine=engine)
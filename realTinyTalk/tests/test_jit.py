@@ -0,0 +1,129 @@
+"""
+═══════════════════════════════════════════════════════════════
+JIT TESTS
+Compiled hot functions must agree with the interpreter, stay
+within bounds, and step aside for anything they cannot express.
+═══════════════════════════════════════════════════════════════
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from realTinyTalk import ExecutionBounds, Lexer, Parser, Runtime
+from realTinyTalk.jit import HOT_CALLS, JitEmitter, Unsupported
+
+
+def execute(source, jit=True, bounds=None):
+    runtime = Runtime(bounds, jit=jit)
+    result = runtime.execute(Parser(Lexer(source).tokenize()).parse())
+    return result, runtime
+
+
+def hot(fn_source, call):
+    """Source that calls fn enough times to compile it, then returns call."""
+    return f"{fn_source}\nfor i in 0..{HOT_CALLS} {{ {call} }}\n{call}"
+
+
+def agree(source):
+    """Run on both tiers; return the jit runtime after checking results match."""
+    plain, _ = execute(source, jit=False)
+    fast, runtime = execute(source)
+    assert repr(fast) == repr(plain)
+    assert fast.type == plain.type
+    return runtime
+
+
+@pytest.mark.parametrize(
+    "fn, call",
+    [
+        ("fn fib(n) {\n if n < 2 { return n }\n fib(n - 1) + fib(n - 2)\n}", "fib(15)"),
+        ("fn f(x) {\n let t = 0.5\n t += 1.5\n t\n}", "f(1)"),
+        ("fn f(a, b) { a / b }", "f(6, 3)"),
+        ("fn f(a) { 2 ** a }", "f(-1)"),
+        ("fn f(a) { (a ^ 3) + (a << 2) }", "f(5)"),
+        ("fn f(a) { 0.1 + 0.2 == a }", "f(0.3)"),
+        ("fn f(a) { a == true }", "f(1)"),
+        ("fn f(a) { a and 5 }", "f(3)"),
+        ("fn f(a) { if a > 1 { 10 } elif a > 0 { 20 } }", "f(-1)"),
+        ("fn f(a) { a > 0 ? -a : a }", "f(4)"),
+        (
+            "fn f(n) {\n let c = 0\n while n != 1 {\n"
+            "  if n % 2 == 0 { n = n >> 1 } else { n = 3 * n + 1 }\n"
+            "  c += 1\n }\n c\n}",
+            "f(27)",
+        ),
+        (
+            "fn f(n) {\n let t = 0\n for i in 0..n { t = t + i }\n"
+            " for i in 0..=n {\n  if i == 3 { continue }\n  t = t - 1\n }\n t\n}",
+            "f(10)",
+        ),
+    ],
+)
+def test_compiled_results_match(fn, call):
+    assert agree(hot(fn, call)).jit.compiled == 1
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [
+        'fn f(a) { show(a) }',
+        'fn f(a) { a + "x" }',
+        "fn f(a) { a + g }",
+        "fn f(a) {\n g = a\n a\n}",
+        "fn f(a) {\n let x = 1\n if a { let x = 2 }\n x\n}",
+        "fn f(a) { [a] }",
+        "fn f(a) { while a > 0 { a = a - 1 } }",
+    ],
+)
+def test_unsupported_functions_stay_interpreted(fn):
+    source = hot("let g = 1\n" + fn, "f(1)")
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr("sys.stdout", open("/dev/null", "w"))
+        runtime = agree(source)
+    assert runtime.jit.compiled == 0
+
+
+def test_emitter_rejects_shadowing():
+    program = Parser(
+        Lexer("fn f(a) {\n for i in 0..a { let a = i }\n a\n}").tokenize()
+    ).parse()
+    from realTinyTalk.resolver import resolve
+
+    fn = resolve(program).statements[0]
+    with pytest.raises(Unsupported):
+        JitEmitter("f", ["a"]).emit_function(fn.body)
+
+
+def test_python_errors_fall_back_to_the_interpreter():
+    source = hot("fn f(a, b) { a % b }", "f(7, 2)") + "\nf(1, 0)"
+    with pytest.raises(Exception, match="modulo by zero|Division by zero"):
+        execute(source)
+    source = hot("fn f(a) { a + 1 }", "f(1)") + "\nf(null)"
+    with pytest.raises(Exception, match="Cannot perform arithmetic on null"):
+        execute(source)
+
+
+def test_bounds_are_enforced_in_compiled_code():
+    spin = "fn f(n) {\n let c = 0\n while true { c += 1 }\n c\n}"
+    with pytest.raises(Exception, match=r"Exceeded maximum iterations \(5000\)"):
+        execute(hot(spin, "f(1)"), bounds=ExecutionBounds(max_iterations=5000))
+
+    deep = "fn d(n) { n == 0 ? 0 : d(n - 1) }"
+    with pytest.raises(Exception, match=r"Exceeded maximum recursion depth \(100\)"):
+        execute(hot(deep, "d(1)") + "\nd(500)", bounds=ExecutionBounds(max_recursion=100))
+
+    busy = "fn f(n) {\n let t = 0\n for i in 0..n { t = t + i * i - i }\n t\n}"
+    with pytest.raises(Exception, match=r"Exceeded maximum operations \(50000\)"):
+        execute(
+            hot(busy, "f(2)") + "\nf(100000)",
+            bounds=ExecutionBounds(max_ops=50_000, max_iterations=10**7),
+        )
+
+
+def test_functions_below_the_threshold_are_interpreted():
+    _, runtime = execute("fn f(a) { a * 2 }\nf(1)\nf(2)")
+    assert runtime.jit.compiled == 0
@@ -0,0 +1,112 @@
+"""
+═══════════════════════════════════════════════════════════════
+LAZY STEP CHAIN TESTS
+Fused step pipelines stop early; ranges stay unbuilt until a
+plain list is really needed.
+═══════════════════════════════════════════════════════════════
+"""
+
+import io
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from realTinyTalk import ENGINES, Lexer, Parser, run
+from realTinyTalk.types import RangeValue, Value
+
+
+COUNTED = """let calls = 0
+fn big(x) {
+  calls = calls + 1
+  x > 2
+}
+"""
+
+
+def output(source, engine):
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        run(source, engine=engine)
+    return buf.getvalue().split("\n")[:-1]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_take_stops_upstream_work(engine):
+    source = COUNTED + "show((0..1000000) _filter(big) _map((x) => x * 10) _take(2))\nshow(calls)"
+    assert output(source, engine) == ["[30, 40]", "5"]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_first_stops_upstream_work(engine):
+    source = COUNTED + "show([1, 2, 3, 4, 5] _filter(big) _first)\nshow(calls)"
+    assert output(source, engine) == ["3", "3"]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_sort_is_a_barrier(engine):
+    source = COUNTED + "show([5, 1, 4, 3] _filter(big) _sort _take(1))\nshow(calls)"
+    assert output(source, engine) == ["[3]", "4"]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_chain_results(engine):
+    source = """show([3, 1, 3, 2] _unique _reverse)
+show([[1, 2], 3, [4]] _flatten _chunk(2))
+show((1..=4) _zip(["a", "b"]))
+show((0..10) _drop(7), (0..10) _take(-8), (0..5) _last, (0..0) _first)
+show((1..=4) _sum, [1, 2.5] _sum, (0..4) _count, (0..10) _count((x) => x > 6))
+show("abc" _reverse, (0..6) _group((x) => x % 2))"""
+    assert output(source, engine) == [
+        "[2, 1, 3]",
+        "[[1, 2], [3, 4]]",
+        "[[1, a], [2, b]]",
+        "[7, 8, 9] [0, 1] 4 null",
+        "10 3.5 4 3",
+        "[c, b, a] {0: [0, 2, 4], 1: [1, 3, 5]}",
+    ]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_step_errors(engine):
+    with pytest.raises(Exception, match="_filter requires a predicate function"):
+        run("[1] _filter", engine=engine)
+    with pytest.raises(Exception, match="Step operations require a list, got int"):
+        run("5 _sort", engine=engine)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_range_is_not_built_for_reads(engine):
+    source = """let r = 0..10000000
+let t = 0
+for i in 0..5 { t = t + r[i] }
+t = t + len(r) + r.len + r[-1] + r.last
+for i in r { if i > 3 { break } }
+if r has 5 { t = t + 1 }
+t"""
+    runtime = ENGINES[engine]()
+    result = runtime.execute(Parser(Lexer(source).tokenize()).parse())
+    assert result.data == 10 + 10000000 * 2 + 9999999 * 2 + 1
+    r = runtime.global_scope.get("r")
+    assert isinstance(r, RangeValue)
+    assert r._items is None
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_range_behaves_like_a_list(engine):
+    source = """let r = 0..4
+r[0] = 9
+show(r, r has 2, r == [9, 1, 2, 3], range(1, 7, 2))
+let e = 0..0
+if e { show("never") } else { show("empty") }"""
+    assert output(source, engine) == ["[9, 1, 2, 3] true true [1, 3, 5]", "empty"]
+
+
+def test_range_value_equality():
+    lazy = RangeValue(range(3))
+    built = Value.list_val([Value.int_val(i) for i in range(3)])
+    assert lazy == built and built == lazy
+    assert lazy.view[1] == Value.int_val(1)
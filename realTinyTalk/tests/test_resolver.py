@@ -0,0 +1,124 @@
+"""
+═══════════════════════════════════════════════════════════════
+RESOLVER TESTS
+Slot-indexed lookups must see exactly what the dict chain saw.
+═══════════════════════════════════════════════════════════════
+"""
+
+import io
+import sys
+from contextlib import redirect_stdout
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from realTinyTalk import run
+from realTinyTalk.lexer import Lexer
+from realTinyTalk.parser import Identifier, Parser
+from realTinyTalk.resolver import GLOBAL_REF, resolve
+
+
+def output(source):
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        run(source)
+    return buf.getvalue().split()
+
+
+def parse(source):
+    return Parser(Lexer(source).tokenize()).parse()
+
+
+def identifiers(node, name):
+    """Every Identifier called name below node."""
+    if isinstance(node, Identifier):
+        return [node] if node.name == name else []
+    if isinstance(node, (list, tuple)):
+        return [i for child in node for i in identifiers(child, name)]
+    if not is_dataclass(node):
+        return []
+    return [i for f in fields(node) for i in identifiers(getattr(node, f.name), name)]
+
+
+def test_annotations():
+    program = resolve(parse("fn f(a) {\n  let b = a\n  len(b)\n}"))
+    assert program.resolved
+    fn = program.statements[0]
+    assert fn.layout == {"a": 0, "b": 1}
+    assert not fn.body.scoped
+    assert [i.ref for i in identifiers(fn, "a")] == [(0, 0)]
+    assert [i.ref for i in identifiers(fn, "len")] == [GLOBAL_REF]
+
+
+def test_blocks_that_declare_nothing_share_the_scope():
+    program = resolve(parse("let x = 1\nif true {\n  x = 2\n}\nif true {\n  let y = 3\n}"))
+    assert not program.statements[1].then_branch.scoped
+    assert program.statements[2].then_branch.scoped
+
+
+def test_shadow_before_let():
+    source = """let x = "global"
+fn f() {
+  show(x)
+  let x = "local"
+  show(x)
+}
+f()
+show(x)"""
+    assert output(source) == ["global", "local", "global"]
+
+
+def test_closure_sees_later_let():
+    source = """fn f() {
+  let g = () => x
+  let x = 5
+  g()
+}
+show(f())"""
+    assert output(source) == ["5"]
+
+
+def test_closures_capture_each_iteration():
+    source = """let fs = []
+for i in [1, 2, 3] {
+  fs = fs + [() => i]
+}
+show(fs[0](), fs[1](), fs[2]())"""
+    assert output(source) == ["1", "2", "3"]
+
+
+def test_assignment_reaches_outer_scopes():
+    source = """let c = 0
+fn inc() { c = c + 1 }
+inc()
+inc()
+if true {
+  y = 5
+}
+show(c)"""
+    assert output(source) == ["2"]
+
+
+def test_local_constants_are_enforced():
+    with pytest.raises(Exception, match="Cannot reassign constant 'q'"):
+        run("fn f() {\n  const q = 1\n  q = 2\n}\nf()")
+
+
+def test_dynamic_names_use_the_dict():
+    source = """fn f() {
+  import "@math"
+  math.sqrt(16)
+}
+show(f())"""
+    assert output(source) == ["4.0"]
+
+
+def test_match_binding_inside_function():
+    source = """fn name(n) {
+  match n { 1 => "one", other => "many " + other }
+}
+show(name(1), name(7))"""
+    assert output(source) == ["one", "many", "7"]
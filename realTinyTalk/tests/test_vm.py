@@ -0,0 +1,288 @@
+"""
+═══════════════════════════════════════════════════════════════
+BYTECODE VM TESTS
+The VM must agree with the tree-walking Runtime: same output,
+same result, same errors (including line numbers).
+═══════════════════════════════════════════════════════════════
+"""
+
+import io
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from realTinyTalk import Code, compile_program, run
+from realTinyTalk.kernel import ExecutionBounds
+from realTinyTalk.lexer import Lexer
+from realTinyTalk.parser import Parser
+from realTinyTalk.tests import runner as conformance
+
+TESTS_DIR = Path(__file__).parent
+
+CONFORMANCE = [
+    (path.stem, name, code, expected, line)
+    for path in sorted(TESTS_DIR.glob("*.tt"))
+    for name, code, expected, line in conformance.parse_test_file(path.read_text(), path.name)
+]
+
+
+def outcome(source, engine, bounds=None):
+    """(stdout, repr of result or error) for one run."""
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            result = run(source, bounds, engine=engine)
+        return buf.getvalue(), repr(result)
+    except Exception as e:
+        return buf.getvalue(), f"{type(e).__name__}: {e}"
+
+
+PROGRAMS = {
+    "closures_in_loop": """
+let fs = []
+for i in [1,2,3] {
+  fs = fs + [() => i]
+}
+show(fs[0](), fs[1](), fs[2]())
+""",
+    "lambda_capture": """
+let k = 10
+let add = (x) => x + k
+k = 20
+show(add(1))
+""",
+    "shadow_before_let": """
+let x = "global"
+fn f() {
+  show(x)
+  let x = "local"
+  show(x)
+}
+f()
+show(x)
+""",
+    "assign_defines_in_block": """
+if true {
+  y = 5
+  show(y)
+}
+show(y)
+""",
+    "assign_outer": """
+let c = 0
+fn inc() { c = c + 1 }
+inc()
+inc()
+show(c)
+""",
+    "const_err": """
+const z = 1
+z = 2
+""",
+    "const_local_err": """
+fn f() {
+  const q = 1
+  q = 2
+}
+f()
+""",
+    "break_continue": """
+let out = []
+for i in 0..10 {
+  if i == 2 { continue }
+  if i == 6 { break }
+  let sq = i * i
+  out = out + [sq]
+}
+show(out)
+let n = 0
+while true {
+  n += 1
+  if n > 4 { break }
+}
+show(n)
+""",
+    "loop_value": """
+fn f() { for i in [1,2,3] { i * 10 } }
+fn g() {
+  let n = 0
+  while n < 3 {
+    n += 1
+    n * 2
+  }
+}
+show(f(), g())
+""",
+    "try_in_loop": """
+for i in [1, 0, 2] {
+  try {
+    if i == 0 { throw "zero" }
+    show(10 / i)
+  } catch (e) {
+    show("err " + e)
+    continue
+  }
+  show("after", i)
+}
+""",
+    "try_break": """
+let i = 0
+while true {
+  try {
+    i += 1
+    if i == 3 { break }
+  } catch (e) { show(e) }
+}
+show(i)
+""",
+    "nested_error_line": """
+fn bad(x) {
+  return x + undefined_thing
+}
+bad(1)
+""",
+    "catch_nested_call": """
+fn boom() { throw "deep" }
+fn mid() {
+  let a = 1
+  boom()
+  a
+}
+try { mid() } catch (e) { show("got " + e) }
+show("ok")
+""",
+    "recursion": """
+fn fact(n) { if n <= 1 { 1 } else { n * fact(n - 1) } }
+show(fact(20))
+""",
+    "blueprint": """
+blueprint Counter
+  field count = 0
+  field label = "c"
+  forge inc(by)
+    self.count = self.count + by
+    reply self
+  end
+  law value
+    reply self.count
+  end
+end
+let c = Counter()
+c.inc(2).inc(3)
+show(c.value(), c.label)
+let d = Counter(7)
+show(d.value())
+""",
+    "steps": """
+let xs = [5, 3, 8, 1, 9, 2]
+show(xs _filter((x) => x > 2) _sort _take(3))
+show(xs _map((x) => x * 2) _sum)
+show(xs.len, xs _count((x) => x % 2 == 0))
+""",
+    "pipe": """
+fn double(x) { x * 2 }
+fn add(a, b) { a + b }
+show(5 |> double |> add(1))
+""",
+    "match": """
+fn name(n) {
+  match n { 1 => "one", 2 => "two", other => "many " + other }
+}
+show(name(1), name(2), name(7))
+""",
+    "compound_index": """
+let a = [1, 2, 3]
+a[0] = 9
+let m = {"k": 1}
+m.k = 5
+m["j"] = 6
+show(a, m)
+""",
+    "undefined_pipe": """
+5 |> nothere
+""",
+    "top_return": """
+show("a")
+return 42
+show("b")
+""",
+    "when_and_strings": """
+when sq(x)
+  do x * x
+finfr
+when base = 3
+show(sq(base), "n=" + 4, 1 < 2 and 2 < 1, 0 or "x")
+""",
+    "map_iter": """
+let m = {"a": 1, "b": 2}
+for k in m { show(k, m[k]) }
+for ch in "hi" { show(ch) }
+""",
+    "nested_fn_recursion": """
+fn outer() {
+  fn inner(n) { if n == 0 { 0 } else { n + inner(n - 1) } }
+  inner(10)
+}
+show(outer())
+""",
+    "import_math": """
+import "@math"
+show(math.sqrt(16))
+""",
+    "index_errors": """
+let a = [1]
+show(a[-1])
+show(a[5])
+""",
+    "cannot_call": """
+let x = 5
+x(1)
+""",
+}
+
+BOUNDED = {
+    "max_iterations": ("let i = 0\nwhile true { i += 1 }", ExecutionBounds(max_iterations=50)),
+    "max_ops": ("let i = 0\nfor j in 0..100000 { i += j }", ExecutionBounds(max_ops=5000)),
+    "max_recursion": ("fn f(n) { f(n + 1) }\nf(0)", ExecutionBounds(max_recursion=50)),
+}
+
+
+@pytest.mark.parametrize(
+    "stem,name,code,expected,line",
+    CONFORMANCE,
+    ids=[f"{stem}:{name}" for stem, name, *_ in CONFORMANCE],
+)
+def test_conformance_suite_on_vm(stem, name, code, expected, line):
+    category = conformance.FILE_CATEGORIES.get(stem, conformance.TestCategory.CORE)
+    result = conformance.run_test(name, code, expected, stem, line, category, engine="vm")
+    assert result.passed, result.error or f"expected {result.expected!r}, got {result.actual!r}"
+
+
+@pytest.mark.parametrize("name", sorted(PROGRAMS))
+def test_vm_matches_tree(name):
+    source = PROGRAMS[name]
+    assert outcome(source, "vm") == outcome(source, "tree")
+
+
+@pytest.mark.parametrize("name", sorted(BOUNDED))
+def test_bounds_match_tree(name):
+    source, bounds = BOUNDED[name]
+    vm_out = outcome(source, "vm", bounds)
+    assert "Error" in vm_out[1]
+    assert vm_out[1] == outcome(source, "tree", bounds)[1]
+
+
+def test_compile_program_returns_code():
+    ast = Parser(Lexer("let x = 1\nshow(x + 2)").tokenize()).parse()
+    code = compile_program(ast)
+    assert isinstance(code, Code)
+    assert code.instructions
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        run("1", engine="llvm")
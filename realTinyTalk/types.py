@@ -9,6 +9,8 @@ Types are verified, not assumed.
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import partial
+from collections.abc import Sequence
 from typing import List, Optional, Dict, Any
 
 
@@ -288,6 +290,77 @@ class Value:
             return {k: v.to_python() for k, v in self.data.items()}
         return self.data
 
+    @property
+    def view(self) -> Any:
+        """Read-only view of a list's items; lazy for ranges."""
+        return self.data
+
+
+class _RangeView(Sequence):
+    """The items of an unbuilt RangeValue, made one at a time."""
+
+    __slots__ = ("_range",)
+
+    def __init__(self, r: range):
+        self._range = r
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [Value(ValueType.INT, n) for n in self._range[i]]
+        return Value(ValueType.INT, self._range[i])
+
+    def __iter__(self):
+        return map(partial(Value, ValueType.INT), self._range)
+
+
+class RangeValue(Value):
+    """
+    An integer range (a..b, range(...)) that is a list only on demand.
+
+    for, len, indexing, membership and step chains read it through .view
+    without building anything. Touching .data builds an ordinary list once,
+    so every other list operation (including mutation) works unchanged.
+    """
+
+    def __init__(self, r: range):
+        self.type = ValueType.LIST
+        self.verified = True
+        self.range = r
+        self._items: Optional[List[Value]] = None
+
+    @property
+    def data(self) -> List[Value]:
+        if self._items is None:
+            self._items = [Value(ValueType.INT, n) for n in self.range]
+        return self._items
+
+    @data.setter
+    def data(self, items: List[Value]):
+        self._items = items
+
+    @property
+    def view(self) -> Any:
+        if self._items is None:
+            return _RangeView(self.range)
+        return self._items
+
+    def is_truthy(self) -> bool:
+        return len(self.view) > 0
+
+    def __eq__(self, other):
+        if not isinstance(other, Value):
+            return NotImplemented
+        return (self.type, self.data, self.verified) == (
+            other.type,
+            other.data,
+            other.verified,
+        )
+
+    __hash__ = None
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TYPE CHECKER
@@ -0,0 +1,703 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+TINYTALK VM
+Stack machine for the bytecode produced by compiler.py.
+
+The VM is a Runtime: it shares the global scope, builtins, value operators,
+member access, step chains and struct construction with the tree-walker, and
+overrides execution and calls. Bounds are enforced per instruction; the wall
+clock is read every TIME_CHECK_INTERVAL instructions rather than on every
+node.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import time
+from typing import List, Optional
+
+from .kernel import ExecutionBounds, Trace
+from .types import Value, ValueType
+from .runtime import (
+    Runtime,
+    TinyTalkError,
+    TinyFunction,
+    TinyStruct,
+    TinyEnum,
+    BoundMethod,
+    StructInstance,
+    _COMPOUND_OPS,
+)
+from .compiler import (
+    Code,
+    UNSET,
+    compile_program,
+    CONST,
+    POP,
+    DUP,
+    LOAD_FAST,
+    LOAD_DEREF,
+    LOAD_GLOBAL,
+    STORE,
+    DEFINE,
+    COMPOUND_STORE,
+    ADD,
+    SUB,
+    MUL,
+    MOD,
+    LT,
+    GT,
+    LE,
+    GE,
+    EQ,
+    NE,
+    BINARY,
+    UNARY,
+    AND_JUMP,
+    OR_JUMP,
+    TO_BOOL,
+    JUMP,
+    JUMP_IF_FALSE,
+    GET_ITER,
+    FOR_ITER,
+    LOOP_BACK,
+    LOOP_CHECK,
+    SET_RESULT,
+    ENTER_SCOPE,
+    EXIT_SCOPE,
+    RETURN,
+    BREAK_OUTSIDE,
+    CALL,
+    CALL_PIPE,
+    MAKE_FUNCTION,
+    GET_ATTR,
+    GET_INDEX,
+    SET_ATTR,
+    SET_INDEX,
+    BUILD_LIST,
+    BUILD_MAP,
+    RANGE,
+    STEP,
+    MAKE_STRUCT,
+    ENUM,
+    IMPORT,
+    MATCH_LITERAL,
+    SETUP_TRY,
+    POP_TRY,
+    THROW,
+)
+
+# How many instructions run between wall-clock checks
+TIME_CHECK_INTERVAL = 1024
+
+_INT = ValueType.INT
+_BOOLEAN = ValueType.BOOLEAN
+_STRING = ValueType.STRING
+_LIST = ValueType.LIST
+_FUNCTION = ValueType.FUNCTION
+_STRUCT_INSTANCE = ValueType.STRUCT_INSTANCE
+_SIMPLE_EQ = (ValueType.INT, ValueType.STRING, ValueType.BOOLEAN, ValueType.NULL)
+
+# Values are never mutated in place, so results can share these
+_TRUE = Value.bool_val(True)
+_FALSE = Value.bool_val(False)
+_NULL = Value.null_val()
+
+
+class _ImportTarget:
+    """Scope stand-in that collects what ffi.import_* defines."""
+
+    def __init__(self):
+        self.values = {}
+
+    def define(self, name: str, value: Value, const: bool = False):
+        self.values[name] = value
+
+
+class VM(Runtime):
+    """
+    Bytecode interpreter for TinyTalk.
+
+    Usage mirrors Runtime: VM(bounds).execute(ast). The AST is compiled with
+    compile_program() first; function values created while running carry
+    their compiled Code as body and the defining frame as closure.
+    """
+
+    def __init__(self, bounds: Optional[ExecutionBounds] = None):
+        super().__init__(bounds)
+        self._check_at = 0
+
+    def execute(self, ast) -> Value:
+        """Compile and execute an AST and return result."""
+        return self.execute_code(compile_program(ast))
+
+    def execute_module(self, module) -> Value:
+        """Execute a cached CompiledModule, reusing its bytecode."""
+        return self.execute_code(module.code)
+
+    def execute_code(self, code: Code) -> Value:
+        """Execute a compiled program and return result."""
+        self.op_count = 0
+        self.iteration_count = 0
+        self.recursion_depth = 0
+        self.start_time = time.time()
+        self.traces = []
+        self._check_at = 0
+        self._explicit_return = False
+
+        result = self._run(code, None)
+        if self._explicit_return:
+            self.traces.append(Trace.t("return", True, {"value": str(result)}))
+        else:
+            self.traces.append(Trace.t("execute", True, {"result": str(result)}))
+        return result
+
+    def _tick(self) -> int:
+        """Check bounds; returns the op count at which to check next."""
+        if self.op_count > self.bounds.max_ops:
+            raise TinyTalkError(f"Exceeded maximum operations ({self.bounds.max_ops})")
+
+        elapsed = time.time() - self.start_time
+        if elapsed > self.bounds.timeout_seconds:
+            raise TinyTalkError(f"Exceeded timeout ({self.bounds.timeout_seconds}s)")
+
+        return min(self.op_count + TIME_CHECK_INTERVAL, self.bounds.max_ops + 1)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # CALLS
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _invoke(self, fn, args: List[Value], line: int) -> Value:
+        """Call a TinyFunction or BoundMethod with evaluated arguments."""
+        self.recursion_depth += 1
+        try:
+            if self.recursion_depth > self.bounds.max_recursion:
+                raise TinyTalkError(
+                    f"Exceeded maximum recursion depth ({self.bounds.max_recursion})",
+                    line,
+                )
+            if isinstance(fn, BoundMethod):
+                args = [Value(_STRUCT_INSTANCE, fn.instance)] + args
+                fn = fn.method
+            if fn.is_native:
+                return fn.native_fn(args)
+
+            code = fn.body
+            n = code.nparams
+            given = len(args)
+            if given == n:
+                frame = [fn.closure, None, *args]
+            elif given > n:
+                frame = [fn.closure, None, *args[:n]]
+            else:
+                frame = [fn.closure, None, *args, *([_NULL] * (n - given))]
+            if code.fill:
+                frame.extend(code.fill)
+            if fn.globals is not self.global_scope and fn.globals is not None:
+                return self._run_in(fn.globals, code, frame)
+            return self._run(code, frame)
+        finally:
+            self.recursion_depth -= 1
+
+    def _run_in(self, global_scope, code: Code, frame) -> Value:
+        """Run a function defined by another VM (an imported .tt module)."""
+        saved = self.global_scope
+        self.global_scope = global_scope
+        try:
+            return self._run(code, frame)
+        finally:
+            self.global_scope = saved
+
+    def _call_function(self, fn, args: List[Value], scope, line: int) -> Value:
+        """Call a function (used by step chains)."""
+        return self._invoke(fn, args, line)
+
+    def _construct(self, struct: TinyStruct, defaults, args: List[Value]) -> Value:
+        """Construct a struct instance, running compiled field defaults."""
+        fields = {}
+        for i, (name, _, _) in enumerate(struct.fields):
+            if i < len(args):
+                fields[name] = args[i]
+            elif defaults[i] is not None:
+                fields[name] = self._run(defaults[i], None)
+            else:
+                fields[name] = Value.null_val()
+
+        instance = StructInstance(struct, fields)
+        return Value(_STRUCT_INSTANCE, instance)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # NAMES
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _load_slow(self, frame, fallback, name: str, error: str, line: int) -> Value:
+        """Outer candidate slots, then the global scope."""
+        for depth, slot in fallback:
+            f = frame
+            for _ in range(depth):
+                f = f[0]
+            v = f[slot]
+            if v is not UNSET:
+                return v
+        v = self.global_scope.variables.get(name)
+        if v is None:
+            raise TinyTalkError(error, line)
+        return v
+
+    def _load(self, frame, cands, name: str, line: int) -> Value:
+        return self._load_slow(frame, cands, name, f"Undefined variable '{name}'", line)
+
+    def _store(self, frame, cands, name: str, own, v: Value) -> bool:
+        """
+        Assign to the innermost defined name, like Scope.set.
+
+        With own given, an undefined name is defined in the current frame
+        (own is a slot) or the global scope (own is None). Returns whether
+        the name was found or defined.
+        """
+        for depth, slot in cands:
+            f = frame
+            for _ in range(depth):
+                f = f[0]
+            if f[slot] is not UNSET:
+                if f[1] and slot in f[1]:
+                    raise TinyTalkError(f"Cannot reassign constant '{name}'")
+                f[slot] = v
+                return True
+        if self.global_scope.set(name, v):
+            return True
+        if own is False:
+            return False
+        if own is None:
+            self.global_scope.define(name, v)
+        else:
+            frame[own] = v
+        return True
+
+    def _define(self, frame, slot, name: str, const: bool, v: Value):
+        if slot is None:
+            self.global_scope.define(name, v, const=const)
+            return
+        frame[slot] = v
+        if const:
+            if frame[1] is None:
+                frame[1] = set()
+            frame[1].add(slot)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # INTERPRETER LOOP
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _run(self, code: Code, frame) -> Value:
+        """Run one Code object in the given frame until it returns."""
+        instructions = code.instructions
+        stack: List = []
+        push = stack.append
+        pop = stack.pop
+        handlers = []
+        pc = 0
+        ops = self.op_count
+        check_at = self._check_at
+        gvars = self.global_scope.variables
+        gconsts = self.global_scope.constants
+
+        try:
+            while True:
+                try:
+                    while True:
+                        op, arg, line = instructions[pc]
+                        pc += 1
+                        ops += 1
+                        if ops >= check_at:
+                            self.op_count = ops
+                            check_at = self._tick()
+
+                        if op == LOAD_FAST:
+                            v = frame[arg[0]]
+                            if v is UNSET:
+                                v = self._load_slow(frame, arg[1], arg[2], arg[3], line)
+                            push(v)
+
+                        elif op == CONST:
+                            push(arg)
+
+                        elif op == LOAD_GLOBAL:
+                            v = gvars.get(arg[0])
+                            if v is None:
+                                raise TinyTalkError(arg[1], line)
+                            push(v)
+
+                        elif op == STORE:
+                            cands, name, own, keep = arg
+                            v = stack[-1] if keep else pop()
+                            if not cands:
+                                if name in gvars and name not in gconsts:
+                                    gvars[name] = v
+                                    continue
+                            elif cands[0][0] == 0:
+                                slot = cands[0][1]
+                                if frame[slot] is not UNSET and not (
+                                    frame[1] and slot in frame[1]
+                                ):
+                                    frame[slot] = v
+                                    continue
+                            self._store(frame, cands, name, own, v)
+
+                        elif op == COMPOUND_STORE:
+                            cands, name, binop = arg
+                            rhs = stack[-1]
+                            if not cands:
+                                old = gvars.get(name)
+                                fast = old is not None and name not in gconsts
+                            else:
+                                slot = cands[0][1]
+                                old = frame[slot] if cands[0][0] == 0 else UNSET
+                                fast = old is not UNSET and not (
+                                    frame[1] and slot in frame[1]
+                                )
+                            if not fast:
+                                old = self._load(frame, cands, name, line)
+                            if old.type is _INT and rhs.type is _INT and binop in ("+", "-", "*"):
+                                v = Value(_INT, _COMPOUND_OPS[binop](old.data, rhs.data))
+                            else:
+                                v = self._apply_op(old, rhs, binop, line)
+                            if not fast:
+                                self._store(frame, cands, name, False, v)
+                            elif not cands:
+                                gvars[name] = v
+                            else:
+                                frame[slot] = v
+                            stack[-1] = v
+
+                        elif op == JUMP_IF_FALSE:
+                            v = pop()
+                            if v is _FALSE or (v is not _TRUE and not v.is_truthy()):
+                                pc = arg
+
+                        elif op == FOR_ITER:
+                            item = next(stack[-1], UNSET)
+                            if item is UNSET:
+                                pop()
+                                pc = arg[0]
+                            else:
+                                self.iteration_count += 1
+                                if self.iteration_count > self.bounds.max_iterations:
+                                    raise TinyTalkError(
+                                        f"Exceeded maximum iterations ({self.bounds.max_iterations})",
+                                        line,
+                                    )
+                                frame = [frame, None, item, *arg[1]]
+
+                        elif op == LOOP_BACK:
+                            frame = frame[0]
+                            pc = arg
+
+                        elif op == POP:
+                            pop()
+
+                        elif op == ADD:
+                            r = pop()
+                            l = stack[-1]
+                            if l.type is _INT and r.type is _INT:
+                                stack[-1] = Value(_INT, l.data + r.data)
+                            else:
+                                stack[-1] = self._binary_op("+", l, r, line)
+
+                        elif op == LT:
+                            r = pop()
+                            stack[-1] = _TRUE if stack[-1].data < r.data else _FALSE
+                        elif op == JUMP:
+                            pc = arg
+
+                        elif op == CALL:
+                            if arg:
+                                args = stack[-arg:]
+                                del stack[-arg:]
+                            else:
+                                args = []
+                            callee = pop()
+                            if callee.type is not _FUNCTION:
+                                raise TinyTalkError(
+                                    f"Cannot call {callee.type.value}", line
+                                )
+                            self.op_count = ops
+                            self._check_at = check_at
+                            push(self._invoke(callee.data, args, line))
+                            ops = self.op_count
+                            check_at = self._check_at
+
+                        elif op == RETURN:
+                            if arg:
+                                self._explicit_return = True
+                            return pop()
+
+                        elif op == LOAD_DEREF:
+                            f = frame
+                            for _ in range(arg[0]):
+                                f = f[0]
+                            v = f[arg[1]]
+                            if v is UNSET:
+                                v = self._load_slow(frame, arg[2], arg[3], arg[4], line)
+                            push(v)
+
+                        elif op == SUB:
+                            r = pop()
+                            l = stack[-1]
+                            if l.type is _INT and r.type is _INT:
+                                stack[-1] = Value(_INT, l.data - r.data)
+                            else:
+                                stack[-1] = self._binary_op("-", l, r, line)
+
+                        elif op == GET_INDEX:
+                            index = pop()
+                            obj = stack[-1]
+                            if obj.type is _LIST and index.type is _INT:
+                                items = obj.view
+                                i = index.data
+                                if -len(items) <= i < len(items):
+                                    stack[-1] = items[i]
+                                    continue
+                            stack[-1] = self._get_index(obj, index, line)
+
+                        elif op == DEFINE:
+                            slot, name, const, keep = arg
+                            v = stack[-1] if keep else pop()
+                            if slot is not None and not const:
+                                frame[slot] = v
+                            else:
+                                self._define(frame, slot, name, const, v)
+
+                        elif op == MUL:
+                            r = pop()
+                            l = stack[-1]
+                            if l.type is _INT and r.type is _INT:
+                                stack[-1] = Value(_INT, l.data * r.data)
+                            else:
+                                stack[-1] = self._binary_op("*", l, r, line)
+
+                        elif op == MOD:
+                            r = pop()
+                            l = stack[-1]
+                            if l.type is _INT and r.type is _INT and r.data:
+                                stack[-1] = Value(_INT, l.data % r.data)
+                            else:
+                                stack[-1] = self._binary_op("%", l, r, line)
+
+                        elif op == EQ or op == NE:
+                            r = pop()
+                            l = stack[-1]
+                            if l.type is r.type and l.type in _SIMPLE_EQ:
+                                eq = l.data == r.data
+                            else:
+                                eq = self._equal(l, r).data
+                            stack[-1] = _TRUE if eq == (op == EQ) else _FALSE
+
+                        elif op == GT:
+                            r = pop()
+                            stack[-1] = _TRUE if stack[-1].data > r.data else _FALSE
+                        elif op == LE:
+                            r = pop()
+                            stack[-1] = _TRUE if stack[-1].data <= r.data else _FALSE
+                        elif op == GE:
+                            r = pop()
+                            stack[-1] = _TRUE if stack[-1].data >= r.data else _FALSE
+
+                        elif op == GET_ATTR:
+                            stack[-1] = self._get_member(stack[-1], arg, line)
+
+                        elif op == LOOP_CHECK:
+                            self.iteration_count += 1
+                            if self.iteration_count > self.bounds.max_iterations:
+                                raise TinyTalkError(
+                                    f"Exceeded maximum iterations ({self.bounds.max_iterations})",
+                                    line,
+                                )
+
+                        elif op == ENTER_SCOPE:
+                            frame = [frame, None, *arg]
+
+                        elif op == EXIT_SCOPE:
+                            frame = frame[0]
+
+                        elif op == SET_RESULT:
+                            v = pop()
+                            stack[-arg] = v
+
+                        elif op == AND_JUMP:
+                            if not stack[-1].is_truthy():
+                                stack[-1] = _FALSE
+                                pc = arg
+                            else:
+                                pop()
+
+                        elif op == OR_JUMP:
+                            if stack[-1].is_truthy():
+                                stack[-1] = _TRUE
+                                pc = arg
+                            else:
+                                pop()
+
+                        elif op == TO_BOOL:
+                            stack[-1] = _TRUE if stack[-1].is_truthy() else _FALSE
+
+                        elif op == BINARY:
+                            r = pop()
+                            stack[-1] = self._binary_op(arg, stack[-1], r, line)
+
+                        elif op == UNARY:
+                            stack[-1] = self._unary_op(arg, stack[-1], line)
+
+                        elif op == DUP:
+                            push(stack[-1])
+
+                        elif op == GET_ITER:
+                            stack[-1] = iter(self._iter_items(stack[-1], line))
+
+                        elif op == BUILD_LIST:
+                            if arg:
+                                items = stack[-arg:]
+                                del stack[-arg:]
+                            else:
+                                items = []
+                            push(Value.list_val(items))
+
+                        elif op == BUILD_MAP:
+                            pairs = {}
+                            if arg:
+                                flat = stack[-2 * arg :]
+                                del stack[-2 * arg :]
+                                for i in range(0, len(flat), 2):
+                                    pairs[flat[i].to_python()] = flat[i + 1]
+                            push(Value.map_val(pairs))
+
+                        elif op == MAKE_FUNCTION:
+                            name, params, body = arg
+                            push(
+                                Value.function_val(
+                                    TinyFunction(
+                                        name,
+                                        params,
+                                        body,
+                                        frame,
+                                        globals=self.global_scope,
+                                    )
+                                )
+                            )
+
+                        elif op == SET_INDEX:
+                            index = pop()
+                            container = pop()
+                            self._set_index(container, index, stack[-1])
+
+                        elif op == SET_ATTR:
+                            obj = pop()
+                            self._set_member(obj, arg, stack[-1])
+
+                        elif op == RANGE:
+                            end = pop()
+                            stack[-1] = self._range_list(stack[-1], end, arg)
+
+                        elif op == CALL_PIPE:
+                            nargs = arg - 1
+                            if nargs:
+                                rest = stack[-nargs:]
+                                del stack[-nargs:]
+                            else:
+                                rest = []
+                            callee = pop()
+                            args = [pop()] + rest
+                            if callee.type is not _FUNCTION:
+                                raise TinyTalkError(
+                                    f"Cannot call {callee.type.value}", line
+                                )
+                            self.op_count = ops
+                            self._check_at = check_at
+                            push(self._invoke(callee.data, args, line))
+                            ops = self.op_count
+                            check_at = self._check_at
+
+                        elif op == STEP:
+                            specs, total = arg
+                            if total:
+                                flat = stack[-total:]
+                                del stack[-total:]
+                            steps = []
+                            i = 0
+                            for step, nargs in specs:
+                                steps.append((step, flat[i : i + nargs] if nargs else []))
+                                i += nargs
+                            self.op_count = ops
+                            self._check_at = check_at
+                            stack[-1] = self._apply_steps(stack[-1], steps, None, line)
+                            ops = self.op_count
+                            check_at = self._check_at
+
+                        elif op == MATCH_LITERAL:
+                            if stack[-1].data != arg[0]:
+                                pc = arg[1]
+
+                        elif op == SETUP_TRY:
+                            handlers.append((arg, len(stack), frame))
+
+                        elif op == POP_TRY:
+                            handlers.pop()
+
+                        elif op == THROW:
+                            raise TinyTalkError(str(pop().data), line)
+
+                        elif op == MAKE_STRUCT:
+                            name, fields, method_codes, defaults = arg
+                            methods = {
+                                m_name: TinyFunction(
+                                    m_name,
+                                    m_params,
+                                    m_code,
+                                    frame,
+                                    globals=self.global_scope,
+                                )
+                                for m_name, m_params, m_code in method_codes
+                            }
+                            struct = TinyStruct(name, fields, methods)
+                            self.structs[name] = struct
+                            push(
+                                Value.function_val(
+                                    TinyFunction(
+                                        name,
+                                        [(f[0], f[1]) for f in fields],
+                                        None,
+                                        frame,
+                                        True,
+                                        lambda args, s=struct, d=defaults: self._construct(
+                                            s, d, args
+                                        ),
+                                    )
+                                )
+                            )
+
+                        elif op == ENUM:
+                            name, variants = arg
+                            self.enums[name] = TinyEnum(name, variants)
+
+                        elif op == IMPORT:
+                            module, items, alias, names = arg
+                            target = _ImportTarget()
+                            self._import(module, target, items, alias)
+                            for name in reversed(names):
+                                push(target.values.get(name, UNSET))
+
+                        elif op == BREAK_OUTSIDE:
+                            raise TinyTalkError("Break/continue outside of loop")
+
+                        else:
+                            raise TinyTalkError(f"Unknown opcode: {op}", line)
+
+                except TinyTalkError as e:
+                    if not handlers:
+                        raise
+                    if self.op_count > ops:
+                        ops = self.op_count
+                        check_at = self._check_at
+                    pc, height, frame = handlers.pop()
+                    del stack[height:]
+                    push(Value.string_val(str(e.message)))
+        finally:
+            self.op_count = ops
+            self._check_at = check_at
@@ -0,0 +1,264 @@
+"""
+Sandboxed execution service for the web playground.
+
+User code runs in a pool of pre-forked worker processes instead of inside
+the Flask worker thread:
+
+- each job has the worker to itself, so stdout capture cannot interleave
+  with other requests
+- a job that outlives its hard wall-clock limit is killed with its worker,
+  which is replaced, so a runaway script cannot pin a server thread
+- workers cap their address space and retire once their peak RSS passes
+  the memory limit
+- at most workers + queue_size jobs are admitted; beyond that submit()
+  raises PoolBusy so the server can answer 429 instead of piling up threads
+
+Workers are forked from a forkserver that has already imported the
+interpreter and its stdlib, so a fresh worker is warm from its first job.
+"""
+
+import io
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, rely on the wall-clock kill
+    resource = None
+
+# Modules every worker should start with
+PRELOAD = ["realTinyTalk", "realTinyTalk.stdlib", "realTinyTalk.ffi"]
+
+
+class PoolBusy(Exception):
+    """Raised when the pool and its queue are full."""
+
+    def __init__(self, depth: int):
+        super().__init__(f"Execution queue is full ({depth} jobs waiting)")
+        self.depth = depth
+
+
+@dataclass
+class JobBounds:
+    """Picklable ExecutionBounds for a job."""
+
+    max_ops: int = 1_000_000
+    max_iterations: int = 100_000
+    max_recursion: int = 500
+    timeout_seconds: float = 10.0
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# WORKER SIDE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+def _limit_memory(memory_mb: int):
+    """Cap the worker's address space (Linux ignores RLIMIT_RSS)."""
+    if resource is None or not memory_mb:
+        return
+    limit = memory_mb * 1024 * 1024
+    try:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _execute(code: str, bounds: JobBounds) -> dict:
+    """Run one job and describe the outcome like /api/run does."""
+    from realTinyTalk import ExecutionBounds, run
+    from realTinyTalk.runtime import TinyTalkError
+
+    stdout_capture = io.StringIO()
+    try:
+        with redirect_stdout(stdout_capture):
+            result = run(code, ExecutionBounds(**asdict(bounds)))
+        result_str = str(result) if result.type.value != "null" else ""
+        return {"success": True, "output": stdout_capture.getvalue(), "result": result_str}
+    except TinyTalkError as e:
+        error = str(e)
+    except SyntaxError as e:
+        error = f"Syntax Error: {e}"
+    except MemoryError:
+        error = "Exceeded memory limit"
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return {"success": False, "error": error, "output": stdout_capture.getvalue()}
+
+
+def _worker_main(conn, memory_mb: int):
+    """Serve jobs from conn until the pool closes it."""
+    _limit_memory(memory_mb)
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            return
+        if job is None:
+            return
+        reply = _execute(*job)
+        # Retire after a job that pushed the heap past the limit; a fresh
+        # worker gives the memory back instead of keeping the peak forever
+        reply["retire"] = bool(memory_mb) and _peak_rss_mb() > memory_mb
+        try:
+            conn.send(reply)
+        except MemoryError:
+            reply = {"success": False, "error": "Exceeded memory limit", "output": ""}
+            reply["retire"] = True
+            conn.send(reply)
+        if reply["retire"]:
+            return
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# POOL SIDE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class _Worker:
+    def __init__(self, ctx, memory_mb: int):
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child, memory_mb), daemon=True
+        )
+        self.process.start()
+        child.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class ExecutionPool:
+    """
+    Pre-forked workers that run TinyTalk jobs one at a time each.
+
+    hard_timeout is the wall-clock limit after which a job's worker is
+    killed; it backs up the interpreter's own timeout_seconds check, which
+    cannot interrupt a single long builtin call.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        queue_size: int = 16,
+        hard_timeout: float = 12.0,
+        memory_mb: int = 256,
+    ):
+        self.size = workers
+        self.queue_size = queue_size
+        self.hard_timeout = hard_timeout
+        self.memory_mb = memory_mb
+
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            self._ctx = multiprocessing.get_context("forkserver")
+            self._ctx.set_forkserver_preload(PRELOAD)
+        else:
+            self._ctx = multiprocessing.get_context("spawn")
+
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._admitted = 0
+        self._closed = False
+        self._workers = [_Worker(self._ctx, memory_mb) for _ in range(workers)]
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    @property
+    def depth(self) -> int:
+        """Jobs admitted but not yet running."""
+        with self._lock:
+            return max(0, self._admitted - self.size)
+
+    def submit(self, code: str, bounds: Optional[JobBounds] = None) -> dict:
+        """Run code on a worker and return its outcome plus elapsed_ms."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Execution pool is closed")
+            if self._admitted >= self.size + self.queue_size:
+                raise PoolBusy(self._admitted - self.size)
+            self._admitted += 1
+        try:
+            worker = self._idle.get()
+            start_time = time.time()
+            reply = self._run(worker, (code, bounds or JobBounds()))
+            reply["elapsed_ms"] = round((time.time() - start_time) * 1000, 2)
+            return reply
+        finally:
+            with self._lock:
+                self._admitted -= 1
+
+    def _run(self, worker: _Worker, job) -> dict:
+        try:
+            worker.conn.send(job)
+            if worker.conn.poll(self.hard_timeout):
+                reply = worker.conn.recv()
+                if reply.pop("retire"):
+                    worker.stop()
+                    worker = self._replace(worker)
+                return reply
+            worker.kill()
+            worker = self._replace(worker)
+            return {
+                "success": False,
+                "error": f"Exceeded hard time limit ({self.hard_timeout}s)",
+                "output": "",
+            }
+        except (EOFError, OSError):
+            # Died mid-job: killed by the OS for memory, or crashed
+            worker.kill()
+            worker = self._replace(worker)
+            return {"success": False, "error": "Worker died (memory limit or crash)", "output": ""}
+        finally:
+            self._idle.put(worker)
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        fresh = _Worker(self._ctx, self.memory_mb)
+        with self._lock:
+            self._workers[self._workers.index(worker)] = fresh
+        return fresh
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+        for worker in workers:
+            worker.stop()
+
+
+def pool_from_env() -> ExecutionPool:
+    """An ExecutionPool sized by TINYTALK_* environment variables."""
+    return ExecutionPool(
+        workers=int(os.environ.get("TINYTALK_WORKERS", os.cpu_count() or 2)),
+        queue_size=int(os.environ.get("TINYTALK_QUEUE", 16)),
+        hard_timeout=float(os.environ.get("TINYTALK_HARD_TIMEOUT", 12.0)),
+        memory_mb=int(os.environ.get("TINYTALK_MEMORY_MB", 256)),
+    )
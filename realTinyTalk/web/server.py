@@ -7,6 +7,8 @@ import sys
 import os
 import json
 import time
+import atexit
+import threading
 from pathlib import Path
 
 # Add parent to path for imports
@@ -15,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from flask import Flask, request, jsonify, send_from_directory, session
 from realTinyTalk import run, ExecutionBounds
 from realTinyTalk.runtime import TinyTalkError
+from realTinyTalk.web.executor import ExecutionPool, JobBounds, PoolBusy, pool_from_env
 from pathlib import Path
 from difflib import SequenceMatcher
 import hashlib
@@ -602,76 +605,41 @@ def serve_static(path):
     return send_from_directory("static", path)
 
 
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ExecutionPool:
+    """The worker pool for /api/run, forked on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = pool_from_env()
+            atexit.register(_pool.close)
+        return _pool
+
+
 @app.route("/api/run", methods=["POST"])
 def run_code():
-    """Execute TinyTalk code and return results."""
+    """Execute TinyTalk code in a sandboxed worker and return results."""
     data = request.get_json()
     code = data.get("code", "")
 
-    # Capture print output
-    import io
-    from contextlib import redirect_stdout
-
-    stdout_capture = io.StringIO()
-
-    start_time = time.time()
+    bounds = JobBounds(
+        max_ops=1_000_000,
+        max_iterations=100_000,
+        max_recursion=500,
+        timeout_seconds=10.0,
+    )
 
     try:
-        bounds = ExecutionBounds(
-            max_ops=1_000_000,
-            max_iterations=100_000,
-            max_recursion=500,
-            timeout_seconds=10.0,
-        )
-
-        with redirect_stdout(stdout_capture):
-            result = run(code, bounds)
-
-        elapsed = (time.time() - start_time) * 1000
-        output = stdout_capture.getvalue()
-
-        # Format result
-        result_str = str(result) if result.type.value != "null" else ""
-
-        return jsonify(
-            {
-                "success": True,
-                "output": output,
-                "result": result_str,
-                "elapsed_ms": round(elapsed, 2),
-            }
-        )
-
-    except TinyTalkError as e:
-        elapsed = (time.time() - start_time) * 1000
-        return jsonify(
-            {
-                "success": False,
-                "error": str(e),
-                "output": stdout_capture.getvalue(),
-                "elapsed_ms": round(elapsed, 2),
-            }
-        )
-    except SyntaxError as e:
-        elapsed = (time.time() - start_time) * 1000
-        return jsonify(
-            {
-                "success": False,
-                "error": f"Syntax Error: {e}",
-                "output": stdout_capture.getvalue(),
-                "elapsed_ms": round(elapsed, 2),
-            }
-        )
-    except Exception as e:
-        elapsed = (time.time() - start_time) * 1000
-        return jsonify(
-            {
-                "success": False,
-                "error": f"{type(e).__name__}: {e}",
-                "output": stdout_capture.getvalue(),
-                "elapsed_ms": round(elapsed, 2),
-            }
-        )
+        return jsonify(get_pool().submit(code, bounds))
+    except PoolBusy as e:
+        response = jsonify({"success": False, "error": str(e), "output": ""})
+        response.status_code = 429
+        response.headers["X-Queue-Depth"] = str(e.depth)
+        response.headers["Retry-After"] = "1"
+        return response
 
 
 @app.route("/api/transpile/js", methods=["POST"])
@@ -1520,6 +1488,8 @@ if __name__ == "__main__":
             f"Server appears to be already running on {HOST}:{PORT}. Not starting a new instance."
         )
     else:
+        # Fork the execution workers before Flask starts its threads
+        get_pool()
         app.run(
             host="0.0.0.0", port=PORT, debug=False, use_reloader=False, threaded=True
         )
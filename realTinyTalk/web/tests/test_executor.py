@@ -0,0 +1,93 @@
+import threading
+import time
+
+import pytest
+
+from realTinyTalk.web import server
+from realTinyTalk.web.executor import ExecutionPool, JobBounds, PoolBusy
+
+SPIN = JobBounds(max_ops=10**12, max_iterations=10**12, timeout_seconds=600)
+
+
+@pytest.fixture
+def pool():
+    p = ExecutionPool(workers=2, queue_size=1, hard_timeout=1.0)
+    yield p
+    p.close()
+
+
+def test_output_is_captured_per_job(pool):
+    replies = {}
+
+    def job(n):
+        replies[n] = pool.submit(f"for i in 0..200 {{ show({n}) }}\n{n} * 2")
+
+    threads = [threading.Thread(target=job, args=(n,)) for n in (1, 2, 3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for n, reply in replies.items():
+        assert reply["success"]
+        assert reply["output"] == f"{n}\n" * 200
+        assert reply["result"] == str(n * 2)
+
+
+def test_errors_are_reported(pool):
+    reply = pool.submit("show(1)\nnope()")
+    assert not reply["success"]
+    assert "nope" in reply["error"]
+    assert reply["output"] == "1\n"
+    assert pool.submit("let = 1")["error"].startswith("Syntax Error")
+
+
+def test_runaway_job_is_killed(pool):
+    reply = pool.submit("while true { }", SPIN)
+    assert reply["error"] == "Exceeded hard time limit (1.0s)"
+    # The replacement worker serves the next job
+    assert pool.submit("1 + 1")["result"] == "2"
+
+
+def test_full_queue_raises(pool):
+    threads = [threading.Thread(target=pool.submit, args=("while true { }", SPIN)) for _ in range(3)]
+    for t in threads:
+        t.start()
+    while pool.depth < 1:
+        time.sleep(0.01)
+    with pytest.raises(PoolBusy) as busy:
+        pool.submit("1")
+    assert busy.value.depth == 1
+    for t in threads:
+        t.join()
+
+
+def test_api_run_answers_429_when_full(monkeypatch):
+    tiny = ExecutionPool(workers=1, queue_size=0, hard_timeout=1.0)
+    monkeypatch.setattr(server, "_pool", tiny)
+    server.app.config["TESTING"] = True
+    try:
+        with server.app.test_client() as client:
+            rv = client.post("/api/run", json={"code": 'show("hi")'})
+            assert rv.status_code == 200
+            assert rv.get_json()["output"] == "hi\n"
+
+            spinner = threading.Thread(target=tiny.submit, args=("while true { }", SPIN))
+            spinner.start()
+            while tiny._admitted < 1:
+                time.sleep(0.01)
+            rv = client.post("/api/run", json={"code": "1"})
+            assert rv.status_code == 429
+            assert rv.headers["X-Queue-Depth"] == "0"
+            spinner.join()
+    finally:
+        tiny.close()
+
+
+def test_memory_limit():
+    small = ExecutionPool(workers=1, memory_mb=128)
+    try:
+        reply = small.submit('let s = "x" * 400000000\nlen(s)')
+        assert reply["error"] == "Exceeded memory limit"
+        assert small.submit("2 + 2")["result"] == "4"
+    finally:
+        small.close()
@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FORGE TESTS
+Tests for the Forge verification cache, compiled constraint plans,
+batch verification and aggregation windows.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+import threading
+import time
+
+import pytest
+
+from core.cdl import AggregationState, CDLEvaluator, CDLParser, Operator
+from core.forge import Forge, ForgeConfig, VerificationCache, VerificationResult
+
+
+@pytest.fixture
+def forge():
+    """Provide a Forge with caching enabled."""
+    f = Forge(ForgeConfig(enable_caching=True))
+    yield f
+    f.shutdown()
+
+
+LIMIT = {"field": "amount", "operator": "lt", "value": 1000}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VERIFICATION CACHE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestVerificationCache:
+    """The bounded LRU/TTL cache on its own."""
+
+    def _result(self, i):
+        return VerificationResult(passed=True, constraint_id=f"C_{i}")
+
+    def test_lru_eviction_is_bounded(self):
+        cache = VerificationCache(max_entries=4, ttl_seconds=60, shards=1)
+        for i in range(4):
+            cache.set(("k", i), self._result(i))
+        cache.get(("k", 0))  # 0 becomes most recently used
+        cache.set(("k", 4), self._result(4))
+
+        assert len(cache) == 4
+        assert cache.get(("k", 1)) is None
+        assert cache.get(("k", 0)) is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_bound_holds_across_shards(self):
+        cache = VerificationCache(max_entries=64, ttl_seconds=60, shards=8)
+        for i in range(10000):
+            cache.set(("k", i), self._result(i))
+        stats = cache.stats()
+        assert stats["entries"] <= cache.max_entries
+        assert stats["evictions"] == 10000 - stats["entries"]
+
+    def test_ttl_expiry(self):
+        cache = VerificationCache(max_entries=8, ttl_seconds=0.01, shards=1)
+        cache.set(("k",), self._result(0))
+        time.sleep(0.02)
+        assert cache.get(("k",)) is None
+        stats = cache.stats()
+        assert stats["expirations"] == 1
+        assert stats["entries"] == 0
+        assert stats["memory_bytes"] == 0
+
+    def test_memory_tracks_entries(self):
+        cache = VerificationCache(max_entries=8, ttl_seconds=60, shards=2)
+        assert cache.stats()["memory_bytes"] == 0
+        cache.set(("k", 1), self._result(1))
+        assert cache.stats()["memory_bytes"] > 0
+        cache.clear()
+        assert cache.stats()["memory_bytes"] == 0
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FORGE CACHING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestForgeCache:
+    """Structural keys and metrics through Forge.verify."""
+
+    def test_repeat_verification_hits(self, forge):
+        first = forge.verify(LIMIT, {"amount": 500})
+        second = forge.verify(LIMIT, {"amount": 500})
+        assert not first.from_cache
+        assert second.from_cache
+        assert second.passed == first.passed
+
+    def test_unread_fields_do_not_affect_key(self, forge):
+        forge.verify(LIMIT, {"amount": 500, "request_id": "a"})
+        result = forge.verify(LIMIT, {"amount": 500, "request_id": "b"})
+        assert result.from_cache
+
+    def test_read_field_changes_miss(self, forge):
+        forge.verify(LIMIT, {"amount": 500})
+        result = forge.verify(LIMIT, {"amount": 5000})
+        assert not result.from_cache
+        assert not result.passed
+
+    def test_value_types_stay_distinct(self, forge):
+        contains = {"field": "flag", "operator": "contains", "value": "1"}
+        assert forge.verify(contains, {"flag": 1}).passed
+        result = forge.verify(contains, {"flag": True})
+        assert not result.from_cache
+        assert not result.passed
+
+    def test_nested_fields_in_composites(self, forge):
+        composite = {
+            "logic": "and",
+            "constraints": [
+                {"field": "user.age", "operator": "ge", "value": 18},
+                {"field": "user.tags", "operator": "contains", "value": "vip"},
+            ],
+        }
+        obj = {"user": {"age": 30, "tags": ["vip"]}, "noise": 1}
+        assert forge.verify(composite, obj).passed
+        assert forge.verify(composite, dict(obj, noise=2)).from_cache
+        changed = {"user": {"age": 12, "tags": ["vip"]}}
+        result = forge.verify(composite, changed)
+        assert not result.from_cache
+        assert not result.passed
+
+    def test_aggregations_are_never_cached(self, forge):
+        rolling = {"field": "amount", "operator": "sum_lt", "value": 100, "window": "1h"}
+        assert forge.verify(rolling, {"amount": 60}).passed
+        result = forge.verify(rolling, {"amount": 60})
+        assert not result.from_cache
+        assert not result.passed
+
+    def test_metrics_report_cache(self, forge):
+        for _ in range(3):
+            forge.verify(LIMIT, {"amount": 1})
+        metrics = forge.get_metrics()
+        assert metrics["cache_hits"] == 2
+        assert metrics["cache_misses"] == 1
+        assert metrics["cache_hit_rate"] == pytest.approx(66.67)
+        assert metrics["cache_entries"] == 1
+        assert metrics["cache_evictions"] == 0
+        assert metrics["cache_memory_bytes"] > 0
+
+        forge.reset_metrics()
+        assert forge.get_metrics()["cache_hits"] == 0
+
+    def test_size_bound_under_diverse_traffic(self):
+        forge = Forge(ForgeConfig(cache_max_entries=32, cache_shards=4))
+        try:
+            for i in range(500):
+                forge.verify(LIMIT, {"amount": i})
+            metrics = forge.get_metrics()
+            assert metrics["cache_entries"] <= metrics["cache_max_entries"] == 32
+            assert metrics["cache_evictions"] == 500 - metrics["cache_entries"]
+        finally:
+            forge.shutdown()
+
+    def test_concurrent_verification(self, forge):
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(200):
+                    amount = (offset + i) % 50
+                    assert forge.verify(LIMIT, {"amount": amount}).passed
+            except AssertionError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert not errors
+        metrics = forge.get_metrics()
+        assert metrics["cache_hits"] + metrics["cache_misses"] == 1600
+        assert metrics["cache_entries"] == 50
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COMPILED PLANS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+PLAN_CONSTRAINTS = [
+    {"field": "amount", "operator": "lt", "value": 1000, "message": "too big"},
+    {"field": "user.age", "operator": "ge", "value": 18},
+    {"field": "name", "operator": "matches", "value": r"^[a-z]+$"},
+    {"field": "name", "operator": "matches", "value": "("},
+    {"field": "name", "operator": "contains", "value": "bo"},
+    {"field": "status", "operator": "in", "value": ["open", "held"]},
+    {"field": "missing", "operator": "exists"},
+    {"field": "tags", "operator": "empty"},
+    {"field": "amount", "operator": "gt", "value": "text"},
+    {"field": "debt", "operator": "ratio_le", "value": 1.0, "denominator": "equity"},
+    {"field": "debt", "operator": "ratio_undefined", "denominator": "equity"},
+    {"f_field": "debt", "g_field": "equity", "operator": "ratio_lt", "threshold": 0.5},
+    {"f_field": "debt", "g_field": "equity", "operator": "lt", "threshold": 0.5},
+    {"field": "sent", "operator": "before", "value": None, "reference": "due"},
+    {
+        "logic": "and",
+        "constraints": [
+            {"field": "amount", "operator": "lt", "value": 100, "message": "a"},
+            {"field": "status", "operator": "eq", "value": "open", "message": "b"},
+            {"field": "amount", "operator": "gt", "value": 0},
+        ],
+    },
+    {
+        "logic": "or",
+        "constraints": [
+            {"field": "amount", "operator": "lt", "value": 10},
+            {"field": "status", "operator": "eq", "value": "open"},
+        ],
+    },
+    {
+        "logic": "not",
+        "constraints": [{"field": "status", "operator": "eq", "value": "held"}],
+    },
+    {"logic": "xor", "constraints": [{"field": "amount", "operator": "gt", "value": 0}]},
+    {
+        "if": {"field": "amount", "operator": "gt", "value": 500},
+        "then": {"field": "approved", "operator": "eq", "value": True},
+        "else": {"field": "status", "operator": "ne", "value": "held"},
+    },
+    {
+        "if": {"field": "amount", "operator": "gt", "value": 500},
+        "then": {"field": "approved", "operator": "eq", "value": True},
+    },
+]
+
+PLAN_OBJECTS = [
+    {"amount": 50, "user": {"age": 30}, "name": "bob", "status": "open",
+     "tags": [], "debt": 10, "equity": 40, "sent": 1, "due": 2, "approved": True},
+    {"amount": 5000, "user": {"age": 12}, "name": "Bob!", "status": "held",
+     "tags": ["x"], "debt": 10, "equity": 0, "sent": 3, "due": 2},
+    {"amount": 0, "user": 7, "name": None, "debt": "x", "equity": 5},
+    {},
+]
+
+
+class TestCompiledPlans:
+    """Plans must agree with the interpreter on every field of the result."""
+
+    @pytest.mark.parametrize("definition", PLAN_CONSTRAINTS)
+    def test_plan_matches_interpreter(self, definition):
+        constraint = CDLParser().parse(definition)
+        evaluator = CDLEvaluator()
+        plan = evaluator.compile(constraint)
+        for obj in PLAN_OBJECTS:
+            expected = evaluator.evaluate(constraint, obj)
+            actual = plan(obj)
+            assert (actual.passed, actual.constraint_id, actual.message) == (
+                expected.passed,
+                expected.constraint_id,
+                expected.message,
+            )
+
+    def test_aggregation_plans_share_window(self):
+        rolling = CDLParser().parse(
+            {"field": "amount", "operator": "sum_lt", "value": 100, "window": "1h"}
+        )
+        evaluator = CDLEvaluator()
+        plan = evaluator.compile(rolling)
+        assert plan({"amount": 60}).passed
+        assert not plan({"amount": 60}).passed
+
+    def test_stateful_or_does_not_short_circuit(self):
+        definition = {
+            "logic": "or",
+            "constraints": [
+                {"field": "ok", "operator": "eq", "value": True},
+                {"field": "amount", "operator": "count_lt", "value": 5, "window": "1h"},
+            ],
+        }
+        evaluator = CDLEvaluator()
+        plan = evaluator.compile(CDLParser().parse(definition))
+        for _ in range(3):
+            plan({"ok": True, "amount": 1})
+        assert evaluator.aggregation_state.count("default", 3600) == 3
+
+    def test_forge_reuses_plans_by_structure(self, forge):
+        constraint = CDLParser().parse(LIMIT)
+        forge.verify(constraint, {"amount": 1}, use_cache=False)
+        forge.verify(CDLParser().parse(LIMIT), {"amount": 2}, use_cache=False)
+        assert len(forge._plans) == 1
+
+    def test_constraint_edited_in_place_recompiles(self, forge):
+        constraint = CDLParser().parse(LIMIT)
+        assert forge.verify(constraint, {"amount": 500}, use_cache=False).passed
+        constraint.value = 100
+        assert not forge.verify(constraint, {"amount": 500}, use_cache=False).passed
+        constraint.operator = Operator.GT
+        assert forge.verify(constraint, {"amount": 500}, use_cache=False).passed
+
+        # The plan filed under the original structure is untouched
+        original = CDLParser().parse(LIMIT)
+        assert forge.verify(original, {"amount": 500}, use_cache=False).passed
+
+    def test_reused_id_with_different_tree_recompiles(self, forge):
+        first = CDLParser().parse({"logic": "and", "constraints": [LIMIT]})
+        second = CDLParser().parse({"logic": "or", "constraints": [LIMIT]})
+        second.id = first.id = "SHARED"
+        forge.verify(first, {"amount": 1}, use_cache=False)
+        result = forge.verify(second, {"amount": 5000}, use_cache=False)
+        assert result.message == "All constraints failed"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BATCH VERIFICATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+BATCH_CONSTRAINTS = PLAN_CONSTRAINTS + [
+    {"field": "amount", "operator": "eq", "value": 1},
+    {"field": "amount", "operator": "lt", "value": 1},
+    {"field": "amount", "operator": "ge", "value": 2.5},
+    {"field": "amount", "operator": "gt", "value": 2**53},
+    {"field": "user.age", "operator": "le", "value": 0},
+    {"field": "amount", "operator": "ne", "value": 2.5},
+    {"field": "amount", "operator": "le", "value": True},
+    {"field": "amount", "operator": "in", "value": [0, 1, 2.5, 2**60]},
+    {"field": "amount", "operator": "not_in", "value": (1, 3)},
+    {"field": "amount", "operator": "gt", "value": 2**60},
+    {"field": "debt", "operator": "ratio_gt", "value": 0.5, "denominator": "equity"},
+    {"f_field": "debt", "g_field": "equity", "operator": "ratio_eq", "threshold": 0.25},
+    {"f_field": "debt", "g_field": "equity", "operator": "ratio_ne", "threshold": 0.25},
+    {"f_field": "debt", "g_field": "equity", "operator": "ratio_le",
+     "threshold": 1.0, "epsilon": 0.0},
+    {"field": "amount", "operator": "sum_lt", "value": 50, "window": "1h"},
+    {
+        "logic": "or",
+        "constraints": [
+            {"field": "amount", "operator": "count_lt", "value": 3, "window": "1h"},
+            {"field": "amount", "operator": "lt", "value": 1},
+        ],
+    },
+]
+
+BATCH_VALUES = [0, 1, -3, 2.5, 2**53, 2**60, float("nan"), float("inf"), True,
+                False, "1", "bob", None, [1], 10**400]
+
+
+def _batch_objects(count, seed=7):
+    import random
+
+    rng = random.Random(seed)
+    objects = []
+    for _ in range(count):
+        obj = {}
+        for name in ("amount", "debt", "equity", "status", "name", "sent", "due"):
+            if rng.random() < 0.9:
+                obj[name] = rng.choice(BATCH_VALUES)
+        if rng.random() < 0.5:
+            obj["status"] = rng.choice(["open", "held"])
+        obj["user"] = {"age": rng.choice(BATCH_VALUES)}
+        objects.append(obj)
+    return objects
+
+
+class TestVerifyBatch:
+    """verify_batch must agree bit for bit with per-object verify()."""
+
+    def _expected(self, constraints, objects):
+        scalar = Forge(ForgeConfig(enable_caching=False))
+        try:
+            return [
+                [bool(scalar.verify(c, obj).passed) for c in constraints]
+                for obj in objects
+            ]
+        finally:
+            scalar.shutdown()
+
+    def _check(self, forge, constraints, objects):
+        expected = self._expected(constraints, objects)
+        result = forge.verify_batch(constraints, objects)
+
+        assert result.passed == [all(row) for row in expected]
+        for c, failed in enumerate(result.failures):
+            assert failed == [i for i, row in enumerate(expected) if not row[c]]
+        return result
+
+    def test_matches_scalar_path(self, forge):
+        result = self._check(forge, BATCH_CONSTRAINTS, _batch_objects(300))
+        assert result.vectorized > 0
+
+    def test_matches_without_numpy(self, forge, monkeypatch):
+        import core.forge
+
+        monkeypatch.setattr(core.forge, "_HAS_NUMPY", False)
+        result = self._check(forge, BATCH_CONSTRAINTS, _batch_objects(100, seed=3))
+        assert result.vectorized == 0
+
+    def test_non_strict_errors(self):
+        lenient = Forge(ForgeConfig(strict_mode=False))
+        try:
+            before = {"field": "sent", "operator": "before", "reference": "due"}
+            objects = [{"sent": "x", "due": 1}, {"sent": 0, "due": 1}]
+            result = lenient.verify_batch([before], objects)
+            assert result.passed == [True, True]
+        finally:
+            lenient.shutdown()
+
+    def test_bitmap_and_dict(self, forge):
+        objects = [{"amount": a} for a in (1, 5000, 2, 3, 4, 5, 6, 7, 9999)]
+        result = forge.verify_batch([LIMIT], objects)
+        assert result.bitmap() == bytes([0b11111101, 0b0])
+        as_dict = result.to_dict()
+        assert as_dict["failed"] == 2
+        assert as_dict["failures"][0]["failed"] == [1, 8]
+
+    def test_empty_inputs(self, forge):
+        assert forge.verify_batch([LIMIT], []).passed == []
+        assert forge.verify_batch([], [{"amount": 1}]).passed == [True]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# AGGREGATION STATE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestAggregationState:
+    """Windowed sums, counts and averages over per-second buckets."""
+
+    def test_window_queries(self):
+        state = AggregationState()
+        now = int(time.time())
+        for age, value in ((7200, 100.0), (1800, 5.0), (60, 2.0), (60, 3.0), (0, 10.0)):
+            state.append("acct", value, timestamp=now - age)
+
+        assert state.count("acct", 3600) == 4
+        assert state.sum("acct", 3600) == 20.0
+        assert state.avg("acct", 3600) == 5.0
+        assert state.sum("acct", 86400) == 120.0
+        assert state.count("other", 3600) == 0
+        assert state.avg("other", 3600) == 0.0
+
+    def test_out_of_order_appends(self):
+        state = AggregationState()
+        now = int(time.time())
+        state.append("g", 1.0, timestamp=now)
+        state.append("g", 2.0, timestamp=now - 100)
+        state.append("g", 4.0, timestamp=now - 50)
+        state.append("g", 8.0, timestamp=now - 100)
+        assert state.sum("g", 75) == 5.0
+        assert state.sum("g", 200) == 15.0
+        assert state.count("g", 200) == 4
+
+    def test_window_sums_are_exact(self):
+        state = AggregationState()
+        now = int(time.time())
+        state.append("g", 0.1, timestamp=now - 100)
+        state.append("g", 0.2, timestamp=now)
+        assert state.sum("g", 10) == 0.2
+
+        # Values that already left the window add no rounding error
+        for age in range(5000, 0, -1):
+            state.append("h", 0.1, timestamp=now - 100 - age)
+        state.append("h", 0.3, timestamp=now)
+        assert state.sum("h", 10) == 0.3
+        assert state.avg("h", 10) == 0.3
+
+        # Long-lived group: many compactions, then an out-of-order value
+        state = AggregationState(max_age_seconds=60)
+        start = now - 20000
+        for t in range(start, now - 5):
+            state.append("k", 0.1, timestamp=t)
+        state.append("k", 0.7, timestamp=now)
+        state.append("k", 0.2, timestamp=now - 2)
+        assert state.sum("k", 3) == 0.8999999999999999  # 0.2 + 0.7
+        assert state.sum("k", 10) == math.fsum([0.1] * 5 + [0.2, 0.7])
+        assert state.count("k", 10) == 7
+
+    def test_automatic_expiry(self):
+        state = AggregationState(max_age_seconds=60)
+        now = int(time.time())
+        for age in range(1000, 0, -1):
+            state.append("g", 1.0, timestamp=now - age)
+        state.append("g", 1.0)
+        assert state.count("g", 10**6) == 61
+        assert len(state._groups["g"]) <= 62
+
+    def test_queried_window_extends_retention(self):
+        state = AggregationState(max_age_seconds=60)
+        state.count("g", 3600)
+        now = int(time.time())
+        state.append("g", 1.0, timestamp=now - 1800)
+        state.append("g", 1.0)
+        assert state.count("g", 3600) == 2
+
+    def test_group_cap(self):
+        state = AggregationState(max_groups=3)
+        for key in "abcd":
+            state.append(key, 1.0)
+        assert len(state) == 3
+        assert state.count("a", 60) == 0
+        assert state.count("d", 60) == 1
+        assert state.evicted_groups == 1
+
+    def test_snapshot_restore(self, tmp_path):
+        state = AggregationState()
+        now = int(time.time())
+        state.append("a", 1.5, timestamp=now - 10)
+        state.append("a", 2.5, timestamp=now - 10)
+        state.append("b", 4.0)
+        path = tmp_path / "agg.json"
+        state.save(str(path))
+
+        restored = AggregationState()
+        assert restored.load(str(path))
+        assert restored.sum("a", 60) == 4.0
+        assert restored.count("a", 60) == 2
+        assert restored.sum("b", 60) == 4.0
+        assert not AggregationState().load(str(tmp_path / "missing.json"))
+
+    def test_forge_persists_windows(self, tmp_path):
+        path = str(tmp_path / "aggregation.json")
+        rolling = {"field": "amount", "operator": "sum_lt", "value": 100, "window": "1h"}
+
+        first = Forge(ForgeConfig(aggregation_state_path=path))
+        assert first.verify(rolling, {"amount": 60}).passed
+        first.shutdown()
+
+        second = Forge(ForgeConfig(aggregation_state_path=path))
+        assert not second.verify(rolling, {"amount": 60}).passed
+        second.shutdown()
@@ -14,7 +14,7 @@ from Kernel.window.nsscreen import NSScreen
 from Kernel.layout.constraint import (
     NSLayoutConstraint, NSLayoutXAxisAnchor,
     NSLayoutDimension, NSLayoutGuide, NSLayoutAttribute,
-    NSLayoutRelation, solve_constraints,
+    NSLayoutRelation, NSLayoutPriority, NSLayoutEngine, solve_constraints,
 )
 from Kernel.gesture.recognizer import (
     NSClickGestureRecognizer,
@@ -350,6 +350,115 @@ class TestNSLayoutConstraint:
         assert guide.width_anchor is not None
 
 
+def _pin(item, attr, to_item, to_attr, constant=0.0, relation=NSLayoutRelation.EQUAL,
+         multiplier=1.0, priority=NSLayoutPriority.REQUIRED):
+    c = NSLayoutConstraint(item, attr, relation, to_item, to_attr, multiplier, constant)
+    c.priority = priority
+    c.activate()
+    return c
+
+
+class TestNSLayoutEngine:
+    def _row(self, count=8):
+        """count views chained left to right inside a 1000pt parent, listed back to front."""
+        A = NSLayoutAttribute
+        parent = NSView(NSRect(0, 0, 1000, 100))
+        views = [NSView(NSRect(0, 0, 10, 10)) for _ in range(count)]
+        constraints = [_pin(views[0], A.LEFT, parent, A.LEFT, 10)]
+        for prev, view in zip(views, views[1:]):
+            constraints.append(_pin(view, A.LEFT, prev, A.RIGHT, 10))
+        for view in views:
+            constraints.append(_pin(view, A.WIDTH, parent, A.WIDTH, -10, multiplier=0.1))
+        return parent, views, constraints[::-1]
+
+    def test_chain_converges_in_any_order(self):
+        parent, views, constraints = self._row()
+        solve_constraints(constraints)
+        assert [v.frame.x for v in views] == [10 + 100 * i for i in range(8)]
+        assert all(v.frame.width == 90 for v in views)
+        assert parent.frame.x == 0 and parent.frame.width == 1000
+
+    def test_engine_follows_constant_and_parent_changes(self):
+        parent, views, constraints = self._row()
+        engine = NSLayoutEngine()
+        engine.solve(constraints)
+
+        constraints[-1].constant = 30  # views[0].left = parent.left + 30
+        engine.solve(constraints)
+        assert views[7].frame.x == 730
+
+        parent.frame = NSRect(0, 0, 500, 100)
+        engine.solve(constraints)
+        assert views[1].frame.x == 30 + 40 + 10
+        assert views[7].frame.width == 40
+
+    def test_removed_constraint_releases_view(self):
+        A = NSLayoutAttribute
+        parent, views, constraints = self._row(2)
+        engine = NSLayoutEngine()
+        engine.solve(constraints)
+        extra = _pin(views[1], A.TOP, parent, A.TOP, 25)
+        engine.solve(constraints + [extra])
+        assert views[1].frame.y == 25
+
+        extra.deactivate()
+        engine.solve(constraints + [extra])
+        assert views[1].frame.y == 25  # keeps its frame, no longer held there
+        parent.frame = NSRect(0, 40, 1000, 100)
+        engine.solve(constraints)
+        assert views[1].frame.y == 25
+
+    def test_priorities(self):
+        A = NSLayoutAttribute
+        v = NSView(NSRect(0, 0, 10, 10))
+        at_least = _pin(v, A.WIDTH, None, A.NOT_AN_ATTRIBUTE, 300,
+                        NSLayoutRelation.GREATER_THAN_OR_EQUAL, priority=NSLayoutPriority.DEFAULT_HIGH)
+        exactly = _pin(v, A.WIDTH, None, A.NOT_AN_ATTRIBUTE, 50,
+                       priority=NSLayoutPriority.DEFAULT_LOW)
+        engine = NSLayoutEngine()
+        engine.solve([at_least, exactly])
+        assert v.frame.width == 300
+
+        at_least.priority = NSLayoutPriority.FITTINGSIZE_COMPRESSION
+        engine.solve([at_least, exactly])
+        assert v.frame.width == 50
+
+    def test_conflicting_required_constraint_is_broken(self):
+        A = NSLayoutAttribute
+        v = NSView(NSRect(0, 0, 10, 10))
+        first = _pin(v, A.WIDTH, None, A.NOT_AN_ATTRIBUTE, 70)
+        second = _pin(v, A.WIDTH, None, A.NOT_AN_ATTRIBUTE, 80)
+        engine = NSLayoutEngine()
+        engine.solve([first, second])
+        assert v.frame.width == 70
+        assert engine.broken == [second]
+
+        first.deactivate()
+        engine.solve([first, second])
+        assert v.frame.width == 80
+
+    def test_drag_with_edit_variables(self):
+        A = NSLayoutAttribute
+        parent, views, constraints = self._row(3)
+        guide = NSLayoutGuide()
+        constraints.append(_pin(guide, A.LEFT, views[2], A.RIGHT, 5))
+        constraints.append(_pin(guide, A.RIGHT, parent, A.RIGHT))
+        engine = NSLayoutEngine()
+        engine.solve(constraints)
+        assert (guide.frame.x, guide.frame.width) == (305, 695)
+
+        engine.begin_edit(parent)
+        engine.suggest_frame(parent, NSRect(200, 0, 600, 100))
+        assert views[0].frame.x == 210
+        assert views[2].frame.width == 50
+        assert guide.frame.x + guide.frame.width == 800
+        engine.end_edit(parent)
+
+        engine.solve(constraints)
+        assert parent.frame.x == 200
+        assert views[2].frame.x == 330
+
+
 # ═══════════════════════════════════════════════════════════════════
 # GESTURE RECOGNIZERS
 # ═══════════════════════════════════════════════════════════════════
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════════════
+LEDGER TESTS
+Tests for ledger storage, integrity and Merkle accumulation.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hashlib
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from core.ledger import (
+    Ledger,
+    LedgerConfig,
+    LedgerIndex,
+    MerkleAccumulator,
+    MerkleTree,
+    SegmentedStore,
+)
+
+
+def _leaf(i):
+    return hashlib.sha256(f"leaf_{i}".encode()).hexdigest()
+
+
+@pytest.fixture
+def temp_storage():
+    """Create temporary storage for tests."""
+    temp_dir = tempfile.mkdtemp()
+    yield temp_dir
+    shutil.rmtree(temp_dir)
+
+
+class TestMerkleAccumulator:
+    """The incremental tree must match the rebuilt MerkleTree exactly."""
+
+    def test_root_matches_merkle_tree(self):
+        acc = MerkleAccumulator()
+        leaves = []
+        for i in range(40):
+            leaves.append(_leaf(i))
+            acc.append(leaves[-1])
+            assert acc.root == MerkleTree(list(leaves)).root
+
+    def test_proofs_match_merkle_tree(self):
+        leaves = [_leaf(i) for i in range(23)]
+        acc = MerkleAccumulator(leaves)
+        tree = MerkleTree(leaves)
+        for i in range(len(leaves)):
+            proof = acc.get_proof(i)
+            assert proof == tree.get_proof(i)
+            assert acc.verify_proof(leaves[i], proof)
+
+    def test_single_leaf_proof(self):
+        acc = MerkleAccumulator([_leaf(0)])
+        assert acc.root == _leaf(0)
+        assert acc.get_proof(0) == []
+        assert acc.verify_proof(_leaf(0), [])
+
+    def test_save_and_load_incrementally(self, temp_storage):
+        directory = Path(temp_storage) / "merkle"
+        acc = MerkleAccumulator([_leaf(i) for i in range(7)])
+        assert acc.save(directory)
+        for i in range(7, 13):
+            acc.append(_leaf(i))
+        assert acc.save(directory)
+
+        loaded = MerkleAccumulator.load(directory)
+        assert loaded is not None
+        assert loaded.levels == acc.levels
+        loaded.append(_leaf(13))
+        assert loaded.root == MerkleTree([_leaf(i) for i in range(14)]).root
+
+    def test_load_rejects_truncated_levels(self, temp_storage):
+        directory = Path(temp_storage) / "merkle"
+        acc = MerkleAccumulator([_leaf(i) for i in range(5)])
+        acc.save(directory)
+        with open(directory / "level_1.hex", "r+b") as f:
+            f.truncate(MerkleAccumulator.NODE_WIDTH)
+        assert MerkleAccumulator.load(directory) is None
+
+
+class TestLedgerMerkle:
+    """Ledger keeps its Merkle tree current across appends and restarts."""
+
+    def test_root_tracks_appends(self, temp_storage):
+        ledger = Ledger(LedgerConfig(storage_path=temp_storage))
+        for i in range(9):
+            ledger.append(operation="test", payload={"i": i}, result="pass")
+            hashes = [e.entry_hash for e in ledger]
+            assert ledger.get_merkle_root() == MerkleTree(hashes).root
+
+        proof = ledger.get_merkle_proof(4)
+        assert ledger.verify_merkle_proof(4, proof)
+
+    def test_restart_restores_tree(self, temp_storage):
+        config = LedgerConfig(storage_path=temp_storage, merkle_persist_interval=4)
+        ledger = Ledger(config)
+        for i in range(10):
+            ledger.append(operation="test", payload={"i": i}, result="pass")
+        root = ledger.get_merkle_root()
+
+        reopened = Ledger(LedgerConfig(storage_path=temp_storage))
+        assert reopened.get_merkle_root() == root
+        assert os.path.exists(os.path.join(temp_storage, "merkle", "merkle.json"))
+
+    def test_stale_tree_is_rebuilt(self, temp_storage):
+        ledger = Ledger(LedgerConfig(storage_path=temp_storage))
+        for i in range(6):
+            ledger.append(operation="test", payload={"i": i}, result="pass")
+        ledger.sync()
+
+        # Replace the history underneath the saved tree
+        other_path = os.path.join(temp_storage, "other")
+        other = Ledger(LedgerConfig(storage_path=other_path))
+        for i in range(8):
+            other.append(operation="other", payload={"i": i}, result="fail")
+        ledger.close()
+        other.close()
+        shutil.rmtree(os.path.join(temp_storage, "segments"))
+        shutil.copytree(
+            os.path.join(other_path, "segments"),
+            os.path.join(temp_storage, "segments"),
+        )
+
+        reopened = Ledger(LedgerConfig(storage_path=temp_storage))
+        hashes = [e.entry_hash for e in reopened]
+        assert reopened.get_merkle_root() == MerkleTree(hashes).root
+
+
+class TestLedgerCheckpoints:
+    """verify_chain only re-checks entries past the verified checkpoint."""
+
+    def _ledger(self, path, n):
+        ledger = Ledger(LedgerConfig(storage_path=path))
+        for i in range(n):
+            ledger.append(operation="test", payload={"i": i}, result="pass")
+        return ledger
+
+    def test_checkpoint_advances_and_persists(self, temp_storage):
+        ledger = self._ledger(temp_storage, 8)
+        assert ledger.verify_chain() == (True, -1)
+        assert ledger.stats()["verified_through"] == 7
+
+        reopened = Ledger(LedgerConfig(storage_path=temp_storage))
+        assert reopened.stats()["verified_through"] == 7
+
+    def test_incremental_skips_checkpointed_entries(self, temp_storage):
+        ledger = self._ledger(temp_storage, 8)
+        ledger.verify_chain()
+
+        # Damage behind the checkpoint is only caught by a full audit
+        ledger._entries[2].result = "TAMPERED"
+        for i in range(3):
+            ledger.append(operation="test", payload={"n": i}, result="pass")
+        assert ledger.verify_chain() == (True, -1)
+        assert ledger.verify_chain(full=True) == (False, 2)
+
+    def test_new_entries_are_verified(self, temp_storage):
+        ledger = self._ledger(temp_storage, 5)
+        ledger.verify_chain()
+        ledger.append(operation="test", payload={}, result="pass")
+        ledger._entries[5].result = "TAMPERED"
+        assert ledger.verify_chain() == (False, 5)
+
+    def test_background_audit(self, temp_storage):
+        ledger = self._ledger(temp_storage, 20)
+        ledger._entries[11].result = "TAMPERED"
+        assert ledger.start_audit()
+        ledger._audit_thread.join(timeout=10)
+
+        status = ledger.audit_status()
+        assert status["running"] is False
+        assert status["valid"] is False
+        assert status["first_invalid"] == 11
+        assert ledger.verify_chain() == (False, 11)
+
+
+class TestSegmentedStorage:
+    """Entries live in indexed segments; RAM holds only a hot tail."""
+
+    def _config(self, path, **kwargs):
+        kwargs.setdefault("segment_max_entries", 7)
+        kwargs.setdefault("max_entries_memory", 4)
+        return LedgerConfig(storage_path=path, **kwargs)
+
+    def test_random_access_across_segments(self, temp_storage):
+        ledger = Ledger(self._config(temp_storage))
+        written = [
+            ledger.append(operation=f"op_{i % 3}", payload={"i": i}, result="pass")
+            for i in range(30)
+        ]
+        assert len(ledger._entries) <= 4
+        assert len(os.listdir(os.path.join(temp_storage, "segments"))) == 10
+
+        for i in (0, 6, 7, 13, 22, 29):
+            assert ledger.get(i).to_dict() == written[i].to_dict()
+        assert [e.index for e in ledger.get_range(5, 16)] == list(range(5, 16))
+        assert [e.index for e in ledger.get_latest(3)] == [27, 28, 29]
+        assert ledger.get(30) is None
+
+    def test_reopen_reads_only_tail(self, temp_storage):
+        ledger = Ledger(self._config(temp_storage))
+        for i in range(20):
+            ledger.append(operation="test", payload={"i": i}, result="pass")
+        tip = ledger.get(19).entry_hash
+        ledger.close()
+
+        reopened = Ledger(self._config(temp_storage))
+        assert len(reopened) == 20
+        assert reopened._entries == []
+        assert reopened.verify_chain(full=True) == (True, -1)
+
+        entry = reopened.append(operation="test", payload={}, result="pass")
+        assert entry.index == 20
+        assert entry.prev_hash == tip
+
+    def test_migrates_legacy_jsonl(self, temp_storage):
+        legacy = Ledger(self._config(os.path.join(temp_storage, "src")))
+        for i in range(9):
+            legacy.append(operation="test", payload={"i": i}, result="pass")
+        with open(os.path.join(temp_storage, "ledger.jsonl"), "w") as f:
+            for entry in legacy:
+                f.write(json.dumps(entry.to_dict()) + "\n")
+
+        ledger = Ledger(self._config(temp_storage))
+        assert len(ledger) == 9
+        assert ledger.get_merkle_root() == legacy.get_merkle_root()
+        assert os.path.exists(os.path.join(temp_storage, "ledger.jsonl.migrated"))
+
+    def test_recovers_unindexed_and_torn_records(self, temp_storage):
+        directory = Path(temp_storage)
+        store = SegmentedStore(directory, segment_max_entries=100)
+        for i in range(3):
+            store.append(json.dumps({"i": i}))
+        store.close()
+
+        # A record that reached the data file but not the index, then a torn write
+        with open(directory / "000000000000.jsonl", "ab") as f:
+            f.write(b'{"i": 3}\n{"i": 4')
+
+        store = SegmentedStore(directory, segment_max_entries=100)
+        assert len(store) == 4
+        assert json.loads(store.read(3)) == {"i": 3}
+        store.append(json.dumps({"i": 4}))
+        assert json.loads(store.read(4)) == {"i": 4}
+        store.close()
+
+
+class TestLedgerSearch:
+    """Indexed search matches a linear scan and paginates by cursor."""
+
+    def _scan(self, ledger, operation=None, result=None, start_time=None, end_time=None):
+        return [
+            e.index
+            for e in reversed(list(ledger))
+            if (not operation or e.operation == operation)
+            and (not result or e.result == result)
+            and (not start_time or e.timestamp >= start_time)
+            and (not end_time or e.timestamp <= end_time)
+        ]
+
+    def _ledger(self, path):
+        ledger = Ledger(LedgerConfig(storage_path=path, segment_max_entries=16))
+        for i in range(60):
+            ledger.append(
+                operation=("verify", "sign", "store")[i % 3],
+                payload={"i": i},
+                result="pass" if i % 4 else "fail",
+            )
+        return ledger
+
+    def test_filters_match_scan(self, temp_storage):
+        ledger = self._ledger(temp_storage)
+        times = sorted({e.timestamp for e in ledger})
+        lo, hi = times[0], times[-1]
+
+        for kwargs in (
+            {},
+            {"operation": "sign"},
+            {"result": "fail"},
+            {"operation": "verify", "result": "pass"},
+            {"start_time": lo, "end_time": hi},
+            {"operation": "store", "start_time": lo},
+            {"operation": "missing"},
+        ):
+            found = [e.index for e in ledger.search(limit=1000, **kwargs)]
+            assert found == self._scan(ledger, **kwargs), kwargs
+
+    def test_cursor_pagination(self, temp_storage):
+        ledger = self._ledger(temp_storage)
+        seen, cursor = [], None
+        while True:
+            page = ledger.search(operation="verify", limit=7, before=cursor)
+            if not page:
+                break
+            seen += [e.index for e in page]
+            cursor = page[-1].index
+        assert seen == self._scan(ledger, operation="verify")
+
+    def test_out_of_order_timestamps(self):
+        index = LedgerIndex()
+        for i, ts in enumerate((100, 300, 200, 400, 250)):
+            index.add(i, "test", "pass", ts)
+        assert index.search(start_time=150, end_time=350) == [4, 2, 1]
+        assert index.search(start_time=150, end_time=350, before=4) == [2, 1]
+
+    @pytest.mark.parametrize("inserts", [LedgerIndex.PENDING_INSERTS, 0])
+    def test_appends_after_clock_regression(self, inserts):
+        index = LedgerIndex()
+        index.PENDING_INSERTS = inserts  # 0: always take the full merge
+        timestamps = [1000 + i for i in range(50)] + [990]  # clock steps back
+        timestamps += [1050 + i for i in range(50)] + [995, 1200, 1001]
+        for i, ts in enumerate(timestamps):
+            index.add(i, "test", "pass", ts)
+
+        # In-order appends extend the time order; only earlier ones wait
+        assert [ts for ts, _ in index._time_pending] == [990, 995, 1001]
+
+        for lo, hi in ((990, 1000), (995, 1001), (1040, 1060), (None, 996), (1100, None)):
+            expected = [
+                i for i in range(len(timestamps) - 1, -1, -1)
+                if (lo is None or timestamps[i] >= lo) and (hi is None or timestamps[i] <= hi)
+            ]
+            assert index.search(start_time=lo, end_time=hi, limit=1000) == expected
+        assert index._time_pending == []
+        assert list(index._time_keys) == sorted(timestamps)
+
+    def test_index_survives_restart(self, temp_storage):
+        ledger = self._ledger(temp_storage)
+        expected = [e.index for e in ledger.search(operation="sign", result="fail")]
+        counts = ledger.stats()["operations"]
+        ledger.close()
+
+        reopened = Ledger(LedgerConfig(storage_path=temp_storage, segment_max_entries=16))
+        assert [e.index for e in reopened.search(operation="sign", result="fail")] == expected
+        assert reopened.stats()["operations"] == counts
+
+
+class TestGroupCommit:
+    """Queued appends reach disk in order and report durability."""
+
+    def _config(self, path, **kwargs):
+        return LedgerConfig(storage_path=path, group_commit=True, **kwargs)
+
+    def test_concurrent_appends_are_chained(self, temp_storage):
+        from concurrent.futures import ThreadPoolExecutor
+
+        ledger = Ledger(self._config(temp_storage, fsync_policy="interval"))
+
+        def write(worker):
+            return [
+                ledger.append(operation="test", payload={"w": worker, "i": i}, result="pass")
+                for i in range(50)
+            ]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            entries = [e for batch in pool.map(write, range(8)) for e in batch]
+
+        last = max(e.index for e in entries)
+        assert ledger.wait_durable(last, timeout=10)
+        ledger.close()
+
+        reopened = Ledger(LedgerConfig(storage_path=temp_storage))
+        assert len(reopened) == 400
+        assert reopened.verify_chain(full=True) == (True, -1)
+        reopened.close()
+
+    def test_durable_future(self, temp_storage):
+        ledger = Ledger(self._config(temp_storage, fsync_policy="entries", fsync_entries=10**6))
+        entry = ledger.append(operation="test", payload={}, result="pass")
+        future = ledger.durable_future(entry.index)
+        assert future.result(timeout=10) >= entry.index
+        ledger.close()
+
+    def test_reads_see_queued_entries(self, temp_storage):
+        ledger = Ledger(self._config(temp_storage, max_entries_memory=0))
+        written = [
+            ledger.append(operation="test", payload={"i": i}, result="pass") for i in range(20)
+        ]
+        assert [e.entry_hash for e in ledger] == [e.entry_hash for e in written]
+        ledger.close()
+
+    def test_sync_mode_future(self, temp_storage):
+        ledger = Ledger(LedgerConfig(storage_path=temp_storage, fsync_policy="entries"))
+        entry = ledger.append(operation="test", payload={}, result="pass")
+        assert ledger.durable_future(entry.index).result(timeout=1) == entry.index
+        ledger.close()
@@ -0,0 +1,102 @@
+"""
+Tests for parcCloud authentication storage.
+
+Covers the SQLite user/session store and the in-process session cache:
+- signup / signin / verify / logout round trips
+- expired sessions and the batched expiry sweep
+- cache invalidation when another process writes to the database
+- one-time import of the old JSON store
+
+Run with: python -m pytest tests/test_parccloud_auth.py -v
+"""
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+parent_dir = str(Path(__file__).parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+import pytest
+
+from parccloud import auth
+
+
+@pytest.fixture(autouse=True)
+def storage(tmp_path, monkeypatch):
+    """Point the auth module at a fresh storage directory."""
+    monkeypatch.setattr(auth, "STORAGE_DIR", tmp_path)
+    monkeypatch.setattr(auth, "DB_FILE", tmp_path / "parccloud.db")
+    monkeypatch.setattr(auth, "USERS_FILE", tmp_path / "parccloud_users.json")
+    yield tmp_path
+    if auth._store is not None:
+        auth._store.close()
+        auth._store = None
+
+
+def test_signup_signin_verify_logout():
+    created = auth.signup("Ada", "Ada@Example.com ", "correct horse")
+    assert created.success
+    assert auth.verify_token(created.token)["email"] == "ada@example.com"
+
+    assert not auth.signup("Ada 2", "ada@example.com", "another pass").success
+    assert not auth.signin("ada@example.com", "wrong password").success
+    assert not auth.signin("nobody@example.com", "correct horse").success
+
+    signed_in = auth.signin("ada@example.com", "correct horse")
+    assert signed_in.success
+    assert signed_in.user["id"] == created.user["id"]
+    assert auth.get_user_count() == 1
+
+    assert auth.logout(signed_in.token)
+    assert auth.verify_token(signed_in.token) is None
+    assert not auth.logout(signed_in.token)
+    assert auth.verify_token(created.token) is not None
+
+
+def test_expired_sessions_are_rejected_and_swept():
+    created = auth.signup("Bo", "bo@example.com", "password123")
+    assert auth.verify_token(created.token) is not None  # runs the first sweep
+    store = auth._get_store()
+    store.add_session("stale", created.user["id"], time.time() - 1, False)
+
+    # Rejected on sight, deleted by the next batched sweep
+    assert auth.verify_token("stale") is None
+    assert store.sweep() == 1
+    assert not auth.logout("stale")
+
+
+def test_cache_drops_sessions_removed_by_another_process(storage):
+    token = auth.signup("Cy", "cy@example.com", "password123").token
+    assert auth.verify_token(token) is not None
+
+    other = sqlite3.connect(str(storage / "parccloud.db"))
+    with other:
+        other.execute("DELETE FROM sessions WHERE token = ?", (token,))
+    other.close()
+
+    assert auth.verify_token(token) is None
+
+
+def test_imports_old_json_store(storage):
+    salt = "00" * 16
+    hashed, _ = auth._hash_password("legacy-pass", salt)
+    expires = (auth.datetime.utcnow() + auth.timedelta(hours=1)).isoformat()
+    (storage / "parccloud_users.json").write_text(json.dumps({
+        "users": {
+            "usr_1": {
+                "id": "usr_1", "name": "Old", "email": "old@example.com",
+                "password_hash": hashed, "password_salt": salt,
+                "is_admin": False, "tier": "free", "created_at": "2025-01-01T00:00:00",
+            }
+        },
+        "sessions": {
+            "old-token": {"user_id": "usr_1", "expires": expires, "is_admin": False}
+        },
+    }))
+
+    assert auth.verify_token("old-token")["id"] == "usr_1"
+    assert auth.signin("old@example.com", "legacy-pass").success
+    assert auth.get_user_count() == 1
@@ -30,7 +30,7 @@ from core.qap import (
     # Parser
     Parser, Program, BinaryOp, Comparison, Identifier, Literal, InExpr,
     # Symbol table
-    SymbolTable, EnumTable, IRMembership, QAPPolynomial,
+    SymbolTable, EnumTable, IRMembership, QAPPolynomial, QAPBuilder,
     # Compiler
     QAPCompiler, compile_to_qap, format_compilation_output
 )
@@ -545,6 +545,44 @@ class TestQAPConversion:
                     expected = expected % TEST_PRIME
                     assert actual == expected, f"A_{j}({root}) = {actual}, expected {expected}"
 
+    def test_qap_lagrange_basis(self):
+        """Test each basis polynomial is 1 at its own point and 0 at the others."""
+        points = [2, 5, 7, 11]
+        builder = QAPBuilder(TEST_PRIME)
+        for i in range(len(points)):
+            basis = builder._build_lagrange_basis(points, i)
+            for k, x in enumerate(points):
+                assert basis.evaluate(F(x, TEST_PRIME)).value == (1 if i == k else 0)
+
+        poly = builder._lagrange_interpolate(points, [3, 0, -1, 9])
+        values = [poly.evaluate(F(x, TEST_PRIME)).value for x in points]
+        assert values == [3, 0, TEST_PRIME - 1, 9]
+
+    def test_qap_ntt_domain(self):
+        """Test the roots-of-unity domain interpolates the same R1CS values."""
+        source = "\n".join(f'when x{i} == "a" and y == "b{i}" finfr' for i in range(3))
+        result = compile_to_qap(source, prime=BN254_PRIME, domain="ntt")
+        assert result.success
+        qap = result.qap
+
+        size = len(qap.roots)
+        assert size >= qap.num_constraints and size & (size - 1) == 0
+        for root in qap.roots:
+            assert qap.target_poly.evaluate(F(root, BN254_PRIME)).value == 0
+
+        for name, polys in (("A", qap.A_polys), ("B", qap.B_polys), ("C", qap.C_polys)):
+            for j, poly in polys.items():
+                for i, root in enumerate(qap.roots):
+                    row = getattr(result.r1cs[i], name) if i < qap.num_constraints else {}
+                    expected = row.get(j, 0) % BN254_PRIME
+                    assert poly.evaluate(F(root, BN254_PRIME)).value == expected
+
+    def test_qap_ntt_domain_needs_roots_of_unity(self):
+        """Test the NTT domain is refused for fields without 2^k-th roots of unity."""
+        result = compile_to_qap('when x == "a" and y == "b" finfr', prime=TEST_PRIME, domain="ntt")
+        assert not result.success
+        assert "roots of unity" in result.errors[0]
+
 
 # ============================================================================
 # END-TO-END COMPILATION TESTS
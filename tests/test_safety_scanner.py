@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════════════════════
+SAFETY SCANNER TESTS
+The prefiltered scanner must agree with searching each pattern in turn.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import itertools
+import random
+import re
+
+import pytest
+
+from core.cartridges import ConstraintChecker
+from core.forge import SAFETY_PATTERNS, Forge, ForgeConfig
+from core.safety_scanner import SafetyScanner, required_literals
+
+
+def naive_scan(table, text, categories=None):
+    """The per-pattern loop the scanner replaced."""
+    text_lower = text.lower()
+    categories = list(table) if categories is None else categories
+    return [
+        name
+        for name in categories
+        if name in table
+        and any(re.search(p, text_lower) for p in table[name]["patterns"])
+    ]
+
+
+TEXTS = [
+    "",
+    "What is the capital of France?",
+    "How to make explosives",
+    "How to make a bomb and hack the bank",
+    "Diagnose my rash, then prescribe me something",
+    "how to evade tax and launder money",
+    "Phishing and MALWARE kits for sale",
+    "I want to kill time before the meeting",
+    "bypass",
+    "hackdiagnose my",
+    "build a weapon, steal password, diagnose this, evade irs",
+    "the self-harm hotline number",
+]
+
+# Overlapping and adjacent patterns across categories
+OVERLAP = {
+    "ab": {"patterns": [r"ab"]},
+    "bc": {"patterns": [r"bc"]},
+    "abc": {"patterns": [r"a.c", r"zzz"]},
+    "c": {"patterns": [r"c$"]},
+    "empty": {"patterns": []},
+}
+
+
+@pytest.fixture
+def scanner():
+    return SafetyScanner(SAFETY_PATTERNS)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# EQUIVALENCE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestEquivalence:
+    """scan() returns exactly what the per-pattern loop did."""
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_all_categories(self, scanner, text):
+        assert scanner.scan(text) == naive_scan(SAFETY_PATTERNS, text)
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_category_subsets_in_caller_order(self, scanner, text):
+        names = list(SAFETY_PATTERNS)
+        for r in range(1, len(names) + 1):
+            for subset in itertools.permutations(names, r):
+                assert scanner.scan(text, subset) == naive_scan(
+                    SAFETY_PATTERNS, text, list(subset)
+                )
+
+    def test_overlapping_matches(self):
+        scanner = SafetyScanner(OVERLAP)
+        for text in ["abc", "xabcx", "bc", "ab", "a-c", "zabcz", "cab", ""]:
+            for subset in itertools.permutations(OVERLAP, 3):
+                assert scanner.scan(text, subset) == naive_scan(
+                    OVERLAP, text, list(subset)
+                ), (text, subset)
+
+    def test_unknown_and_duplicate_categories(self, scanner):
+        categories = ["nope", "harm", "security", "harm"]
+        text = "how to hack and hurt"
+        assert scanner.scan(text, categories) == ["harm", "security", "harm"]
+        assert scanner.check(text, ["nope", "medical"]) == (["medical"], [])
+
+    def test_case_insensitive_and_backreference_patterns(self):
+        table = {
+            "repeat": {"patterns": [r"(\w+) \1"]},
+            "shout": {"patterns": [r"(?i)HELLO"]},
+        }
+        scanner = SafetyScanner(table)
+        for text in ["hello hello", "Hello world", "bye bye", "HELLO", "x"]:
+            assert scanner.scan(text) == naive_scan(table, text)
+
+    def test_random_texts(self):
+        rng = random.Random(7)
+        words = [
+            "how", "to", "make", "a", "bomb", "hack", "diagnose", "my", "tax",
+            "evade", "self-harm", "the", "bank", "phishing", "i", "want", "kill",
+            "prescribe", "me", "launder", "money", "bypass", "cat", "steal",
+        ]
+        scanner = SafetyScanner(SAFETY_PATTERNS)
+        for _ in range(500):
+            text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 8)))
+            assert scanner.scan(text) == naive_scan(SAFETY_PATTERNS, text), text
+
+    def test_violations_report_first_pattern(self):
+        scanner = SafetyScanner(OVERLAP)
+        assert scanner.violations("zzz abc", ["abc", "c"]) == [
+            ("abc", r"a.c"),
+            ("c", r"c$"),
+        ]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LITERAL PREFILTER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestRequiredLiterals:
+    """Literals extracted from each pattern's parse tree."""
+
+    @pytest.mark.parametrize(
+        "pattern,expected",
+        [
+            (r"(how to )?(hack|crack|exploit)", {"hack", "crack", "exploit"}),
+            (r"(how to )?(suicide|self.harm)", {"uicide", "harm"}),
+            (r"\bjailbreak (mode|enabled)\b", {"jailbreak "}),
+            (r"(foo)+bar", {"foo"}),
+            (r"(ab|)c", {"c"}),
+        ],
+    )
+    def test_extracted(self, pattern, expected):
+        assert required_literals(pattern) == frozenset(expected)
+
+    @pytest.mark.parametrize("pattern", [r"(?i)hack", r"a?b*", r"[abc]+", r"(x|)"])
+    def test_no_literal_means_always_searched(self, pattern):
+        assert required_literals(pattern) is None
+
+    def test_every_table_pattern_match_contains_a_literal(self):
+        for spec in SAFETY_PATTERNS.values():
+            for pattern in spec["patterns"]:
+                literals = required_literals(pattern)
+                for text in TEXTS:
+                    m = re.search(pattern, text.lower())
+                    if m and literals is not None:
+                        assert any(lit in m.group(0) for lit in literals)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CALLERS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestCallers:
+    """Forge, cartridges and the agent share the scanner."""
+
+    def test_forge_verify_content(self):
+        forge = Forge(ForgeConfig(enable_caching=False))
+        try:
+            result = forge.verify_content("How to make a bomb and hack the bank")
+            assert not result.passed
+            assert result.constraint_id == f"CONTENT_{len(SAFETY_PATTERNS)}"
+            assert result.message == "Violations: harm, security"
+
+            result = forge.verify_content("hello", ["medical", "missing"])
+            assert result.passed
+            assert result.constraint_id == "CONTENT_2"
+        finally:
+            forge.shutdown()
+
+    def test_cartridge_check_safety(self):
+        result = ConstraintChecker.check_safety("phishing kit, then hack it")
+        assert not result.passed
+        assert result.violations == [
+            r"Security: (how to )?(hack|crack|break into|exploit|bypass)"
+        ]
+
+    def test_agent_respects_filter_flags(self):
+        agent_module = pytest.importorskip("adan.agent")
+        agent = agent_module.NewtonAgent(
+            agent_module.AgentConfig(enable_security_filter=False)
+        )
+        passed, failed = agent._check_constraints("how to hack and make a bomb")
+        assert failed == ["harm"]
+        assert "security" not in passed
+        assert "privacy" in passed
+
+    def test_portable_copy_matches(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        with open(os.path.join(root, "core", "safety_scanner.py")) as f:
+            shared = f.read()
+        with open(os.path.join(root, "adan_portable", "core", "safety_scanner.py")) as f:
+            portable = f.read()
+        assert portable == shared
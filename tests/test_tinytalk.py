@@ -746,6 +746,55 @@ class TestPerformanceBenchmarks:
         assert result.avg_time_ms < 1.0, f"Complex law evaluation too slow: {result.avg_time_ms}ms"
         print(f"\nComplex Laws (6 laws): {result.ops_per_second:.0f} ops/sec, avg {result.avg_time_ms:.4f}ms")
 
+    def test_wide_blueprint_forge_speed(self):
+        """Benchmark forge calls on a 50-field blueprint that touch one field."""
+        namespace = {f"f{i:02d}": field(float, default=0.0) for i in range(50)}
+        namespace["history"] = field(list, default=None)
+
+        @law
+        def bounded(self):
+            when(self.f00 > 1e12, finfr)
+
+        @forge
+        def nudge(self, amount: float):
+            self.f00 += amount
+            return self.f00
+
+        namespace.update(bounded=bounded, nudge=nudge)
+        WideBlueprint = type("WideBlueprint", (Blueprint,), namespace)
+        bp = WideBlueprint(history=list(range(100)))
+
+        result = benchmark(lambda: bp.nudge(0.5), iterations=10000)
+
+        assert result.avg_time_ms < 0.1, f"Wide forge too slow: {result.avg_time_ms}ms"
+        print(f"\nWide Forge (50 fields): {result.ops_per_second:.0f} forges/sec, avg {result.avg_time_ms:.4f}ms")
+
+    def test_many_laws_forge_speed(self):
+        """Benchmark a forge touching one field on a blueprint with 40 laws."""
+        namespace = {f"f{i:02d}": field(int, default=0) for i in range(40)}
+
+        def bounds(name):
+            def check(self):
+                when(getattr(self, name) > 1_000_000, finfr)
+            check._is_law = True
+            return check
+
+        for i in range(40):
+            namespace[f"law_{i:02d}"] = bounds(f"f{i:02d}")
+
+        @forge
+        def bump(self):
+            self.f00 += 1
+
+        namespace["bump"] = bump
+        ManyLawBlueprint = type("ManyLawBlueprint", (Blueprint,), namespace)
+        bp = ManyLawBlueprint()
+
+        result = benchmark(bp.bump, iterations=10000)
+
+        assert result.avg_time_ms < 0.1, f"Many-law forge too slow: {result.avg_time_ms}ms"
+        print(f"\nMany Laws (40 laws): {result.ops_per_second:.0f} forges/sec, avg {result.avg_time_ms:.4f}ms")
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # PART 3: FUNCTIONALITY TESTS - ENSURE TINYTALK WORKS
@@ -942,6 +991,100 @@ class TestLawFunctionality:
         when(False, finfr)  # No exception
         when(False, fin)  # No exception
 
+    def test_only_affected_laws_rerun(self):
+        """Test that a forge re-runs only laws that read a changed field."""
+        runs = []
+
+        class TrackedBlueprint(Blueprint):
+            x = field(int, default=0)
+            y = field(int, default=0)
+
+            @law
+            def x_bounds(self):
+                runs.append("x")
+                when(self.x > 10, finfr)
+
+            @law
+            def y_bounds(self):
+                runs.append("y")
+                when(self.y > 10, finfr)
+
+            @forge
+            def set_x(self, value):
+                self.x = value
+
+        bp = TrackedBlueprint()
+        bp.set_x(1)
+        assert runs == ["x", "y"]  # First check runs every law
+
+        runs.clear()
+        bp.set_x(2)
+        assert runs == ["x"]
+
+        # A write outside a forge is seen by the next check
+        runs.clear()
+        bp.y = 20
+        with pytest.raises(LawViolation):
+            bp.set_x(3)
+        assert runs == ["x", "y"]
+        assert bp.x == 2
+
+    def test_incremental_check_matches_full_check(self):
+        """Test verify mode over random forges on laws with branching reads."""
+        import random
+
+        class BranchyBlueprint(Blueprint):
+            a = field(int, default=0)
+            b = field(int, default=0)
+            c = field(int, default=0)
+            items = field(list, default=None)
+
+            @law
+            def guarded(self):
+                when(self.a > 0 and self.b > 5, finfr)
+
+            @law
+            def either(self):
+                if self.c % 2:
+                    when(self.a < -5, finfr)
+                else:
+                    when(self.b < -5, fin)
+
+            @law
+            def short_list(self):
+                when(self.items is not None and len(self.items) > 4, finfr)
+
+            @forge
+            def set_field(self, name, value):
+                setattr(self, name, value)
+
+            @forge
+            def push(self, value):
+                self.items.append(value)
+
+        rng = random.Random(7)
+        verified = BranchyBlueprint(items=[])
+        verified.law_mode = "verify"
+        full = BranchyBlueprint(items=[])
+        full.law_mode = "full"
+        for _ in range(500):
+            if rng.random() < 0.2:
+                call = ("push", (rng.randint(0, 9),))
+            else:
+                call = ("set_field", (rng.choice("abc"), rng.randint(-8, 8)))
+            if rng.random() < 0.1:
+                verified.items.clear()
+                full.items.clear()
+            outcomes = []
+            for bp in (verified, full):
+                try:
+                    getattr(bp, call[0])(*call[1])
+                    outcomes.append(None)
+                except (LawViolation, FinClosure) as e:
+                    outcomes.append(e.law_name)
+            assert outcomes[0] == outcomes[1]
+            assert verified._get_state() == full._get_state()
+
 
 class TestForgeFunctionality:
     """Test Forge execution functionality."""
@@ -1020,6 +1163,87 @@ class TestForgeFunctionality:
         assert bp.b == "test"
         assert bp.c == [1, 2, 3]  # Deep copy should have preserved
 
+    def test_forge_rollback_restores_in_place_changes(self):
+        """Test that rollback undoes changes made through a field's value."""
+        class ListBlueprint(Blueprint):
+            items = field(list, default=None)
+            count = field(int, default=0)
+
+            @law
+            def at_most_three(self):
+                when(len(self.items) > 3, finfr)
+
+            @forge
+            def add(self, item):
+                self.items.append(item)
+                self.count += 1
+
+        bp = ListBlueprint(items=[1, 2, 3])
+
+        with pytest.raises(LawViolation):
+            bp.add(4)
+
+        assert bp.items == [1, 2, 3]
+        assert bp.count == 0
+        assert bp._journal is None
+
+    def test_nested_forge_rollback(self):
+        """Test that a failing outer forge undoes its nested forges too."""
+        class NestedBlueprint(Blueprint):
+            a = field(int, default=0)
+            b = field(int, default=0)
+
+            @forge
+            def set_b(self, value):
+                self.b = value
+
+            @forge
+            def set_both(self, value):
+                self.a = value
+                self.set_b(value)
+                raise ValueError("abort")
+
+        bp = NestedBlueprint()
+        bp.set_b(5)
+
+        with pytest.raises(ValueError):
+            bp.set_both(7)
+
+        assert (bp.a, bp.b) == (0, 5)
+
+    @pytest.mark.parametrize("law_mode", ["incremental", "verify", "full"])
+    def test_nested_forge_sees_outer_writes(self, law_mode):
+        """Test that a nested forge checks the outer forge's unchecked writes."""
+        class NestedBlueprint(Blueprint):
+            a = field(int, default=0)
+            b = field(int, default=0)
+
+            @law
+            def a_limit(self):
+                when(self.a > 10, finfr)
+
+            @forge
+            def bump_b(self):
+                self.b += 1
+
+            @forge
+            def set_a_then_bump(self, value):
+                self.a = value
+                self.bump_b()
+
+        bp = NestedBlueprint()
+        bp.law_mode = law_mode
+        bp.bump_b()
+
+        with pytest.raises(LawViolation) as exc:
+            bp.set_a_then_bump(100)
+        assert exc.value.law_name == "a_limit"
+        # Only the nested forge rolls back; the outer write is still unchecked
+        assert (bp.a, bp.b) == (100, 1)
+        assert bp._enclosing == ()
+        with pytest.raises(LawViolation):
+            bp.bump_b()
+
 
 class TestMatterTypeFunctionality:
     """Test Matter types for type safety."""
@@ -0,0 +1,135 @@
+"""
+Tests for the Vault's derived-key cache and batched encryption.
+
+Covers:
+- unlocks within the TTL skip key derivation
+- zeroization on lock, forget and expiry
+- store_many / retrieve_many, serial and across the worker pool
+
+Run with: python -m pytest tests/test_vault_key_cache.py -v
+"""
+import sys
+from pathlib import Path
+
+parent_dir = str(Path(__file__).parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+import pytest
+
+from core.vault import KeyCache, Vault, VaultConfig
+
+
+def make_vault(path, **kwargs):
+    return Vault(VaultConfig(storage_path=str(path), key_derivation_iterations=1000, **kwargs))
+
+
+@pytest.fixture
+def vault(tmp_path):
+    v = make_vault(tmp_path)
+    yield v
+    v.close()
+
+
+@pytest.fixture
+def derivations(vault, monkeypatch):
+    """Count calls into the real key derivation."""
+    calls = []
+    derive = vault.key_derivation.derive_key
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return derive(*args, **kwargs)
+
+    monkeypatch.setattr(vault.key_derivation, "derive_key", counting)
+    return calls
+
+
+def test_unlock_per_request_derives_once(vault, derivations):
+    owner_id = vault.register_identity("svc@example.com", "pw")
+    salt = vault._keys[owner_id][1]
+    entry_id = vault.store(owner_id, {"n": 1})
+
+    for _ in range(5):
+        vault.lock(owner_id)
+        assert vault.unlock("svc@example.com", "pw", salt) == owner_id
+        assert vault.retrieve(owner_id, entry_id) == {"n": 1}
+
+    # Re-registering within the TTL reuses the same key and salt
+    vault.lock(owner_id)
+    vault.register_identity("svc@example.com", "pw")
+    assert vault._keys[owner_id][1] == salt
+    assert vault.retrieve(owner_id, entry_id) == {"n": 1}
+
+    assert len(derivations) == 1
+    assert vault.key_cache.hits == 6
+
+
+def test_wrong_passphrase_is_not_served_from_cache(vault, derivations):
+    owner_id = vault.register_identity("svc@example.com", "pw")
+    salt = vault._keys[owner_id][1]
+    entry_id = vault.store(owner_id, {"n": 1})
+    vault.lock(owner_id)
+
+    vault.unlock("svc@example.com", "not-pw", salt)
+    assert len(derivations) == 2
+    with pytest.raises(Exception):
+        vault.retrieve(owner_id, entry_id)
+
+
+def test_lock_zeroes_key(vault, derivations):
+    owner_id = vault.register_identity("svc@example.com", "pw")
+    key, salt = vault._keys[owner_id]
+    vault.lock(owner_id)
+    assert key == bytearray(len(key))
+    assert not vault.is_unlocked(owner_id)
+
+    # The cached copy is separate and still serves the next unlock
+    vault.unlock("svc@example.com", "pw", salt)
+    assert len(derivations) == 1
+
+    cached = next(iter(vault.key_cache._entries.values()))[0]
+    vault.lock(owner_id, forget=True)
+    assert cached == bytearray(len(cached))
+    assert len(vault.key_cache) == 0
+
+    vault.unlock("svc@example.com", "pw", salt)
+    assert len(derivations) == 2
+
+
+def test_cache_expiry_and_size(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("core.vault.time.monotonic", lambda: now[0])
+    cache = KeyCache(ttl=10, max_entries=2)
+
+    keys = [bytearray(b"k%d" % i * 8) for i in range(3)]
+    cache.put("a", "pw", b"s0", keys[0], "A")
+    assert cache.get("a", "pw", b"s0") == (keys[0], b"s0")
+    assert cache.get("a", "pw") == (keys[0], b"s0")
+    assert cache.get("a", "other", b"s0") is None
+
+    cache.put("b", "pw", b"s1", keys[1], "B")
+    cache.put("c", "pw", b"s2", keys[2], "C")
+    assert cache.get("a", "pw", b"s0") is None  # evicted as the oldest
+    assert len(cache) == 2
+
+    now[0] += 11
+    assert cache.get("b", "pw", b"s1") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_store_many_and_retrieve_many(tmp_path, workers):
+    vault = make_vault(tmp_path, crypto_workers=workers, parallel_min_bytes=0)
+    owner_id = vault.register_identity("batch@example.com", "pw")
+    items = [{"i": i, "pad": "x" * i} for i in range(40)]
+
+    entry_ids = vault.store_many(owner_id, items)
+    assert vault.retrieve_many(owner_id, reversed(entry_ids)) == items[::-1]
+
+    other = vault.register_identity("other@example.com", "pw")
+    with pytest.raises(PermissionError):
+        vault.retrieve_many(other, entry_ids[:2])
+    with pytest.raises(KeyError):
+        vault.retrieve_many(owner_id, [entry_ids[0], "V_MISSING"])
+    vault.close()
@@ -0,0 +1,162 @@
+"""
+Tests for the Vault's append-only record log.
+
+Covers:
+- reopening a vault and reading entries back from the log
+- recovery from a torn final record
+- compaction of overwritten and deleted records
+- store_many batches
+- one-time import of the old entries.json format
+
+Run with: python -m pytest tests/test_vault_log.py -v
+"""
+import json
+import sys
+from pathlib import Path
+
+parent_dir = str(Path(__file__).parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+import pytest
+
+from core.vault import Vault, VaultConfig, VaultEntry
+
+
+IDENTITY = "log@example.com"
+PASSPHRASE = "log-pass"
+
+
+def make_vault(path, **kwargs):
+    return Vault(VaultConfig(storage_path=str(path), key_derivation_iterations=1000, **kwargs))
+
+
+def reopen(vault, path, owner_id, **kwargs):
+    """Close vault and open the same storage again, unlocked."""
+    salt = vault._keys[owner_id][1]
+    vault.close()
+    again = make_vault(path, **kwargs)
+    again.unlock(IDENTITY, PASSPHRASE, salt)
+    return again
+
+
+@pytest.fixture
+def vault(tmp_path):
+    v = make_vault(tmp_path)
+    yield v
+    v.close()
+
+
+def test_entries_survive_reopen(vault, tmp_path):
+    owner_id = vault.register_identity(IDENTITY, PASSPHRASE)
+    first = vault.store(owner_id, {"n": 1}, metadata={"type": "a"})
+    second = vault.store(owner_id, b"\x00raw bytes")
+    vault.store(owner_id, {"n": 2}, entry_id=first)
+
+    again = reopen(vault, tmp_path, owner_id)
+    assert again.retrieve(owner_id, first) == {"n": 2}
+    assert again.retrieve(owner_id, second) == b"\x00raw bytes"
+    listed = {e["id"]: e for e in again.list_entries(owner_id)}
+    assert listed[first]["version"] == 2
+    assert listed[first]["metadata"] == {}
+    again.close()
+
+
+def test_torn_tail_is_truncated(vault, tmp_path):
+    owner_id = vault.register_identity(IDENTITY, PASSPHRASE)
+    kept = vault.store(owner_id, {"kept": True})
+    torn = vault.store(owner_id, {"torn": True})
+    log_path = tmp_path / Vault.LOG_FILE
+    intact = vault._slots[torn].offset
+
+    salt = vault._keys[owner_id][1]
+    vault.close()
+    with open(log_path, "r+b") as f:
+        f.truncate(log_path.stat().st_size - 3)
+
+    again = make_vault(tmp_path)
+    again.unlock(IDENTITY, PASSPHRASE, salt)
+    assert again.retrieve(owner_id, kept) == {"kept": True}
+    with pytest.raises(KeyError):
+        again.retrieve(owner_id, torn)
+    assert log_path.stat().st_size == intact
+
+    # New records land where the torn one was cut off
+    again.store(owner_id, {"after": True})
+    assert again.stats()["total_entries"] == 2
+    again.close()
+
+
+def test_compaction_drops_dead_records(tmp_path):
+    vault = make_vault(tmp_path, compaction_min_bytes=0)
+    owner_id = vault.register_identity(IDENTITY, PASSPHRASE)
+    entry_id = vault.store(owner_id, {"v": 0})
+    for v in range(1, 20):
+        vault.store(owner_id, {"v": v}, entry_id=entry_id)
+    doomed = vault.store(owner_id, {"bye": True})
+    vault.delete(owner_id, doomed)
+
+    stats = vault.stats()
+    assert stats["dead_bytes"] <= stats["log_bytes"] * vault.config.compaction_ratio
+    assert vault.retrieve(owner_id, entry_id) == {"v": 19}
+
+    vault.compact()
+    assert vault.stats()["dead_bytes"] == 0
+    assert vault.stats()["log_bytes"] == vault._slots[entry_id].size
+
+    again = reopen(vault, tmp_path, owner_id)
+    assert again.retrieve(owner_id, entry_id) == {"v": 19}
+    assert [e["id"] for e in again.list_entries(owner_id)] == [entry_id]
+    again.close()
+
+
+def test_store_many(vault, tmp_path):
+    owner_id = vault.register_identity(IDENTITY, PASSPHRASE)
+    items = [{"i": i} for i in range(50)]
+    entry_ids = vault.store_many(owner_id, items, metadata={"batch": 1})
+    assert len(set(entry_ids)) == 50
+
+    again = reopen(vault, tmp_path, owner_id)
+    assert [again.retrieve(owner_id, eid) for eid in entry_ids] == items
+    assert all(e["metadata"] == {"batch": 1} for e in again.list_entries(owner_id))
+    again.close()
+
+
+def test_corrupt_record_is_rejected(vault, tmp_path):
+    owner_id = vault.register_identity(IDENTITY, PASSPHRASE)
+    entry_id = vault.store(owner_id, {"x": 1})
+    vault.store(owner_id, {"y": 2})
+    slot = vault._slots[entry_id]
+
+    with open(tmp_path / Vault.LOG_FILE, "r+b") as f:
+        f.seek(slot.offset + slot.size - 1)
+        last = f.read(1)
+        f.seek(slot.offset + slot.size - 1)
+        f.write(bytes([last[0] ^ 0xFF]))
+
+    with pytest.raises(ValueError):
+        vault.retrieve(owner_id, entry_id)
+
+
+def test_imports_old_json_files(tmp_path):
+    vault = make_vault(tmp_path / "old")
+    owner_id = vault.register_identity(IDENTITY, PASSPHRASE)
+    key, salt = vault._keys[owner_id]
+    ciphertext, nonce = vault.encryption.encrypt(key, json.dumps({"legacy": True}).encode())
+    entry = VaultEntry(
+        id="V_LEGACY", owner_id=owner_id, data=ciphertext, nonce=nonce,
+        created_at=1, updated_at=2, version=3, metadata={"m": 1},
+    )
+    vault.close()
+
+    storage = tmp_path / "legacy"
+    storage.mkdir()
+    (storage / "entries.json").write_text(json.dumps({entry.id: entry.to_dict()}))
+    (storage / "index.json").write_text(json.dumps({owner_id: [entry.id]}))
+
+    imported = make_vault(storage)
+    imported.unlock(IDENTITY, PASSPHRASE, salt)
+    assert imported.retrieve(owner_id, "V_LEGACY") == {"legacy": True}
+    assert imported.list_entries(owner_id)[0]["version"] == 3
+    assert (storage / Vault.LOG_FILE).exists()
+    imported.close()
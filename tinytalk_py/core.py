@@ -225,6 +225,18 @@ def finfr_if_undefined(f: float, g: float, epsilon: float = 1e-9) -> None:
 
 T = TypeVar('T')
 
+# Values a forge cannot change in place; the journal keeps them by reference
+_ATOMIC = frozenset({type(None), bool, int, float, complex, str, bytes})
+
+# Recorded in a law's read-set when it reads a mutable value, which can
+# change in place without passing through Field.__set__
+_MUTABLE = object()
+
+
+def _journal_value(value: Any) -> Any:
+    """The copy of a field value the journal needs to restore it."""
+    return value if type(value) in _ATOMIC else copy.deepcopy(value)
+
 
 @dataclass
 class Field(Generic[T]):
@@ -232,6 +244,11 @@ class Field(Generic[T]):
     A field declaration for a Blueprint.
 
     Fields hold Matter - typed values with units.
+
+    While a forge runs, the blueprint's write journal records the original
+    value of each field the first time it is assigned or read (a read may
+    hand out a mutable value that is then changed in place). While a law
+    runs, reads are traced into the law's read-set instead.
     """
     type_: type
     default: Optional[T] = None
@@ -243,7 +260,18 @@ class Field(Generic[T]):
     def __get__(self, obj, objtype=None) -> T:
         if obj is None:
             return self
-        return getattr(obj, f"_field_{self.name}", self.default)
+        value = getattr(obj, f"_field_{self.name}", self.default)
+        journal = getattr(obj, "_journal", None)
+        if journal is not None:
+            if self.name not in journal and type(value) not in _ATOMIC:
+                journal[self.name] = copy.deepcopy(value)
+        else:
+            reads = getattr(obj, "_reads", None)
+            if reads is not None:
+                reads.add(self.name)
+                if type(value) not in _ATOMIC:
+                    reads.add(_MUTABLE)
+        return value
 
     def __set__(self, obj, value: T):
         # Type checking
@@ -259,6 +287,16 @@ class Field(Generic[T]):
                         f"Field '{self.name}' expects {self.type_.__name__}, "
                         f"got {type(value).__name__}"
                     )
+        journal = getattr(obj, "_journal", None)
+        if journal is None:
+            # Written outside a forge: the next law check must see it
+            unchecked = getattr(obj, "_unchecked", None)
+            if unchecked is not None:
+                unchecked.add(self.name)
+        elif self.name not in journal:
+            journal[self.name] = _journal_value(
+                getattr(obj, f"_field_{self.name}", self.default)
+            )
         setattr(obj, f"_field_{self.name}", value)
 
 
@@ -281,15 +319,30 @@ class Law:
 
     Laws are evaluated before any forge executes.
     If a law's condition is True and result is finfr, the operation is blocked.
+
+    A law built from a @law method keeps the bound method, which evaluate()
+    calls directly. reads is the set of fields the law has read so far, and
+    volatile marks a law that must run on every check because it read a
+    mutable value or no fields at all.
     """
     name: str
     condition: Callable[['Blueprint'], bool]
     result: LawResult = LawResult.FINFR
     message: str = ""
+    method: Optional[Callable[[], Any]] = None
+    reads: Optional[set] = None
+    volatile: bool = False
 
     def evaluate(self, blueprint: 'Blueprint') -> tuple[bool, LawResult]:
         """Evaluate the law against current blueprint state."""
         try:
+            if self.method is not None:
+                # A law method signals by raising; returning normally passes
+                try:
+                    self.method()
+                except (LawViolation, FinClosure):
+                    return True, self.result
+                return False, LawResult.ALLOWED
             triggered = self.condition(blueprint)
             if triggered:
                 return True, self.result
@@ -317,7 +370,10 @@ def forge(func: Callable) -> Callable:
     Decorator to mark a method as a Forge.
 
     Forges are the executive layer - they mutate state.
-    Before a forge runs, all laws are checked against the projected state.
+    After a forge runs, the laws are checked against the new state; if one
+    is violated, the fields the forge touched are rolled back from its
+    write journal. Only laws that read a changed field are re-run (see
+    Blueprint.law_mode).
 
     Usage:
         @forge
@@ -327,28 +383,39 @@ def forge(func: Callable) -> Callable:
     """
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        # Save current state for rollback
-        saved_state = self._save_state()
+        # Journal original values of the fields this forge touches
+        outer = self._journal
+        enclosing = self._enclosing
+        if outer is not None:
+            self._enclosing = enclosing + (outer,)
+        saved_state = self._journal = {}
+        checked = rolled_back = False
 
         try:
             # Execute the forge
-            result = func(self, *args, **kwargs)
-
-            # Check all laws against new state
-            for law_obj in self._laws:
-                triggered, law_result = law_obj.evaluate(self)
-                if triggered and law_result == LawResult.FINFR:
-                    # Rollback and raise
-                    self._restore_state(saved_state)
-                    raise LawViolation(
-                        law_obj.name,
-                        law_obj.message or f"Law '{law_obj.name}' prevents this state"
-                    )
-                elif triggered and law_result == LawResult.FIN:
-                    # Rollback but allow handling
-                    self._restore_state(saved_state)
-                    raise FinClosure(law_obj.name, law_obj.message)
-
+            try:
+                result = func(self, *args, **kwargs)
+            finally:
+                # Laws and rollback only read state; don't journal them
+                self._journal = None
+
+            # Check laws against new state
+            law_obj = self._find_violation(self._changed_fields(saved_state))
+            if law_obj is not None and law_obj.result == LawResult.FINFR:
+                # Rollback and raise
+                self._rollback(saved_state)
+                rolled_back = True
+                raise LawViolation(
+                    law_obj.name,
+                    law_obj.message or f"Law '{law_obj.name}' prevents this state"
+                )
+            elif law_obj is not None:
+                # Rollback but allow handling
+                self._rollback(saved_state)
+                rolled_back = True
+                raise FinClosure(law_obj.name, law_obj.message)
+
+            checked = True
             return result
 
         except (LawViolation, FinClosure):
@@ -356,8 +423,21 @@ def forge(func: Callable) -> Callable:
             raise
         except Exception:
             # Rollback on any error
-            self._restore_state(saved_state)
+            self._rollback(saved_state)
+            rolled_back = True
             raise
+        finally:
+            if outer is not None:
+                # A nested forge hands its originals to the enclosing one
+                for name, value in saved_state.items():
+                    outer.setdefault(name, value)
+            elif checked:
+                self._unchecked = set()
+            elif not rolled_back and self._unchecked is not None:
+                # Escaped without a check or rollback; check these next time
+                self._unchecked.update(saved_state)
+            self._journal = outer
+            self._enclosing = enclosing
 
     wrapper._is_forge = True
     return wrapper
@@ -368,11 +448,18 @@ def forge(func: Callable) -> Callable:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class BlueprintMeta(type):
-    """Metaclass that collects laws and forges from class definition."""
+    """Metaclass that collects fields, laws and forges from class definition."""
 
     def __new__(mcs, name, bases, namespace):
         cls = super().__new__(mcs, name, bases, namespace)
 
+        # Collect fields, including inherited ones, in dir() order
+        cls._fields = {}
+        for attr_name in dir(cls):
+            attr = getattr(cls, attr_name)
+            if isinstance(attr, Field):
+                cls._fields[attr_name] = attr
+
         # Collect laws
         cls._law_methods = []
         for attr_name, attr_value in namespace.items():
@@ -381,6 +468,12 @@ class BlueprintMeta(type):
 
         return cls
 
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        # Keep the registry in step with fields added after class creation
+        if isinstance(value, Field):
+            cls._fields = dict(sorted({**cls._fields, name: value}.items()))
+
 
 class Blueprint(metaclass=BlueprintMeta):
     """
@@ -406,13 +499,26 @@ class Blueprint(metaclass=BlueprintMeta):
                 return "cleared"
     """
 
+    # How forges check laws: "incremental" re-runs only the laws whose
+    # read-set meets a field changed since the laws last passed, "full"
+    # re-runs every law, and "verify" does both and raises AssertionError
+    # if they disagree. Incremental checking assumes laws depend only on
+    # this blueprint's fields.
+    law_mode = "incremental"
+
+    # Write journal of the running forge: field name -> original value
+    _journal: Optional[Dict[str, Any]] = None
+    # Read-set of the running law
+    _reads: Optional[set] = None
+    _unchecked: Optional[set] = None
+    # Journals of the forges enclosing the running one, outermost first
+    _enclosing: tuple = ()
+
     def __init__(self, **kwargs):
         # Initialize fields with defaults
-        for attr_name in dir(self.__class__):
-            attr = getattr(self.__class__, attr_name)
-            if isinstance(attr, Field):
-                default = kwargs.get(attr_name, attr.default)
-                setattr(self, attr_name, default)
+        for attr_name, attr in self._fields.items():
+            default = kwargs.get(attr_name, attr.default)
+            setattr(self, attr_name, default)
 
         # Build law objects from law methods
         self._laws: List[Law] = []
@@ -433,18 +539,20 @@ class Blueprint(metaclass=BlueprintMeta):
             self._laws.append(Law(
                 name=law_name,
                 condition=make_condition(law_method),
-                result=LawResult.FINFR
+                result=LawResult.FINFR,
+                method=law_method
             ))
 
+        # Fields written since the laws last passed
+        self._unchecked = set(self._fields)
+
     def _save_state(self) -> Dict[str, Any]:
         """Save current field values for potential rollback."""
         state = {}
-        for attr_name in dir(self.__class__):
-            attr = getattr(self.__class__, attr_name)
-            if isinstance(attr, Field):
-                value = getattr(self, attr_name)
-                # Deep copy to handle mutable objects
-                state[attr_name] = copy.deepcopy(value)
+        for attr_name in self._fields:
+            value = getattr(self, attr_name)
+            # Deep copy to handle mutable objects
+            state[attr_name] = copy.deepcopy(value)
         return state
 
     def _restore_state(self, state: Dict[str, Any]):
@@ -452,14 +560,55 @@ class Blueprint(metaclass=BlueprintMeta):
         for attr_name, value in state.items():
             setattr(self, attr_name, value)
 
+    def _rollback(self, journal: Dict[str, Any]):
+        """Put journaled fields back as they were before the forge."""
+        for attr_name, value in journal.items():
+            setattr(self, f"_field_{attr_name}", value)
+
+    def _changed_fields(self, journal: Dict[str, Any]) -> set:
+        """Fields that may differ from the state the laws last passed on."""
+        if self._unchecked is None:
+            return set(self._fields)
+        # Writes of enclosing forges are not checked until they finish
+        return self._unchecked.union(journal, *self._enclosing)
+
+    def _first_violation(self, laws) -> Optional[Law]:
+        """Run laws in order, tracing their reads; return the first triggered."""
+        for law_obj in laws:
+            self._reads = reads = set()
+            try:
+                triggered, result = law_obj.evaluate(self)
+            finally:
+                self._reads = None
+            if not reads or _MUTABLE in reads:
+                law_obj.volatile = True
+                reads.discard(_MUTABLE)
+            law_obj.reads = reads if law_obj.reads is None else law_obj.reads | reads
+            if triggered and result != LawResult.ALLOWED:
+                return law_obj
+        return None
+
+    def _find_violation(self, changed: set) -> Optional[Law]:
+        """The first law the current state violates, per law_mode."""
+        if self.law_mode == "full":
+            return self._first_violation(self._laws)
+        found = self._first_violation(
+            law_obj for law_obj in self._laws
+            if law_obj.reads is None or law_obj.volatile
+            or not law_obj.reads.isdisjoint(changed)
+        )
+        if self.law_mode == "verify":
+            expected = self._first_violation(self._laws)
+            if found is not expected:
+                raise AssertionError(
+                    f"Incremental law check found {found and found.name!r}, "
+                    f"full check found {expected and expected.name!r}"
+                )
+        return found
+
     def _get_state(self) -> Dict[str, Any]:
         """Get current state as dictionary."""
-        state = {}
-        for attr_name in dir(self.__class__):
-            attr = getattr(self.__class__, attr_name)
-            if isinstance(attr, Field):
-                state[attr_name] = getattr(self, attr_name)
-        return state
+        return {attr_name: getattr(self, attr_name) for attr_name in self._fields}
 
     def _check_laws(self) -> tuple[bool, Optional[Law]]:
         """Check all laws. Returns (blocked, triggered_law)."""